@@ -22,4 +22,5 @@
 # src/pulsepipe/adapters/__init__.py
 
 from .base import Adapter
-from .file_watcher import FileWatcherAdapter
\ No newline at end of file
+from .file_watcher import FileWatcherAdapter
+from .mllp import MLLPAdapter
@@ -0,0 +1,407 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/adapters/file_scanner.py
+
+"""
+Incremental directory scanner for the file watcher adapter.
+
+Walks the watch path with ``os.scandir`` and keeps an index of every
+matching file's (size, mtime_ns, inode) signature plus each directory's
+mtime. A directory whose mtime has not changed since the last scan has the
+same entries, so its listing is reused and only its subdirectories are
+visited. The index is persisted to SQLite so a restart resumes from the
+last known state instead of re-globbing the tree and re-checking every
+historical file against the bookmark store. Index rows are keyed by a
+``watch_key`` (by default the root and extensions), so watchers with
+different configs sharing one index file do not see each other's state.
+
+Directory mtimes do not change when a file is rewritten in place, so a
+periodic full scan (``full_scan_interval``) re-stats every file to catch
+those. Writers that replace files via rename are caught on the next
+incremental scan.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from pulsepipe.utils.log_factory import LogFactory
+
+DEFAULT_INDEX_PATH = ".pulsepipe/state/file_watcher_index.sqlite3"
+
+# Directories modified this recently are rescanned on the next pass, since a
+# file created within the same timestamp tick would not bump the mtime again
+_RACY_WINDOW_NS = 2_000_000_000
+
+FileSignature = Tuple[int, int, int]
+
+# Signature of a file that was reported but not handed off; never matches a stat
+_STALE: FileSignature = (-1, -1, -1)
+
+
+def watch_key(config: Dict[str, Any]) -> str:
+    """Index key for a watch config: a hash of its settings, in any key order."""
+    encoded = json.dumps(config, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class ScanChanges:
+    """Files that appeared, changed or disappeared since the previous scan."""
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    # Skipped as modified within settle_seconds; reported again once settled
+    unsettled: List[str] = field(default_factory=list)
+    full_scan: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
+
+
+@dataclass
+class _DirEntry:
+    mtime_ns: int
+    parent: Optional[str]
+    subdirs: Set[str] = field(default_factory=set)
+    files: Set[str] = field(default_factory=set)
+
+
+class IncrementalFileScanner:
+    """
+    Incremental scanner with a persisted (path, size, mtime_ns, inode) index.
+
+    ``scan()`` updates the in-memory index and returns what changed;
+    ``save()`` writes the changes to disk. Callers save after the changed
+    files have been handed off so a crash in between re-reports them, and
+    ``discard()`` the ones they could not hand off.
+    Files modified within ``settle_seconds`` are left for a later scan so
+    files still being written are not reported half-finished.
+    """
+
+    def __init__(
+        self,
+        root: str,
+        extensions: Iterable[str],
+        index_path: Optional[str] = DEFAULT_INDEX_PATH,
+        full_scan_interval: float = 300.0,
+        settle_seconds: float = 0.0,
+        key: Optional[str] = None,
+    ):
+        self.logger = LogFactory.get_logger(__name__)
+        self.root = str(root)
+        self.extensions = tuple(extensions)
+        self.watch_key = key or watch_key({"root": self.root, "extensions": sorted(self.extensions)})
+        self.full_scan_interval = full_scan_interval
+        self.settle_ns = int(settle_seconds * 1_000_000_000)
+        self.index_path = str(index_path) if index_path else None
+
+        self._dirs: Dict[str, _DirEntry] = {}
+        self._files: Dict[str, FileSignature] = {}
+        self._dirty_dirs: Set[str] = set()
+        self._dirty_files: Set[str] = set()
+        self._deleted_dirs: Set[str] = set()
+        self._deleted_files: Set[str] = set()
+        self._last_full_scan = 0.0
+
+        self.conn = None
+        if self.index_path:
+            index_dir = os.path.dirname(self.index_path)
+            if index_dir and not os.path.exists(index_dir):
+                os.makedirs(index_dir, exist_ok=True)
+            self.conn = sqlite3.connect(self.index_path, check_same_thread=False)
+            self._ensure_schema()
+            self._load()
+
+    def _ensure_schema(self) -> None:
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS scan_dirs (
+                watch_key TEXT NOT NULL,
+                path TEXT NOT NULL,
+                parent TEXT,
+                mtime_ns INTEGER NOT NULL,
+                PRIMARY KEY (watch_key, path)
+            )
+        """)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS scan_files (
+                watch_key TEXT NOT NULL,
+                path TEXT NOT NULL,
+                dir TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                PRIMARY KEY (watch_key, path)
+            )
+        """)
+        self.conn.commit()
+
+    def _load(self) -> None:
+        for path, parent, mtime_ns in self.conn.execute(
+            "SELECT path, parent, mtime_ns FROM scan_dirs WHERE watch_key = ?", (self.watch_key,)
+        ):
+            self._dirs[path] = _DirEntry(mtime_ns, parent)
+        for path, entry in self._dirs.items():
+            if entry.parent in self._dirs:
+                self._dirs[entry.parent].subdirs.add(path)
+
+        for path, directory, size, mtime_ns, inode in self.conn.execute(
+            "SELECT path, dir, size, mtime_ns, inode FROM scan_files WHERE watch_key = ?", (self.watch_key,)
+        ):
+            self._files[path] = (size, mtime_ns, inode)
+            if directory in self._dirs:
+                self._dirs[directory].files.add(path)
+
+        if self._files:
+            self.logger.info(
+                f"📇 Loaded scan index for {self.root}: {len(self._files)} files, {len(self._dirs)} directories"
+            )
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._files
+
+    def scan(self, full: Optional[bool] = None) -> ScanChanges:
+        """
+        Walk the tree and return files added, modified or removed since the last scan.
+
+        Unchanged directories are not listed again unless this is a full
+        scan, which happens every ``full_scan_interval`` seconds or when
+        ``full`` is True.
+        """
+        now = time.monotonic()
+        if full is None:
+            full = (
+                self.full_scan_interval is not None
+                and now - self._last_full_scan >= self.full_scan_interval
+            )
+        if full:
+            self._last_full_scan = now
+
+        changes = ScanChanges(full_scan=full)
+        scan_start_ns = time.time_ns()
+        seen_dirs: Set[str] = set()
+        stack: List[Tuple[str, Optional[str]]] = [(self.root, None)]
+
+        while stack:
+            directory, parent = stack.pop()
+            try:
+                dir_mtime = os.stat(directory).st_mtime_ns
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
+            seen_dirs.add(directory)
+
+            cached = self._dirs.get(directory)
+            if not full and cached is not None and cached.mtime_ns == dir_mtime:
+                stack.extend((subdir, directory) for subdir in cached.subdirs)
+                continue
+
+            entry = self._list_directory(directory, parent, dir_mtime, scan_start_ns, changes)
+            if entry is None:
+                continue
+            stack.extend((subdir, directory) for subdir in entry.subdirs)
+
+        for directory in [d for d in self._dirs if d not in seen_dirs]:
+            self._drop_directory(directory, changes)
+
+        return changes
+
+    def _list_directory(
+        self,
+        directory: str,
+        parent: Optional[str],
+        dir_mtime: int,
+        scan_start_ns: int,
+        changes: ScanChanges,
+    ) -> Optional[_DirEntry]:
+        subdirs: Set[str] = set()
+        files: Set[str] = set()
+        unsettled = False
+
+        try:
+            with os.scandir(directory) as entries:
+                for dir_entry in entries:
+                    try:
+                        if dir_entry.is_dir(follow_symlinks=False):
+                            subdirs.add(dir_entry.path)
+                            continue
+                        if not dir_entry.name.endswith(self.extensions) or not dir_entry.is_file():
+                            continue
+                        st = dir_entry.stat()
+                    except OSError:
+                        continue
+
+                    path = dir_entry.path
+                    if scan_start_ns - st.st_mtime_ns < self.settle_ns:
+                        # Still being written; pick it up once it settles
+                        unsettled = True
+                        changes.unsettled.append(path)
+                        if path in self._files:
+                            files.add(path)
+                        continue
+
+                    files.add(path)
+                    signature = (st.st_size, st.st_mtime_ns, st.st_ino)
+                    previous = self._files.get(path)
+                    if previous == signature:
+                        continue
+                    if previous is None:
+                        changes.added.append(path)
+                    else:
+                        changes.modified.append(path)
+                    self._files[path] = signature
+                    self._dirty_files.add(path)
+                    self._deleted_files.discard(path)
+        except (FileNotFoundError, NotADirectoryError, PermissionError) as e:
+            self.logger.warning(f"⚠️ Could not list {directory}: {e}")
+            return None
+
+        previous = self._dirs.get(directory)
+        if previous is not None:
+            for path in previous.files - files:
+                self._forget_file(path, changes)
+            for subdir in previous.subdirs - subdirs:
+                self._drop_directory(subdir, changes)
+
+        # An mtime that could still be bumped in the same tick, or a pending
+        # unsettled file, forces this directory to be listed again next time
+        racy = unsettled or scan_start_ns - dir_mtime < _RACY_WINDOW_NS
+        entry = _DirEntry(-1 if racy else dir_mtime, parent, subdirs, files)
+        self._dirs[directory] = entry
+        self._dirty_dirs.add(directory)
+        self._deleted_dirs.discard(directory)
+        return entry
+
+    def _forget_file(self, path: str, changes: ScanChanges) -> None:
+        if self._files.pop(path, None) is not None:
+            changes.removed.append(path)
+            self._dirty_files.discard(path)
+            self._deleted_files.add(path)
+
+    def _drop_directory(self, directory: str, changes: ScanChanges) -> None:
+        entry = self._dirs.pop(directory, None)
+        if entry is None:
+            return
+        self._dirty_dirs.discard(directory)
+        self._deleted_dirs.add(directory)
+        for path in entry.files:
+            self._forget_file(path, changes)
+        for subdir in entry.subdirs:
+            self._drop_directory(subdir, changes)
+
+    def refresh(self, path: str) -> Optional[str]:
+        """
+        Re-stat a single file reported by an external watcher.
+
+        Returns ``"added"`` or ``"modified"`` when the file differs from the
+        index (and updates it), or None when it is unchanged or gone.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        signature = (st.st_size, st.st_mtime_ns, st.st_ino)
+        previous = self._files.get(path)
+        if previous == signature:
+            return None
+
+        self._files[path] = signature
+        self._dirty_files.add(path)
+        self._deleted_files.discard(path)
+        directory = os.path.dirname(path)
+        if directory in self._dirs:
+            self._dirs[directory].files.add(path)
+        return "added" if previous is None else "modified"
+
+    def discard(self, path: str) -> None:
+        """
+        Un-index a reported file that could not be handed off.
+
+        The file is reported as modified by the next scan of its directory,
+        including after a restart, so it is retried rather than skipped.
+        """
+        if path not in self._files:
+            return
+        self._files[path] = _STALE
+        self._dirty_files.add(path)
+        entry = self._dirs.get(os.path.dirname(path))
+        if entry is not None:
+            # Force a relisting; the directory mtime has not changed
+            entry.mtime_ns = -1
+            self._dirty_dirs.add(os.path.dirname(path))
+
+    def save(self) -> None:
+        """Persist index changes accumulated since the last save."""
+        if self.conn is None:
+            self._clear_dirty()
+            return
+        if not (self._dirty_dirs or self._dirty_files or self._deleted_dirs or self._deleted_files):
+            return
+
+        with self.conn:
+            if self._deleted_files:
+                self.conn.executemany(
+                    "DELETE FROM scan_files WHERE watch_key = ? AND path = ?",
+                    [(self.watch_key, path) for path in self._deleted_files]
+                )
+            if self._deleted_dirs:
+                self.conn.executemany(
+                    "DELETE FROM scan_dirs WHERE watch_key = ? AND path = ?",
+                    [(self.watch_key, path) for path in self._deleted_dirs]
+                )
+            if self._dirty_dirs:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO scan_dirs (watch_key, path, parent, mtime_ns) VALUES (?, ?, ?, ?)",
+                    [
+                        (self.watch_key, path, self._dirs[path].parent, self._dirs[path].mtime_ns)
+                        for path in self._dirty_dirs if path in self._dirs
+                    ]
+                )
+            if self._dirty_files:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO scan_files (watch_key, path, dir, size, mtime_ns, inode) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (self.watch_key, path, os.path.dirname(path), *self._files[path])
+                        for path in self._dirty_files if path in self._files
+                    ]
+                )
+        self._clear_dirty()
+
+    def _clear_dirty(self) -> None:
+        self._dirty_dirs.clear()
+        self._dirty_files.clear()
+        self._deleted_dirs.clear()
+        self._deleted_files.clear()
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.save()
+            self.conn.close()
+            self.conn = None
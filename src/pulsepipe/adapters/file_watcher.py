@@ -32,6 +32,12 @@ from .base import Adapter
 from pulsepipe.persistence.factory import get_database_connection
 from .file_watcher_bookmarks.sqlite_store import SQLiteBookmarkStore
 from .file_watcher_bookmarks.factory import create_bookmark_store
+from .file_scanner import IncrementalFileScanner, DEFAULT_INDEX_PATH, watch_key
+from .inotify_watcher import (
+    InotifyWatcher, inotify_available,
+    IN_CLOSE_WRITE, IN_CREATE, IN_DELETE_SELF, IN_ISDIR, IN_MODIFY,
+    IN_MOVE_SELF, IN_MOVED_TO, IN_Q_OVERFLOW,
+)
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.utils.errors import FileWatcherError, FileSystemError
 from pulsepipe.utils.database_diagnostics import raise_database_diagnostic_error, DatabaseDiagnosticError
@@ -44,13 +50,33 @@ class FileWatcherAdapter(Adapter):
     This adapter watches a specified directory for files with supported extensions
     and processes them as they appear, supporting both one-time batch processing
     and continuous monitoring modes.
+
+    Files at least ``stream_threshold_bytes`` large are enqueued as
+    :class:`~pathlib.Path` objects rather than their contents, so ingesters
+    with a ``parse_file`` method can stream them from disk.
+
+    Continuous monitoring is event driven on Linux (inotify) and falls back to
+    periodic directory scans elsewhere. ``watch_mode`` selects the strategy:
+    ``auto`` (default) prefers inotify, ``inotify`` requests it explicitly and
+    ``poll`` always scans.
+
+    With ``incremental_scan`` enabled, scans go through an
+    :class:`IncrementalFileScanner` whose persisted index lets restarts skip
+    files already seen and re-ingests files that were modified in place.
     """
+
+    WATCH_MODES = ("auto", "inotify", "poll")
+
+    # Enqueued files are bookmarked in batches of this size
+    MARK_BATCH_SIZE = 500
     
     def __init__(self, config: dict):
         self.logger = LogFactory.get_logger(__name__)
         self.logger.info("📁 Initializing FileWatcherAdapter")
         self._stop_event = asyncio.Event()
         self._scan_interval = 1.0  # Default scan interval in seconds in tests
+        self._debounce = 1.0  # Quiet period before a still-open file is picked up
+        self._event_watcher: Optional[InotifyWatcher] = None
         
         try:
             # Support for testing
@@ -66,10 +92,24 @@ class FileWatcherAdapter(Adapter):
                 interval = float(config["scan_interval"])
                 if interval > 0:
                     self._scan_interval = interval
+
+            self.watch_mode = str(config.get("watch_mode", "auto")).lower()
+            if self.watch_mode not in self.WATCH_MODES:
+                raise FileWatcherError(
+                    f"Invalid watch_mode: {self.watch_mode}",
+                    details={"valid_modes": list(self.WATCH_MODES)}
+                )
+            if "debounce_seconds" in config:
+                debounce = float(config["debounce_seconds"])
+                if debounce >= 0:
+                    self._debounce = debounce
+            threshold = config.get("stream_threshold_bytes")
+            self.stream_threshold: Optional[int] = int(threshold) if threshold else None
             
             self.logger.info(f"🔍 Watch path: {self.watch_path}")
             self.logger.info(f"📦 Watching extensions: {self.file_extensions}")
             self.logger.info(f"⏱️ Scan interval: {self._scan_interval}s")
+            self.logger.info(f"🔔 Watch mode: {self.watch_mode}")
 
             # Initialize the bookmark store for tracking processed files
             # Handle both bookmark file (test compatibility) and database modes
@@ -78,7 +118,9 @@ class FileWatcherAdapter(Adapter):
                 self.bookmarks = type('SimpleBookmarks', (), {
                     'processed_files': set(),
                     'mark_processed': lambda self, file_path: self.processed_files.add(file_path),
-                    'is_processed': lambda self, file_path: file_path in self.processed_files
+                    'is_processed': lambda self, file_path: file_path in self.processed_files,
+                    'mark_processed_many': lambda self, paths: self.processed_files.update(paths),
+                    'filter_unprocessed': lambda self, paths: [p for p in paths if p not in self.processed_files]
                 })()
                 self.logger.info(f"Using simple bookmark store for testing with {self.bookmark_file}")
             else:
@@ -143,6 +185,24 @@ class FileWatcherAdapter(Adapter):
             
             # Track existing files to detect new ones
             self._known_files: Set[str] = set()
+            # Files the initial incremental scan left for debouncing
+            self._unsettled: List[str] = []
+
+            # Optional incremental scanner backed by a persisted file index
+            self.scanner: Optional[IncrementalFileScanner] = None
+            if config.get("incremental_scan", False):
+                # Keyed by the whole watch config (minus database settings), so
+                # pipelines sharing a directory keep separate indexes
+                self.scanner = IncrementalFileScanner(
+                    str(self.watch_path),
+                    self.file_extensions,
+                    index_path=config.get("scan_index_path", DEFAULT_INDEX_PATH),
+                    full_scan_interval=float(config.get("full_scan_interval", 300.0)),
+                    # A one-shot run has no later scan to pick up unsettled files
+                    settle_seconds=self._debounce if self.continuous else 0.0,
+                    key=watch_key({k: v for k, v in config.items() if k != "persistence"}),
+                )
+                self.logger.info(f"📇 Incremental scan index: {self.scanner.index_path}")
             
         except KeyError as e:
             # Specific error for missing required configuration
@@ -175,15 +235,30 @@ class FileWatcherAdapter(Adapter):
                         cause=e
                     ) from e
             
-            # Process existing files first
-            files_processed = await self.process_existing_files(queue)
-            self.logger.info(f"📋 Processed {files_processed} existing files")
-            
-            # If continuous mode is enabled, continue watching for new files
-            if self.continuous:
-                await self.watch_for_changes(queue)
-            else:
-                self.logger.info("📁 One-time processing completed")
+            # Arm the event watcher before the initial scan so files landing
+            # in between are not missed
+            watcher = self._start_event_watcher() if self.continuous else None
+            self._event_watcher = watcher
+
+            try:
+                # Process existing files first
+                files_processed = await self.process_existing_files(queue)
+                self.logger.info(f"📋 Processed {files_processed} existing files")
+
+                # If continuous mode is enabled, continue watching for new files
+                if self.continuous:
+                    if watcher is not None:
+                        await self.watch_for_events(queue, watcher)
+                    else:
+                        await self.watch_for_changes(queue)
+                else:
+                    self.logger.info("📁 One-time processing completed")
+            finally:
+                if watcher is not None:
+                    self._event_watcher = None
+                    watcher.close()
+                if self.scanner is not None:
+                    self.scanner.save()
                 
         except asyncio.CancelledError:
             self.logger.info("🛑 File watcher task was cancelled")
@@ -196,10 +271,35 @@ class FileWatcherAdapter(Adapter):
                 cause=e
             ) from e
 
+    def _start_event_watcher(self) -> Optional[InotifyWatcher]:
+        """Create an inotify watcher for the watch path, or None to use polling."""
+        if self.watch_mode == "poll" or getattr(self, 'single_scan_mode', False):
+            return None
+
+        if not inotify_available():
+            if self.watch_mode == "inotify":
+                self.logger.warning("⚠️ inotify is not available on this platform, falling back to polling")
+            return None
+
+        watcher = None
+        try:
+            watcher = InotifyWatcher()
+            watcher.add_tree(self.watch_path)
+            watcher.start()
+            self.logger.info(f"🔔 inotify watching {watcher.watch_count} directories under {self.watch_path}")
+            return watcher
+        except OSError as e:
+            self.logger.warning(f"⚠️ Could not start inotify watcher ({e}), falling back to polling")
+            if watcher is not None:
+                watcher.close()
+            return None
+
 
     async def stop(self):
         self.logger.info("🛑 Stop event set on FileWatcherAdapter")
         self._stop_event.set()
+        if self._event_watcher is not None:
+            self._event_watcher.wake()
 
 
     def _normalize_path(self, path):
@@ -215,30 +315,46 @@ class FileWatcherAdapter(Adapter):
         file_errors = []
         
         try:
-            matching_files = self._find_matching_files()
+            if self.scanner is not None:
+                # Only files that are new or changed since the indexed state
+                changes = await asyncio.to_thread(self.scanner.scan)
+                self._unsettled = changes.unsettled
+                candidates = [(Path(p), False) for p in changes.added]
+                candidates += [(Path(p), True) for p in changes.modified]
+            else:
+                candidates = [(file_path, False) for file_path in self._find_matching_files()]
+            
+            # One set-based bookmark lookup for the whole backlog
+            unprocessed = set(self.bookmarks.filter_unprocessed(
+                [self._normalize_path(file_path) for file_path, modified in candidates if not modified]
+            ))
+            enqueued: List[str] = []
             
-            for file_path in matching_files:
+            for file_path, modified in candidates:
                 str_path = self._normalize_path(file_path)
                 
                 # Add to known files set for future change detection
-                self._known_files.add(str_path)
+                if self.scanner is None:
+                    self._known_files.add(str_path)
                 
-                # Skip already processed files
-                if self.bookmarks.is_processed(str_path):
+                # Skip already processed files; modified files are re-ingested
+                if not modified and str_path not in unprocessed:
                     continue
                 
                 try:
                     # Read and process the file
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        raw_data = f.read()
+                    raw_data = self._read_payload(file_path)
                     
                     # Put data on the queue
                     await queue.put(raw_data)
                     self.logger.info(f"✅ Enqueued: {file_path}")
                     
-                    # Mark as processed
-                    self.bookmarks.mark_processed(str_path)
+                    # Mark as processed in batches
+                    enqueued.append(str_path)
                     files_processed += 1
+                    if len(enqueued) >= self.MARK_BATCH_SIZE:
+                        self.bookmarks.mark_processed_many(enqueued)
+                        enqueued = []
                 except Exception as e:
                     error_details = {
                         "file_path": str(file_path),
@@ -246,7 +362,15 @@ class FileWatcherAdapter(Adapter):
                     }
                     self.logger.error(f"❌ Error reading {file_path}: {e}")
                     file_errors.append(error_details)
+                    if self.scanner is not None:
+                        # Keep it out of the saved index so it is retried
+                        self.scanner.discard(str(file_path))
             
+            if enqueued:
+                self.bookmarks.mark_processed_many(enqueued)
+            if self.scanner is not None:
+                self.scanner.save()
+
             # If we encountered errors but processed some files, continue
             if file_errors and files_processed > 0:
                 self.logger.warning(
@@ -280,50 +404,30 @@ class FileWatcherAdapter(Adapter):
         
         try:
             # Initial set of known files
-            if not self._known_files:
+            if self.scanner is None and not self._known_files:
                 self._known_files = set(self._normalize_path(f) for f in self._find_matching_files())
             
             while not self._stop_event.is_set():
-                # Check for new files
-                current_files = set(self._normalize_path(f) for f in self._find_matching_files())
-                
-                # Find new files (in current but not in known)
-                new_files = current_files - self._known_files
-                
-                # Process new files
-                for file_path in new_files:
-                    self.logger.info(f"📡 Detected new file: {file_path}")
+                if self.scanner is not None:
+                    # Incremental scan off the event loop; only changed directories are listed
+                    changes = await asyncio.to_thread(self.scanner.scan)
+                    await self._enqueue_new_files(queue, [self._normalize_path(f) for f in changes.added])
+                    await self._enqueue_new_files(
+                        queue, [self._normalize_path(f) for f in changes.modified], reprocess=True
+                    )
+                    self.scanner.save()
+                else:
+                    # Check for new files
+                    current_files = set(self._normalize_path(f) for f in self._find_matching_files())
                     
-                    # Skip already processed files (extra safety check)
-                    if self.bookmarks.is_processed(file_path):
-                        self.logger.info(f"🔁 Already processed: {file_path}")
-                        continue
+                    # Find new files (in current but not in known)
+                    new_files = current_files - self._known_files
                     
-                    try:
-                        # Read and process the file - use the original path, not normalized for file I/O
-                        original_path = file_path
-                        if sys.platform == 'win32':
-                            # Convert back to OS-specific path for file operations if needed
-                            original_path = file_path.replace('/', '\\')
-                            
-                        with open(original_path, 'r', encoding='utf-8') as f:
-                            raw_data = f.read()
-                        
-                        # Put data on the queue
-                        await queue.put(raw_data)
-                        self.logger.info(f"✅ Enqueued: {file_path}")
-                        
-                        # Mark as processed with normalized path
-                        self.bookmarks.mark_processed(file_path)
-                    except FileNotFoundError:
-                        self.logger.info(f"🚫 File disappeared before processing: {file_path}")
-                    except PermissionError:
-                        self.logger.error(f"🔒 Permission denied for file: {file_path}")
-                    except Exception as e:
-                        self.logger.error(f"❌ Error reading {file_path}: {e}")
-                
-                # Update known files
-                self._known_files = current_files
+                    # Process new files
+                    await self._enqueue_new_files(queue, sorted(new_files))
+                    
+                    # Update known files
+                    self._known_files = current_files
                 
                 # Wait for a bit before the next scan
                 # Check if a flag was passed to just do a single scan and complete
@@ -354,6 +458,169 @@ class FileWatcherAdapter(Adapter):
             ) from e
 
 
+    async def _enqueue_new_files(self, queue: asyncio.Queue, file_paths: List[str], reprocess: bool = False) -> int:
+        """
+        Read newly detected files onto the queue, skipping ones already processed.
+
+        Bookmarks are checked and written with the store's bulk calls.
+        ``reprocess`` is set for files modified in place, which are re-ingested
+        even though the bookmark store already has them.
+        """
+        if not file_paths:
+            return 0
+
+        for file_path in file_paths:
+            if reprocess:
+                self.logger.info(f"✏️ Detected modified file: {file_path}")
+            else:
+                self.logger.info(f"📡 Detected new file: {file_path}")
+
+        # Skip already processed files (extra safety check)
+        pending = file_paths if reprocess else self.bookmarks.filter_unprocessed(file_paths)
+        if len(pending) < len(file_paths):
+            pending_set = set(pending)
+            for file_path in file_paths:
+                if file_path not in pending_set:
+                    self.logger.info(f"🔁 Already processed: {file_path}")
+
+        enqueued: List[str] = []
+        for file_path in pending:
+            try:
+                # Read and process the file - use the original path, not normalized for file I/O
+                original_path = file_path
+                if sys.platform == 'win32':
+                    # Convert back to OS-specific path for file operations if needed
+                    original_path = file_path.replace('/', '\\')
+
+                raw_data = self._read_payload(original_path)
+
+                # Put data on the queue
+                await queue.put(raw_data)
+                self.logger.info(f"✅ Enqueued: {file_path}")
+                enqueued.append(file_path)
+            except FileNotFoundError:
+                self.logger.info(f"🚫 File disappeared before processing: {file_path}")
+            except PermissionError:
+                self.logger.error(f"🔒 Permission denied for file: {file_path}")
+            except Exception as e:
+                self.logger.error(f"❌ Error reading {file_path}: {e}")
+
+        # Mark as processed with normalized paths
+        if enqueued:
+            self.bookmarks.mark_processed_many(enqueued)
+        if self.scanner is not None:
+            # Files that could not be read stay out of the saved index so they are retried
+            for file_path in set(pending).difference(enqueued):
+                self.scanner.discard(file_path)
+        return len(enqueued)
+
+    def _read_payload(self, file_path) -> Any:
+        """Return a file's contents, or its Path when it is large enough to stream."""
+        if self.stream_threshold and os.path.getsize(file_path) >= self.stream_threshold:
+            return Path(file_path)
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    async def watch_for_events(self, queue: asyncio.Queue, watcher: InotifyWatcher):
+        """
+        Watch for new files using inotify events instead of directory scans.
+
+        Files are enqueued as soon as the writer closes them (``IN_CLOSE_WRITE``)
+        or they are moved into the tree (``IN_MOVED_TO``). Files that are
+        created or modified but not closed are picked up once they have been
+        quiet for ``debounce_seconds``. New subdirectories are watched as they
+        appear and any files already inside them are queued for the same
+        debounce. A kernel queue overflow triggers one full rescan.
+        """
+        self.logger.info(f"👀 Watching for changes in {self.watch_path} (inotify)")
+        # Files still being written at the initial scan may get no further
+        # event, so they wait out the same debounce as unclosed files
+        now = time.monotonic()
+        pending: Dict[str, float] = {str_path: now for str_path in self._unsettled}
+        self._unsettled = []
+
+        try:
+            while not self._stop_event.is_set():
+                timeout = self._scan_interval
+                if pending:
+                    due = min(pending.values()) + self._debounce - time.monotonic()
+                    timeout = min(timeout, max(0.0, due))
+
+                events = await watcher.read_events(timeout)
+                now = time.monotonic()
+                ready: List[str] = []
+
+                for path, mask in events:
+                    if mask & IN_Q_OVERFLOW:
+                        self.logger.warning("⚠️ inotify event queue overflowed, rescanning watch path")
+                        ready.extend(
+                            self._normalize_path(f) for f in self._add_watch_tree(watcher, self.watch_path)
+                            if f.suffix in self.file_extensions
+                        )
+                        continue
+
+                    if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                        if path == self.watch_path:
+                            self.logger.warning(f"⚠️ Watch path {self.watch_path} was removed or moved")
+                        continue
+
+                    if mask & IN_ISDIR:
+                        if mask & (IN_CREATE | IN_MOVED_TO):
+                            for file_path in self._add_watch_tree(watcher, path):
+                                if file_path.suffix in self.file_extensions:
+                                    pending[self._normalize_path(file_path)] = now
+                        continue
+
+                    if path.suffix not in self.file_extensions:
+                        continue
+
+                    str_path = self._normalize_path(path)
+                    if mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                        pending.pop(str_path, None)
+                        ready.append(str_path)
+                    elif mask & (IN_CREATE | IN_MODIFY):
+                        pending[str_path] = now
+
+                for str_path, last_seen in list(pending.items()):
+                    if now - last_seen >= self._debounce:
+                        del pending[str_path]
+                        ready.append(str_path)
+
+                ready = list(dict.fromkeys(ready))
+                if self.scanner is None:
+                    await self._enqueue_new_files(queue, ready)
+                else:
+                    added, modified = [], []
+                    for str_path in ready:
+                        status = self.scanner.refresh(str_path)
+                        if status == "added":
+                            added.append(str_path)
+                        elif status == "modified":
+                            modified.append(str_path)
+                    await self._enqueue_new_files(queue, added)
+                    await self._enqueue_new_files(queue, modified, reprocess=True)
+
+                if ready and self.scanner is not None:
+                    self.scanner.save()
+
+        except asyncio.CancelledError:
+            self.logger.info("🛑 File watcher task was cancelled")
+            raise
+        except Exception as e:
+            raise FileWatcherError(
+                f"Error watching for file events: {str(e)}",
+                details={"watch_path": str(self.watch_path)},
+                cause=e
+            ) from e
+
+    def _add_watch_tree(self, watcher: InotifyWatcher, directory: Path) -> List[Path]:
+        """Watch a new directory tree, returning files already inside it."""
+        try:
+            return watcher.add_tree(directory)
+        except OSError as e:
+            self.logger.warning(f"⚠️ Could not watch {directory}: {e}")
+            return []
+
     def _find_matching_files(self) -> List[Path]:
         """Find all files in watch_path with matching extensions"""
         matching_files = []
@@ -365,4 +632,4 @@ class FileWatcherAdapter(Adapter):
             return matching_files
         except Exception as e:
             self.logger.error(f"Error scanning directory {self.watch_path}: {e}")
-            return []
\ No newline at end of file
+            return []
\ No newline at end of file
@@ -20,6 +20,7 @@
 # ------------------------------------------------------------------------------
 
 from abc import ABC, abstractmethod
+from typing import Iterable, List
 
 class BookmarkStore(ABC):
     @abstractmethod
@@ -30,6 +31,15 @@ class BookmarkStore(ABC):
     def mark_processed(self, path: str, status: str = "processed"):
         pass
 
+    def filter_unprocessed(self, paths: Iterable[str]) -> List[str]:
+        """Return the paths that have not been processed yet, in input order."""
+        return [path for path in paths if not self.is_processed(path)]
+
+    def mark_processed_many(self, paths: Iterable[str], status: str = "processed"):
+        """Mark several paths as processed."""
+        for path in paths:
+            self.mark_processed(path, status)
+
     @abstractmethod
     def get_all(self):
         pass
@@ -21,7 +21,7 @@
 
 import os
 import sys
-from typing import List
+from typing import Iterable, List, Optional, Set
 from .base import BookmarkStore
 from pulsepipe.persistence.database import DatabaseConnection, DatabaseDialect
 
@@ -31,18 +31,26 @@ class CommonBookmarkStore(BookmarkStore):
     Common bookmark store that works with all database backends.
     
     Uses the DatabaseDialect pattern to support SQLite, PostgreSQL, and MongoDB.
+    Bulk lookups and inserts use set-based queries when the dialect provides
+    them, so checking a backlog of files costs one round trip per batch.
     """
     
-    def __init__(self, connection: DatabaseConnection, dialect: DatabaseDialect):
+    # Paths per set-based query; keeps statements under SQLite's bound parameter limit
+    BATCH_SIZE = 500
+    
+    def __init__(self, connection: DatabaseConnection, dialect: DatabaseDialect, cache: bool = False):
         """
         Initialize common bookmark store.
         
         Args:
             connection: Database connection from the adapter system
             dialect: SQL dialect for database-specific operations
+            cache: Keep an in-process set of known processed paths so repeat
+                checks skip the database
         """
         self.conn = connection
         self.dialect = dialect
+        self._cache: Optional[Set[str]] = set() if cache else None
         self._ensure_schema()
 
     def _ensure_schema(self):
@@ -56,19 +64,51 @@ class CommonBookmarkStore(BookmarkStore):
                 # Table might already exist
                 pass
 
-    def is_processed(self, path: str) -> bool:
-        """Check if a file path has been processed."""
+    @staticmethod
+    def _normalize_path(path: str) -> str:
         # Normalize path for Windows compatibility
         if 'PYTEST_CURRENT_TEST' in os.environ and sys.platform == 'win32':
-            path = path.replace('\\', '/')
+            return path.replace('\\', '/')
+        return path
+
+    def is_processed(self, path: str) -> bool:
+        """Check if a file path has been processed."""
+        path = self._normalize_path(path)
+        if self._cache is not None and path in self._cache:
+            return True
         
         if hasattr(self.dialect, 'get_bookmark_check'):
             sql = self.dialect.get_bookmark_check()
             result = self.conn.execute(sql, (path,))
-            return len(result.rows) > 0
+            processed = len(result.rows) > 0
+            if processed and self._cache is not None:
+                self._cache.add(path)
+            return processed
         
         return False
 
+    def filter_unprocessed(self, paths: Iterable[str]) -> List[str]:
+        """Return the paths that have not been processed yet, in input order."""
+        if not hasattr(self.dialect, 'get_bookmark_check_many'):
+            return super().filter_unprocessed(paths)
+        
+        pairs = [(path, self._normalize_path(path)) for path in paths]
+        lookup = list(dict.fromkeys(normalized for _, normalized in pairs))
+        if self._cache is not None:
+            lookup = [path for path in lookup if path not in self._cache]
+        
+        processed: Set[str] = set()
+        for start in range(0, len(lookup), self.BATCH_SIZE):
+            batch = lookup[start:start + self.BATCH_SIZE]
+            sql = self.dialect.get_bookmark_check_many(len(batch))
+            result = self.conn.execute(sql, tuple(batch))
+            processed.update(row['path'] for row in result.rows)
+        
+        if self._cache is not None:
+            self._cache.update(processed)
+            processed = self._cache
+        return [path for path, normalized in pairs if normalized not in processed]
+
     def mark_processed(self, path: str, status: str = "processed"):
         """Mark a file path as processed."""
         # Normalize path for Windows compatibility
@@ -79,6 +119,31 @@ class CommonBookmarkStore(BookmarkStore):
             sql = self.dialect.get_bookmark_insert()
             self.conn.execute(sql, (path, status))
             self.conn.commit()
+            if self._cache is not None:
+                self._cache.add(path)
+
+    def mark_processed_many(self, paths: Iterable[str], status: str = "processed"):
+        """Mark several paths as processed with one commit."""
+        unique = list(dict.fromkeys(self._normalize_path(path) for path in paths))
+        if not unique:
+            return
+        
+        if hasattr(self.dialect, 'get_bookmark_insert_many'):
+            # Two bound parameters per row
+            rows_per_batch = self.BATCH_SIZE // 2
+            for start in range(0, len(unique), rows_per_batch):
+                batch = unique[start:start + rows_per_batch]
+                sql = self.dialect.get_bookmark_insert_many(len(batch))
+                params = tuple(value for path in batch for value in (path, status))
+                self.conn.execute(sql, params)
+        elif hasattr(self.dialect, 'get_bookmark_insert'):
+            self.conn.executemany(self.dialect.get_bookmark_insert(), [(path, status) for path in unique])
+        else:
+            return
+        
+        self.conn.commit()
+        if self._cache is not None:
+            self._cache.update(unique)
 
     def get_all(self) -> List[str]:
         """Get all processed file paths."""
@@ -95,6 +160,8 @@ class CommonBookmarkStore(BookmarkStore):
             sql = self.dialect.get_bookmark_clear()
             result = self.conn.execute(sql)
             self.conn.commit()
+            if self._cache is not None:
+                self._cache.clear()
             return result.rowcount or 0
         
         return 0
\ No newline at end of file
@@ -33,6 +33,9 @@ def create_bookmark_store(config: dict):
     
     Now supports all database backends through the unified adapter system.
     """
+    # Optional in-process cache of processed paths
+    cache_enabled = bool(config.get("bookmark_cache", False))
+
     # Check if we should use the new common store
     persistence_config = config.get("persistence", {})
     
@@ -50,7 +53,7 @@ def create_bookmark_store(config: dict):
                 logger = logging.getLogger(__name__)
                 logger.warning(f"⚠️ Slow bookmark store connection: {elapsed:.2f}s")
             
-            return CommonBookmarkStore(connection, dialect)
+            return CommonBookmarkStore(connection, dialect, cache=cache_enabled)
         except Exception as e:
             elapsed = time.time() - start_time
             # Get database type from either persistence.type or persistence.database.type
@@ -97,7 +100,7 @@ def create_bookmark_store(config: dict):
         from pulsepipe.persistence.database.sqlite_impl import SQLiteConnection, SQLiteDialect
         connection = SQLiteConnection(db_path)
         dialect = SQLiteDialect()
-        return CommonBookmarkStore(connection, dialect)
+        return CommonBookmarkStore(connection, dialect, cache=cache_enabled)
 
     elif store_type == "postgres" or store_type == "postgresql":
         # Now supported through the common store with enhanced diagnostics
@@ -112,7 +115,7 @@ def create_bookmark_store(config: dict):
                 logger = logging.getLogger(__name__)
                 logger.warning(f"⚠️ Slow PostgreSQL bookmark store connection: {elapsed:.2f}s")
             
-            return CommonBookmarkStore(connection, dialect)
+            return CommonBookmarkStore(connection, dialect, cache=cache_enabled)
         except Exception as e:
             elapsed = time.time() - start_time
             
@@ -156,7 +159,7 @@ def create_bookmark_store(config: dict):
                 logger = logging.getLogger(__name__)
                 logger.warning(f"⚠️ Slow MongoDB bookmark store connection: {elapsed:.2f}s")
             
-            return CommonBookmarkStore(connection, dialect)
+            return CommonBookmarkStore(connection, dialect, cache=cache_enabled)
         except Exception as e:
             elapsed = time.time() - start_time
             
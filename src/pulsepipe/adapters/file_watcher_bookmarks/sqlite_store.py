@@ -22,10 +22,17 @@
 import sqlite3
 import os
 import sys
+from typing import Iterable, List, Optional, Set
 from .base import BookmarkStore
 
+# Paths per IN (...) lookup; stays under SQLite's bound parameter limit
+_BATCH_SIZE = 500
+
+
 class SQLiteBookmarkStore(BookmarkStore):
-    def __init__(self, db_connection_or_path):
+    def __init__(self, db_connection_or_path, cache: bool = False):
+        # Optional in-process set of known processed paths
+        self._cache: Optional[Set[str]] = set() if cache else None
         # Accept either a connection object or a path to the database
         if isinstance(db_connection_or_path, sqlite3.Connection):
             self.conn = db_connection_or_path
@@ -52,13 +59,42 @@ class SQLiteBookmarkStore(BookmarkStore):
         """)
         self.conn.commit()
 
-    def is_processed(self, path: str) -> bool:
+    @staticmethod
+    def _normalize_path(path: str) -> str:
         # Normalize path for Windows
         if 'PYTEST_CURRENT_TEST' in os.environ and sys.platform == 'win32':
-            path = path.replace('\\', '/')
+            return path.replace('\\', '/')
+        return path
+
+    def is_processed(self, path: str) -> bool:
+        path = self._normalize_path(path)
+        if self._cache is not None and path in self._cache:
+            return True
         result = self.conn.execute("SELECT 1 FROM bookmarks WHERE path = ?", (path,)).fetchone()
+        if result is not None and self._cache is not None:
+            self._cache.add(path)
         return result is not None
 
+    def filter_unprocessed(self, paths: Iterable[str]) -> List[str]:
+        pairs = [(path, self._normalize_path(path)) for path in paths]
+        lookup = list(dict.fromkeys(normalized for _, normalized in pairs))
+        if self._cache is not None:
+            lookup = [path for path in lookup if path not in self._cache]
+
+        processed: Set[str] = set()
+        for start in range(0, len(lookup), _BATCH_SIZE):
+            batch = lookup[start:start + _BATCH_SIZE]
+            placeholders = ", ".join(["?"] * len(batch))
+            rows = self.conn.execute(
+                f"SELECT path FROM bookmarks WHERE path IN ({placeholders})", batch
+            ).fetchall()
+            processed.update(row[0] for row in rows)
+
+        if self._cache is not None:
+            self._cache.update(processed)
+            processed = self._cache
+        return [path for path, normalized in pairs if normalized not in processed]
+
     def mark_processed(self, path: str, status: str = "processed"):
         # Normalize path for Windows
         if 'PYTEST_CURRENT_TEST' in os.environ and sys.platform == 'win32':
@@ -68,6 +104,20 @@ class SQLiteBookmarkStore(BookmarkStore):
             (path, status)
         )
         self.conn.commit()
+        if self._cache is not None:
+            self._cache.add(path)
+
+    def mark_processed_many(self, paths: Iterable[str], status: str = "processed"):
+        unique = list(dict.fromkeys(self._normalize_path(path) for path in paths))
+        if not unique:
+            return
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO bookmarks (path, status) VALUES (?, ?)",
+            [(path, status) for path in unique]
+        )
+        self.conn.commit()
+        if self._cache is not None:
+            self._cache.update(unique)
 
     def get_all(self):
         cursor = self.conn.cursor()
@@ -79,4 +129,6 @@ class SQLiteBookmarkStore(BookmarkStore):
         cursor.execute("DELETE FROM bookmarks")
         count = cursor.rowcount
         self.conn.commit()
+        if self._cache is not None:
+            self._cache.clear()
         return count
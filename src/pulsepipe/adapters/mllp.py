@@ -0,0 +1,244 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/adapters/mllp.py
+
+"""
+MLLP (Minimal Lower Layer Protocol) listener for HL7v2 feeds.
+
+Interface engines send each HL7 message framed as ``<VT> message <FS><CR>``
+and wait for an ACK on the same connection. ``MLLPAdapter`` accepts those
+connections with ``asyncio.start_server``, puts every message on the
+ingestion queue and answers with an ACK once the message has been parsed
+(``ack_mode: parse``) or as soon as it is queued (``ack_mode: enqueue``).
+
+In parse mode a message that is not parsed within ``ack_timeout`` is answered
+with AE and withdrawn: the ingestion engine drops it instead of ingesting it,
+so the sender's retransmission is the only copy that reaches the pipeline.
+
+A connection handles one message at a time, so when the ingestion queue is
+full the adapter stops reading from the socket and TCP flow control pushes
+back on the sender.
+"""
+
+import asyncio
+import uuid
+from datetime import datetime
+from typing import Any, Optional, Set
+
+from .base import Adapter
+from pulsepipe.utils.log_factory import LogFactory
+from pulsepipe.utils.errors import MLLPError
+
+START_BLOCK = b"\x0b"
+END_BLOCK = b"\x1c\x0d"
+
+ACK_MODES = ("parse", "enqueue")
+
+
+def frame(message: str, encoding: str = "utf-8") -> bytes:
+    """Wrap an HL7 message in MLLP start and end blocks."""
+    return START_BLOCK + message.encode(encoding) + END_BLOCK
+
+
+def build_ack(message: str, code: str, text: Optional[str] = None) -> str:
+    """
+    Build an HL7 ACK for a received message.
+
+    Sender and receiver from the original MSH are swapped and MSA-2 echoes
+    its control id. Messages without a usable MSH get a minimal ACK.
+    """
+    first = message.lstrip("\r\n").split("\r", 1)[0].split("\n", 1)[0]
+    sep = first[3] if first.startswith("MSH") and len(first) > 3 else "|"
+    fields = first.split(sep) if first.startswith("MSH") else ["MSH", "^~\\&"]
+    fields += [""] * (12 - len(fields))
+
+    comp_sep = fields[1][:1] or "^"
+    message_type = fields[8].split(comp_sep)
+    trigger = message_type[1] if len(message_type) > 1 else ""
+    msh = sep.join([
+        "MSH", fields[1] or "^~\\&",
+        fields[4], fields[5], fields[2], fields[3],
+        datetime.now().strftime("%Y%m%d%H%M%S"), "",
+        f"ACK{comp_sep}{trigger}" if trigger else "ACK",
+        uuid.uuid4().hex[:20],
+        fields[10] or "P",
+        fields[11] or "2.5",
+    ])
+    msa = ["MSA", code, fields[9]]
+    if text:
+        msa.append(text.replace(sep, " ").replace("\r", " ")[:80])
+    return msh + "\r" + sep.join(msa)
+
+
+class MLLPMessage(str):
+    """
+    HL7 text received over MLLP.
+
+    Behaves as a plain string for ingesters. The ingestion engine reports the
+    parse outcome through ``acknowledge`` so the adapter can send AA or AE,
+    and drops the message if the adapter has ``withdraw``-n it.
+    """
+
+    def __new__(cls, text: str, ack: Optional[asyncio.Future] = None):
+        obj = super().__new__(cls, text)
+        obj.ack = ack
+        return obj
+
+    def acknowledge(self, result: Any = None, error: Optional[BaseException] = None) -> None:
+        if self.ack is None or self.ack.done():
+            return
+        if error is not None:
+            self.ack.set_result(str(error) or type(error).__name__)
+        elif isinstance(result, list) and not result:
+            self.ack.set_result("No message could be parsed")
+        else:
+            self.ack.set_result(None)
+
+    def withdraw(self) -> None:
+        """Mark the message as refused; the sender was sent AE and will retransmit."""
+        if self.ack is not None:
+            self.ack.cancel()
+
+    @property
+    def withdrawn(self) -> bool:
+        return self.ack is not None and self.ack.cancelled()
+
+
+class MLLPAdapter(Adapter):
+    """
+    TCP listener that receives MLLP-framed HL7v2 messages.
+
+    Configuration::
+
+        adapter:
+          type: mllp
+          host: 0.0.0.0
+          port: 2575
+          ack_mode: parse          # parse | enqueue
+          ack_timeout: 30          # seconds to wait for a parse before AE
+          max_message_bytes: 1048576
+    """
+
+    def __init__(self, config: dict):
+        self.logger = LogFactory.get_logger(__name__)
+        self.logger.info("📁 Initializing MLLPAdapter")
+        self._stop_event = asyncio.Event()
+        self._connections: Set[asyncio.StreamWriter] = set()
+
+        self.host = config.get("host", "127.0.0.1")
+        self.port = int(config.get("port", 2575))
+        self.encoding = config.get("encoding", "utf-8")
+        self.ack_timeout = float(config.get("ack_timeout", 30.0))
+        self.max_message_bytes = int(config.get("max_message_bytes", 1024 * 1024))
+        self.ack_mode = str(config.get("ack_mode", "parse")).lower()
+        if self.ack_mode not in ACK_MODES:
+            raise MLLPError(
+                f"Invalid ack_mode: {self.ack_mode}",
+                details={"valid_modes": list(ACK_MODES)}
+            )
+
+        # Set once the server is listening; useful with port 0
+        self.bound_port: Optional[int] = None
+        self.listening = asyncio.Event()
+
+    async def run(self, queue: asyncio.Queue):
+        self._stop_event.clear()
+        try:
+            server = await asyncio.start_server(
+                lambda reader, writer: self._handle_connection(queue, reader, writer),
+                self.host, self.port, limit=self.max_message_bytes,
+            )
+        except OSError as e:
+            raise MLLPError(
+                f"Cannot listen on {self.host}:{self.port}",
+                details={"host": self.host, "port": self.port},
+                cause=e
+            ) from e
+
+        self.bound_port = server.sockets[0].getsockname()[1]
+        self.logger.info(f"📡 MLLP listening on {self.host}:{self.bound_port}")
+        self.listening.set()
+        try:
+            async with server:
+                await self._stop_event.wait()
+        finally:
+            self.listening.clear()
+            for writer in list(self._connections):
+                writer.close()
+            self.logger.info("🛑 MLLP listener closed")
+
+    async def stop(self):
+        self.logger.info("🛑 Stop event set on MLLPAdapter")
+        self._stop_event.set()
+
+    async def _handle_connection(self, queue: asyncio.Queue, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        peer = writer.get_extra_info("peername")
+        self.logger.info(f"🔌 MLLP connection from {peer}")
+        self._connections.add(writer)
+        try:
+            while not self._stop_event.is_set():
+                try:
+                    block = await reader.readuntil(END_BLOCK)
+                except asyncio.IncompleteReadError:
+                    break  # peer closed the connection
+                except asyncio.LimitOverrunError:
+                    self.logger.error(f"❌ MLLP message from {peer} exceeds {self.max_message_bytes} bytes")
+                    writer.write(frame(build_ack("", "AE", "Message too large"), self.encoding))
+                    await writer.drain()
+                    break
+
+                start = block.find(START_BLOCK)
+                if start < 0:
+                    self.logger.warning(f"⚠️ Discarding MLLP block without start byte from {peer}")
+                    continue
+                message = block[start + 1:-len(END_BLOCK)].decode(self.encoding, errors="replace")
+
+                ack = await self._ingest(queue, message)
+                writer.write(frame(ack, self.encoding))
+                await writer.drain()
+        except ConnectionError as e:
+            self.logger.warning(f"⚠️ MLLP connection from {peer} dropped: {e}")
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _ingest(self, queue: asyncio.Queue, message: str) -> str:
+        """Queue a message and return the ACK to send back."""
+        ack = asyncio.get_running_loop().create_future() if self.ack_mode == "parse" else None
+        queued = MLLPMessage(message, ack)
+        # Blocks while the queue is full, which stops reads from this socket
+        await queue.put(queued)
+        if ack is None:
+            return build_ack(message, "AA")
+
+        try:
+            error = await asyncio.wait_for(ack, timeout=self.ack_timeout)
+        except asyncio.TimeoutError:
+            # The sender retransmits after an AE, so this copy must not be ingested too
+            self.logger.warning("⚠️ Timed out waiting for MLLP message to be parsed, withdrawing it")
+            queued.withdraw()
+            return build_ack(message, "AE", "Timed out waiting for ingestion")
+        if error:
+            return build_ack(message, "AE", error)
+        return build_ack(message, "AA")
@@ -29,13 +29,13 @@ correlation IDs, and integration with the persistence layer.
 """
 
 import uuid
-import json
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from enum import Enum
 from dataclasses import dataclass, asdict
 from contextlib import contextmanager
 
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.config.data_intelligence_config import DataIntelligenceConfig
 from pulsepipe.persistence import TrackingRepository, ProcessingStatus, ErrorCategory
@@ -101,13 +101,9 @@ class AuditEvent:
         """Convert to dictionary for JSON serialization."""
         return asdict(self)
     
-    def to_json(self) -> str:
+    def to_json(self, pretty: bool = False) -> str:
         """Convert to JSON string."""
-        data = self.to_dict()
-        # Convert datetime to ISO string
-        if data['timestamp']:
-            data['timestamp'] = data['timestamp'].isoformat()
-        return json.dumps(data, indent=2)
+        return json_codec.dumps(self.to_dict(), pretty=pretty)
 
 
 class AuditLogger:
@@ -499,7 +495,7 @@ class AuditLogger:
         logger.debug(f"Audit event buffer flushed for pipeline: {self.pipeline_run_id}")
     
     def export_events(self, file_path: str, event_type: Optional[EventType] = None,
-                     format: str = "json") -> None:
+                     format: str = "json", pretty: bool = False) -> None:
         """
         Export events to file.
         
@@ -507,6 +503,7 @@ class AuditLogger:
             file_path: Path to export file
             event_type: Optional event type filter
             format: Export format (json, csv)
+            pretty: Whether to indent JSON output
         """
         events = self.get_events(event_type)
         
@@ -526,7 +523,7 @@ class AuditLogger:
         
         if format.lower() == "json":
             with open(file_path, 'w') as f:
-                json.dump([event.to_dict() for event in events], f, indent=2, default=str)
+                json_codec.dump([event.to_dict() for event in events], f, pretty=pretty)
         elif format.lower() == "csv":
             import csv
             with open(file_path, 'w', newline='') as f:
@@ -28,7 +28,6 @@ Provides report generation capabilities for processing statistics,
 error analysis, and operational insights.
 """
 
-import json
 import csv
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Union
@@ -36,6 +35,7 @@ from dataclasses import dataclass, asdict
 from pathlib import Path
 
 from pulsepipe.persistence import TrackingRepository, PipelineRunSummary
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.log_factory import LogFactory
 
 logger = LogFactory.get_logger(__name__)
@@ -126,9 +126,9 @@ class AuditReport:
         """Convert to dictionary for serialization."""
         return asdict(self)
     
-    def to_json(self) -> str:
+    def to_json(self, pretty: bool = False) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2, default=str)
+        return json_codec.dumps(self.to_dict(), pretty=pretty)
 
 
 class AuditReporter:
@@ -351,7 +351,8 @@ class AuditReporter:
         logger.info(f"Generated failure report: {report.report_id}")
         return report
     
-    def export_report(self, report: AuditReport, file_path: str, format: str = "json") -> None:
+    def export_report(self, report: AuditReport, file_path: str, format: str = "json",
+                      pretty: bool = False) -> None:
         """
         Export audit report to file.
         
@@ -359,6 +360,7 @@ class AuditReporter:
             report: AuditReport to export
             file_path: Path to export file
             format: Export format (json, csv, html)
+            pretty: Whether to indent JSON output
         """
         import os
         import sys
@@ -381,7 +383,7 @@ class AuditReporter:
         
         if format.lower() == "json":
             with open(output_path, 'w') as f:
-                f.write(report.to_json())
+                f.write(report.to_json(pretty=pretty))
         
         elif format.lower() == "csv":
             self._export_csv(report, output_path)
@@ -28,7 +28,6 @@ Provides comprehensive tracking of chunking operations with detailed metrics
 and export capabilities for analysis.
 """
 
-import json
 import csv
 import time
 from datetime import datetime, timedelta
@@ -38,6 +37,7 @@ from pathlib import Path
 from enum import Enum
 from contextlib import contextmanager
 
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.persistence import TrackingRepository, ProcessingStatus, ErrorCategory, ChunkingStat
 from pulsepipe.config.data_intelligence_config import DataIntelligenceConfig
@@ -754,7 +754,7 @@ class ChunkingTracker:
         return ChunkingSummary.from_batches(self.pipeline_run_id, all_batches)
     
     def export_metrics(self, file_path: str, format: str = "json", 
-                      include_details: bool = False) -> None:
+                      include_details: bool = False, pretty: bool = False) -> None:
         """
         Export chunking metrics to file.
         
@@ -762,6 +762,7 @@ class ChunkingTracker:
             file_path: Path to export file
             format: Export format (json, csv)
             include_details: Whether to include detailed record information
+            pretty: Whether to indent JSON output
         """
         if not self.enabled:
             logger.warning("Chunking tracking is disabled, no metrics to export")
@@ -785,7 +786,7 @@ class ChunkingTracker:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         if format.lower() == "json":
-            self._export_json(summary, output_path, include_details)
+            self._export_json(summary, output_path, include_details, pretty)
         elif format.lower() == "csv":
             self._export_csv(summary, output_path, include_details)
         else:
@@ -794,7 +795,7 @@ class ChunkingTracker:
         logger.info(f"Exported chunking metrics to: {file_path}")
     
     def _export_json(self, summary: ChunkingSummary, file_path: Path, 
-                    include_details: bool) -> None:
+                    include_details: bool, pretty: bool = False) -> None:
         """Export metrics to JSON format."""
         export_data = {
             "summary": summary.to_dict(),
@@ -811,7 +812,7 @@ class ChunkingTracker:
                 }
         
         with open(file_path, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+            json_codec.dump(export_data, f, pretty=pretty)
     
     def _export_csv(self, summary: ChunkingSummary, file_path: Path, 
                    include_details: bool) -> None:
@@ -28,7 +28,6 @@ Provides comprehensive tracking of de-identification operations with detailed me
 and export capabilities for analysis.
 """
 
-import json
 import csv
 import time
 from datetime import datetime, timedelta
@@ -38,6 +37,7 @@ from pathlib import Path
 from enum import Enum
 from contextlib import contextmanager
 
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.persistence import TrackingRepository, ProcessingStatus, ErrorCategory, DeidStat
 from pulsepipe.config.data_intelligence_config import DataIntelligenceConfig
@@ -116,6 +116,7 @@ class DeidBatchMetrics:
     errors_by_stage: Dict[str, int] = field(default_factory=dict)
     deid_methods: List[str] = field(default_factory=list)
     content_types: List[str] = field(default_factory=list)
+    prefilter_counts: Dict[str, int] = field(default_factory=dict)  # PHI prefilter verdicts (skip/regex/ner)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
     def calculate_metrics(self) -> None:
@@ -174,6 +175,7 @@ class DeidSummary:
     performance_trends: List[Dict[str, Any]] = field(default_factory=list)
     deid_methods: List[str] = field(default_factory=list)
     content_types: List[str] = field(default_factory=list)
+    prefilter_counts: Dict[str, int] = field(default_factory=dict)
     recommendations: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     
@@ -229,6 +231,10 @@ class DeidSummary:
             for content_type in batch.content_types:
                 if content_type not in summary.content_types:
                     summary.content_types.append(content_type)
+            
+            # Aggregate PHI prefilter verdicts
+            for verdict, count in batch.prefilter_counts.items():
+                summary.prefilter_counts[verdict] = summary.prefilter_counts.get(verdict, 0) + count
         
         # Calculate derived metrics
         if summary.total_records > 0:
@@ -609,6 +615,24 @@ class DeidTracker:
         if self.auto_persist and self.repository:
             self._persist_record(record)
     
+    def record_prefilter(self, counts: Dict[str, int]) -> None:
+        """
+        Record PHI prefilter verdicts for text fields.
+        
+        Args:
+            counts: Number of fields per verdict (skip, regex, ner)
+        """
+        if not self.enabled:
+            return
+        
+        if not self.current_batch:
+            # Create a default batch if none exists
+            self.start_batch(f"auto_batch_{int(time.time())}")
+        
+        batch_counts = self.current_batch.prefilter_counts
+        for verdict, count in counts.items():
+            batch_counts[verdict] = batch_counts.get(verdict, 0) + count
+    
     def _add_record(self, record: DeidRecord) -> None:
         """Add record to current batch and update metrics."""
         if not self.current_batch:
@@ -731,6 +755,7 @@ class DeidTracker:
             "total_phi_detected": batch.total_phi_detected,
             "total_phi_removed": batch.total_phi_removed,
             "success_rate": success_rate,
+            "prefilter_counts": dict(batch.prefilter_counts),
             "duration_seconds": (datetime.now() - batch.started_at).total_seconds()
         }
     
@@ -757,7 +782,8 @@ class DeidTracker:
                 errors_by_category=self.current_batch.errors_by_category.copy(),
                 errors_by_stage=self.current_batch.errors_by_stage.copy(),
                 deid_methods=self.current_batch.deid_methods.copy(),
-                content_types=self.current_batch.content_types.copy()
+                content_types=self.current_batch.content_types.copy(),
+                prefilter_counts=self.current_batch.prefilter_counts.copy()
             )
             temp_batch.calculate_metrics()
             all_batches.append(temp_batch)
@@ -765,7 +791,7 @@ class DeidTracker:
         return DeidSummary.from_batches(self.pipeline_run_id, all_batches)
     
     def export_metrics(self, file_path: str, format: str = "json", 
-                      include_details: bool = False) -> None:
+                      include_details: bool = False, pretty: bool = False) -> None:
         """
         Export de-identification metrics to file.
         
@@ -773,6 +799,7 @@ class DeidTracker:
             file_path: Path to export file
             format: Export format (json, csv)
             include_details: Whether to include detailed record information
+            pretty: Whether to indent JSON output
         """
         if not self.enabled:
             logger.warning("De-identification tracking is disabled, no metrics to export")
@@ -796,7 +823,7 @@ class DeidTracker:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         if format.lower() == "json":
-            self._export_json(summary, output_path, include_details)
+            self._export_json(summary, output_path, include_details, pretty)
         elif format.lower() == "csv":
             self._export_csv(summary, output_path, include_details)
         else:
@@ -805,7 +832,7 @@ class DeidTracker:
         logger.info(f"Exported de-identification metrics to: {file_path}")
     
     def _export_json(self, summary: DeidSummary, file_path: Path, 
-                    include_details: bool) -> None:
+                    include_details: bool, pretty: bool = False) -> None:
         """Export metrics to JSON format."""
         export_data = {
             "summary": summary.to_dict(),
@@ -823,7 +850,7 @@ class DeidTracker:
                 }
         
         with open(file_path, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+            json_codec.dump(export_data, f, pretty=pretty)
     
     def _export_csv(self, summary: DeidSummary, file_path: Path, 
                    include_details: bool) -> None:
@@ -28,7 +28,6 @@ Provides comprehensive tracking of embedding operations with detailed metrics
 and export capabilities for analysis.
 """
 
-import json
 import csv
 import time
 from datetime import datetime, timedelta
@@ -38,6 +37,7 @@ from pathlib import Path
 from enum import Enum
 from contextlib import contextmanager
 
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.persistence import TrackingRepository, ProcessingStatus, ErrorCategory, EmbeddingStat
 from pulsepipe.config.data_intelligence_config import DataIntelligenceConfig
@@ -103,6 +103,8 @@ class EmbeddingBatchMetrics:
     total_processing_time_ms: int = 0
     total_chunks_embedded: int = 0
     total_vectors_generated: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
     avg_processing_time_ms: float = 0.0
     records_per_second: float = 0.0
     chunks_per_second: float = 0.0
@@ -160,6 +162,9 @@ class EmbeddingSummary:
     total_processing_time_ms: int = 0
     total_chunks_embedded: int = 0
     total_vectors_generated: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_hit_rate: float = 0.0
     records_per_second: float = 0.0
     chunks_per_second: float = 0.0
     vectors_per_second: float = 0.0
@@ -205,6 +210,8 @@ class EmbeddingSummary:
             summary.total_processing_time_ms += batch.total_processing_time_ms
             summary.total_chunks_embedded += batch.total_chunks_embedded
             summary.total_vectors_generated += batch.total_vectors_generated
+            summary.cache_hits += batch.cache_hits
+            summary.cache_misses += batch.cache_misses
             
             if batch.avg_embedding_dimensions > 0:
                 embedding_dimensions.append(batch.avg_embedding_dimensions)
@@ -234,6 +241,10 @@ class EmbeddingSummary:
             summary.avg_processing_time_ms = summary.total_processing_time_ms / summary.total_records
             summary.avg_chunks_per_record = summary.total_chunks_embedded / summary.total_records
         
+        cache_lookups = summary.cache_hits + summary.cache_misses
+        if cache_lookups > 0:
+            summary.cache_hit_rate = (summary.cache_hits / cache_lookups) * 100
+        
         if embedding_dimensions:
             summary.avg_embedding_dimensions = sum(embedding_dimensions) / len(embedding_dimensions)
         
@@ -602,6 +613,23 @@ class EmbeddingTracker:
         if self.auto_persist and self.repository:
             self._persist_record(record)
     
+    def record_cache_stats(self, hits: int, misses: int) -> None:
+        """
+        Record embedding cache lookups for the current batch.
+        
+        Args:
+            hits: Number of chunks served from the embedding cache
+            misses: Number of chunks that had to be embedded by the model
+        """
+        if not self.enabled:
+            return
+        
+        if not self.current_batch:
+            self.start_batch(f"auto_batch_{int(time.time())}")
+        
+        self.current_batch.cache_hits += hits
+        self.current_batch.cache_misses += misses
+    
     def _add_record(self, record: EmbeddingRecord) -> None:
         """Add record to current batch and update metrics."""
         if not self.current_batch:
@@ -721,6 +749,8 @@ class EmbeddingTracker:
             "skipped_records": batch.skipped_records,
             "total_chunks_embedded": batch.total_chunks_embedded,
             "total_vectors_generated": batch.total_vectors_generated,
+            "cache_hits": batch.cache_hits,
+            "cache_misses": batch.cache_misses,
             "success_rate": success_rate,
             "duration_seconds": (datetime.now() - batch.started_at).total_seconds()
         }
@@ -745,6 +775,8 @@ class EmbeddingTracker:
                 total_processing_time_ms=self.current_batch.total_processing_time_ms,
                 total_chunks_embedded=self.current_batch.total_chunks_embedded,
                 total_vectors_generated=self.current_batch.total_vectors_generated,
+                cache_hits=self.current_batch.cache_hits,
+                cache_misses=self.current_batch.cache_misses,
                 errors_by_category=self.current_batch.errors_by_category.copy(),
                 errors_by_stage=self.current_batch.errors_by_stage.copy(),
                 model_names=self.current_batch.model_names.copy(),
@@ -756,7 +788,7 @@ class EmbeddingTracker:
         return EmbeddingSummary.from_batches(self.pipeline_run_id, all_batches)
     
     def export_metrics(self, file_path: str, format: str = "json", 
-                      include_details: bool = False) -> None:
+                      include_details: bool = False, pretty: bool = False) -> None:
         """
         Export embedding metrics to file.
         
@@ -764,6 +796,7 @@ class EmbeddingTracker:
             file_path: Path to export file
             format: Export format (json, csv)
             include_details: Whether to include detailed record information
+            pretty: Whether to indent JSON output
         """
         if not self.enabled:
             logger.warning("Embedding tracking is disabled, no metrics to export")
@@ -787,7 +820,7 @@ class EmbeddingTracker:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         if format.lower() == "json":
-            self._export_json(summary, output_path, include_details)
+            self._export_json(summary, output_path, include_details, pretty)
         elif format.lower() == "csv":
             self._export_csv(summary, output_path, include_details)
         else:
@@ -796,7 +829,7 @@ class EmbeddingTracker:
         logger.info(f"Exported embedding metrics to: {file_path}")
     
     def _export_json(self, summary: EmbeddingSummary, file_path: Path, 
-                    include_details: bool) -> None:
+                    include_details: bool, pretty: bool = False) -> None:
         """Export metrics to JSON format."""
         export_data = {
             "summary": summary.to_dict(),
@@ -814,7 +847,7 @@ class EmbeddingTracker:
                 }
         
         with open(file_path, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+            json_codec.dump(export_data, f, pretty=pretty)
     
     def _export_csv(self, summary: EmbeddingSummary, file_path: Path, 
                    include_details: bool) -> None:
@@ -842,6 +875,9 @@ class EmbeddingTracker:
             writer.writerow(["Avg Embedding Dimensions", f"{summary.avg_embedding_dimensions:.0f}"])
             writer.writerow(["Chunks Per Second", f"{summary.chunks_per_second:.2f}"])
             writer.writerow(["Vectors Per Second", f"{summary.vectors_per_second:.2f}"])
+            writer.writerow(["Cache Hits", summary.cache_hits])
+            writer.writerow(["Cache Misses", summary.cache_misses])
+            writer.writerow(["Cache Hit Rate (%)", f"{summary.cache_hit_rate:.2f}"])
             writer.writerow([])
             
             # Write error breakdown
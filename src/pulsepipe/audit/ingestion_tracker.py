@@ -28,7 +28,6 @@ Provides comprehensive tracking of ingestion operations with detailed metrics
 and export capabilities for analysis.
 """
 
-import json
 import csv
 import time
 from datetime import datetime, timedelta
@@ -38,6 +37,7 @@ from pathlib import Path
 from enum import Enum
 from contextlib import contextmanager
 
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.persistence import TrackingRepository, ProcessingStatus, ErrorCategory, IngestionStat
 from pulsepipe.config.data_intelligence_config import DataIntelligenceConfig
@@ -692,7 +692,7 @@ class IngestionTracker:
         return IngestionSummary.from_batches(self.pipeline_run_id, all_batches)
     
     def export_metrics(self, file_path: str, format: str = "json", 
-                      include_details: bool = False) -> None:
+                      include_details: bool = False, pretty: bool = False) -> None:
         """
         Export ingestion metrics to file.
         
@@ -700,6 +700,7 @@ class IngestionTracker:
             file_path: Path to export file
             format: Export format (json, csv)
             include_details: Whether to include detailed record information
+            pretty: Whether to indent JSON output
         """
         if not self.enabled:
             logger.warning("Ingestion tracking is disabled, no metrics to export")
@@ -723,7 +724,7 @@ class IngestionTracker:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         if format.lower() == "json":
-            self._export_json(summary, output_path, include_details)
+            self._export_json(summary, output_path, include_details, pretty)
         elif format.lower() == "csv":
             self._export_csv(summary, output_path, include_details)
         else:
@@ -732,7 +733,7 @@ class IngestionTracker:
         logger.info(f"Exported ingestion metrics to: {file_path}")
     
     def _export_json(self, summary: IngestionSummary, file_path: Path, 
-                    include_details: bool) -> None:
+                    include_details: bool, pretty: bool = False) -> None:
         """Export metrics to JSON format."""
         export_data = {
             "summary": summary.to_dict(),
@@ -751,7 +752,7 @@ class IngestionTracker:
                 }
         
         with open(file_path, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+            json_codec.dump(export_data, f, pretty=pretty)
     
     def _export_csv(self, summary: IngestionSummary, file_path: Path, 
                    include_details: bool) -> None:
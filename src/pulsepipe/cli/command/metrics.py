@@ -167,7 +167,7 @@ def analyze(pipeline_run_id: Optional[str], days: int, format: str):
             )
         
         if format == 'json':
-            click.echo(report.to_json())
+            click.echo(report.to_json(pretty=True))
         else:
             # Display table format
             _display_metrics_table(report)
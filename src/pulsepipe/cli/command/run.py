@@ -22,7 +22,7 @@
 # src/pulsepipe/cli/command/run.py
 
 """
-Run command implementation for single pipeline execution.
+Run command implementation for single and multi-pipeline execution.
 """
 
 import os
@@ -79,9 +79,10 @@ def run_async_with_shutdown(coro, runner=None):
     async def shutdown_procedure():
         """Gracefully shut down all running pipelines"""
         if runner:
-            print("\n🛑 Stopping running pipeline...")
-            # For the single pipeline version, we don't need to stop multiple pipelines
-            print("✅ Pipeline stopped")
+            print("\n🛑 Stopping running pipelines...")
+            # Reaches every pipeline started by this runner, including run --all
+            await runner.stop()
+            print("✅ Pipelines stopped")
     
     def signal_handler(signum, frame):
         nonlocal is_shutting_down
@@ -179,6 +180,30 @@ def display_error(error: PulsePipeError, verbose: bool = False):
         click.echo("  • Verify that the data model is compatible with the chunker")
 
 
+def supplement_from_main_config(config: Dict[str, Any], main_config_path: str = "./pulsepipe.yaml") -> None:
+    """Fill in data_intelligence and persistence sections missing from a pipeline config."""
+    missing_intelligence = "data_intelligence" not in config
+    missing_persistence = "persistence" not in config
+    
+    if not (missing_intelligence or missing_persistence) or not os.path.exists(main_config_path):
+        return
+    
+    try:
+        main_config = load_config(main_config_path)
+        
+        # Only merge sections that are missing from the pipeline config
+        if missing_intelligence and "data_intelligence" in main_config:
+            config["data_intelligence"] = main_config["data_intelligence"]
+            logger.info(f"Added data_intelligence config from {main_config_path}")
+        
+        if missing_persistence and "persistence" in main_config:
+            config["persistence"] = main_config["persistence"] 
+            logger.info(f"Added persistence config from {main_config_path}")
+            
+    except Exception as e:
+        logger.debug(f"Could not load main config from {main_config_path}: {e}")
+
+
 def find_profile_path(profile_name: str) -> Optional[str]:
     """Find the profile configuration file in the appropriate directories."""
     # Define possible locations in priority order
@@ -220,6 +245,11 @@ def find_profile_path(profile_name: str) -> Optional[str]:
 @click.option('--embedding', '-e', type=click.Path(exists=True, dir_okay=False), help="Embedding config YAML")
 @click.option('--vectorstore', '-vs', type=click.Path(exists=True, dir_okay=False), help="Vector store config YAML")
 @click.option('--profile', '-p', type=str, help="Profile name to use (e.g., new_profile)")
+@click.option('--all', 'run_all', is_flag=True, help="Run every active pipeline in pipeline.yaml concurrently")
+@click.option('--pipelines-file', type=click.Path(exists=True, dir_okay=False),
+              help="Pipelines file for --all (defaults to pipeline.yaml)")
+@click.option('--max-concurrency', type=click.IntRange(min=1), default=None,
+              help="Maximum items processed at once across all pipelines with --all")
 @click.option('--timeout', type=float, default=None, help="Timeout for pipeline execution in seconds")
 @click.option('--continuous/--one-time', 'continuous_mode', default=None)
 @click.option('--concurrent', '-cc', is_flag=True, help="Run pipeline stages concurrently")
@@ -227,12 +257,13 @@ def find_profile_path(profile_name: str) -> Optional[str]:
 @click.option('--verbose', '-v', is_flag=True, help="Show detailed error information")
 @output_options
 @click.pass_context
-def run(ctx, adapter, ingester, chunker, embedding, vectorstore, profile, timeout,
-        continuous_mode, concurrent, watch, print_model, 
-        summary, output, pretty, verbose):
+def run(ctx, adapter, ingester, chunker, embedding, vectorstore, profile, run_all,
+        pipelines_file, max_concurrency, timeout, continuous_mode, concurrent, watch,
+        print_model, summary, output, pretty, verbose):
     """Run a data processing pipeline.
     
     Process healthcare data through configurable adapter, ingester, chunker, embedding and vectorstore stages.
+    With --all, every active pipeline in pipeline.yaml runs in this process, sharing loaded models.
     """
     logger = LogFactory.get_logger("cli.run")
     
@@ -241,8 +272,73 @@ def run(ctx, adapter, ingester, chunker, embedding, vectorstore, profile, timeou
     runner = PipelineRunner()
     
     try:
+        # Handle multi-pipeline execution
+        if run_all:
+            pipelines_path = pipelines_file or find_profile_path("pipeline")
+            if not pipelines_path:
+                raise MissingConfigurationError(
+                    "Pipelines file not found: pipeline.yaml",
+                    details={
+                        "searched_locations": [
+                            "./config/", 
+                            "./", 
+                            "src/pulsepipe/config/"
+                        ]
+                    }
+                )
+            
+            try:
+                pipelines = load_config(pipelines_path).get("pipelines") or []
+            except Exception as e:
+                raise ConfigurationError(
+                    f"Failed to load pipelines file: {pipelines_path}",
+                    details={"pipelines_path": pipelines_path},
+                    cause=e
+                )
+            
+            active_pipelines = [p for p in pipelines if p.get("active", True)]
+            if not active_pipelines:
+                raise ConfigurationError(
+                    f"No active pipelines defined in {pipelines_path}",
+                    details={"pipelines_path": pipelines_path}
+                )
+            
+            for pipeline_config in active_pipelines:
+                supplement_from_main_config(pipeline_config)
+                
+                # Apply continuous mode override if specified
+                adapter_config = pipeline_config.get("adapter", {})
+                if continuous_mode is not None and adapter_config.get("type") == "file_watcher":
+                    adapter_config["continuous"] = continuous_mode
+            
+            names = ", ".join(p.get("name", "?") for p in active_pipelines)
+            click.echo(f"📋 Running {len(active_pipelines)} pipelines from {pipelines_path}: {names}")
+            
+            result = run_async_with_shutdown(
+                runner.run_all(
+                    active_pipelines,
+                    max_concurrency=max_concurrency,
+                    output_path=output,
+                    summary=summary,
+                    print_model=print_model,
+                    pretty=pretty,
+                    verbose=verbose,
+                    watch=watch,
+                    timeout=timeout
+                ),
+                runner=runner
+            )
+            
+            for name, pipeline_result in result.get("results", {}).items():
+                status = "✅" if pipeline_result.get("success") else "❌"
+                click.echo(f"{status} {name}")
+            
+            if not result.get("success", False):
+                logger.error(f"Pipeline execution failed: {result.get('errors')}")
+                ctx.exit(1)
+                
         # Handle profile-based execution
-        if profile:
+        elif profile:
             # Find the profile path
             profile_path = find_profile_path(profile)
             
@@ -270,26 +366,7 @@ def run(ctx, adapter, ingester, chunker, embedding, vectorstore, profile, timeou
                 
                 if not is_likely_test:
                     # Check if we need to supplement with main config sections
-                    missing_intelligence = "data_intelligence" not in profile_config
-                    missing_persistence = "persistence" not in profile_config
-                    
-                    if missing_intelligence or missing_persistence:
-                        main_config_path = "./pulsepipe.yaml"
-                        if os.path.exists(main_config_path):
-                            try:
-                                main_config = load_config(main_config_path)
-                                
-                                # Only merge sections that are missing from profile config
-                                if missing_intelligence and "data_intelligence" in main_config:
-                                    profile_config["data_intelligence"] = main_config["data_intelligence"]
-                                    logger.info(f"Added data_intelligence config from {main_config_path}")
-                                
-                                if missing_persistence and "persistence" in main_config:
-                                    profile_config["persistence"] = main_config["persistence"] 
-                                    logger.info(f"Added persistence config from {main_config_path}")
-                                    
-                            except Exception as e:
-                                logger.debug(f"Could not load main config from {main_config_path}: {e}")
+                    supplement_from_main_config(profile_config)
                     
             except Exception as e:
                 raise ConfigurationError(
@@ -467,7 +544,7 @@ def run(ctx, adapter, ingester, chunker, embedding, vectorstore, profile, timeou
         # No configuration provided
         else:
             raise CLIError(
-                "You must specify either --profile, or both --adapter and --ingester",
+                "You must specify either --profile, or both --adapter and --ingester (or --all)",
                 details={
                     "profile": profile,
                     "adapter": adapter,
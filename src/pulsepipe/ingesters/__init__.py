@@ -22,12 +22,14 @@
 # ingesters/__init__.py
 
 from .fhir_ingester import FHIRIngester
+from .fhir_ndjson_ingester import FHIRNDJSONIngester
 from .hl7v2_ingester import HL7v2Ingester
 from .cda_ingester import CDAIngester
 from .plaintext_ingester import PlainTextIngester
 
 __all__ = [
     "FHIRIngester",
+    "FHIRNDJSONIngester",
     "HL7v2Ingester",
     "CDAIngester",
     "PlainTextIngester",
@@ -21,8 +21,10 @@
 
 # src/pulsepipe/ingesters/cda_ingester.py
 
+import io
 import xml.etree.ElementTree as ET
-from typing import List, Union, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Union, Dict, Any, Optional, BinaryIO, TextIO
 from datetime import datetime
 
 from .base import Ingester
@@ -50,7 +52,7 @@ class CDAIngester(Ingester):
         self.parser = CDADocumentParser()
         self.mapper_registry = CDAMapperRegistry()
 
-    def parse(self, raw_data: str) -> Union[PulseClinicalContent, List[PulseClinicalContent]]:
+    def parse(self, raw_data: Union[str, bytes]) -> Union[PulseClinicalContent, List[PulseClinicalContent]]:
         """
         Parse CDA XML data and convert to PulseClinicalContent.
         
@@ -60,6 +62,34 @@ class CDAIngester(Ingester):
         Returns:
             PulseClinicalContent object or list of objects
             
+        Raises:
+            ValidationError: If XML is malformed or required elements are missing
+            SchemaValidationError: If CDA structure doesn't conform to expected format
+        """
+        source = io.BytesIO(raw_data) if isinstance(raw_data, bytes) else io.StringIO(raw_data)
+        return self.parse_stream(source)
+
+    def parse_file(self, path: Union[str, Path]) -> Union[PulseClinicalContent, List[PulseClinicalContent]]:
+        """
+        Parse a CDA document from disk without loading it whole.
+
+        Args:
+            path: Path to a CDA XML file
+
+        Returns:
+            Same result shape as :meth:`parse`
+        """
+        with open(path, "rb") as fp:
+            return self.parse_stream(fp)
+
+    def parse_stream(self, fp: Union[BinaryIO, TextIO]) -> Union[PulseClinicalContent, List[PulseClinicalContent]]:
+        """
+        Parse CDA XML from a file-like object.
+
+        The header is validated as soon as it has been read, then body
+        sections are mapped and released one at a time (see
+        :meth:`CDADocumentParser.iterparse_document`).
+
         Raises:
             ValidationError: If XML is malformed or required elements are missing
             SchemaValidationError: If CDA structure doesn't conform to expected format
@@ -67,19 +97,12 @@ class CDAIngester(Ingester):
         try:
             self.logger.info("🔍 Parsing CDA document")
             
-            # Parse XML
+            # Parse the document structure, validating the header first
             try:
-                root = ET.fromstring(raw_data)
+                parsed_data = self.parser.iterparse_document(fp, validate=self._validate_root)
             except ET.ParseError as e:
                 raise ValidationError(f"Invalid XML: {str(e)}")
             
-            # Validate it's a CDA document
-            if not self._is_cda_document(root):
-                raise SchemaValidationError("Document is not a valid CDA document")
-            
-            # Parse the document structure
-            parsed_data = self.parser.parse_document(root)
-            
             # Convert to clinical content
             clinical_content = self._convert_to_clinical_content(parsed_data)
             
@@ -90,6 +113,11 @@ class CDAIngester(Ingester):
             self.logger.error(f"❌ Error parsing CDA document: {str(e)}")
             raise ValidationError(f"Failed to parse CDA document: {str(e)}")
     
+    def _validate_root(self, root: ET.Element) -> None:
+        """Raise if the document header does not identify a CDA document."""
+        if not self._is_cda_document(root):
+            raise SchemaValidationError("Document is not a valid CDA document")
+
     def _is_cda_document(self, root: ET.Element) -> bool:
         """
         Check if the XML root element represents a valid CDA document.
@@ -113,25 +141,7 @@ class CDAIngester(Ingester):
         """
         Find elements using xpath, handling both namespaced and non-namespaced XML.
         """
-        # First try original xpath
-        elements = root.findall(xpath)
-        
-        # If no elements found and xpath doesn't have namespace, try with namespace
-        if not elements and '{urn:hl7-org:v3}' not in xpath:
-            # Convert xpath to include namespace
-            parts = xpath.split('/')
-            namespaced_parts = []
-            for part in parts:
-                if part == '' or part == '.' or part == '..' or part == '*':
-                    namespaced_parts.append(part)
-                elif part.startswith('@'):
-                    namespaced_parts.append(part)
-                else:
-                    namespaced_parts.append(f'{{{self.parser.namespaces["cda"]}}}{part}')
-            namespaced_xpath = '/'.join(namespaced_parts)
-            elements = root.findall(namespaced_xpath)
-        
-        return elements
+        return self.parser._find_elements(root, xpath)
     
     def _convert_to_clinical_content(self, parsed_data: Dict[str, Any]) -> PulseClinicalContent:
         """
@@ -22,9 +22,20 @@
 # src/pulsepipe/ingesters/cda_utils/document_parser.py
 
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Any, Optional
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, TextIO, Tuple, Union
 from datetime import datetime
 
+# Section templateId -> (result key, parser method name)
+SECTION_TEMPLATES = {
+    '2.16.840.1.113883.10.20.22.2.6.1': ('allergies', '_parse_allergies_section'),
+    '2.16.840.1.113883.10.20.22.2.1.1': ('medications', '_parse_medications_section'),
+    '2.16.840.1.113883.10.20.22.2.5.1': ('problems', '_parse_problems_section'),
+    '2.16.840.1.113883.10.20.22.2.7.1': ('procedures', '_parse_procedures_section'),
+    '2.16.840.1.113883.10.20.22.2.4.1': ('vital_signs', '_parse_vital_signs_section'),
+    '2.16.840.1.113883.10.20.22.2.2.1': ('immunizations', '_parse_immunizations_section'),
+    '2.16.840.1.113883.10.20.22.2.3.1': ('lab_results', '_parse_lab_results_section'),
+}
+
 class CDADocumentParser:
     """
     Parser for CDA document structure that extracts relevant sections
@@ -36,6 +47,13 @@ class CDADocumentParser:
             'cda': 'urn:hl7-org:v3',
             'xsi': 'http://www.w3.org/2001/XMLSchema-instance'
         }
+        self._ns_prefix = f'{{{self.namespaces["cda"]}}}'
+        # Plain path -> namespaced path, built once per parser
+        self._compiled_paths: Dict[str, str] = {}
+        self._section_parsers = {
+            template_id: (key, getattr(self, method))
+            for template_id, (key, method) in SECTION_TEMPLATES.items()
+        }
     
     def parse_document(self, root: ET.Element) -> Dict[str, Any]:
         """
@@ -61,6 +79,72 @@ class CDADocumentParser:
             result.update(self._parse_structured_body(body))
         
         return result
+
+    def iterparse_document(self, source: Union[str, BinaryIO, TextIO],
+                           validate: Optional[Callable[[ET.Element], None]] = None) -> Dict[str, Any]:
+        """
+        Parse a CDA document incrementally with ``ET.iterparse``.
+
+        Each top-level ``structuredBody/component/section`` is parsed as soon
+        as its end tag is read and then cleared, so memory is bounded by the
+        header plus the largest section instead of the whole document.
+
+        Args:
+            source: File path or file-like object containing the CDA XML
+            validate: Optional callback invoked with the root element once the
+                header has been read, before any section is parsed
+
+        Returns:
+            Dictionary containing parsed sections, as :meth:`parse_document`
+
+        Raises:
+            ET.ParseError: If the XML is malformed
+        """
+        sections: Dict[str, Any] = {}
+        stack: List[str] = []
+        root = None
+        body_depth = None
+        body_seen = False
+
+        for event, elem in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                name = self._local_name(elem.tag)
+                if root is None:
+                    root = elem
+                elif validate is not None and len(stack) == 1 and name == 'component':
+                    validate(root)
+                    validate = None
+                if name == 'structuredBody' and not body_seen and stack and stack[-1] == 'component':
+                    body_depth = len(stack)
+                    body_seen = True
+                stack.append(name)
+                continue
+
+            name = stack.pop()
+            if body_depth is None:
+                continue
+            if name == 'section' and len(stack) == body_depth + 2 and stack[-1] == 'component':
+                # Nested subsections are parsed in document order with their parent
+                for section in [elem] + self._find_elements(elem, './/component/section'):
+                    self._parse_section(section, sections)
+                elem.clear()
+            elif name == 'structuredBody' and len(stack) == body_depth:
+                body_depth = None
+
+        if validate is not None:
+            validate(root)
+
+        result = {
+            'patient': self._parse_patient_info(root),
+            'encounters': self._parse_encounter_info(root),
+        }
+        result.update(sections)
+        return result
+
+    @staticmethod
+    def _local_name(tag: str) -> str:
+        """Strip the ``{namespace}`` prefix from an element tag."""
+        return tag.rsplit('}', 1)[-1]
     
     def _parse_patient_info(self, root: ET.Element) -> Dict[str, Any]:
         """Extract patient information from recordTarget section."""
@@ -253,30 +337,20 @@ class CDADocumentParser:
         sections = self._find_elements(body, './/component/section')
         
         for section in sections:
-            # Get template ID to determine section type
-            template_elem = self._find_element(section, './templateId')
-            if template_elem is None:
-                continue
-                
-            template_id = template_elem.get('root', '')
-            
-            # Parse based on section type
-            if template_id == '2.16.840.1.113883.10.20.22.2.6.1':  # Allergies
-                result['allergies'] = self._parse_allergies_section(section)
-            elif template_id == '2.16.840.1.113883.10.20.22.2.1.1':  # Medications
-                result['medications'] = self._parse_medications_section(section)
-            elif template_id == '2.16.840.1.113883.10.20.22.2.5.1':  # Problems
-                result['problems'] = self._parse_problems_section(section)
-            elif template_id == '2.16.840.1.113883.10.20.22.2.7.1':  # Procedures
-                result['procedures'] = self._parse_procedures_section(section)
-            elif template_id == '2.16.840.1.113883.10.20.22.2.4.1':  # Vital Signs
-                result['vital_signs'] = self._parse_vital_signs_section(section)
-            elif template_id == '2.16.840.1.113883.10.20.22.2.2.1':  # Immunizations
-                result['immunizations'] = self._parse_immunizations_section(section)
-            elif template_id == '2.16.840.1.113883.10.20.22.2.3.1':  # Results/Labs
-                result['lab_results'] = self._parse_lab_results_section(section)
+            self._parse_section(section, result)
         
         return result
+
+    def _parse_section(self, section: ET.Element, result: Dict[str, Any]) -> None:
+        """Parse one section into ``result`` based on its templateId."""
+        template_elem = self._find_element(section, './templateId')
+        if template_elem is None:
+            return
+
+        handler = self._section_parsers.get(template_elem.get('root', ''))
+        if handler is not None:
+            key, parse_section = handler
+            result[key] = parse_section(section)
     
     def _parse_allergies_section(self, section: ET.Element) -> List[Dict[str, Any]]:
         """Parse allergies section."""
@@ -561,23 +635,34 @@ class CDADocumentParser:
     
     def _find_element(self, parent: ET.Element, path: str) -> Optional[ET.Element]:
         """Find single element, handling namespaces."""
-        # Try without namespace first
-        element = parent.find(path)
-        if element is None:
-            # Add namespace to each element in the path
-            namespaced_path = self._add_namespace_to_path(path)
-            element = parent.find(namespaced_path)
+        first, second = self._lookup_order(parent, path)
+        element = parent.find(first)
+        if element is None and second != first:
+            element = parent.find(second)
         return element
     
     def _find_elements(self, parent: ET.Element, path: str) -> List[ET.Element]:
         """Find multiple elements, handling namespaces."""
-        # Try without namespace first
-        elements = parent.findall(path)
-        if not elements:
-            # Add namespace to each element in the path
-            namespaced_path = self._add_namespace_to_path(path)
-            elements = parent.findall(namespaced_path)
+        first, second = self._lookup_order(parent, path)
+        elements = parent.findall(first)
+        if not elements and second != first:
+            elements = parent.findall(second)
         return elements
+
+    def _lookup_order(self, parent: ET.Element, path: str) -> Tuple[str, str]:
+        """
+        Return the (first, fallback) paths to try under ``parent``.
+
+        The namespaced form is compiled once per path. Children of a
+        namespaced element are almost always namespaced too, so that form is
+        tried first there and the plain path only as a fallback.
+        """
+        namespaced_path = self._compiled_paths.get(path)
+        if namespaced_path is None:
+            namespaced_path = self._compiled_paths[path] = self._add_namespace_to_path(path)
+        if parent.tag.startswith(self._ns_prefix):
+            return namespaced_path, path
+        return path, namespaced_path
     
     def _add_namespace_to_path(self, path: str) -> str:
         """Add namespace to each element in an XPath."""
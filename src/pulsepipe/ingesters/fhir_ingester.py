@@ -21,12 +21,14 @@
 
 # src/pulsepipe/ingesters/fhir_ingester.py
 
-import json
+from pulsepipe.utils import json_codec
+from pathlib import Path
 from pulsepipe.utils.log_factory import LogFactory
-from typing import List, Union, Dict, Any
+from typing import List, Union, Dict, Any, Iterable, TextIO
 from pulsepipe.models import PulseClinicalContent, MessageCache
-from .fhir_utils.base_mapper import MAPPER_REGISTRY
-from pulsepipe.utils.xml_to_json import xml_to_json
+from .fhir_utils.base_mapper import get_fhir_mapper
+from .fhir_utils.bundle_stream import FHIRBundleStream, DEFAULT_CHUNK_SIZE
+from .fhir_utils.xml_converter import fhir_xml_to_dict
 from pulsepipe.canonical.builder import CanonicalBuilder
 from pulsepipe.utils.errors import FHIRError, ValidationError, SchemaValidationError
 
@@ -39,6 +41,9 @@ class FHIRIngester:
     - FHIR bundles
     - Arrays of FHIR resources
     - Both JSON and XML formats
+
+    Large JSON files can be read with :meth:`parse_file`, which streams
+    Bundle entries from disk instead of materializing the whole document.
     """
     
     def __init__(self):
@@ -67,11 +72,11 @@ class FHIRIngester:
             # Convert raw data to JSON if it's in XML format
             try:
                 # First try to parse as JSON
-                data = json.loads(raw_data)
-            except json.JSONDecodeError:
+                data = json_codec.loads(raw_data)
+            except json_codec.JSONDecodeError:
                 try:
-                    # If that fails, try to parse as XML
-                    data = xml_to_json(raw_data)
+                    # If that fails, try to parse as FHIR XML
+                    data = fhir_xml_to_dict(raw_data)
                 except Exception as e:
                     raise FHIRError(
                         "Failed to parse input as JSON or XML",
@@ -82,35 +87,7 @@ class FHIRIngester:
             # Check if we have an array of FHIR resources
             if isinstance(data, list):
                 self.logger.info(f"Detected array of FHIR resources with {len(data)} items")
-                results = []
-                errors = []
-                
-                for i, item in enumerate(data):
-                    try:
-                        # Process each item as a separate FHIR resource
-                        results.append(self._parse_single_resource(item))
-                    except Exception as e:
-                        error_info = {
-                            "index": i,
-                            "resource_type": item.get("resourceType", "unknown"),
-                            "error": str(e)
-                        }
-                        errors.append(error_info)
-                        self.logger.error(f"Error processing resource at index {i}: {str(e)}")
-                
-                if not results and errors:
-                    # If all resources failed, raise an error
-                    raise FHIRError(
-                        f"Failed to process any FHIR resources. {len(errors)} errors encountered.",
-                        details={"errors": errors}
-                    )
-                elif errors:
-                    # If some resources failed but others succeeded, log a warning
-                    self.logger.warning(
-                        f"Processed {len(results)} resources successfully, but encountered {len(errors)} errors"
-                    )
-                
-                return results
+                return self._parse_resource_list(data)
             else:
                 # Single FHIR resource or Bundle
                 return self._parse_single_resource(data)
@@ -125,6 +102,179 @@ class FHIRIngester:
                 cause=e
             ) from e
     
+    def parse_file(self, path: Union[str, Path],
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Union[PulseClinicalContent, List[PulseClinicalContent]]:
+        """
+        Parse a FHIR file from disk, streaming Bundle entries.
+
+        Args:
+            path: Path to a FHIR JSON or XML file
+            chunk_size: Number of characters read per refill
+
+        Returns:
+            Same result shape as :meth:`parse`
+        """
+        with open(path, "r", encoding="utf-8") as fp:
+            return self.parse_stream(fp, chunk_size)
+
+    def parse_stream(self, fp: TextIO,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Union[PulseClinicalContent, List[PulseClinicalContent]]:
+        """
+        Parse FHIR data from a seekable text handle.
+
+        A Bundle is read twice: the first pass caches the patient, encounter
+        and order ids, the second maps entries one at a time. Memory use is
+        bounded by the largest entry. Arrays are parsed element by element;
+        XML and non-Bundle resources fall back to :meth:`parse`.
+
+        Raises:
+            FHIRError: If there's an error processing the FHIR data
+        """
+        try:
+            start = fp.tell()
+            stream = FHIRBundleStream(fp, chunk_size)
+            first = stream.peek()
+            if not first:
+                raise FHIRError("Empty or blank data received")
+            if first not in ("{", "["):
+                # XML or otherwise not streamable JSON
+                fp.seek(start)
+                return self.parse(fp.read())
+            if first == "[":
+                self.logger.info("Streaming array of FHIR resources")
+                return self._parse_resource_list(stream)
+
+            # 🔵 First Pass - Cache Important References
+            cache: MessageCache = {"patient_id": None, "encounter_id": None, "reference_id": None}
+            entry_count = 0
+            for entry in stream:
+                self._cache_references(entry.get("resource", {}), cache)
+                entry_count += 1
+            header = stream.header
+
+            if header.get("resourceType") != "Bundle":
+                # Single resources are small; parse them as a whole
+                fp.seek(start)
+                return self.parse(fp.read())
+
+            self.logger.info(f"Streaming Bundle with {entry_count} entries")
+
+            # 🟣 Second Pass - Map entries as they are read
+            fp.seek(start)
+            content = self._new_content()
+            mapped_resources = self._map_entries(FHIRBundleStream(fp, chunk_size), content, cache)
+            if mapped_resources == 0:
+                raise FHIRError(
+                    "Failed to map any resources from the Bundle",
+                    details={"bundle_type": header.get("type", "unknown")}
+                )
+
+            self._link_missing_references(content, cache)
+            return content
+
+        except (FHIRError, ValidationError):
+            raise
+        except Exception as e:
+            raise FHIRError(
+                f"Unexpected error processing FHIR data: {str(e)}",
+                cause=e
+            ) from e
+
+    def _parse_resource_list(self, items: Iterable[Dict[str, Any]]) -> List[PulseClinicalContent]:
+        """Parse each resource of an array separately, tolerating partial failures."""
+        results = []
+        errors = []
+
+        for i, item in enumerate(items):
+            try:
+                # Process each item as a separate FHIR resource
+                results.append(self._parse_single_resource(item))
+            except Exception as e:
+                error_info = {
+                    "index": i,
+                    "resource_type": item.get("resourceType", "unknown"),
+                    "error": str(e)
+                }
+                errors.append(error_info)
+                self.logger.error(f"Error processing resource at index {i}: {str(e)}")
+
+        if not results and errors:
+            # If all resources failed, raise an error
+            raise FHIRError(
+                f"Failed to process any FHIR resources. {len(errors)} errors encountered.",
+                details={"errors": errors}
+            )
+        elif errors:
+            # If some resources failed but others succeeded, log a warning
+            self.logger.warning(
+                f"Processed {len(results)} resources successfully, but encountered {len(errors)} errors"
+            )
+
+        return results
+
+    @staticmethod
+    def _new_content() -> PulseClinicalContent:
+        """Create an empty clinical content container."""
+        return PulseClinicalContent(
+            patient=None,
+            encounter=None,
+            vital_signs=[],
+            allergies=[],
+            immunizations=[],
+            diagnoses=[],
+            problem_list=[],
+            procedures=[],
+            medications=[],
+            payors=[],
+            mar=[],
+            notes=[],
+            imaging=[],
+            lab=[],
+            pathology=[],
+            diagnostic_test=[],
+            microbiology=[],
+            blood_bank=[],
+            family_history=[],
+            social_history=[],
+            advance_directives=[],
+            functional_status=[],
+            order=[],
+            implant=[],
+        )
+
+    @staticmethod
+    def _cache_references(res: Dict[str, Any], cache: MessageCache) -> None:
+        """Cache the first patient, encounter and order ids seen in a Bundle."""
+        if not res:
+            return
+
+        rtype = res.get("resourceType")
+        rid = res.get("id")
+
+        if rtype == "Patient" and not cache["patient_id"]:
+            cache["patient_id"] = rid
+        if rtype == "Encounter" and not cache["encounter_id"]:
+            cache["encounter_id"] = rid
+        if rtype in {"ServiceRequest", "Order"} and not cache.get("order_id"):
+            cache["order_id"] = rid
+
+    def _map_entries(self, entries: Iterable[Dict[str, Any]], content: PulseClinicalContent,
+                     cache: MessageCache) -> int:
+        """Map Bundle entries into content and return how many were mapped."""
+        mapped_resources = 0
+        for entry in entries:
+            try:
+                resource = entry.get("resource", {})
+                if resource:
+                    self._map_resource(resource, content, cache)
+                    mapped_resources += 1
+            except Exception as e:
+                resource_type = entry.get("resource", {}).get("resourceType", "unknown")
+                self.logger.warning(
+                    f"Error mapping resource of type {resource_type}: {str(e)}"
+                )
+        return mapped_resources
+
     def _parse_single_resource(self, data: Dict[str, Any]) -> PulseClinicalContent:
         """
         Parse a single FHIR resource or Bundle
@@ -151,32 +301,7 @@ class FHIRIngester:
 
             cache: MessageCache = {"patient_id": None, "encounter_id": None, "reference_id": None}
 
-            content = PulseClinicalContent(
-                patient=None,
-                encounter=None,
-                vital_signs=[],
-                allergies=[],
-                immunizations=[],
-                diagnoses=[],
-                problem_list=[],
-                procedures=[],
-                medications=[],
-                payors=[],
-                mar=[],
-                notes=[],
-                imaging=[],
-                lab=[],
-                pathology=[],
-                diagnostic_test=[],
-                microbiology=[],
-                blood_bank=[],
-                family_history=[],
-                social_history=[],
-                advance_directives=[],
-                functional_status=[],
-                order=[],
-                implant=[],
-            )
+            content = self._new_content()
 
             # 🔵 First Pass - Cache Important References + Build Index
             if data["resourceType"] == "Bundle":
@@ -184,35 +309,11 @@ class FHIRIngester:
                 self.logger.info(f"Processing Bundle with {len(bundle_entries)} entries")
                 
                 for entry in bundle_entries:
-                    res = entry.get("resource", {})
-                    if not res: 
-                        continue
-
-                    rtype = res.get("resourceType")
-                    rid = res.get("id")
-
-                    # cache first found patient, encounter, order
-                    if rtype == "Patient" and not cache["patient_id"]:
-                        cache["patient_id"] = rid
-                    if rtype == "Encounter" and not cache["encounter_id"]:
-                        cache["encounter_id"] = rid
-                    if rtype in {"ServiceRequest", "Order"} and not cache.get("order_id"):
-                        cache["order_id"] = rid
+                    self._cache_references(entry.get("resource", {}), cache)
 
             # 🟣 Second Pass - Map normally
             if data["resourceType"] == "Bundle":
-                mapped_resources = 0
-                for entry in data.get("entry", []):
-                    try:
-                        resource = entry.get("resource", {})
-                        if resource:
-                            self._map_resource(resource, content, cache)
-                            mapped_resources += 1
-                    except Exception as e:
-                        resource_type = entry.get("resource", {}).get("resourceType", "unknown")
-                        self.logger.warning(
-                            f"Error mapping resource of type {resource_type}: {str(e)}"
-                        )
+                mapped_resources = self._map_entries(data.get("entry", []), content, cache)
                 
                 if mapped_resources == 0:
                     raise FHIRError(
@@ -247,14 +348,10 @@ class FHIRIngester:
         resource_type = resource.get("resourceType", "unknown")
         
         try:
-            mapper_found = False
-            for mapper in MAPPER_REGISTRY:
-                if mapper.accepts(resource):
-                    mapper.map(resource, content, cache)
-                    mapper_found = True
-                    break
-                    
-            if not mapper_found:
+            mapper = get_fhir_mapper(resource_type)
+            if mapper is not None:
+                mapper.map(resource, content, cache)
+            else:
                 self.logger.warning(f"No mapper found for resource type: {resource_type}")
                 
         except Exception as e:
@@ -0,0 +1,234 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/ingesters/fhir_ndjson_ingester.py
+
+"""
+FHIR Bulk Data (NDJSON) ingester.
+
+Bulk ``$export`` output is one resource per line, usually one file per
+resource type. Large files are split into byte ranges that end on newline
+boundaries; each range is parsed and mapped in a worker process and its
+resources are grouped by patient reference into ``PulseClinicalContent``
+objects. Ranges are emitted as they complete, so a patient whose lines
+span several ranges yields one content object per range.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from pulsepipe.models import PulseClinicalContent, MessageCache
+from pulsepipe.utils import json_codec
+from pulsepipe.utils.log_factory import LogFactory
+from pulsepipe.utils.errors import FHIRError
+from .fhir_ingester import FHIRIngester
+
+# Target size of the byte range handed to each worker
+DEFAULT_RANGE_BYTES = 16 * 1024 * 1024
+
+# Reference fields that point at the owning patient, in lookup order
+PATIENT_REFERENCE_FIELDS = ("subject", "patient", "beneficiary")
+
+# FHIRIngester used for mapping inside the current (worker) process
+_worker_ingester: Optional[FHIRIngester] = None
+
+
+def split_ranges(path: Union[str, Path], range_bytes: int = DEFAULT_RANGE_BYTES) -> List[Tuple[int, int]]:
+    """
+    Split a file into ``(start, end)`` byte ranges that end on newline boundaries.
+
+    Every line belongs to exactly one range; ranges are roughly ``range_bytes``
+    long, longer where a line crosses the nominal boundary.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = start + range_bytes
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            end = min(end, size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def range_first_lines(path: Union[str, Path], ranges: List[Tuple[int, int]]) -> List[int]:
+    """
+    Return the 1-based number of the first line in each byte range.
+
+    Counts the newlines before each range start in one sequential read, so
+    workers can report line numbers relative to the whole file.
+    """
+    first_lines = []
+    lineno = 1
+    pos = 0
+    with open(path, "rb") as f:
+        for start, _ in ranges:
+            while pos < start:
+                block = f.read(min(DEFAULT_RANGE_BYTES, start - pos))
+                if not block:
+                    break
+                lineno += block.count(b"\n")
+                pos += len(block)
+            first_lines.append(lineno)
+    return first_lines
+
+
+def patient_key(resource: dict) -> Optional[str]:
+    """Return the id of the patient a resource belongs to, if any."""
+    if resource.get("resourceType") == "Patient":
+        return resource.get("id")
+    for field in PATIENT_REFERENCE_FIELDS:
+        ref = resource.get(field)
+        if isinstance(ref, dict) and ref.get("reference"):
+            return ref["reference"].split("/")[-1]
+    return None
+
+
+def _get_worker_ingester() -> FHIRIngester:
+    global _worker_ingester
+    if _worker_ingester is None:
+        _worker_ingester = FHIRIngester()
+    return _worker_ingester
+
+
+def map_lines(lines, first_line: int = 1) -> List[PulseClinicalContent]:
+    """
+    Map NDJSON lines into one content object per patient, in first-seen order.
+
+    ``first_line`` is the file line number of ``lines[0]``, used when
+    reporting malformed lines.
+    """
+    ingester = _get_worker_ingester()
+    grouped: Dict[Optional[str], Tuple[PulseClinicalContent, MessageCache]] = {}
+
+    for lineno, line in enumerate(lines, first_line):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            resource = json_codec.loads(line)
+        except json_codec.JSONDecodeError as e:
+            ingester.logger.warning(f"Skipping malformed NDJSON line {lineno}: {e}")
+            continue
+
+        key = patient_key(resource)
+        if key not in grouped:
+            cache: MessageCache = {"patient_id": key, "encounter_id": None, "reference_id": None}
+            grouped[key] = (FHIRIngester._new_content(), cache)
+        content, cache = grouped[key]
+        ingester._map_resource(resource, content, cache)
+
+    return [content for content, _ in grouped.values()]
+
+
+def _map_range(path: str, start: int, end: int, first_line: int = 1) -> List[PulseClinicalContent]:
+    """Worker entry point: map the lines in ``[start, end)`` of an NDJSON file."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    # Split on newlines only, matching split_ranges and range_first_lines
+    return map_lines(data.decode("utf-8").split("\n"), first_line)
+
+
+class FHIRNDJSONIngester:
+    """
+    Ingester for FHIR Bulk Data NDJSON exports.
+
+    ``parse`` handles NDJSON text in process. ``iter_file`` fans byte ranges
+    of a file out to a process pool and yields each range's patient groups
+    as soon as they are mapped; ``parse_file`` collects them into one list.
+    """
+
+    def __init__(self, workers: Optional[int] = None, range_bytes: int = DEFAULT_RANGE_BYTES):
+        self.logger = LogFactory.get_logger(__name__)
+        self.logger.info("📁 Initializing FHIRNDJSONIngester")
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        self.range_bytes = max(1, int(range_bytes))
+
+    @classmethod
+    def from_config(cls, config: dict) -> "FHIRNDJSONIngester":
+        return cls(
+            workers=config.get("workers"),
+            range_bytes=config.get("range_bytes", DEFAULT_RANGE_BYTES),
+        )
+
+    def parse(self, raw_data: str) -> List[PulseClinicalContent]:
+        """
+        Parse NDJSON text into one PulseClinicalContent per patient.
+
+        Raises:
+            FHIRError: If the data is empty
+        """
+        if not raw_data or not raw_data.strip():
+            raise FHIRError("Empty or blank data received")
+        return map_lines(raw_data.splitlines())
+
+    def iter_file(self, path: Union[str, Path]) -> Iterator[List[PulseClinicalContent]]:
+        """
+        Yield the patient groups of each byte range of an NDJSON file as it completes.
+
+        Small files and single-worker configurations are mapped in process.
+        """
+        path = str(path)
+        ranges = split_ranges(path, self.range_bytes)
+        if self.workers == 1 or len(ranges) <= 1:
+            for (start, end), first_line in zip(ranges, range_first_lines(path, ranges)):
+                yield _map_range(path, start, end, first_line)
+            return
+
+        self.logger.info(
+            f"Mapping {path} in {len(ranges)} ranges on {self.workers} worker processes"
+        )
+        pending = deque(zip(ranges, range_first_lines(path, ranges)))
+        in_flight = set()
+        # Bound outstanding ranges so mapped results cannot outrun the consumer
+        max_in_flight = self.workers * 2
+        pool = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < max_in_flight:
+                    (start, end), first_line = pending.popleft()
+                    in_flight.add(pool.submit(_map_range, path, start, end, first_line))
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            # Runs on exhaustion, error, or close() by a cancelled consumer;
+            # don't wait on ranges nobody will read
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def parse_file(self, path: Union[str, Path]) -> List[PulseClinicalContent]:
+        """Parse a whole NDJSON file, mapping byte ranges in parallel."""
+        results: List[PulseClinicalContent] = []
+        for batch in self.iter_file(path):
+            results.extend(batch)
+        if not results:
+            raise FHIRError("No FHIR resources found in NDJSON file", details={"path": str(path)})
+        return results
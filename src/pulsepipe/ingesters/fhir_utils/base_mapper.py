@@ -21,10 +21,14 @@
 
 # src/pulsepipe/ingesters/fhir_utils/base_mapper.py
 
-from typing import Type, List, Optional
+from typing import Type, List, Dict, Optional
 
 MAPPER_REGISTRY: List["BaseFHIRMapper"] = []
 
+# resourceType -> mapper, filled by @fhir_mapper. Each type is stored as
+# declared and lowercased so lookups stay case-insensitive like accepts().
+MAPPER_DISPATCH: Dict[str, "BaseFHIRMapper"] = {}
+
 class BaseFHIRMapper:
     resource_type: Optional[str] = None
 
@@ -41,10 +45,34 @@ class BaseFHIRMapper:
         return self.__repr__()
 
 
+def get_fhir_mapper(resource_type: Optional[str]) -> Optional[BaseFHIRMapper]:
+    """Return the mapper registered for a resourceType, or None."""
+    if not resource_type:
+        return None
+    mapper = MAPPER_DISPATCH.get(resource_type)
+    if mapper is None:
+        mapper = MAPPER_DISPATCH.get(resource_type.lower())
+    return mapper
+
+
 def fhir_mapper(resource_type: str):
+    """
+    Register a mapper class for a FHIR resourceType.
+
+    Raises:
+        ValueError: If another mapper is already registered for the type
+    """
     def decorator(cls: Type[BaseFHIRMapper]):
+        existing = MAPPER_DISPATCH.get(resource_type.lower())
+        if existing is not None:
+            raise ValueError(
+                f"Duplicate FHIR mapper for {resource_type}: "
+                f"{cls.__name__} conflicts with {existing.__class__.__name__}"
+            )
         cls.resource_type = resource_type
         instance = cls()
         MAPPER_REGISTRY.append(instance)
+        MAPPER_DISPATCH[resource_type] = instance
+        MAPPER_DISPATCH[resource_type.lower()] = instance
         return cls
     return decorator
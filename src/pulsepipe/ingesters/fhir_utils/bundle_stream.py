@@ -0,0 +1,159 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/ingesters/fhir_utils/bundle_stream.py
+
+"""
+Incremental reader for large FHIR JSON documents.
+
+``FHIRBundleStream`` walks a Bundle from a file handle one ``entry`` at a
+time, so memory is bounded by the largest entry instead of the whole
+document. Members of the top-level object other than ``entry`` are collected
+into :attr:`FHIRBundleStream.header`; a top-level array yields its elements.
+"""
+
+import json
+from typing import Any, Dict, Iterator, TextIO
+
+from pulsepipe.utils.errors import FHIRError
+
+# Characters read from the handle per refill
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class _JSONTokenStream:
+    """Buffered cursor over a text handle decoding one JSON value at a time."""
+
+    def __init__(self, fp: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping the consumed prefix of the buffer."""
+        if self.eof:
+            return False
+        # Grow reads with the pending value so huge entries need few refills
+        chunk = self.fp.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise FHIRError(
+                f"Malformed FHIR JSON: expected '{char}'",
+                details={"found": found or "end of input"}
+            )
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        if not self.peek():
+            raise FHIRError("Malformed FHIR JSON: unexpected end of input")
+        while True:
+            try:
+                obj, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError as e:
+                if self._fill():
+                    continue
+                raise FHIRError("Malformed FHIR JSON", cause=e) from e
+            # A number touching the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def array(self) -> Iterator[Any]:
+        """Yield the elements of the array at the cursor one by one."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            sep = self.peek()
+            self.expect(sep if sep in ",]" else ",")
+            if sep == "]":
+                return
+
+
+class FHIRBundleStream:
+    """
+    Iterate the entries of a FHIR JSON document without loading all of it.
+
+    Iterating a Bundle yields the raw ``entry`` dictionaries; iterating a
+    top-level array yields its resources. Any other resource yields nothing
+    and ends up whole in :attr:`header`. The header is complete only once
+    iteration has finished, since members may follow ``entry``.
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._tokens = _JSONTokenStream(fp, chunk_size)
+        self.header: Dict[str, Any] = {}
+        self.is_array = False
+
+    def peek(self) -> str:
+        """Return the first significant character of the document ("" if blank)."""
+        return self._tokens.peek()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        tokens = self._tokens
+        if tokens.peek() == "[":
+            self.is_array = True
+            yield from tokens.array()
+            return
+
+        tokens.expect("{")
+        if tokens.peek() == "}":
+            tokens.pos += 1
+            return
+        while True:
+            key = tokens.value()
+            tokens.expect(":")
+            if key == "entry" and tokens.peek() == "[":
+                yield from tokens.array()
+            else:
+                self.header[key] = tokens.value()
+            sep = tokens.peek()
+            tokens.expect(sep if sep in ",}" else ",")
+            if sep == "}":
+                return
@@ -23,10 +23,12 @@
 # src/pulsepipe/ingesters/fhir_utils/condition_mapper.py
 
 from pulsepipe.models import PulseClinicalContent, Problem, Diagnosis, MessageCache
-from .base_mapper import BaseFHIRMapper, fhir_mapper
+from .base_mapper import BaseFHIRMapper
 from .extractors import extract_patient_reference, extract_encounter_reference
 
-@fhir_mapper("Condition")
+# Not registered: Condition resources are dispatched to ProblemListMapper.
+# This class never accepted anything (it has no RESOURCE_TYPE) and is kept
+# for direct use.
 class ConditionMapper(BaseFHIRMapper):
     def map(self, resource: dict, content: PulseClinicalContent, cache: MessageCache) -> None:
         categories = resource.get("category", [])
@@ -0,0 +1,361 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+
+# src/pulsepipe/ingesters/fhir_utils/xml_converter.py
+
+"""
+Single-pass FHIR XML to FHIR JSON conversion.
+
+``fhir_xml_to_dict`` feeds the XML once through expat and builds the dict
+the JSON parser would have produced for the same resource, without an
+element tree or a JSON round trip: primitives are unwrapped from their
+``value`` attribute and typed, repeating elements become lists even when
+they occur once, nested resources carry ``resourceType`` and primitive
+extensions move to ``_element`` keys. The result can go straight to the
+FHIR mappers.
+
+XML carries no cardinality or type information, so both are taken from the
+element tables below, which cover the resources PulsePipe maps.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from typing import Any, BinaryIO, Dict, FrozenSet, List, Optional, TextIO, Tuple, Union
+from xml.sax.saxutils import escape, quoteattr
+
+FHIR_NS = "http://hl7.org/fhir"
+XHTML_NS = "http://www.w3.org/1999/xhtml"
+_XML_NS = "http://www.w3.org/XML/1998/namespace"
+_XHTML_PREFIX = f"{{{XHTML_NS}}}"
+
+# Elements that are 0..* wherever they occur
+REPEATING_ELEMENTS: FrozenSet[str] = frozenset({
+    "account", "activity", "additionalInstruction", "addresses",
+    "adjudication", "agent", "alias", "availableTime", "basedOn", "bodySite",
+    "careTeam", "careTeamSequence", "classHistory", "coding",
+    "communication", "complication", "component", "conclusionCode",
+    "contact", "contained", "content", "contributor", "daysOfWeek",
+    "derivedFrom", "deviceName", "diagnosis", "diagnosisSequence",
+    "dosage", "dosageInstruction", "doseAndRate", "education", "endpoint",
+    "entity", "entry", "episodeOfCare", "evidence", "extension",
+    "focalDevice", "followUp", "generalPractitioner", "given", "goal",
+    "hasMember", "healthcareService", "informationSequence", "ingredient",
+    "instance",
+    "instantiatesCanonical", "instantiatesUri", "insurance",
+    "interpretation", "item", "line", "link", "manifestation", "modality",
+    "modifierExtension", "note", "noteNumber", "notAvailable", "partOf",
+    "participant", "payor", "performer", "policy", "prefix",
+    "presentedForm", "procedure", "procedureCode", "procedureSequence",
+    "profile",
+    "property", "protocolApplied", "qualification", "reaction",
+    "reasonCode", "reasonReference", "referenceRange", "replaces", "report", "requestedPeriod", "result", "security",
+    "securityLabel", "series", "serviceType", "signature", "specialty", "stage",
+    "statusHistory", "subDetail", "suffix", "supportingInfo",
+    "supportingInformation", "tag", "target", "telecom", "udiCarrier",
+    "usedCode", "usedReference",
+})
+
+# Parent.element pairs that repeat only in that context
+REPEATING_PATHS: FrozenSet[str] = frozenset({
+    "Patient.name", "Practitioner.name", "RelatedPerson.name", "Person.name",
+    "Patient.address", "Practitioner.address", "Organization.address",
+    "RelatedPerson.address", "Person.address",
+    "contact.relationship", "RelatedPerson.relationship", "Device.version",
+    "Encounter.type", "Organization.type", "Location.type",
+    "HealthcareService.type", "participant.type", "diagnosis.type",
+    "participant.role", "agent.role",
+    "Encounter.location", "PractitionerRole.code",
+    "CareTeam.managingOrganization", "ExplanationOfBenefit.total",
+    "Composition.author", "DocumentReference.author",
+    "item.detail", "item.encounter", "context.encounter",
+    "AllergyIntolerance.category", "CarePlan.category", "CareTeam.category",
+    "Communication.category", "Composition.category", "Condition.category",
+    "Consent.category", "DiagnosticReport.category",
+    "DocumentReference.category", "Goal.category",
+    "MedicationRequest.category", "Observation.category",
+    "ServiceRequest.category",
+})
+
+# Parent.element pairs that are 0..1 although the name repeats elsewhere
+SINGLE_PATHS: FrozenSet[str] = frozenset({
+    "Bundle.identifier", "Composition.identifier",
+    "QuestionnaireResponse.identifier", "Bundle.signature",
+    "MedicationRequest.performer", "MedicationAdministration.dosage",
+    "Observation.bodySite", "series.bodySite", "series.modality",
+    "Encounter.partOf", "Location.partOf", "Organization.partOf",
+    "CarePlan.author",
+})
+
+# A parent holding only these children is a Reference
+_REFERENCE_ELEMENTS = frozenset({"reference", "type", "identifier", "display", "extension"})
+
+BOOLEAN_ELEMENTS: FrozenSet[str] = frozenset({
+    "abstract", "active", "doNotPerform", "exclude", "experimental",
+    "focal", "hidden", "immutable", "inactive", "isSubpotent", "preferred",
+    "primarySource", "readOnly", "repeats", "required", "userSelected",
+})
+
+INTEGER_ELEMENTS: FrozenSet[str] = frozenset({
+    "careTeamSequence", "count", "countMax", "detailSequence",
+    "diagnosisSequence", "frequency", "frequencyMax", "informationSequence",
+    "itemSequence", "minutesDuration", "noteNumber", "number",
+    "numberOfInstances", "numberOfSeries", "offset", "priority",
+    "procedureSequence", "rank", "sequence", "size", "subDetailSequence",
+    "total",
+})
+
+DECIMAL_ELEMENTS: FrozenSet[str] = frozenset({
+    "altitude", "duration", "durationMax", "factor", "latitude",
+    "longitude", "lowerLimit", "period", "periodMax", "upperLimit",
+})
+
+# Elements of Quantity or Money type, whose ``value`` is a decimal
+QUANTITY_ELEMENTS: FrozenSet[str] = frozenset({
+    "amount", "denominator", "dose", "high", "low", "net", "numerator",
+    "quantity", "unitPrice",
+})
+_QUANTITY_SUFFIXES = ("Quantity", "Money", "Duration", "Age", "Count", "Distance")
+_QUANTITY_SIBLINGS = frozenset({"unit", "comparator", "currency"})
+
+_INTEGER_RE = re.compile(r"-?\d+")
+
+_Source = Union[str, bytes, TextIO, BinaryIO]
+
+
+# Characters or bytes read from a file object per parser feed
+READ_SIZE = 64 * 1024
+
+
+class _Frame:
+    """An element whose end tag has not been read yet."""
+
+    __slots__ = ("name", "attrib", "children")
+
+    def __init__(self, name: str, attrib: Dict[str, str]):
+        self.name = name
+        self.attrib = attrib
+        # child name -> [(raw value or dict, primitive extras or None)]
+        self.children: Dict[str, List[Tuple[Any, Optional[Dict[str, Any]]]]] = {}
+
+
+class _FHIRJSONBuilder:
+    """``XMLParser`` target that builds FHIR JSON without an element tree."""
+
+    def __init__(self):
+        self.stack: List[_Frame] = []
+        self.result: Optional[Dict[str, Any]] = None
+        # Narrative XHTML is the only part built as elements
+        self.xhtml: Optional[ET.TreeBuilder] = None
+        self.xhtml_depth = 0
+        # Qualified tag -> local name; FHIR documents reuse a small vocabulary
+        self.names: Dict[str, str] = {}
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if self.xhtml_depth or tag.startswith(_XHTML_PREFIX):
+            if not self.xhtml_depth:
+                self.xhtml = ET.TreeBuilder()
+            self.xhtml_depth += 1
+            self.xhtml.start(tag, attrib)
+            return
+        name = self.names.get(tag)
+        if name is None:
+            name = self.names[tag] = _split_tag(tag)[1]
+        self.stack.append(_Frame(name, attrib))
+
+    def data(self, text: str) -> None:
+        if self.xhtml_depth:
+            self.xhtml.data(text)
+
+    def end(self, tag: str) -> None:
+        if self.xhtml_depth:
+            elem = self.xhtml.end(tag)
+            self.xhtml_depth -= 1
+            if not self.xhtml_depth:
+                # Narrative is kept as serialized XHTML, as in FHIR JSON
+                self.stack[-1].children.setdefault(_split_tag(tag)[1], []).append(
+                    (_serialize_xhtml(elem), None)
+                )
+                self.xhtml = None
+            return
+
+        frame = self.stack.pop()
+        resource = frame.name[:1].isupper()
+        if not self.stack:
+            if not resource:
+                raise ValueError(f"Root element <{frame.name}> is not a FHIR resource")
+            self.result = _finish(frame, resource=True)[0]
+            return
+        self.stack[-1].children.setdefault(frame.name, []).append(_finish(frame, resource=resource))
+
+    def close(self) -> Optional[Dict[str, Any]]:
+        return self.result
+
+
+def fhir_xml_to_dict(source: _Source) -> Dict[str, Any]:
+    """
+    Convert a FHIR XML resource or Bundle to its FHIR JSON dict.
+
+    Args:
+        source: XML text, bytes or a readable file object
+
+    Returns:
+        Dict shaped like the FHIR JSON representation of the resource
+
+    Raises:
+        ET.ParseError: If the XML is malformed
+        ValueError: If the document is not a FHIR resource
+    """
+    parser = ET.XMLParser(target=_FHIRJSONBuilder())
+    if isinstance(source, (str, bytes, bytearray)):
+        parser.feed(source)
+    else:
+        for chunk in iter(lambda: source.read(READ_SIZE), source.read(0)):
+            parser.feed(chunk)
+    result = parser.close()
+    if result is None:
+        raise ValueError("No FHIR resource found in XML")
+    return result
+
+
+def _finish(frame: _Frame, resource: bool = False) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """Build the JSON value for a completed element."""
+    attrib = frame.attrib
+    if "value" in attrib:
+        # Primitive: the parent types the value once all siblings are known
+        extras: Dict[str, Any] = {}
+        if "id" in attrib:
+            extras["id"] = attrib["id"]
+        extension = frame.children.get("extension")
+        if extension:
+            extras["extension"] = [value for value, _ in extension]
+        return attrib["value"], extras or None
+
+    children = frame.children
+    if not resource and len(children) == 1 and not attrib:
+        # <resource>, <contained> and friends wrap exactly one resource
+        (child_name, values), = children.items()
+        if child_name[:1].isupper() and len(values) == 1:
+            return values[0]
+
+    obj: Dict[str, Any] = {}
+    if resource:
+        obj["resourceType"] = frame.name
+    if "id" in attrib:
+        obj["id"] = attrib["id"]
+    if "url" in attrib:
+        obj["url"] = attrib["url"]
+
+    siblings = children.keys()
+    for child_name, values in children.items():
+        repeating = len(values) > 1 or _is_repeating(frame.name, child_name, siblings, resource)
+        typed = [
+            _primitive(frame.name, child_name, value, siblings) if isinstance(value, str) else value
+            for value, _ in values
+        ]
+        obj[child_name] = typed if repeating else typed[0]
+
+        if any(extras for _, extras in values):
+            extras_list = [extras for _, extras in values]
+            obj[f"_{child_name}"] = extras_list if repeating else extras_list[0]
+    return obj, None
+
+
+def _is_repeating(parent: str, name: str, siblings, resource: bool) -> bool:
+    """Whether ``name`` under ``parent`` is an array in FHIR JSON."""
+    path = f"{parent}.{name}"
+    if path in SINGLE_PATHS:
+        return False
+    if path in REPEATING_PATHS:
+        return True
+    if name == "identifier":
+        # Reference.identifier is 0..1; elsewhere identifiers repeat
+        return resource or not _REFERENCE_ELEMENTS.issuperset(siblings)
+    return name in REPEATING_ELEMENTS
+
+
+def _primitive(parent: str, name: str, raw: str, siblings) -> Any:
+    """Type a primitive ``value`` attribute as the JSON parser would."""
+    if name in BOOLEAN_ELEMENTS or name.endswith("Boolean"):
+        return {"true": True, "false": False}.get(raw, raw)
+    if name in INTEGER_ELEMENTS or name.endswith(("Integer", "PositiveInt", "UnsignedInt")):
+        return int(raw) if _INTEGER_RE.fullmatch(raw) else raw
+    if (
+        name in DECIMAL_ELEMENTS
+        or name.endswith("Decimal")
+        or (name == "value" and (
+            parent in QUANTITY_ELEMENTS
+            or parent.endswith(_QUANTITY_SUFFIXES)
+            or not _QUANTITY_SIBLINGS.isdisjoint(siblings)
+        ))
+    ):
+        return _number(raw)
+    return raw
+
+
+def _number(raw: str) -> Any:
+    """Parse a decimal the way ``json.loads`` would, keeping bad input as text."""
+    if _INTEGER_RE.fullmatch(raw):
+        return int(raw)
+    try:
+        return float(raw)
+    except ValueError:
+        return raw
+
+
+def _split_tag(tag: str) -> Tuple[str, str]:
+    """Split ``{namespace}local`` into its parts."""
+    if tag[:1] == "{":
+        namespace, _, local = tag[1:].partition("}")
+        return namespace, local
+    return "", tag
+
+
+def _serialize_xhtml(elem: ET.Element) -> str:
+    """Serialize a narrative ``div`` with XHTML as the default namespace."""
+    parts: List[str] = []
+    _write_xhtml(elem, parts, root=True)
+    return "".join(parts)
+
+
+def _write_xhtml(elem: ET.Element, parts: List[str], root: bool = False) -> None:
+    """Append ``elem`` and its descendants (not its tail) to ``parts``."""
+    name = _split_tag(elem.tag)[1]
+    parts.append(f"<{name}")
+    if root:
+        parts.append(f' xmlns="{XHTML_NS}"')
+    for key, value in elem.attrib.items():
+        namespace, local = _split_tag(key)
+        if namespace == _XML_NS:
+            local = f"xml:{local}"
+        parts.append(f" {local}={quoteattr(value)}")
+    if elem.text is None and not len(elem):
+        parts.append("/>")
+        return
+    parts.append(">")
+    if elem.text:
+        parts.append(escape(elem.text))
+    for child in elem:
+        _write_xhtml(child, parts)
+        if child.tail:
+            parts.append(escape(child.tail))
+    parts.append(f"</{name}>")
@@ -37,6 +37,13 @@ class HL7v2Ingester:
     def __init__(self):
         self.logger = LogFactory.get_logger(__name__)
         self.logger.info("📁 Initializing HL7v2Ingester")
+        # Mappers are stateless, so one instance per segment type is reused
+        self.segment_mappers = {
+            "MSH": MSHMapper(),
+            "PID": PIDMapper(),
+            "OBR": OBRMapper(),
+            "OBX": OBXMapper(),
+        }
 
 
     def parse(self, hl7_blob: str) -> list:
@@ -132,15 +139,9 @@ class HL7v2Ingester:
             self.logger.info(f"\nHL7 Message: {hl7_message}\n")
             # important, implement cache
             for segment in hl7_message.segments:
-                segment_id = segment.id
-                if segment_id == "MSH":
-                    MSHMapper().map(segment, content, cache)
-                elif segment_id == "PID":
-                    PIDMapper().map(segment, content, cache)
-                elif segment_id == "OBR":
-                    OBRMapper().map(segment, content, cache)
-                elif segment_id == "OBX":
-                    OBXMapper().map(segment, content, cache)
+                mapper = self.segment_mappers.get(segment.id)
+                if mapper is not None:
+                    mapper.map(segment, content, cache)
 
             self.logger.debug(f"Finished parsing. Patient: {content.patient}")
             return content
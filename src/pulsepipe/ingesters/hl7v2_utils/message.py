@@ -21,9 +21,11 @@
 
 # src/pulsepipe/ingesters/hl7v2_utils/message.py
 
-from typing import List
+from typing import List, Optional, Sequence, Tuple
 
 class Subcomponent:
+    __slots__ = ("subcomponents",)
+
     def __init__(self, subcomponents: List[str]):
         self.subcomponents = subcomponents
 
@@ -42,6 +44,8 @@ class Subcomponent:
         return "&".join(str(s) if s is not None else "" for s in self.subcomponents)
 
 class Component:
+    __slots__ = ("components",)
+
     def __init__(self, components: List[Subcomponent]):
         self.components = components
 
@@ -61,6 +65,8 @@ class Component:
         return "^".join(str(sub) for sub in self.components)
 
 class Field:
+    __slots__ = ("repetitions",)
+
     def __init__(self, repetitions: List[Component]):
         self.repetitions = repetitions
 
@@ -80,6 +86,8 @@ class Field:
         return "~".join(str(rep) for rep in self.repetitions)
 
 class Segment:
+    __slots__ = ("id", "fields")
+
     def __init__(self, id: str, fields: List[Field]):
         self.id = id
         self.fields = fields
@@ -106,6 +114,8 @@ class Segment:
         return "".join(field_strs)
 
 class Message:
+    __slots__ = ("id", "segments")
+
     def __init__(self, id: str, segments: List[Segment]):
         self.id = id
         self.segments = segments
@@ -125,3 +135,96 @@ class Message:
 
     def __str__(self):
         return "\r".join(str(segment) for segment in self.segments)
+
+
+def decode_field(raw: str, separators: Tuple[str, str, str]) -> Field:
+    """Split one raw field into repetitions, components and subcomponents."""
+    comp_sep, rep_sep, sub_sep = separators
+    return Field([
+        Subcomponent([Component(c.split(sub_sep)) for c in rep.split(comp_sep)])
+        for rep in raw.split(rep_sep)
+    ])
+
+
+class LazyFieldList(Sequence):
+    """
+    Field list of a LazySegment that decodes each field on first access.
+
+    Raw field strings are split from the segment once; ``Field`` objects are
+    only built for the indexes a caller actually reads.
+    """
+
+    __slots__ = ("_segment", "_decoded")
+
+    def __init__(self, segment: "LazySegment"):
+        self._segment = segment
+        self._decoded: List[Optional[Field]] = [None] * len(segment.raw_fields)
+
+    def __len__(self):
+        return len(self._decoded)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        field = self._decoded[index]
+        if field is None:
+            field = self._decoded[index] = self._segment.decode(index)
+        return field
+
+
+class LazySegment(Segment):
+    """
+    Segment backed by its raw text.
+
+    Fields are split on first use and decoded individually, so mappers that
+    read a handful of values never allocate objects for the rest. Behaves
+    like an eagerly parsed ``Segment``.
+    """
+
+    __slots__ = ("raw", "field_sep", "separators", "_raw_fields", "_fields")
+
+    def __init__(self, id: str, raw: str, field_sep: str, separators: Tuple[str, str, str]):
+        self.id = id
+        self.raw = raw
+        self.field_sep = field_sep
+        # (component, repetition, subcomponent)
+        self.separators = separators
+        self._raw_fields: Optional[List[str]] = None
+        self._fields: Optional[LazyFieldList] = None
+
+    @property
+    def raw_fields(self) -> List[str]:
+        if self._raw_fields is None:
+            self._raw_fields = [self.id] + self.raw[4:].split(self.field_sep)
+        return self._raw_fields
+
+    @property
+    def fields(self) -> LazyFieldList:
+        if self._fields is None:
+            self._fields = LazyFieldList(self)
+        return self._fields
+
+    def decode(self, index: int) -> Field:
+        raw = self.raw_fields[index]
+        if self.id == "MSH" and index == 1:
+            # MSH-2 holds the encoding characters themselves
+            return Field([Subcomponent([Component([raw])])])
+        return decode_field(raw, self.separators)
+
+    def value(self, field: int, component: int = 1, subcomponent: int = 1) -> Optional[str]:
+        """Return a value of the first repetition straight from the raw text."""
+        raw_fields = self.raw_fields
+        if len(raw_fields) <= field:
+            return None
+        comp_sep, rep_sep, sub_sep = self.separators
+        try:
+            if self.id == "MSH" and field == 1:
+                # Single unsplit value, indexed like a decoded field
+                return [[raw_fields[1]]][component - 1][subcomponent - 1]
+            first = raw_fields[field].split(rep_sep, 1)[0]
+            return first.split(comp_sep)[component - 1].split(sub_sep)[subcomponent - 1]
+        except IndexError:
+            return None
+
+    def __len__(self):
+        return len(self.raw_fields)
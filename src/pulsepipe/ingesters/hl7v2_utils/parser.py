@@ -22,18 +22,46 @@
 # src/pulsepipe/ingesters/hl7v2_utils/hl7_parser.py
 
 import re
-from typing import List, Optional
-from .message import Segment, Field, Component, Subcomponent
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from .message import LazySegment
+
+_ACCESSOR_RE = re.compile(r"([A-Z]{2,3})\.(\d+)(?:\.(\d+))?(?:\.(\d+))?")
+
+
+@lru_cache(maxsize=1024)
+def parse_accessor(accessor: str) -> Tuple[str, int, int, int]:
+    """Split an accessor like 'PID.3.1.2' into (segment, field, component, subcomponent)."""
+    match = _ACCESSOR_RE.match(accessor)
+    if not match:
+        raise ValueError("Accessor must be in the form SEG.F[.C[.S]]")
+
+    seg_id, field_idx, comp_idx, sub_idx = match.groups()
+    return (
+        seg_id,
+        int(field_idx),
+        int(comp_idx) if comp_idx else 1,
+        int(sub_idx) if sub_idx else 1,
+    )
+
 
 class HL7Message:
     """
     Represents a single HL7v2 message, parsed into structured segments.
     Provides accessors like 'PID.3.1.2' to retrieve field/component/subcomponent values.
+
+    Parsing only splits the text into segments. Fields are decoded when a
+    segment is first read (see ``LazySegment``).
     """
 
+    __slots__ = (
+        "segments", "segment_map", "encoding_chars", "field_sep", "comp_sep",
+        "repetition_sep", "escape_char", "subcomp_sep", "_raw_segments",
+    )
+
     def __init__(self, hl7_text: str):
-        self.segments: List[Segment] = []
-        self.segment_map: dict[str, List[List[List[List[str]]]]] = {}
+        self.segments: List[LazySegment] = []
+        self.segment_map: dict[str, List[LazySegment]] = {}
         self.encoding_chars: dict[str, str] = {}
         self._parse(hl7_text)
 
@@ -56,28 +84,12 @@ class HL7Message:
         self.repetition_sep = self.encoding_chars['repetition']
         self.escape_char = self.encoding_chars['escape']
         self.subcomp_sep = self.encoding_chars['subcomponent']
+        self._raw_segments = raw_segments
 
+        separators = (self.comp_sep, self.repetition_sep, self.subcomp_sep)
         for raw_segment in raw_segments:
             seg_id = raw_segment[:3]
-            rest = raw_segment[4:]
-            fields = [seg_id] + rest.split(self.field_sep)
-
-            field_objs: List[Field] = []
-
-            for i, field in enumerate(fields):
-                if seg_id == "MSH" and i == 1:
-                    field_objs.append(Field([Subcomponent([Component([enc])])]))
-                    continue
-
-                repetitions = field.split(self.repetition_sep)
-                rep_objs = []
-                for rep in repetitions:
-                    components = rep.split(self.comp_sep)
-                    comp_objs = [Component(c.split(self.subcomp_sep)) for c in components]
-                    rep_objs.append(Subcomponent(comp_objs))
-                field_objs.append(Field(rep_objs))
-
-            segment = Segment(seg_id, field_objs)
+            segment = LazySegment(seg_id, raw_segment, self.field_sep, separators)
             self.segments.append(segment)
             self.segment_map.setdefault(seg_id, []).append(segment)
 
@@ -92,43 +104,14 @@ class HL7Message:
         Returns:
             Optional[str]: The extracted value, or None if not found
         """
-        match = re.match(r"([A-Z]{2,3})\.(\d+)(?:\.(\d+))?(?:\.(\d+))?", accessor)
-        if not match:
-            raise ValueError("Accessor must be in the form SEG.F[.C[.S]]")
-
-        seg_id, field_idx, comp_idx, sub_idx = match.groups()
-        field_idx = int(field_idx)
-        comp_idx = int(comp_idx) if comp_idx else 1
-        sub_idx = int(sub_idx) if sub_idx else 1
+        seg_id, field_idx, comp_idx, sub_idx = parse_accessor(accessor)
 
         segs = self.segment_map.get(seg_id)
         if not segs or len(segs) <= occurrence:
             return None
 
-        segment = segs[occurrence]
-        if len(segment) <= field_idx:
-            return None
-
-        field = segment[field_idx]
-        if not field or not field[0]:
-            return None
-
-        try:
-            return field[0][comp_idx - 1][sub_idx - 1]
-        except IndexError:
-            return None
+        return segs[occurrence].value(field_idx, comp_idx, sub_idx)
 
     def __str__(self) -> str:
         """Reconstructs the HL7 message as a string."""
-        lines = []
-        for segment in self.segments:
-            field_strings = []
-            for field in segment:
-                rep_strings = []
-                for repetition in field:
-                    comp_strings = [self.subcomp_sep.join(sub) for sub in repetition]
-                    rep_strings.append(self.comp_sep.join(comp_strings))
-                field_strings.append(self.repetition_sep.join(rep_strings))
-            lines.append(self.field_sep.join(field_strings))
-
-        return '\r'.join(lines)
+        return '\r'.join(self._raw_segments)
@@ -22,14 +22,43 @@
 # src/pulsepipe/ingesters/ingestion_engine.py
 
 import asyncio
+import functools
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
 from pulsepipe.utils.log_factory import LogFactory
-from typing import Optional, Any, List, Union
+from typing import Optional, Any, Dict, List, Union, Callable, Awaitable
 from pulsepipe.models.clinical_content import PulseClinicalContent
 from pulsepipe.models.operational_content import PulseOperationalContent
 from pulsepipe.utils.errors import (
-    IngestionEngineError, IngesterError, AdapterError, PulsePipeError
+    IngestionEngineError, IngesterError, AdapterError, PulsePipeError, ConfigurationError
 )
 
+POOL_TYPES = ("process", "thread")
+
+# Ingester copy owned by each process-pool worker (set by _init_worker)
+_worker_ingester = None
+
+
+def _parse_item(ingester: Any, raw_data: Any) -> Any:
+    """Parse one queued item; Paths go to the ingester's streaming parse_file."""
+    if isinstance(raw_data, Path):
+        if hasattr(ingester, "parse_file"):
+            return ingester.parse_file(raw_data)
+        raw_data = raw_data.read_text(encoding="utf-8")
+    return ingester.parse(raw_data)
+
+
+def _init_worker(ingester: Any) -> None:
+    """Process-pool initializer: unpickle the ingester once per worker."""
+    global _worker_ingester
+    _worker_ingester = ingester
+
+
+def _parse_in_worker(raw_data: Any) -> Any:
+    """Process-pool task entry point."""
+    return _parse_item(_worker_ingester, raw_data)
+
+
 class IngestionEngine:
     """
     Core engine that coordinates data flow between adapters and ingesters.
@@ -37,20 +66,44 @@ class IngestionEngine:
     The IngestionEngine manages the flow of data from adapters (input sources)
     to ingesters (parsers) and coordinates the asynchronous processing of data.
     It handles error conditions and timeouts.
+    
+    With workers > 1, queued items are parsed concurrently in a process (or
+    thread) pool. Results are handed on in queue order, or as they finish
+    when ordered is False.
     """
     
-    def __init__(self, adapter, ingester):
+    def __init__(self, adapter, ingester, max_queue_size: int = 0,
+                 workers: int = 1, pool: str = "process", ordered: bool = True):
         self.logger = LogFactory.get_logger(__name__)
         self.logger.info("📁 Initializing IngestionEngine")
+        if workers < 1:
+            raise ConfigurationError(
+                "Ingestion workers must be at least 1",
+                details={"workers": workers}
+            )
+        if pool not in POOL_TYPES:
+            raise ConfigurationError(
+                f"Unknown ingestion pool type: {pool}",
+                details={"pool": pool, "supported": list(POOL_TYPES)}
+            )
         self.adapter = adapter
         self.ingester = ingester
-        self.queue = asyncio.Queue()
+        self.workers = workers
+        self.pool = pool
+        self.ordered = ordered
+        # A bounded queue applies backpressure to the adapter (0 = unbounded)
+        self.queue = asyncio.Queue(maxsize=max_queue_size)
         self.results = []
         self.stop_flag = asyncio.Event()
         self.processing_errors = []
+        # Set by stream() to hand results downstream instead of accumulating them
+        self._emit: Optional[Callable[[Any], Awaitable[None]]] = None
 
     async def process(self):
         """Worker that processes items from the queue"""
+        if self.workers > 1:
+            await self._process_parallel()
+            return
         try:
             while not (self.stop_flag.is_set() and self.queue.empty()):
                 try:
@@ -58,37 +111,7 @@ class IngestionEngine:
                     raw_data = await asyncio.wait_for(self.queue.get(), timeout=0.5)
                     
                     try:
-                        result = self.ingester.parse(raw_data)
-                        
-                        # Handle case where ingester returns a list of results (batch processing)
-                        if isinstance(result, list):
-                            self.logger.info(f"Processed batch of {len(result)} items")
-                            for item in result:
-                                self.results.append(item)
-                                # Print summary for each item
-                                self.logger.info(f"🧪 Common Data Model Results (Item {len(self.results)}):")
-                                self.logger.info(item.summary())
-                        else:
-                            self.results.append(result)
-                            # Print results nicely
-                            self.logger.info("🧪 Common Data Model Results:")
-                            self.logger.info(result.summary())
-
-                    except PulsePipeError as e:
-                        # Handle our custom errors
-                        self.logger.error(f"❌ Ingestion error: {e.message}")
-                        self.processing_errors.append({
-                            "message": e.message,
-                            "type": type(e).__name__,
-                            "details": e.details
-                        })
-                    except Exception as e:
-                        # Handle other exceptions
-                        self.logger.error(f"❌ Unexpected ingestion error: {e}", exc_info=True)
-                        self.processing_errors.append({
-                            "message": str(e),
-                            "type": type(e).__name__
-                        })
+                        await self._process_item(raw_data)
                     finally:
                         self.queue.task_done()
                         
@@ -98,7 +121,203 @@ class IngestionEngine:
                     
         except asyncio.CancelledError:
             self.logger.debug("Process task was cancelled")
+
+    async def _process_item(self, raw_data: Any) -> None:
+        """Parse one queued item in the event loop's thread and hand on the result."""
+        try:
+            if isinstance(raw_data, Path) and hasattr(self.ingester, "iter_file"):
+                await self._process_file(raw_data)
+            else:
+                result = self._parse(raw_data)
+                self._acknowledge(raw_data, result=result)
+                if not self._withdrawn(raw_data):
+                    await self._handle_result(result)
+        except Exception as e:
+            self._record_error(raw_data, e)
+
+    async def _process_file(self, path: Path) -> None:
+        """
+        Hand on each batch an incremental ingester maps from a file.
+
+        The ingester's generator is closed when processing stops early
+        (cancellation or an error), so pools it owns are shut down. Each
+        ``next`` runs in a worker thread and is shielded from cancellation;
+        if one is still running, the close waits until it returns.
+        """
+        # Incremental ingesters hand back batches as they are mapped
+        iterator = self.ingester.iter_file(path)
+        done = object()
+        step: Optional[asyncio.Future] = None
+        try:
+            while True:
+                step = asyncio.ensure_future(asyncio.to_thread(next, iterator, done))
+                batch = await asyncio.shield(step)
+                if batch is done:
+                    break
+                await self._handle_result(batch)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                if step is not None and not step.done():
+                    def close_after(future: asyncio.Future) -> None:
+                        if not future.cancelled():
+                            future.exception()  # Nobody is left to await it
+                        close()
+                    step.add_done_callback(close_after)
+                else:
+                    close()
+
+    async def _process_parallel(self) -> None:
+        """
+        Parse queued items concurrently in a worker pool.
+        
+        At most workers * 2 items are in flight, so a large backlog still
+        applies backpressure to the adapter. Paths for incremental
+        (iter_file) ingesters run inline once earlier items have finished.
+        """
+        loop = asyncio.get_running_loop()
+        executor, parse = self._create_executor()
+        # Insertion-ordered: future -> queued item
+        in_flight: Dict[asyncio.Future, Any] = {}
+        limit = self.workers * 2
+        get_task: Optional[asyncio.Task] = None
+        try:
+            while True:
+                draining = self.stop_flag.is_set() and self.queue.empty()
+                if get_task is not None and draining and not get_task.done():
+                    get_task.cancel()
+                    get_task = None
+                if get_task is None and not draining and len(in_flight) < limit:
+                    get_task = asyncio.ensure_future(self.queue.get())
+                if get_task is None and not in_flight:
+                    if draining:
+                        break
+                    await asyncio.sleep(0.05)
+                    continue
+                
+                waiters = set(in_flight)
+                if get_task is not None:
+                    waiters.add(get_task)
+                done, _ = await asyncio.wait(waiters, timeout=0.5,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                
+                if get_task is not None and get_task in done:
+                    raw_data = get_task.result()
+                    get_task = None
+                    if isinstance(raw_data, Path) and hasattr(self.ingester, "iter_file"):
+                        await self._collect(in_flight, wait_all=True)
+                        try:
+                            await self._process_item(raw_data)
+                        finally:
+                            self.queue.task_done()
+                    else:
+                        future = loop.run_in_executor(executor, parse, self._payload(raw_data))
+                        in_flight[future] = raw_data
+                
+                await self._collect(in_flight)
+        except asyncio.CancelledError:
+            self.logger.debug("Process task was cancelled")
+        finally:
+            if get_task is not None:
+                get_task.cancel()
+            for future in in_flight:
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _create_executor(self) -> "tuple[Executor, Callable[[Any], Any]]":
+        """Build the worker pool and the callable each task runs."""
+        if self.pool == "thread":
+            return (ThreadPoolExecutor(max_workers=self.workers),
+                    functools.partial(_parse_item, self.ingester))
+        # Each worker unpickles the ingester once instead of once per task
+        return (ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                    initargs=(self.ingester,)),
+                _parse_in_worker)
+
+    def _payload(self, raw_data: Any) -> Any:
+        """Strip str subclasses (e.g. MLLP messages and their ack hooks) before pickling."""
+        if self.pool == "process" and isinstance(raw_data, str) and type(raw_data) is not str:
+            return str(raw_data)
+        return raw_data
+
+    async def _collect(self, in_flight: Dict[asyncio.Future, Any], wait_all: bool = False) -> None:
+        """Hand on finished parses: in queue order when ordered, else as they complete."""
+        if wait_all and in_flight:
+            await asyncio.wait(set(in_flight))
+        for future in list(in_flight):
+            if not future.done():
+                if self.ordered:
+                    break
+                continue
+            raw_data = in_flight.pop(future)
+            try:
+                result = future.result()
+                self._acknowledge(raw_data, result=result)
+                if not self._withdrawn(raw_data):
+                    await self._handle_result(result)
+            except Exception as e:
+                self._record_error(raw_data, e)
+            finally:
+                self.queue.task_done()
+
+    def _record_error(self, raw_data: Any, error: Exception) -> None:
+        """Acknowledge a failed item and add it to processing_errors."""
+        self._acknowledge(raw_data, error=error)
+        if isinstance(error, PulsePipeError):
+            # Handle our custom errors
+            self.logger.error(f"❌ Ingestion error: {error.message}")
+            self.processing_errors.append({
+                "message": error.message,
+                "type": type(error).__name__,
+                "details": error.details
+            })
+        else:
+            # Handle other exceptions
+            self.logger.error(f"❌ Unexpected ingestion error: {error}", exc_info=error)
+            self.processing_errors.append({
+                "message": str(error),
+                "type": type(error).__name__
+            })
     
+    @staticmethod
+    def _acknowledge(raw_data: Any, result: Any = None, error: Optional[BaseException] = None) -> None:
+        """Report the parse outcome to items that carry an acknowledge hook (e.g. MLLP messages)."""
+        acknowledge = getattr(raw_data, "acknowledge", None)
+        if callable(acknowledge):
+            acknowledge(result=result, error=error)
+
+    def _withdrawn(self, raw_data: Any) -> bool:
+        """True for items the sender was told were not accepted (e.g. MLLP messages NAKed on timeout)."""
+        if getattr(raw_data, "withdrawn", False):
+            self.logger.warning("⚠️ Dropping item withdrawn by its adapter after an ACK timeout")
+            return True
+        return False
+
+    async def _handle_result(self, result: Any) -> None:
+        """Emit a parse result downstream or accumulate it for run()."""
+        if self._emit is not None:
+            # Streaming mode: pass results straight downstream
+            await self._emit(result)
+            return
+        
+        # Handle case where ingester returns a list of results (batch processing)
+        if isinstance(result, list):
+            self.logger.info(f"Processed batch of {len(result)} items")
+            for item in result:
+                self.results.append(item)
+                # Print summary for each item
+                self.logger.info(f"🧪 Common Data Model Results (Item {len(self.results)}):")
+                self.logger.info(item.summary())
+        else:
+            self.results.append(result)
+            # Print results nicely
+            self.logger.info("🧪 Common Data Model Results:")
+            self.logger.info(result.summary())
+
+    def _parse(self, raw_data: Any) -> Any:
+        """Parse one queued item; Paths go to the ingester's streaming parse_file."""
+        return _parse_item(self.ingester, raw_data)
+
     def _get_current_results(self) -> Any:
         """
         Get the current results without waiting for the adapter to finish.
@@ -127,6 +346,57 @@ class IngestionEngine:
             # Return None instead of empty model to prevent continuous processing loops
             return None
     
+    async def stream(self, emit: Callable[[Any], Awaitable[None]],
+                     stop_event: Optional[asyncio.Event] = None) -> None:
+        """
+        Run the adapter and ingester until the adapter finishes or stop_event is set.
+        
+        Unlike run(), results are not accumulated: each parse result is awaited
+        through emit as soon as it is available, so a single engine can serve
+        a continuous pipeline for its whole lifetime.
+        
+        Args:
+            emit: Coroutine function called with each parse result
+            stop_event: Event that ends streaming when set
+            
+        Raises:
+            AdapterError: If there's an error in the adapter
+            IngestionEngineError: If there's an unexpected error in the engine
+        """
+        self._emit = emit
+        processor_task = asyncio.create_task(self.process())
+        adapter_task = asyncio.create_task(self.adapter.run(self.queue))
+        stop_task = asyncio.create_task(stop_event.wait()) if stop_event else None
+        
+        try:
+            waiters = {adapter_task} if stop_task is None else {adapter_task, stop_task}
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            
+            if adapter_task.done():
+                # Propagate adapter failures, otherwise drain what it queued
+                adapter_task.result()
+                self.logger.info("Adapter task completed, draining ingestion queue")
+                self.stop_flag.set()
+                await processor_task
+        except (AdapterError, IngesterError):
+            raise
+        except Exception as e:
+            raise IngestionEngineError(
+                f"Unexpected error in ingestion stream: {str(e)}",
+                cause=e
+            ) from e
+        finally:
+            for task in (stop_task, adapter_task, processor_task):
+                if task is not None and not task.done():
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
+                    except Exception as e:
+                        self.logger.error(f"Error cancelling ingestion task: {str(e)}")
+            self._emit = None
+    
     async def run(self, timeout: Optional[float] = 30.0) -> Any:
         """
         Run the ingestion pipeline with adapter and ingester.
@@ -21,9 +21,14 @@
 
 # src/pulsepipe/ingesters/x12_ingester.py
 
+from pathlib import Path
+from typing import Iterator, List, Optional, TextIO, Union
+
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.models import PulseOperationalContent, MessageCache
+from pulsepipe.utils.errors import X12Error
 from .x12_utils import base_mapper
+from .x12_utils.tokenizer import iter_segments, DEFAULT_CHUNK_SIZE
 from .x12_utils import (
     clp_mapper,
     svc_mapper,
@@ -33,12 +38,69 @@ from .x12_utils import (
     svc_mapper,
 )
 
+# How parsed content is split: one object per interchange, per ST/SE
+# transaction set, or per CLP claim loop
+SPLIT_MODES = ("interchange", "transaction", "claim")
+
+# Segments that end a CLP claim loop in claim mode: the 835 loop 2000 header
+# (LX, TS3, TS2) and the PLB provider adjustments after the last claim
+CLAIM_LOOP_TERMINATORS = frozenset(("LX", "TS3", "TS2", "PLB"))
+
+# GS01 functional identifier code -> transaction set
+GS_TRANSACTION_TYPES = {
+    'HC': '837',  # Health Care Claim
+    'HP': '835',  # Health Care Claim Payment/Advice
+    'HR': '834',  # Benefit Enrollment and Maintenance
+    'HI': '270',  # Eligibility, Coverage or Benefit Inquiry
+    'HJ': '271',  # Eligibility, Coverage or Benefit Information
+    'HB': '276',  # Health Care Claim Status Request
+    'HN': '277',  # Health Care Claim Status Notification
+    'HS': '278',  # Health Care Services Review Information
+    'RT': '820',  # Payroll Deducted and Other Group Premium Payment
+    'FA': '999',  # Implementation Acknowledgment
+    'TA': '999',  # Implementation Acknowledgment (alternate code)
+    'RA': '277CA', # Claims Acknowledgement (used post-837)
+}
+
 class X12Ingester:
-    def __init__(self):
+    """
+    X12 ingester producing PulseOperationalContent.
+
+    Delimiters come from the ISA header. By default one content object is
+    built for the whole interchange; with ``split_by: transaction`` or
+    ``split_by: claim`` a content object is emitted per ST/SE transaction set
+    or per CLP claim loop, and ``iter_file`` streams them from disk.
+    """
+
+    def __init__(self, split_by: str = "interchange", chunk_size: int = DEFAULT_CHUNK_SIZE):
         self.logger = LogFactory.get_logger(__name__)
         self.logger.info("📁 Initializing X12Ingester")
+        if split_by not in SPLIT_MODES:
+            raise X12Error(
+                f"Invalid split_by: {split_by}",
+                details={"valid_modes": list(SPLIT_MODES)}
+            )
+        self.split_by = split_by
+        self.chunk_size = chunk_size
+
+    @classmethod
+    def from_config(cls, config: dict) -> "X12Ingester":
+        return cls(
+            split_by=config.get("split_by") or "interchange",
+            chunk_size=config.get("chunk_size", DEFAULT_CHUNK_SIZE),
+        )
+
+    @staticmethod
+    def _new_content(meta: dict) -> PulseOperationalContent:
+        return PulseOperationalContent(
+            transaction_type=meta.get("transaction_type", "UNKNOWN"),
+            interchange_control_number=meta.get("interchange_control_number", "UNKNOWN"),
+            functional_group_control_number=meta.get("functional_group_control_number", "UNKNOWN"),
+            organization_id="UNKNOWN",  # For now unless you pass it externally
+            claims=[], charges=[], payments=[], adjustments=[], prior_authorizations=[]
+        )
 
-    def parse(self, raw_data: str) -> PulseOperationalContent:
+    def parse(self, raw_data: str) -> Union[PulseOperationalContent, List[PulseOperationalContent]]:
         if not raw_data or not raw_data.strip():
             self.logger.warning("Empty X12 data received, returning empty model")
             return PulseOperationalContent(
@@ -53,27 +115,21 @@ class X12Ingester:
                 prior_authorizations=[]
             )
 
+        if self.split_by != "interchange":
+            return list(self.iter_contents(raw_data))
+
         try:
-            segments = [line.strip() for line in raw_data.strip().split('~') if line.strip()]
+            segments = list(iter_segments(raw_data, self.chunk_size))
             if not segments:
                 raise ValueError("No segments found in X12 data")
 
             meta = self._detect_transaction_type(segments)
 
             cache: MessageCache = {"claim_id": None, "patient_id": None, "encounter_id": None}
-            content = PulseOperationalContent(
-                transaction_type=meta.get("transaction_type", "UNKNOWN"),
-                interchange_control_number=meta.get("interchange_control_number", "UNKNOWN"),
-                functional_group_control_number=meta.get("functional_group_control_number", "UNKNOWN"),
-                organization_id="UNKNOWN",  # For now unless you pass it externally
-                claims=[], charges=[], payments=[], adjustments=[], prior_authorizations=[]
-            )
+            content = self._new_content(meta)
 
-            for segment_text in segments:
-                elements = segment_text.split('*')
-                segment_id = elements[0]
-                elements = elements[1:]
-                self._map_segment(segment_id, elements, content, cache)
+            for elements in segments:
+                self._map_segment(elements[0], elements[1:], content, cache)
 
             self.logger.info(f"Successfully parsed X12 message with {len(segments)} segments")
 
@@ -94,6 +150,87 @@ class X12Ingester:
                 prior_authorizations=[]
             )
 
+    def iter_file(self, path: Union[str, Path]) -> Iterator[List[PulseOperationalContent]]:
+        """Stream an X12 file from disk, yielding each content object as it completes."""
+        with open(path, "r", encoding="utf-8") as fp:
+            if self.split_by == "interchange":
+                yield [self.parse(fp.read())]
+                return
+            for content in self.iter_contents(fp):
+                yield [content]
+
+    def iter_contents(self, source: Union[str, TextIO]) -> Iterator[PulseOperationalContent]:
+        """
+        Yield one content object per transaction set (or claim loop) of an interchange.
+
+        In ``claim`` mode segments outside claim loops (payer details, LX
+        header numbers and TS3/TS2 provider summaries, PLB adjustments,
+        non-835 transactions) are collected into a transaction-level object
+        emitted at SE when it holds any data.
+        """
+        meta = {
+            "transaction_type": "UNKNOWN",
+            "interchange_control_number": "UNKNOWN",
+            "functional_group_control_number": "UNKNOWN"
+        }
+        by_claim = self.split_by == "claim"
+        cache: MessageCache = {}
+        outer: Optional[PulseOperationalContent] = None
+        claim: Optional[PulseOperationalContent] = None
+
+        for elements in iter_segments(source, self.chunk_size):
+            segment_id = elements[0]
+            if segment_id in ("ISA", "GS"):
+                self._update_meta(meta, elements)
+                continue
+            if segment_id == "ST":
+                cache = {"claim_id": None, "patient_id": None, "encounter_id": None}
+                outer, claim = self._new_content(meta), None
+                continue
+            if outer is None:
+                continue  # envelope segments outside a transaction set
+            if segment_id == "SE":
+                if claim is not None:
+                    yield claim
+                if not by_claim or self._has_data(outer):
+                    yield outer
+                outer = claim = None
+                continue
+
+            if by_claim:
+                if segment_id == "CLP":
+                    if claim is not None:
+                        yield claim
+                    claim = self._new_content(meta)
+                elif segment_id in CLAIM_LOOP_TERMINATORS and claim is not None:
+                    # A new header number loop (LX and its TS3/TS2 summaries) or
+                    # the provider level adjustments close the current claim loop
+                    yield claim
+                    claim = None
+            self._map_segment(segment_id, elements[1:], claim if claim is not None else outer, cache)
+
+        if outer is not None:
+            self.logger.warning("X12 transaction set without SE trailer; emitting what was parsed")
+            if claim is not None:
+                yield claim
+            if not by_claim or self._has_data(outer):
+                yield outer
+
+    @staticmethod
+    def _has_data(content: PulseOperationalContent) -> bool:
+        return bool(content.claims or content.charges or content.payments
+                    or content.adjustments or content.prior_authorizations)
+
+    @staticmethod
+    def _update_meta(meta: dict, parts: list) -> None:
+        if parts[0] == 'ISA':
+            if len(parts) > 13:
+                meta["interchange_control_number"] = parts[13]
+        elif parts[0] == 'GS':
+            if len(parts) > 1:
+                meta["transaction_type"] = GS_TRANSACTION_TYPES.get(parts[1], 'UNKNOWN')
+            if len(parts) > 6:
+                meta["functional_group_control_number"] = parts[6]
 
     def _detect_transaction_type(self, segments: list) -> dict:
         meta = {
@@ -102,41 +239,20 @@ class X12Ingester:
             "functional_group_control_number": "UNKNOWN"
         }
 
-        for seg in segments:
-            if seg.startswith('ISA'):
-                parts = seg.split('*')
-                if len(parts) > 13:
-                    meta["interchange_control_number"] = parts[13]
-            elif seg.startswith('GS'):
-                parts = seg.split('*')
-                if len(parts) > 1:
-                    meta["transaction_type"] = {
-                        'HC': '837',  # Health Care Claim
-                        'HP': '835',  # Health Care Claim Payment/Advice
-                        'HR': '834',  # Benefit Enrollment and Maintenance
-                        'HI': '270',  # Eligibility, Coverage or Benefit Inquiry
-                        'HJ': '271',  # Eligibility, Coverage or Benefit Information
-                        'HB': '276',  # Health Care Claim Status Request
-                        'HN': '277',  # Health Care Claim Status Notification
-                        'HS': '278',  # Health Care Services Review Information
-                        'RT': '820',  # Payroll Deducted and Other Group Premium Payment
-                        'FA': '999',  # Implementation Acknowledgment
-                        'TA': '999',  # Implementation Acknowledgment (alternate code)
-                        'RA': '277CA', # Claims Acknowledgement (used post-837)
-                    }.get(parts[1], 'UNKNOWN')
-                if len(parts) > 6:
-                    meta["functional_group_control_number"] = parts[6]
-                break  # we only expect one GS segment
+        for parts in segments:
+            if parts[0] in ('ISA', 'GS'):
+                self._update_meta(meta, parts)
+                if parts[0] == 'GS':
+                    break  # we only expect one GS segment
 
         return meta
 
 
     def _map_segment(self, segment_id: str, elements: list, content: PulseOperationalContent, cache: dict):
-        for mapper in base_mapper.MAPPER_REGISTRY:
-            if mapper.accepts(segment_id):
-                try:
-                    mapper.map(segment_id, elements, content, cache)
-                    self.logger.debug(f"Mapped segment {segment_id} using {mapper.__class__.__name__}")
-                except Exception as e:
-                    self.logger.exception(f"Error mapping segment {segment_id} with {mapper.__class__.__name__}")
-                break  # Only one mapper should handle a segment
+        mapper = base_mapper.get_x12_mapper(segment_id)
+        if mapper is not None:
+            try:
+                mapper.map(segment_id, elements, content, cache)
+                self.logger.debug(f"Mapped segment {segment_id} using {mapper.__class__.__name__}")
+            except Exception as e:
+                self.logger.exception(f"Error mapping segment {segment_id} with {mapper.__class__.__name__}")
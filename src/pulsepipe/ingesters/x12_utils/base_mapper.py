@@ -21,17 +21,63 @@
 
 # src/pulsepipe/ingesters/x12_utils/base_mapper.py
 
+from typing import Dict, List, Optional
+
 from pulsepipe.models import MessageCache
 
 MAPPER_REGISTRY = []
 
+# Segment id -> mapper, for mappers that accept their own typeCode
+MAPPER_DISPATCH: Dict[str, "BaseX12Mapper"] = {}
+
+# Mappers without a usable typeCode are still consulted through accepts()
+_FALLBACK_MAPPERS: List["BaseX12Mapper"] = []
+
+# Resolved lookups, including misses for unmapped segments
+_LOOKUP_CACHE: Dict[str, Optional["BaseX12Mapper"]] = {}
+
 class BaseX12Mapper:
     def __init_subclass__(cls):
         super().__init_subclass__()
-        MAPPER_REGISTRY.append(cls())
+        register_mapper(cls())
 
     def accepts(self, segment_id: str) -> bool:
         raise NotImplementedError("Mapper must implement `accepts()`")
 
     def map(self, segment_id: str, elements: list, content, cache: MessageCache):
         raise NotImplementedError("Mapper must implement `map()`")
+
+
+def register_mapper(mapper: BaseX12Mapper) -> None:
+    """
+    Add a mapper to the registry and index it by its segment id.
+
+    Raises:
+        ValueError: If another mapper already handles the same segment id
+    """
+    code = getattr(mapper, "typeCode", None)
+    if code and mapper.accepts(code):
+        existing = MAPPER_DISPATCH.get(code)
+        if existing is not None:
+            raise ValueError(
+                f"Duplicate X12 mapper for segment {code}: "
+                f"{mapper.__class__.__name__} conflicts with {existing.__class__.__name__}"
+            )
+        MAPPER_DISPATCH[code] = mapper
+    else:
+        _FALLBACK_MAPPERS.append(mapper)
+    MAPPER_REGISTRY.append(mapper)
+    _LOOKUP_CACHE.clear()
+
+
+def get_x12_mapper(segment_id: str) -> Optional[BaseX12Mapper]:
+    """Return the mapper for a segment id, or None if no mapper accepts it."""
+    try:
+        return _LOOKUP_CACHE[segment_id]
+    except KeyError:
+        pass
+    mapper = MAPPER_DISPATCH.get(segment_id)
+    if mapper is None:
+        mapper = next((m for m in _FALLBACK_MAPPERS if m.accepts(segment_id)), None)
+    _LOOKUP_CACHE[segment_id] = mapper
+    return mapper
@@ -0,0 +1,108 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/ingesters/x12_utils/tokenizer.py
+
+"""
+Streaming X12 segment tokenizer.
+
+Delimiters are taken from the ISA header instead of being assumed: the
+element separator is the character after ``ISA``, and the component
+separator and segment terminator are the two characters that follow the
+sixteenth element separator. Segments are then produced one at a time from
+a string or a text handle, so large interchanges are never split into one
+big list.
+"""
+
+import io
+from typing import Iterator, List, NamedTuple, TextIO, Union
+
+# Characters read from a handle per refill
+DEFAULT_CHUNK_SIZE = 256 * 1024
+
+
+class X12Delimiters(NamedTuple):
+    element: str = "*"
+    component: str = ":"
+    segment: str = "~"
+
+
+DEFAULT_DELIMITERS = X12Delimiters()
+
+
+def read_delimiters(text: str) -> X12Delimiters:
+    """
+    Read the delimiters declared by the ISA header at the start of ``text``.
+
+    Falls back to ``*``, ``:`` and ``~`` when there is no complete ISA header.
+    """
+    isa = text.lstrip("﻿ \t\r\n")
+    if not isa.startswith("ISA") or len(isa) < 4:
+        return DEFAULT_DELIMITERS
+
+    element = isa[3]
+    pos = 3
+    for _ in range(15):
+        pos = isa.find(element, pos + 1)
+        if pos < 0:
+            return DEFAULT_DELIMITERS
+    # ISA16 is a single component separator, followed by the segment terminator
+    if len(isa) < pos + 3:
+        return DEFAULT_DELIMITERS
+    return X12Delimiters(element=element, component=isa[pos + 1], segment=isa[pos + 2])
+
+
+def iter_segments(source: Union[str, TextIO], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[str]]:
+    """
+    Yield each segment of an interchange as a list of elements.
+
+    The first element is the segment id. Whitespace around segments (such
+    as line breaks after the terminator) is dropped, as are empty segments.
+    """
+    fp = io.StringIO(source) if isinstance(source, str) else source
+
+    buffer = fp.read(chunk_size)
+    # The ISA header is 106 characters; make sure all of it is buffered
+    while len(buffer) < 128:
+        more = fp.read(chunk_size)
+        if not more:
+            break
+        buffer += more
+    delimiters = read_delimiters(buffer)
+    terminator, element = delimiters.segment, delimiters.element
+
+    while True:
+        segments = buffer.split(terminator)
+        # The last piece may be a partial segment; keep it for the next chunk
+        buffer = segments.pop()
+        for segment in segments:
+            segment = segment.strip()
+            if segment:
+                yield segment.split(element)
+        more = fp.read(chunk_size)
+        if not more:
+            break
+        buffer += more
+
+    buffer = buffer.strip()
+    if buffer:
+        yield buffer.split(element)
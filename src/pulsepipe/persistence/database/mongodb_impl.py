@@ -198,8 +198,12 @@ class MongoDBConnection(DatabaseConnection):
                 return DatabaseResult(rows=rows)
             
             elif operation_type == "find":
+                filter_criteria = operation.get("filter", {})
+                if operation.get("in_field") and params:
+                    # Set-based lookup: match any of the given values
+                    filter_criteria = {**filter_criteria, operation["in_field"]: {"$in": list(params)}}
                 cursor = collection.find(
-                    operation.get("filter", {}),
+                    filter_criteria,
                     operation.get("projection")
                 )
                 
@@ -263,6 +267,10 @@ class MongoDBConnection(DatabaseConnection):
     
     def executemany(self, query: str, params_list: List[Union[Tuple, Dict]]) -> DatabaseResult:
         """Execute multiple MongoDB operations."""
+        operation = json.loads(query) if isinstance(query, str) else query
+        if operation.get("operation") == "update_one" and params_list:
+            return self._bulk_update(operation, params_list)
+        
         total_rowcount = 0
         last_id = None
         
@@ -278,6 +286,31 @@ class MongoDBConnection(DatabaseConnection):
             rowcount=total_rowcount
         )
     
+    def _bulk_update(self, operation: Dict[str, Any], params_list: List[Union[Tuple, Dict]]) -> DatabaseResult:
+        """Send a batch of update_one operations as a single unordered bulk_write."""
+        if self._database is None:
+            raise ConnectionError("Database connection is not established")
+        
+        collection = self._database[operation["collection"]]
+        upsert = operation.get("options", {}).get("upsert", False)
+        requests = []
+        for params in params_list:
+            update_doc, filter_doc = self._params_to_update(params, "update_one")
+            requests.append(pymongo.UpdateOne(filter_doc, update_doc, upsert=upsert))
+        
+        try:
+            result = collection.bulk_write(requests, ordered=False)
+        except pymongo.errors.PyMongoError as e:
+            raise wrap_database_error(
+                e,
+                f"MongoDB bulk update failed on {operation['collection']}",
+                {"operation": operation, "params_count": len(params_list)}
+            )
+        return DatabaseResult(
+            rows=[],
+            rowcount=result.modified_count + result.upserted_count
+        )
+    
     def commit(self) -> None:
         """Commit the current transaction (if in transaction)."""
         if self._in_transaction and self._session:
@@ -888,6 +921,16 @@ class MongoDBAdapter(DatabaseDialect):
             "options": {"upsert": True}
         })
     
+    def get_bookmark_check_many(self, count: int) -> str:
+        """Get MongoDB operation returning which of the given paths have bookmarks."""
+        return json.dumps({
+            "collection": f"{self.collection_prefix}bookmarks",
+            "operation": "find",
+            "filter": {},
+            "in_field": "path",  # Filled with {"$in": params}
+            "projection": {"path": 1, "_id": 0}
+        })
+    
     def get_bookmark_list(self) -> str:
         """Get MongoDB operation for listing all bookmarks."""
         return json.dumps({
@@ -27,7 +27,6 @@ PostgreSQL implementation of database connection and SQL dialect.
 Provides PostgreSQL-specific implementations with connection pooling support.
 """
 
-import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 from contextlib import contextmanager
@@ -41,6 +40,8 @@ try:
 except ImportError:
     PSYCOPG2_AVAILABLE = False
 
+from pulsepipe.utils import json_codec
+
 from .connection import DatabaseConnection, DatabaseResult
 from .dialect import DatabaseDialect
 from .exceptions import (
@@ -731,14 +732,14 @@ class PostgreSQLDialect(DatabaseDialect):
     
     def serialize_json(self, data: Any) -> str:
         """Serialize data to JSON for PostgreSQL storage."""
-        return json.dumps(data) if data is not None else None
+        return json_codec.dumps(data) if data is not None else None
     
     def deserialize_json(self, json_str: Optional[str]) -> Any:
         """Deserialize JSON from PostgreSQL storage."""
         if isinstance(json_str, dict):
             # Already deserialized by psycopg2
             return json_str
-        return json.loads(json_str) if json_str else None
+        return json_codec.loads(json_str) if json_str else None
     
     def escape_identifier(self, identifier: str) -> str:
         """Escape PostgreSQL identifier."""
@@ -791,6 +792,16 @@ class PostgreSQLDialect(DatabaseDialect):
             ON CONFLICT (path) DO NOTHING
         """
     
+    def get_bookmark_check_many(self, count: int) -> str:
+        """Get SQL returning which of ``count`` paths already have bookmarks."""
+        placeholders = ", ".join(["%s"] * count)
+        return f"SELECT path FROM bookmarks WHERE path IN ({placeholders})"
+    
+    def get_bookmark_insert_many(self, count: int) -> str:
+        """Get SQL inserting ``count`` (path, status) bookmarks in one statement."""
+        rows = ", ".join(["(%s, %s)"] * count)
+        return f"INSERT INTO bookmarks (path, status) VALUES {rows} ON CONFLICT (path) DO NOTHING"
+    
     def get_bookmark_list(self) -> str:
         """Get SQL for listing all bookmarks."""
         return "SELECT path FROM bookmarks ORDER BY path"
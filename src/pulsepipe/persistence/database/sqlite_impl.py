@@ -28,12 +28,13 @@ Provides SQLite-specific implementations while maintaining backward compatibilit
 """
 
 import sqlite3
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union
 from contextlib import contextmanager
 
+from pulsepipe.utils import json_codec
+
 from .connection import DatabaseConnection, DatabaseResult
 from .dialect import DatabaseDialect
 from .exceptions import (
@@ -654,11 +655,11 @@ class SQLiteDialect(DatabaseDialect):
     
     def serialize_json(self, data: Any) -> str:
         """Serialize data to JSON for SQLite storage."""
-        return json.dumps(data) if data is not None else None
+        return json_codec.dumps(data) if data is not None else None
     
     def deserialize_json(self, json_str: Optional[str]) -> Any:
         """Deserialize JSON from SQLite storage."""
-        return json.loads(json_str) if json_str else None
+        return json_codec.loads(json_str) if json_str else None
     
     def escape_identifier(self, identifier: str) -> str:
         """Escape SQLite identifier."""
@@ -701,6 +702,16 @@ class SQLiteDialect(DatabaseDialect):
         """Get SQL for inserting a bookmark."""
         return "INSERT OR IGNORE INTO bookmarks (path, status) VALUES (?, ?)"
     
+    def get_bookmark_check_many(self, count: int) -> str:
+        """Get SQL returning which of ``count`` paths already have bookmarks."""
+        placeholders = ", ".join(["?"] * count)
+        return f"SELECT path FROM bookmarks WHERE path IN ({placeholders})"
+    
+    def get_bookmark_insert_many(self, count: int) -> str:
+        """Get SQL inserting ``count`` (path, status) bookmarks in one statement."""
+        rows = ", ".join(["(?, ?)"] * count)
+        return f"INSERT OR IGNORE INTO bookmarks (path, status) VALUES {rows}"
+    
     def get_bookmark_list(self) -> str:
         """Get SQL for listing all bookmarks."""
         return "SELECT path FROM bookmarks ORDER BY path"
@@ -179,14 +179,16 @@ def get_tracking_repository(config: dict, connection: Optional[DatabaseConnectio
     Returns:
         TrackingRepository instance ready for use
     """
+    write_behind = config.get("persistence", {}).get("write_behind")
+    
     if connection is None:
         # Create new connection using the database abstraction
         db_connection = get_database_connection(config)
         dialect = get_sql_dialect(config)
-        return TrackingRepository(db_connection, dialect)
+        return TrackingRepository(db_connection, dialect, write_behind=write_behind)
     else:
         # Use provided connection
         dialect = get_sql_dialect(config)
-        return TrackingRepository(connection, dialect)
+        return TrackingRepository(connection, dialect, write_behind=write_behind)
 
 
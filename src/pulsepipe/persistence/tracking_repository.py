@@ -29,6 +29,7 @@ audit events, quality metrics, and performance data.
 """
 
 import json
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
@@ -36,6 +37,7 @@ from dataclasses import dataclass
 from pulsepipe.utils.log_factory import LogFactory
 from .models import ProcessingStatus, ErrorCategory
 from .database import DatabaseConnection, DatabaseDialect
+from .write_behind import WriteBehindBuffer
 
 logger = LogFactory.get_logger(__name__)
 
@@ -185,19 +187,32 @@ class TrackingRepository:
     
     Provides a high-level interface for data intelligence operations
     while abstracting away the database implementation details.
+    
+    With write-behind enabled, the ``record_*`` statistics and event inserts
+    are queued and written in batches by a background thread instead of one
+    execute and commit per call. Those methods then return None instead of
+    the inserted row ID. Reads, cleanup and ``complete_pipeline_run`` flush
+    the queue first.
     """
     
-    def __init__(self, connection: DatabaseConnection, dialect: DatabaseDialect):
+    def __init__(self, connection: DatabaseConnection, dialect: DatabaseDialect,
+                 write_behind: Optional[Dict[str, Any]] = None):
         """
         Initialize tracking repository.
         
         Args:
             connection: Database connection (abstracted)
             dialect: SQL dialect for database-specific operations
+            write_behind: Optional write-behind settings (enabled, batch_size,
+                flush_interval, max_queue_size)
         """
         self.conn = connection
         self.dialect = dialect
         
+        # Serializes connection use between callers and the write-behind flusher
+        self._lock = threading.RLock()
+        self._buffer = WriteBehindBuffer.from_config(connection, write_behind, lock=self._lock)
+        
         # Initialize schema if the connection supports it
         if hasattr(self.conn, 'init_schema'):
             try:
@@ -207,6 +222,31 @@ class TrackingRepository:
                 logger.warning(f"Could not initialize database schema: {e}")
                 # Don't fail - the schema might already exist
     
+    @property
+    def write_behind_enabled(self) -> bool:
+        return self._buffer is not None
+    
+    def _insert(self, sql: str, params: Tuple) -> Optional[int]:
+        """Insert a tracking row, buffering it when write-behind is enabled."""
+        if self._buffer is not None:
+            self._buffer.submit(sql, params)
+            return None
+        
+        with self._lock:
+            result = self.conn.execute(sql, params)
+            self.conn.commit()
+        return result.lastrowid
+    
+    def flush(self) -> None:
+        """Write any buffered tracking rows to the database."""
+        if self._buffer is not None:
+            self._buffer.flush()
+    
+    def close(self) -> None:
+        """Drain buffered rows and stop the write-behind flusher."""
+        if self._buffer is not None:
+            self._buffer.close()
+    
     # Pipeline Run Management
     
     def start_pipeline_run(self, run_id: str, name: str, config_snapshot: Optional[Dict[str, Any]] = None) -> None:
@@ -223,8 +263,9 @@ class TrackingRepository:
         sql = self.dialect.get_pipeline_run_insert()
         params = (run_id, name, self.dialect.format_datetime(datetime.now()), "running", config_data)
         
-        self.conn.execute(sql, params)
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute(sql, params)
+            self.conn.commit()
         logger.debug(f"Started tracking pipeline run: {run_id}")
     
     def complete_pipeline_run(self, run_id: str, status: str = "completed", 
@@ -237,12 +278,16 @@ class TrackingRepository:
             status: Final status (completed, failed, cancelled)
             error_message: Optional error message if failed
         """
+        # Guaranteed drain: every buffered row lands before the run is closed
+        self.flush()
+        
         sql = self.dialect.get_pipeline_run_update()
         now = self.dialect.format_datetime(datetime.now())
         params = (now, status, error_message, now, run_id)
         
-        self.conn.execute(sql, params)
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute(sql, params)
+            self.conn.commit()
         logger.debug(f"Completed pipeline run: {run_id} with status: {status}")
     
     def update_pipeline_run_counts(self, run_id: str, total: int = 0, 
@@ -260,8 +305,9 @@ class TrackingRepository:
         sql = self.dialect.get_pipeline_run_count_update()
         params = (total, successful, failed, skipped, self.dialect.format_datetime(datetime.now()), run_id)
         
-        self.conn.execute(sql, params)
-        self.conn.commit()
+        with self._lock:
+            self.conn.execute(sql, params)
+            self.conn.commit()
     
     def get_pipeline_run(self, run_id: str) -> Optional[PipelineRunSummary]:
         """
@@ -274,7 +320,8 @@ class TrackingRepository:
             PipelineRunSummary or None if not found
         """
         sql = self.dialect.get_pipeline_run_select()
-        result = self.conn.execute(sql, (run_id,))
+        with self._lock:
+            result = self.conn.execute(sql, (run_id,))
         
         row = result.fetchone()
         if not row:
@@ -295,7 +342,7 @@ class TrackingRepository:
     
     # Ingestion Statistics
     
-    def record_ingestion_stat(self, stat: IngestionStat) -> int:
+    def record_ingestion_stat(self, stat: IngestionStat) -> Optional[int]:
         """
         Record an ingestion statistic.
         
@@ -303,7 +350,7 @@ class TrackingRepository:
             stat: IngestionStat object to record
             
         Returns:
-            ID of the inserted record
+            ID of the inserted record, or None when write-behind is enabled
         """
         error_details_data = self.dialect.serialize_json(stat.error_details)
         
@@ -317,9 +364,7 @@ class TrackingRepository:
             self.dialect.format_datetime(stat.timestamp) if stat.timestamp else self.dialect.format_datetime(datetime.now())
         )
         
-        result = self.conn.execute(sql, params)
-        self.conn.commit()
-        return result.lastrowid
+        return self._insert(sql, params)
     
     def record_failed_record(self, ingestion_stat_id: int, original_data: str,
                            failure_reason: str, normalized_data: Optional[str] = None,
@@ -340,13 +385,15 @@ class TrackingRepository:
         sql = self.dialect.get_failed_record_insert()
         params = (ingestion_stat_id, original_data, normalized_data, failure_reason, stack_trace)
         
-        result = self.conn.execute(sql, params)
-        self.conn.commit()
+        # Written immediately: callers may need the row ID
+        with self._lock:
+            result = self.conn.execute(sql, params)
+            self.conn.commit()
         return result.lastrowid
     
     # Quality Metrics
     
-    def record_quality_metric(self, metric: QualityMetric) -> int:
+    def record_quality_metric(self, metric: QualityMetric) -> Optional[int]:
         """
         Record a quality metric.
         
@@ -354,7 +401,7 @@ class TrackingRepository:
             metric: QualityMetric object to record
             
         Returns:
-            ID of the inserted record
+            ID of the inserted record, or None when write-behind is enabled
         """
         missing_fields_json = self.dialect.serialize_json(metric.missing_fields) if metric.missing_fields else None
         invalid_fields_json = self.dialect.serialize_json(metric.invalid_fields) if metric.invalid_fields else None
@@ -372,15 +419,13 @@ class TrackingRepository:
             self.dialect.format_datetime(metric.timestamp) if metric.timestamp else self.dialect.format_datetime(datetime.now())
         )
         
-        result = self.conn.execute(sql, params)
-        self.conn.commit()
-        return result.lastrowid
+        return self._insert(sql, params)
     
     # Audit Events
     
     def record_audit_event(self, pipeline_run_id: str, event_type: str, stage_name: str,
                          message: str, event_level: str = "INFO", record_id: Optional[str] = None,
-                         details: Optional[Dict[str, Any]] = None, correlation_id: Optional[str] = None) -> int:
+                         details: Optional[Dict[str, Any]] = None, correlation_id: Optional[str] = None) -> Optional[int]:
         """
         Record an audit event.
         
@@ -395,7 +440,7 @@ class TrackingRepository:
             correlation_id: Optional correlation identifier for tracking related events
             
         Returns:
-            ID of the inserted audit event
+            ID of the inserted audit event, or None when write-behind is enabled
         """
         details_json = self.dialect.serialize_json(details) if details else None
         
@@ -405,9 +450,7 @@ class TrackingRepository:
             event_level, message, details_json, correlation_id
         )
         
-        result = self.conn.execute(sql, params)
-        self.conn.commit()
-        return result.lastrowid
+        return self._insert(sql, params)
     
     # Performance Metrics
     
@@ -415,7 +458,7 @@ class TrackingRepository:
                                 started_at: datetime, completed_at: datetime,
                                 records_processed: int = 0, memory_usage_mb: Optional[float] = None,
                                 cpu_usage_percent: Optional[float] = None,
-                                bottleneck_indicator: Optional[str] = None) -> int:
+                                bottleneck_indicator: Optional[str] = None) -> Optional[int]:
         """
         Record performance metrics for a pipeline stage.
         
@@ -430,7 +473,7 @@ class TrackingRepository:
             bottleneck_indicator: Description of any bottlenecks identified
             
         Returns:
-            ID of the inserted performance metric
+            ID of the inserted performance metric, or None when write-behind is enabled
         """
         duration_ms = int((completed_at - started_at).total_seconds() * 1000)
         records_per_second = records_processed / (duration_ms / 1000) if duration_ms > 0 else 0
@@ -442,11 +485,9 @@ class TrackingRepository:
             memory_usage_mb, cpu_usage_percent, bottleneck_indicator
         )
         
-        result = self.conn.execute(sql, params)
-        self.conn.commit()
-        return result.lastrowid
+        return self._insert(sql, params)
     
-    def record_chunking_stat(self, stat: ChunkingStat) -> int:
+    def record_chunking_stat(self, stat: ChunkingStat) -> Optional[int]:
         """
         Record a chunking statistic.
         
@@ -454,7 +495,7 @@ class TrackingRepository:
             stat: ChunkingStat object to record
             
         Returns:
-            ID of the inserted record
+            ID of the inserted record, or None when write-behind is enabled
         """
         error_details_data = self.dialect.serialize_json(stat.error_details)
         confidence_scores_data = self.dialect.serialize_json(stat.confidence_scores if hasattr(stat, 'confidence_scores') else None)
@@ -470,11 +511,9 @@ class TrackingRepository:
             self.dialect.format_datetime(stat.timestamp) if stat.timestamp else self.dialect.format_datetime(datetime.now())
         )
         
-        result = self.conn.execute(sql, params)
-        self.conn.commit()
-        return result.lastrowid
+        return self._insert(sql, params)
     
-    def record_deid_stat(self, stat: DeidStat) -> int:
+    def record_deid_stat(self, stat: DeidStat) -> Optional[int]:
         """
         Record a de-identification statistic.
         
@@ -482,7 +521,7 @@ class TrackingRepository:
             stat: DeidStat object to record
             
         Returns:
-            ID of the inserted record
+            ID of the inserted record, or None when write-behind is enabled
         """
         error_details_data = self.dialect.serialize_json(stat.error_details)
         confidence_scores_data = self.dialect.serialize_json(stat.confidence_scores)
@@ -498,11 +537,9 @@ class TrackingRepository:
             self.dialect.format_datetime(stat.timestamp) if stat.timestamp else self.dialect.format_datetime(datetime.now())
         )
         
-        result = self.conn.execute(sql, params)
-        self.conn.commit()
-        return result.lastrowid
+        return self._insert(sql, params)
     
-    def record_embedding_stat(self, stat: EmbeddingStat) -> int:
+    def record_embedding_stat(self, stat: EmbeddingStat) -> Optional[int]:
         """
         Record an embedding statistic.
         
@@ -510,7 +547,7 @@ class TrackingRepository:
             stat: EmbeddingStat object to record
             
         Returns:
-            ID of the inserted record
+            ID of the inserted record, or None when write-behind is enabled
         """
         error_details_data = self.dialect.serialize_json(stat.error_details)
         
@@ -524,11 +561,9 @@ class TrackingRepository:
             self.dialect.format_datetime(stat.timestamp) if stat.timestamp else self.dialect.format_datetime(datetime.now())
         )
         
-        result = self.conn.execute(sql, params)
-        self.conn.commit()
-        return result.lastrowid
+        return self._insert(sql, params)
     
-    def record_vector_db_stat(self, stat: VectorDbStat) -> int:
+    def record_vector_db_stat(self, stat: VectorDbStat) -> Optional[int]:
         """
         Record a vector database statistic.
         
@@ -536,7 +571,7 @@ class TrackingRepository:
             stat: VectorDbStat object to record
             
         Returns:
-            ID of the inserted record
+            ID of the inserted record, or None when write-behind is enabled
         """
         error_details_data = self.dialect.serialize_json(stat.error_details)
         
@@ -551,9 +586,7 @@ class TrackingRepository:
             self.dialect.format_datetime(stat.timestamp) if stat.timestamp else self.dialect.format_datetime(datetime.now())
         )
         
-        result = self.conn.execute(sql, params)
-        self.conn.commit()
-        return result.lastrowid
+        return self._insert(sql, params)
     
     # Analytics and Reporting
     
@@ -571,9 +604,10 @@ class TrackingRepository:
         Returns:
             Dictionary with ingestion summary statistics
         """
+        self.flush()
         sql, params = self.dialect.get_ingestion_summary(pipeline_run_id, start_date, end_date)
-        result = self.conn.execute(sql, params)
-        results = result.fetchall()
+        with self._lock:
+            results = self.conn.execute(sql, params).fetchall()
         
         summary = {
             "total_records": 0,
@@ -624,9 +658,10 @@ class TrackingRepository:
         Returns:
             Dictionary with quality summary statistics
         """
+        self.flush()
         sql, params = self.dialect.get_quality_summary(pipeline_run_id)
-        result = self.conn.execute(sql, params)
-        results = result.fetchall()
+        with self._lock:
+            results = self.conn.execute(sql, params).fetchall()
         
         if not results:
             return {
@@ -663,8 +698,8 @@ class TrackingRepository:
             List of PipelineRunSummary objects
         """
         sql = self.dialect.get_recent_pipeline_runs(limit)
-        result = self.conn.execute(sql, ())
-        results = result.fetchall()
+        with self._lock:
+            results = self.conn.execute(sql, ()).fetchall()
         
         return [
             PipelineRunSummary(
@@ -693,26 +728,28 @@ class TrackingRepository:
             Number of records deleted
         """
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
+        self.flush()
         
         # Use dialect-specific cleanup SQL
         cleanup_statements = self.dialect.get_cleanup(cutoff_date)
         
         total_deleted = 0
         
-        # Execute each cleanup statement in order
-        for sql, params in cleanup_statements:
-            try:
-                result = self.conn.execute(sql, params)
-                # Only count positive rowcounts to avoid negative totals from failed operations
-                if result.rowcount > 0:
-                    total_deleted += result.rowcount
-                    logger.debug(f"Deleted {result.rowcount} rows from cleanup SQL: {sql[:50]}...")
-            except Exception as e:
-                logger.error(f"Error executing cleanup SQL: {sql[:100]}... Error: {e}")
-                # Continue with other statements even if one fails
-                continue
-        
-        self.conn.commit()
+        with self._lock:
+            # Execute each cleanup statement in order
+            for sql, params in cleanup_statements:
+                try:
+                    result = self.conn.execute(sql, params)
+                    # Only count positive rowcounts to avoid negative totals from failed operations
+                    if result.rowcount > 0:
+                        total_deleted += result.rowcount
+                        logger.debug(f"Deleted {result.rowcount} rows from cleanup SQL: {sql[:50]}...")
+                except Exception as e:
+                    logger.error(f"Error executing cleanup SQL: {sql[:100]}... Error: {e}")
+                    # Continue with other statements even if one fails
+                    continue
+            
+            self.conn.commit()
         logger.info(f"Cleaned up {total_deleted} old tracking records older than {days_to_keep} days")
         
         return total_deleted
\ No newline at end of file
@@ -0,0 +1,211 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/persistence/write_behind.py
+
+"""
+Write-behind buffer for tracking inserts.
+
+Stage trackers record one row per processed record. Writing each row with
+its own execute and commit makes audit persistence the dominant cost of a
+run, so the buffer queues rows in memory and a background thread writes
+them in batches: rows are grouped by statement, sent with ``executemany``
+and committed once per batch.
+"""
+
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pulsepipe.utils.log_factory import LogFactory
+from .database import DatabaseConnection
+
+logger = LogFactory.get_logger(__name__)
+
+Params = Union[Tuple, Dict]
+
+# Queue sentinels
+_FLUSH = object()
+_STOP = object()
+
+
+class WriteBehindBuffer:
+    """
+    Bounded in-memory queue of pending inserts drained by a flusher thread.
+
+    A batch is written when it reaches ``batch_size`` rows or when its first
+    row has waited ``flush_interval`` seconds. ``submit`` blocks once
+    ``max_queue_size`` rows are pending, so a slow database applies
+    backpressure instead of growing memory without bound.
+
+    ``lock`` guards the shared connection; callers that also use the
+    connection directly must hold the same lock.
+    """
+
+    def __init__(self, connection: DatabaseConnection, lock: Optional[threading.RLock] = None,
+                 batch_size: int = 500, flush_interval: float = 1.0, max_queue_size: int = 10000):
+        self.conn = connection
+        self.lock = lock or threading.RLock()
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+
+        self.rows_written = 0
+        self.rows_failed = 0
+        self.batches_written = 0
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, max_queue_size))
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="tracking-write-behind", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_config(cls, connection: DatabaseConnection, config: Optional[Dict[str, Any]],
+                    lock: Optional[threading.RLock] = None) -> Optional["WriteBehindBuffer"]:
+        """
+        Build a buffer from a ``persistence.write_behind`` config section.
+
+        Returns None when the section is missing or disabled.
+        """
+        if not config or not config.get("enabled", False):
+            return None
+        return cls(
+            connection,
+            lock=lock,
+            batch_size=int(config.get("batch_size", 500)),
+            flush_interval=float(config.get("flush_interval", 1.0)),
+            max_queue_size=int(config.get("max_queue_size", 10000)),
+        )
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of queued rows."""
+        return self._queue.qsize()
+
+    def submit(self, sql: str, params: Params) -> None:
+        """Queue a row for insertion, blocking while the queue is full."""
+        if self._closed:
+            # Late writes after close go straight to the database
+            self._write([(sql, params)])
+            return
+        self._queue.put((sql, params))
+
+    def flush(self) -> None:
+        """Block until every row submitted so far has been written."""
+        if self._closed or threading.current_thread() is self._thread:
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def close(self, timeout: Optional[float] = 30.0) -> None:
+        """Drain pending rows and stop the flusher thread."""
+        if self._closed:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._closed = True
+        if self._thread.is_alive():
+            logger.warning(f"Write-behind flusher did not stop within {timeout}s; {self.pending} rows pending")
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            batch: List[Tuple[str, Params]] = []
+            taken = 1
+            stop = item is _STOP
+
+            if item is not _FLUSH and not stop:
+                batch.append(item)
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = self._queue.get(timeout=remaining)
+                    except queue.Empty:
+                        break
+                    taken += 1
+                    if item is _FLUSH:
+                        break
+                    if item is _STOP:
+                        stop = True
+                        break
+                    batch.append(item)
+
+            if batch:
+                self._write(batch)
+            for _ in range(taken):
+                self._queue.task_done()
+
+            if stop:
+                self._drain()
+                return
+
+    def _drain(self) -> None:
+        """Write anything still queued at shutdown."""
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _FLUSH and item is not _STOP:
+                batch.append(item)
+            self._queue.task_done()
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch: List[Tuple[str, Params]]) -> None:
+        grouped: "OrderedDict[str, List[Params]]" = OrderedDict()
+        for sql, params in batch:
+            grouped.setdefault(sql, []).append(params)
+
+        with self.lock:
+            try:
+                for sql, rows in grouped.items():
+                    self.conn.executemany(sql, rows)
+                self.conn.commit()
+                self.rows_written += len(batch)
+                self.batches_written += 1
+                return
+            except Exception as e:
+                logger.warning(f"Batched tracking write of {len(batch)} rows failed, retrying row by row: {e}")
+                self._rollback()
+
+            # Salvage what we can so one bad row does not lose the whole batch
+            for sql, params in batch:
+                try:
+                    self.conn.execute(sql, params)
+                    self.conn.commit()
+                    self.rows_written += 1
+                except Exception as e:
+                    self.rows_failed += 1
+                    logger.error(f"Dropping tracking row that could not be written: {e}")
+                    self._rollback()
+
+    def _rollback(self) -> None:
+        try:
+            self.conn.rollback()
+        except Exception:
+            pass
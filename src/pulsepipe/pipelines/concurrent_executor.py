@@ -29,13 +29,14 @@ Orchestrates the execution of pipeline stages in parallel using queues.
 
 import asyncio
 import time
+from collections import deque
 from typing import Dict, List, Any, Optional
 import traceback
 
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.utils.errors import PipelineError, ConfigurationError
 from pulsepipe.pipelines.context import PipelineContext
-from pulsepipe.pipelines.stages import PipelineStage
+from pulsepipe.pipelines.stages import PipelineStage, LazyStageMap, close_stages, warm_up_models
 
 logger = LogFactory.get_logger(__name__)
 
@@ -48,21 +49,20 @@ class ConcurrentPipelineExecutor:
     and producing to its output queue.
     """
     
-    def __init__(self):
-        """Initialize the concurrent pipeline executor."""
-        from pulsepipe.pipelines.stages import (
-            IngestionStage, DeidentificationStage, 
-            ChunkingStage, EmbeddingStage, VectorStoreStage
-        )
+    def __init__(self, stages: Optional[Dict[str, PipelineStage]] = None,
+                 concurrency_limit: Optional[asyncio.Semaphore] = None):
+        """
+        Initialize the concurrent pipeline executor.
         
+        Args:
+            stages: Stage instances to use, e.g. shared between several pipelines
+                    run in the same process; a fresh set is created if None
+            concurrency_limit: Semaphore bounding in-flight items across every
+                               executor that shares it
+        """
         # Register available stages
-        self.available_stages = {
-            "ingestion": IngestionStage(),
-            "deid": DeidentificationStage(),
-            "chunking": ChunkingStage(),
-            "embedding": EmbeddingStage(),
-            "vectorstore": VectorStoreStage(),
-        }
+        self.available_stages = stages if stages is not None else self.create_stages()
+        self.concurrency_limit = concurrency_limit
         
         # Define stage dependencies
         self.stage_dependencies = {
@@ -85,6 +85,11 @@ class ConcurrentPipelineExecutor:
         # Global timeout
         self.timeout = None
         
+    @staticmethod
+    def create_stages() -> LazyStageMap:
+        """Create the stage map; each stage is constructed when first used."""
+        return LazyStageMap()
+    
     async def execute_pipeline(self, context: PipelineContext, timeout: Optional[float] = None) -> Any:
         """
         Execute a pipeline with concurrent stages.
@@ -123,6 +128,11 @@ class ConcurrentPipelineExecutor:
             
             logger.info(f"{context.log_prefix} Enabled stages: {', '.join(enabled_stages)}")
             
+            # Load models up front if configured, rather than on the first item
+            await warm_up_models(context, [
+                stage for stage in map(self.available_stages.get, enabled_stages) if stage
+            ])
+            
             # Create queues between stages
             self.queues = self._create_queues(enabled_stages)
             
@@ -152,6 +162,10 @@ class ConcurrentPipelineExecutor:
                 cause=e
             )
         finally:
+            # Release the worker pools the stages started for this run
+            stages = [self.available_stages.get(stage_name) for stage_name in self.tasks]
+            close_stages([stage for stage in stages if stage], context)
+            
             # Cancel timeout task if it exists
             if timeout_task:
                 timeout_task.cancel()
@@ -291,7 +305,23 @@ class ConcurrentPipelineExecutor:
                     if adapter_config.get("type") == "file_watcher":
                         continuous_mode = adapter_config.get("continuous", True)
                     
-                    if continuous_mode:
+                    if continuous_mode and callable(getattr(stage, "open_session", None)):
+                        # One adapter and engine for the lifetime of the pipeline,
+                        # streaming parsed items straight onto the output queue
+                        logger.info(f"{context.log_prefix} Running ingestion in continuous mode")
+                        logger.info(f"{context.log_prefix} Starting persistent ingestion session")
+                        
+                        session = stage.open_session(context)
+                        
+                        # Items are only counted; a long-running session must not
+                        # hold everything it has streamed in memory
+                        try:
+                            item_count = await session.run(output_queue.put, self.stop_event)
+                        finally:
+                            await session.close()
+                        
+                        logger.info(f"{context.log_prefix} Continuous ingestion completed, processed {item_count} items")
+                    elif continuous_mode:
                         logger.info(f"{context.log_prefix} Running ingestion in continuous mode")
                         logger.info(f"{context.log_prefix} Starting continuous ingestion")
                         
@@ -397,7 +427,7 @@ class ConcurrentPipelineExecutor:
                     
                 # For continuous mode, we don't signal completion until explicitly stopped
                 if continuous_mode:
-                    logger.info(f"{context.log_prefix} Ingestion stage ongoing - processed {len(stage_results)} items so far")
+                    logger.info(f"{context.log_prefix} Ingestion stage ongoing - processed {item_count} items so far")
                 else:
                     # For one-time processing, mark completion
                     logger.info(f"{context.log_prefix} Ingestion completed, sent {len(stage_results)} items to next stage")
@@ -420,50 +450,77 @@ class ConcurrentPipelineExecutor:
                         "results": []
                     }
                 
-                while not self.stop_event.is_set():
+                # Items are dispatched to stage.execute concurrently, up to the
+                # stage executor's max_in_flight, and emitted in arrival order
+                max_in_flight = stage.get_executor(context).max_in_flight
+                in_flight = deque()
+                
+                async def emit_oldest():
+                    nonlocal item_count, last_progress_time
+                    task = in_flight.popleft()
                     try:
-                        # Get item from input queue with timeout
-                        item = await asyncio.wait_for(input_queue.get(), timeout=10.0)
+                        result = await task
                         
-                        # Check for end-of-queue marker
-                        if item is None:
-                            logger.info(f"{context.log_prefix} Received end-of-queue marker in {stage_name}")
-                            break
-                        
-                        # Process item
+                        # Put result in output queue if we have one
+                        if result and output_queue:
+                            await output_queue.put(result)
+                            stage_results.append(result)
+                            item_count += 1
+                            
+                            # Log progress periodically
+                            current_time = time.time()
+                            if current_time - last_progress_time > 5.0:
+                                logger.info(f"{context.log_prefix} {stage_name}: Processed {item_count} items so far")
+                                last_progress_time = current_time
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        logger.error(f"{context.log_prefix} Error processing item in {stage_name}: {e}")
+                        context.add_error(stage_name, f"Error processing item: {str(e)}")
+                    
+                    # Mark item as processed
+                    input_queue.task_done()
+                
+                try:
+                    while not self.stop_event.is_set():
                         try:
-                            result = await stage.execute(context, item)
+                            # Get item from input queue with timeout
+                            item = await asyncio.wait_for(input_queue.get(), timeout=10.0)
                             
-                            # Put result in output queue if we have one
-                            if result and output_queue:
-                                await output_queue.put(result)
-                                stage_results.append(result)
-                                item_count += 1
-                                
-                                # Log progress periodically
-                                current_time = time.time()
-                                if current_time - last_progress_time > 5.0:
-                                    logger.info(f"{context.log_prefix} {stage_name}: Processed {item_count} items so far")
-                                    last_progress_time = current_time
+                            # Check for end-of-queue marker
+                            if item is None:
+                                logger.info(f"{context.log_prefix} Received end-of-queue marker in {stage_name}")
+                                break
+                            
+                            # Process item
+                            in_flight.append(asyncio.create_task(self._execute_item(stage, context, item)))
+                            while len(in_flight) >= max_in_flight:
+                                await emit_oldest()
+                            
+                        except asyncio.TimeoutError:
+                            # Flush finished work while the input is idle
+                            while in_flight and in_flight[0].done():
+                                await emit_oldest()
+                            # Check if we should continue waiting
+                            if self.stop_event.is_set():
+                                logger.info(f"{context.log_prefix} Stop event detected in {stage_name}, exiting")
+                                break
+                            # Log that we're still waiting for input
+                            logger.debug(f"{context.log_prefix} {stage_name} waiting for input...")
+                            continue
+                        except asyncio.CancelledError:
+                            raise
                         except Exception as e:
-                            logger.error(f"{context.log_prefix} Error processing item in {stage_name}: {e}")
-                            context.add_error(stage_name, f"Error processing item: {str(e)}")
-                        
-                        # Mark item as processed
-                        input_queue.task_done()
-                        
-                    except asyncio.TimeoutError:
-                        # Check if we should continue waiting
-                        if self.stop_event.is_set():
-                            logger.info(f"{context.log_prefix} Stop event detected in {stage_name}, exiting")
-                            break
-                        # Log that we're still waiting for input
-                        logger.debug(f"{context.log_prefix} {stage_name} waiting for input...")
-                        continue
-                    except Exception as e:
-                        logger.error(f"{context.log_prefix} Unexpected error in {stage_name}: {e}")
-                        if self.stop_event.is_set():
-                            break
+                            logger.error(f"{context.log_prefix} Unexpected error in {stage_name}: {e}")
+                            if self.stop_event.is_set():
+                                break
+                    
+                    # Drain items still being processed
+                    while in_flight and not self.stop_event.is_set():
+                        await emit_oldest()
+                finally:
+                    for task in in_flight:
+                        task.cancel()
                 
                 # Signal the end of this stage's output
                 if output_queue:
@@ -511,6 +568,13 @@ class ConcurrentPipelineExecutor:
             )
     
 
+    async def _execute_item(self, stage: PipelineStage, context: PipelineContext, item: Any) -> Any:
+        """Execute a stage on one item within the shared concurrency limit, if any."""
+        if self.concurrency_limit is None:
+            return await stage.execute(context, item)
+        async with self.concurrency_limit:
+            return await stage.execute(context, item)
+
     async def _wait_for_completion(
         self, tasks: Dict[str, asyncio.Task], context: PipelineContext
     ) -> Dict[str, Any]:
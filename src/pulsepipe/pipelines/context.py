@@ -28,18 +28,19 @@ Manages state and configuration during pipeline execution.
 """
 
 import uuid
-import json
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.utils.errors import ConfigurationError
 from pulsepipe.utils.config_loader import load_config
 from pulsepipe.config.data_intelligence_config import load_data_intelligence_config
 from pulsepipe.persistence.factory import get_tracking_repository
+from pulsepipe.persistence.tracking_repository import TrackingRepository
 from pulsepipe.audit.audit_logger import AuditLogger
 from pulsepipe.audit.ingestion_tracker import IngestionTracker
 from pulsepipe.audit.chunking_tracker import ChunkingTracker
@@ -67,7 +68,8 @@ class PipelineContext:
                  summary: bool = False,
                  print_model: bool = False,
                  pretty: bool = True,
-                 verbose: bool = False):
+                 verbose: bool = False,
+                 tracking_repository: Optional[TrackingRepository] = None):
         """
         Initialize a pipeline context.
         
@@ -79,6 +81,8 @@ class PipelineContext:
             print_model: Whether to print the model data
             pretty: Whether to use pretty formatting for output
             verbose: Whether to include verbose information
+            tracking_repository: Repository shared with other pipelines in this
+                                 process; a dedicated one is created if None
         """
         self.pipeline_id = str(uuid.uuid4())
         self.name = name
@@ -113,6 +117,7 @@ class PipelineContext:
         # Initialize data intelligence and audit logging
         self.audit_logger = None
         self.tracking_repository = None
+        self._shared_tracking_repository = tracking_repository
         self.stage_trackers = {}  # Store stage-specific trackers
         self._init_data_intelligence()
         
@@ -135,7 +140,9 @@ class PipelineContext:
                 
                 # Initialize database connection and tracking repository
                 logger.debug(f"{self.log_prefix} Creating tracking repository...")
-                self.tracking_repository = get_tracking_repository(self.config)
+                self.tracking_repository = (
+                    self._shared_tracking_repository or get_tracking_repository(self.config)
+                )
                 logger.debug(f"{self.log_prefix} Tracking repository created successfully")
                 
                 # Initialize database schema
@@ -500,7 +507,7 @@ class PipelineContext:
             return f"{base}_{stage_name}_{suffix}{ext}"
         return f"{base}_{stage_name}{ext}"
     
-    def export_results(self, data, output_type=None, format=None):
+    def export_results(self, data, output_type=None, format=None, pretty=False):
         """
         Export pipeline results to the configured output path.
         
@@ -508,6 +515,7 @@ class PipelineContext:
             data: The data to export
             output_type: Type of output (ingestion, chunking, etc.)
             format: Output format (json, csv, etc.)
+            pretty: Whether to indent JSON output
         """
         if not self.output_path:
             return
@@ -536,10 +544,9 @@ class PipelineContext:
         with open(normalized_path, "w", encoding='utf-8') as f:
             if hasattr(data, 'model_dump_json'):
                 # If it's a Pydantic model, use its JSON serialization
-                f.write(data.model_dump_json(indent=2))
+                f.write(data.model_dump_json(indent=2 if pretty else None))
             else:
-                # Otherwise use standard JSON serialization
-                json.dump(data, f, indent=2)
+                json_codec.dump(data, f, pretty=pretty)
 
 
     def get_summary(self) -> Dict[str, Any]:
@@ -587,6 +594,12 @@ class PipelineContext:
                 status=status,
                 error_message=error_message
             )
+            if self.tracking_repository is self._shared_tracking_repository:
+                # Other pipelines still write here; the owner closes it
+                self.tracking_repository.flush()
+            else:
+                # Stop the write-behind flusher, if any; later writes go straight through
+                self.tracking_repository.close()
         
         # Build summary
         return {
@@ -0,0 +1,212 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/pipelines/deid/field_plan.py
+
+"""
+Per-model de-identification field plans.
+
+The Safe Harbor handlers used to walk every object's __dict__ and test each
+attribute's name and value type for every record. A FieldPlan does that
+classification once per Pydantic model class, from its field names and
+annotations, and records which fields each handler touches:
+
+- dates: fields that may hold a date, datetime or list of them, plus date-named strings
+- identifiers: identifier dicts, MRN/SSN/license strings and *_id references
+- geographic: address-like attributes
+- contact, biometric, account: the remaining PHI categories
+- free_text: descriptions, notes and comments; the structured record handlers
+  redact them through the prefiltered text path (Note.text and
+  ImagingReport.narrative have their own, unprefiltered, note path)
+
+Plans for Pydantic models are cached per class, so printing plan_for_model()
+for a model shows exactly which of its fields de-identification can change.
+Other objects get a plan built from their instance attributes on each call.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from types import UnionType
+from typing import Annotated, Any, FrozenSet, Iterable, Literal, Optional, Tuple, Type, Union, get_args, get_origin
+from datetime import date
+
+from pydantic import BaseModel
+
+# Attribute-name keywords per PHI category, matched case-insensitively
+DATE_KEYWORDS = ("date", "time", "birth", "admit", "discharge")
+ADDRESS_KEYWORDS = ("address", "street", "city", "zip", "zipcode", "postal")
+CONTACT_KEYWORDS = ("phone", "fax", "email", "contact")
+BIOMETRIC_KEYWORDS = ("biometric", "fingerprint", "iris", "retinal", "voice", "dna")
+ACCOUNT_KEYWORDS = ("account", "payment", "credit", "debit", "card", "bank", "financial")
+FREE_TEXT_KEYWORDS = ("text", "narrative", "note", "comment", "description", "summary",
+                      "impression", "interpretation", "instruction")
+
+# Kinds of string identifier, in the order the identifier handler checks them
+MRN = "mrn"
+SSN = "ssn"
+LICENSE = "license"
+REFERENCE = "reference"
+
+
+@dataclass(frozen=True)
+class FieldPlan:
+    """Fields of one model class that each de-identification handler works on, in declaration order."""
+    model: str
+    dates: Tuple[str, ...] = ()
+    date_strings: FrozenSet[str] = frozenset()
+    identifiers: Tuple[Tuple[str, Optional[str]], ...] = ()
+    identifier_dicts: FrozenSet[str] = frozenset()
+    geographic: Tuple[str, ...] = ()
+    contact: Tuple[str, ...] = ()
+    biometric: Tuple[str, ...] = ()
+    account: Tuple[str, ...] = ()
+    free_text: Tuple[str, ...] = ()
+
+
+def plan_for(obj: Any) -> FieldPlan:
+    """Plan for an object: cached per class for Pydantic models, built from attributes otherwise."""
+    if isinstance(obj, BaseModel):
+        return plan_for_model(type(obj))
+    fields = [(name, Any) for name in vars(obj)]
+    return compile_plan(type(obj).__name__, fields, dir(obj))
+
+
+@lru_cache(maxsize=None)
+def plan_for_model(model: Type[BaseModel]) -> FieldPlan:
+    """Compile the plan for a Pydantic model class from its field names and annotations."""
+    fields = [(name, info.annotation) for name, info in model.model_fields.items()]
+    # Attribute names as dir() sees them on an instance: class attributes plus fields
+    attributes = sorted(set(dir(model)) | set(model.model_fields))
+    return compile_plan(model.__name__, fields, attributes)
+
+
+def compile_plan(model: str, fields: Iterable[Tuple[str, Any]], attributes: Iterable[str]) -> FieldPlan:
+    """
+    Classify fields by name and annotation.
+    
+    Args:
+        model: Name of the model, for auditing
+        fields: (name, annotation) pairs; Any admits every value type
+        attributes: All attribute names, searched for address-like names
+    """
+    dates, date_strings, identifiers, identifier_dicts = [], set(), [], set()
+    contact, biometric, account, free_text = [], [], [], []
+    
+    for name, annotation in fields:
+        if name.startswith("_"):
+            continue
+        lowered = name.lower()
+        holds_str = _admits(annotation, str)
+        
+        is_date_string = holds_str and _matches(lowered, DATE_KEYWORDS)
+        if is_date_string:
+            date_strings.add(name)
+        if is_date_string or _admits(annotation, date) or _admits_list_of(annotation, date):
+            dates.append(name)
+        
+        is_identifier_dict = "identifiers" in name and _admits(annotation, dict)
+        if is_identifier_dict:
+            identifier_dicts.add(name)
+        kind = _identifier_kind(name, lowered) if holds_str else None
+        if kind or is_identifier_dict:
+            identifiers.append((name, kind))
+        
+        if holds_str and _matches(lowered, CONTACT_KEYWORDS):
+            contact.append(name)
+        if _matches(lowered, BIOMETRIC_KEYWORDS):
+            biometric.append(name)
+        if holds_str and _matches(lowered, ACCOUNT_KEYWORDS):
+            account.append(name)
+        if holds_str and _matches(lowered, FREE_TEXT_KEYWORDS) and not lowered.endswith(("_id", "_code")):
+            free_text.append(name)
+    
+    geographic = tuple(name for name in attributes if _matches(name.lower(), ADDRESS_KEYWORDS))
+    
+    return FieldPlan(
+        model=model,
+        dates=tuple(dates),
+        date_strings=frozenset(date_strings),
+        identifiers=tuple(identifiers),
+        identifier_dicts=frozenset(identifier_dicts),
+        geographic=geographic,
+        contact=tuple(contact),
+        biometric=tuple(biometric),
+        account=tuple(account),
+        free_text=tuple(free_text),
+    )
+
+
+def _matches(lowered: str, keywords: Tuple[str, ...]) -> bool:
+    return any(keyword in lowered for keyword in keywords)
+
+
+def _identifier_kind(name: str, lowered: str) -> Optional[str]:
+    """Kind of string identifier a field name marks, or None."""
+    if "mrn" in lowered:
+        return MRN
+    if "ssn" in lowered:
+        return SSN
+    if "license" in lowered:
+        return LICENSE
+    if name.endswith("_id"):
+        return REFERENCE
+    return None
+
+
+def _branches(annotation: Any) -> Iterable[Any]:
+    """Yield the alternatives of an annotation, looking through Optional, Union, Annotated and Literal."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        yield from _branches(get_args(annotation)[0])
+    elif origin is Union or origin is UnionType:
+        for arg in get_args(annotation):
+            yield from _branches(arg)
+    elif origin is Literal:
+        for value in get_args(annotation):
+            yield type(value)
+    else:
+        yield annotation
+
+
+def _admits(annotation: Any, kind: type) -> bool:
+    """True if a field with this annotation may hold a value of the given type."""
+    for branch in _branches(annotation):
+        target = get_origin(branch) or branch
+        # Any, object, TypeVars and unresolved forward references admit anything
+        if branch is Any or target is object or not isinstance(target, type):
+            return True
+        if issubclass(target, kind):
+            return True
+    return False
+
+
+def _admits_list_of(annotation: Any, kind: type) -> bool:
+    """True if a field with this annotation may hold a list with items of the given type."""
+    for branch in _branches(annotation):
+        target = get_origin(branch) or branch
+        if branch is Any or target is object or not isinstance(target, type):
+            return True
+        if issubclass(target, list):
+            args = get_args(branch)
+            if not args or any(_admits(arg, kind) for arg in args):
+                return True
+    return False
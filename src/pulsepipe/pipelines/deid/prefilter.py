@@ -0,0 +1,98 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/pipelines/deid/prefilter.py
+
+"""
+Cheap PHI prefilter that decides which text fields need NER.
+
+Short structured values (codes, units, numbers, vocabulary display names)
+rarely contain PHI, yet a Presidio/spaCy analysis costs the same for them
+as for a sentence. The prefilter sorts each field into one of three tiers:
+
+- SKIP: known vocabulary, or no letters and no structured PHI; left unchanged
+- REGEX: any other text that does not look name-like; regex-redacted
+- NER: long text or anything name-like, sent to the analyzer
+
+The prefilter is meant for short structured fields. Note and narrative
+text is never prefiltered, since a short note can name a patient in a way
+these checks miss ("smith called re refill").
+"""
+
+import re
+from typing import Any, Dict, Iterable, Optional
+
+from pulsepipe.pipelines.deid.regex_redactor import RegexRedactor
+
+SKIP = "skip"
+REGEX = "regex"
+NER = "ner"
+
+DEFAULT_MAX_LENGTH = 64
+
+# A capitalized word after the first token, an honorific, or two or more
+# all-caps words in a row (HL7-style "SMITH, JOHN")
+_NAME_LIKE = re.compile(
+    r"\b(?:Dr|Doctor|Mr|Mrs|Ms|Miss)\b"
+    r"|\s[A-Z][a-z]+"
+    r"|\b[A-Z]{2,},?\s+[A-Z]{2,}\b"
+)
+
+_HAS_LETTER = re.compile(r"[^\W\d_]")
+
+
+class PHIPrefilter:
+    """
+    Heuristic screen deciding whether a text field needs NER.
+    
+    Args:
+        max_length: Texts longer than this always go to NER
+        vocabulary: Known non-PHI values (e.g. code display names), matched case-insensitively
+    """
+    
+    def __init__(self, max_length: int = DEFAULT_MAX_LENGTH, vocabulary: Optional[Iterable[str]] = None):
+        self.max_length = max_length
+        self.vocabulary = frozenset(v.casefold() for v in vocabulary or ())
+        # Address and ZIP patterns included; state precision leaves out the
+        # location pattern that would flag every capitalized word
+        self.redactor = RegexRedactor(geographic_precision="state")
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PHIPrefilter":
+        """Build from the deid config (prefilter_max_length, prefilter_vocabulary)."""
+        return cls(
+            max_length=config.get("prefilter_max_length", DEFAULT_MAX_LENGTH),
+            vocabulary=config.get("prefilter_vocabulary")
+        )
+    
+    def classify(self, text: str) -> str:
+        """Return SKIP, REGEX or NER for one text field."""
+        stripped = text.strip()
+        if not stripped or stripped.casefold() in self.vocabulary:
+            return SKIP
+        if len(stripped) > self.max_length or _NAME_LIKE.search(stripped):
+            return NER
+        # Letters can always spell PHI the checks above miss, so they get at
+        # least regex redaction
+        if _HAS_LETTER.search(stripped) or self.redactor.search(stripped):
+            return REGEX
+        return SKIP
@@ -0,0 +1,185 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/pipelines/deid/regex_redactor.py
+
+"""
+Precompiled regex redaction for de-identification.
+
+The enabled PHI patterns are compiled once into two alternations with a
+named group per pattern: the structured patterns (MRN, phone, SSN, date,
+...) and the name and geographic patterns. The structured scanner runs
+first; the name/geographic scanner then only scans the text between its
+matches, so a date such as "March 3, 2021" can never be taken for a name
+or an address. Within one scanner, where matches overlap the leftmost
+wins; at the same position the pattern listed first in PHI_PATTERNS wins.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+# (name, pattern, replacement) in priority order. Every pattern must start
+# with a word boundary. Replacements may refer to the pattern's own named
+# groups with \g<name>.
+PHI_PATTERNS: List[Tuple[str, str, str]] = [
+    # Medical record numbers - various formats (the label is kept)
+    ("mrn", r'(?i:\b(?P<mrn_label>MRN|Medical Record Number|Record Number|Chart Number)\s*:?\s*[A-Za-z0-9-]{4,14}\b)',
+     r'\g<mrn_label>: [REDACTED-MRN]'),
+    
+    # Phone numbers
+    ("phone", r'\b(?:\+\d{1,3}[-\s.]?)?\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4}\b', '[REDACTED-PHONE]'),
+    
+    # Social Security Numbers (with or without dashes)
+    ("ssn", r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b', '[REDACTED-SSN]'),
+    
+    # Email addresses
+    ("email", r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[REDACTED-EMAIL]'),
+    
+    # URLs
+    ("url", r'\bhttps?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(?:/[-\w%.]+)*\b', '[REDACTED-URL]'),
+    
+    # IP addresses
+    ("ip", r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', '[REDACTED-IP]'),
+    
+    # Common financial account patterns (the label is kept)
+    ("account", r'(?i:\b(?P<account_label>Acct|Account)\s*(?:#|No|Number|:)?\s*[-#]?\s*\d{4,17}\b)',
+     r'\g<account_label>: [REDACTED-ACCT]'),
+    
+    # Credit card-like patterns
+    ("cc", r'\b(?:\d{4}[- ]?){3}\d{4}\b', '[REDACTED-CC]'),
+    
+    # License numbers (simple pattern, could be enhanced)
+    ("license", r'(?i:\b[A-Z](?:\d[- ]?){6,8}[A-Z0-9]\b)', '[REDACTED-LICENSE]'),
+    
+    # Dates: YYYY-MM-DD, MM/DD/YYYY, DD-MON-YYYY, MON DD, YYYY
+    ("date", r'\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b'
+             r'|\b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b'
+             r'|\b\d{1,2}[-\s][A-Za-z]{3,9}[-\s]\d{4}\b'
+             r'|\b[A-Za-z]{3,9}\s\d{1,2},?\s\d{4}\b', '[REDACTED-DATE]'),
+    
+    # Bare years, only for patients over 90 with over_90_handling: redact
+    ("year", r'\b(?:19|20)\d{2}\b', '[REDACTED-YEAR]'),
+    
+    # Names: Dr./Mr./Mrs./Ms. with up to three names, First Last. The honorific
+    # takes the whole name, since it matches leftmost and would otherwise leave
+    # the surname of "Mr. Robert Lee" behind
+    ("name", r'\b(?:Dr|Doctor|Mr|Mrs|Ms|Miss)\.?\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}\b'
+             r'|\b[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b', '[REDACTED-NAME]'),
+    
+    # Street addresses (state precision)
+    ("address", r'(?i:\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Place|Pl|Terrace|Ter|Way)\b)',
+     '[REDACTED-ADDRESS]'),
+    
+    # City and state names (none/country precision; would need a gazetteer for production)
+    ("location", r'\b[A-Z][a-z]+(?:,\s*[A-Z]{2})?\b', '[REDACTED-LOCATION]'),
+    
+    # ZIP codes
+    ("zip", r'\b\d{5}(?:-\d{4})?\b', '[REDACTED-ZIP]'),
+]
+
+# Patterns always scanned for; year and the geographic ones depend on the config
+BASE_PATTERNS = ("mrn", "phone", "ssn", "email", "url", "ip", "account", "cc", "license", "date", "name")
+
+# Patterns that only scan the text left over by the structured ones
+FREE_TEXT_PATTERNS = frozenset(("name", "address", "location", "zip"))
+GEOGRAPHIC_PATTERNS = {
+    "none": ("location", "zip"),
+    "country": ("location", "zip"),
+    "state": ("address", "zip"),
+}
+
+_REPLACEMENTS = {name: replacement for name, _, replacement in PHI_PATTERNS}
+
+
+@lru_cache(maxsize=None)
+def compile_scanner(names: Tuple[str, ...]) -> "re.Pattern[str]":
+    """Compile the named PHI patterns into one alternation, in PHI_PATTERNS priority order."""
+    alternatives = [f"(?P<{name}>{pattern})" for name, pattern, _ in PHI_PATTERNS if name in names]
+    # Every pattern starts at a word boundary; checking it once up front lets
+    # the scan skip positions inside words without trying each alternative
+    return re.compile(r"\b(?:" + "|".join(alternatives) + ")")
+
+
+def enabled_patterns(geographic_precision: str = "state", redact_years: bool = False) -> Tuple[str, ...]:
+    """Names of the patterns that apply for a de-identification config."""
+    names = BASE_PATTERNS + GEOGRAPHIC_PATTERNS.get(geographic_precision, ())
+    if redact_years:
+        names += ("year",)
+    return names
+
+
+class RegexRedactor:
+    """
+    Regex PHI redactor over precompiled scanners.
+    
+    Scanners are compiled once per pattern set and shared by all instances,
+    so constructing a redactor per config is cheap.
+    """
+    
+    def __init__(self, geographic_precision: str = "state", redact_years: bool = False):
+        self.patterns = enabled_patterns(geographic_precision, redact_years)
+        self.structured_scanner = compile_scanner(
+            tuple(name for name in self.patterns if name not in FREE_TEXT_PATTERNS)
+        )
+        self.free_text_scanner = compile_scanner(
+            tuple(name for name in self.patterns if name in FREE_TEXT_PATTERNS)
+        )
+    
+    def redact(self, text: Optional[str]) -> Optional[str]:
+        """Replace every PHI match with its redaction marker."""
+        if not text:
+            return text
+        parts = []
+        pos = 0
+        for match in self._matches(text):
+            parts.append(text[pos:match.start()])
+            parts.append(self._replace(match))
+            pos = match.end()
+        parts.append(text[pos:])
+        return "".join(parts)
+    
+    def finditer(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """Yield (pattern name, start, end) for each PHI match, left to right."""
+        for match in self._matches(text):
+            yield match.lastgroup, match.start(), match.end()
+    
+    def search(self, text: str) -> bool:
+        """True if the text contains any PHI match."""
+        return (self.structured_scanner.search(text) is not None
+                or self.free_text_scanner.search(text) is not None)
+    
+    def _matches(self, text: str) -> Iterator["re.Match[str]"]:
+        """Structured matches, with name/geographic matches from the gaps between them, left to right."""
+        pos = 0
+        for match in self.structured_scanner.finditer(text):
+            yield from self.free_text_scanner.finditer(text, pos, match.start())
+            yield match
+            pos = match.end()
+        yield from self.free_text_scanner.finditer(text, pos)
+    
+    @staticmethod
+    def _replace(match: "re.Match[str]") -> str:
+        replacement = _REPLACEMENTS[match.lastgroup]
+        if "\\g<" in replacement:
+            return match.expand(replacement)
+        return replacement
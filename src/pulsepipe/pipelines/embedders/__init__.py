@@ -23,9 +23,11 @@
 from .clinical_embedder import ClinicalEmbedder
 from .operational_embedder import OperationalEmbedder
 from .base_embedder import Embedder
+from .embedding_cache import EmbeddingCache
 
 __all__ = [
     "Embedder",
+    "EmbeddingCache",
     "ClinicalEmbedder",
     "OperationalEmbedder"
 ]
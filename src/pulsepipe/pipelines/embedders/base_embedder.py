@@ -22,9 +22,55 @@
 # src/pulsepipe/pipelines/embedders/base_embedder.py
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from pulsepipe.utils.model_registry import model_registry
+from .embedding_cache import EmbeddingCache
+
+# Registry kind for sentence-transformers models, keyed by model name
+SENTENCE_TRANSFORMER = "sentence_transformer"
+
+
+def _load_sentence_transformer(model_name: str) -> Any:
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+
+model_registry.register_loader(SENTENCE_TRANSFORMER, _load_sentence_transformer)
+
 
 class Embedder(ABC):
+    # Optional EmbeddingCache, shared by the caller or built from the "cache" config section
+    cache = None
+    # True when the cache was built by this embedder and is closed with it
+    _owns_cache = False
+    # Registry key of the model held by this embedder, if any
+    _model_key = None
+
+    def _use_cache(self, cache: Optional[EmbeddingCache]) -> None:
+        """Use a cache shared by the caller, or build a private one from the config."""
+        if cache is not None:
+            self.cache = cache
+        else:
+            self.cache = EmbeddingCache.from_config(self.config.get("cache"))
+            self._owns_cache = self.cache is not None
+
+    def _acquire_model(self, model_name: str) -> Any:
+        """Get a shared model from the registry, loading it on first use."""
+        self._model_key = (SENTENCE_TRANSFORMER, model_name)
+        return model_registry.acquire(*self._model_key)
+
+    def close(self) -> None:
+        """Release the shared model and close a cache this embedder built itself."""
+        if self._model_key is not None:
+            model_registry.release(*self._model_key)
+            self._model_key = None
+        if self._owns_cache:
+            self.cache.close()
+            self._owns_cache = False
+
     @abstractmethod
     async def embed(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for a list of text chunks"""
@@ -34,4 +80,78 @@ class Embedder(ABC):
     @abstractmethod
     def dimension(self) -> int:
         """Return the dimension of the embedding vectors"""
-        pass
\ No newline at end of file
+        pass
+
+    def _chunk_text(self, chunk: Dict[str, Any]) -> str:
+        """Extract the text to embed from a chunk"""
+        content = chunk["content"]
+        if isinstance(content, str):
+            return content
+        if isinstance(content, list) and content:
+            return " ".join(str(item) for item in content)
+        return str(content)
+
+    def _encode_text(self, text: str) -> Any:
+        """Encode a single text, going through the cache when one is configured."""
+        if self.cache is None:
+            return self.model.encode(text, normalize_embeddings=self.normalize)
+        cached = self.cache.get_many(self.model_name, [text], self.normalize)[0]
+        if cached is not None:
+            return cached
+        embedding = np.asarray(self.model.encode(text, normalize_embeddings=self.normalize))
+        self.cache.put_many(self.model_name, [text], [embedding], self.normalize)
+        return embedding
+
+    def embed_chunks(self, chunks: List[Dict[str, Any]], batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Embed a batch of chunks with a single encode call.
+        
+        Texts are extracted for the whole batch, encoded together and the
+        resulting matrix rows are scattered back onto copies of the chunks.
+        When a cache is configured only texts it has not seen are encoded.
+        Chunks without a 'content' key are returned unchanged.
+        
+        Args:
+            chunks: Chunks to embed, each with a 'content' key
+            batch_size: Encoder batch size (defaults to the embedder's batch size)
+            
+        Returns:
+            The chunks, in input order, with 'embedding' keys added
+        """
+        positions = [idx for idx, chunk in enumerate(chunks) if "content" in chunk]
+        if len(positions) < len(chunks):
+            self.logger.warning(f"{len(chunks) - len(positions)} chunks missing 'content' field, skipping embedding")
+
+        results = list(chunks)
+        if not positions:
+            return results
+
+        texts = [self._chunk_text(chunks[idx]) for idx in positions]
+        vectors = self.cache.get_many(self.model_name, texts, self.normalize) if self.cache is not None else [None] * len(texts)
+
+        # Encode each distinct uncached text once
+        pending: Dict[str, List[int]] = {}
+        for k, vector in enumerate(vectors):
+            if vector is None:
+                pending.setdefault(texts[k], []).append(k)
+
+        if pending:
+            to_encode = list(pending)
+            matrix = np.asarray(self.model.encode(to_encode,
+                                                  normalize_embeddings=self.normalize,
+                                                  batch_size=batch_size or self.batch_size))
+            for row, text in enumerate(to_encode):
+                for k in pending[text]:
+                    vectors[k] = matrix[row]
+            if self.cache is not None:
+                self.cache.put_many(self.model_name, to_encode, matrix, self.normalize)
+
+        dimension = self.dimension
+        for k, vector in enumerate(vectors):
+            result = chunks[positions[k]].copy()
+            result["embedding"] = vector.tolist()
+            result["embedding_model"] = self.model_name
+            result["embedding_dim"] = dimension
+            results[positions[k]] = result
+
+        return results
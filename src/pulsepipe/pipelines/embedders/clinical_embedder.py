@@ -21,8 +21,9 @@
 
 # src/pulsepipe/pipelines/embedders/clinical_embedder.py
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .base_embedder import Embedder
+from .embedding_cache import EmbeddingCache
 from pulsepipe.utils.log_factory import LogFactory
 
 class ClinicalEmbedder(Embedder):
@@ -30,19 +31,22 @@ class ClinicalEmbedder(Embedder):
     Clinical embedder that uses BioClinicalBERT or other clinical-domain models
     to create embeddings specifically optimized for clinical text.
     """
+
+    DEFAULT_MODEL_NAME = "emilyalsentzer/Bio_ClinicalBERT"
     
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, cache: Optional[EmbeddingCache] = None):
         self.logger = LogFactory.get_logger(__name__)
         self.logger.info("📁 Initializing ClinicalEmbedder")
         
         self.config = config or {}
-        self.model_name = self.config.get("model_name", "emilyalsentzer/Bio_ClinicalBERT")
+        self.model_name = self.config.get("model_name", self.DEFAULT_MODEL_NAME)
         self.normalize = self.config.get("normalize", True)
+        self.batch_size = self.config.get("batch_size", 32)
         
-        # Initialize the model
-        from sentence_transformers import SentenceTransformer
-        self.logger.info(f"Loading clinical embedding model: {self.model_name}")
-        self.model = SentenceTransformer(self.model_name)
+        # Shared across embedders, so the model is only loaded once per process
+        self.logger.info(f"Using clinical embedding model: {self.model_name}")
+        self.model = self._acquire_model(self.model_name)
+        self._use_cache(cache)
         self.name = "ClinicalEmbedder"
         
     async def embed(self, texts: List[str]) -> List[List[float]]:
@@ -58,7 +62,7 @@ class ClinicalEmbedder(Embedder):
         self.logger.info(f"Embedding {len(texts)} clinical text chunks")
         
         # Handle batching for large input
-        batch_size = 32  # Reasonable default batch size
+        batch_size = self.batch_size
         if len(texts) > batch_size:
             self.logger.info(f"Processing in batches of {batch_size}")
             
@@ -89,16 +93,10 @@ class ClinicalEmbedder(Embedder):
             content_value = " "
 
         # Extract the text to embed from the chunk
-        if isinstance(chunk["content"], str):
-            text = chunk["content"]
-        elif isinstance(chunk["content"], list) and chunk["content"]:
-            # For clinical content model chunks, create a concatenated representation
-            text = " ".join(str(item) for item in chunk["content"])
-        else:
-            text = str(chunk["content"])
+        text = self._chunk_text(chunk)
         
         # Generate the embedding
-        embedding = self.model.encode(text, normalize_embeddings=self.normalize)
+        embedding = self._encode_text(text)
         
         # Add the embedding to the chunk
         result = chunk.copy()
@@ -0,0 +1,213 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+# src/pulsepipe/pipelines/embedders/embedding_cache.py
+
+"""
+Content-addressed embedding cache.
+
+Embeddings are keyed by a hash of the model name, whether the vectors are
+L2-normalized, and the normalized chunk text, so byte-identical content (re-sent feeds, unchanged bundle sections)
+costs a lookup instead of a model call. The cache has an in-memory LRU tier
+and an optional SQLite tier that persists across runs.
+
+A cache is meant to outlive the embedders that use it: the embedding stage
+keeps one per pipeline run, shares it across that run's executes, and closes
+it when the run closes the stage (``close_executor``).
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from pulsepipe.utils.log_factory import LogFactory
+
+_WHITESPACE = re.compile(r"\s+")
+
+# SQLite limits the number of bound parameters per statement
+_SQLITE_MAX_PARAMS = 500
+
+
+class EmbeddingCache:
+    """
+    Two-tier (memory LRU + SQLite) cache of embedding vectors.
+    
+    Vectors are stored as float32. Hit and miss counters are cumulative for
+    the lifetime of the cache; callers diff them to attribute hits to batches.
+    """
+    
+    def __init__(self, max_memory_entries: int = 10000, db_path: Optional[str] = None):
+        self.logger = LogFactory.get_logger(__name__)
+        self.max_memory_entries = max_memory_entries
+        self.db_path = str(db_path) if db_path else None
+        
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        
+        self.conn = None
+        if self.db_path:
+            db_dir = os.path.dirname(self.db_path)
+            if db_dir and not os.path.exists(db_dir):
+                os.makedirs(db_dir, exist_ok=True)
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._ensure_schema()
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> Optional["EmbeddingCache"]:
+        """
+        Build a cache from an embedding ``cache`` config section.
+        
+        Returns None when the section is missing or disabled.
+        """
+        if not config or not config.get("enabled", True):
+            return None
+        return cls(
+            max_memory_entries=config.get("memory_entries", 10000),
+            db_path=config.get("db_path")
+        )
+    
+    def _ensure_schema(self) -> None:
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS embedding_cache (
+                key TEXT PRIMARY KEY,
+                model_name TEXT,
+                dim INTEGER,
+                vector BLOB
+            )
+        """)
+        self.conn.commit()
+    
+    @staticmethod
+    def make_key(model_name: str, text: str, normalize: bool = True) -> str:
+        """Hash the model name, vector normalization and normalized text into a cache key."""
+        normalized = _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+        return hashlib.sha256(f"{model_name}\0{int(bool(normalize))}\0{normalized}".encode("utf-8")).hexdigest()
+    
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+    
+    def get_many(self, model_name: str, texts: Sequence[str], normalize: bool = True) -> List[Optional[np.ndarray]]:
+        """
+        Look up embeddings for texts.
+        
+        Returns a list aligned with texts holding the cached vector or None.
+        Disk hits are promoted into the memory tier.
+        """
+        keys = [self.make_key(model_name, text, normalize) for text in texts]
+        results: List[Optional[np.ndarray]] = [None] * len(keys)
+        pending: Dict[str, List[int]] = {}
+        
+        with self._lock:
+            for idx, key in enumerate(keys):
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    results[idx] = vector
+                    self.memory_hits += 1
+                else:
+                    pending.setdefault(key, []).append(idx)
+        
+        disk_hits = 0
+        if pending and self.conn is not None:
+            for key, vector in self._fetch_from_disk(list(pending)).items():
+                self._remember(key, vector)
+                for idx in pending.pop(key):
+                    results[idx] = vector
+                    disk_hits += 1
+        
+        with self._lock:
+            self.disk_hits += disk_hits
+            self.misses += sum(len(indexes) for indexes in pending.values())
+        return results
+    
+    def put_many(self, model_name: str, texts: Sequence[str], vectors: Any, normalize: bool = True) -> None:
+        """Store one vector per text in both tiers."""
+        rows = []
+        for text, vector in zip(texts, vectors):
+            key = self.make_key(model_name, text, normalize)
+            vector = np.asarray(vector, dtype=np.float32)
+            self._remember(key, vector)
+            rows.append((key, model_name, int(vector.shape[0]), vector.tobytes()))
+        
+        if rows and self.conn is not None:
+            with self._lock:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO embedding_cache (key, model_name, dim, vector) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self.conn.commit()
+    
+    def _remember(self, key: str, vector: np.ndarray) -> None:
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+    
+    def _fetch_from_disk(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), _SQLITE_MAX_PARAMS):
+                part = keys[start:start + _SQLITE_MAX_PARAMS]
+                placeholders = ",".join("?" * len(part))
+                cursor = self.conn.execute(
+                    f"SELECT key, vector FROM embedding_cache WHERE key IN ({placeholders})",
+                    part
+                )
+                for key, blob in cursor.fetchall():
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+    
+    def stats(self) -> Dict[str, int]:
+        """Return cumulative hit/miss counters and tier sizes."""
+        with self._lock:
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "memory_entries": len(self._memory),
+            }
+    
+    def clear(self) -> None:
+        """Drop all cached vectors from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self.conn is not None:
+                self.conn.execute("DELETE FROM embedding_cache")
+                self.conn.commit()
+    
+    def close(self) -> None:
+        """Close the SQLite tier; the memory tier stays usable."""
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
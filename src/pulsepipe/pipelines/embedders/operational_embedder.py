@@ -21,8 +21,9 @@
 
 # src/pulsepipe/pipelines/embedders/operational_embedder.py
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .base_embedder import Embedder
+from .embedding_cache import EmbeddingCache
 from pulsepipe.utils.log_factory import LogFactory
 
 class OperationalEmbedder(Embedder):
@@ -30,20 +31,23 @@ class OperationalEmbedder(Embedder):
     Operational embedder optimized for healthcare operational content like
     claims, billing data, and administrative information.
     """
+
+    DEFAULT_MODEL_NAME = "all-MiniLM-L6-v2"
     
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, cache: Optional[EmbeddingCache] = None):
         self.logger = LogFactory.get_logger(__name__)
         self.logger.info("📁 Initializing OperationalEmbedder")
         
         self.config = config or {}
         # Use a more general model for operational content by default
-        self.model_name = self.config.get("model_name", "all-MiniLM-L6-v2")
+        self.model_name = self.config.get("model_name", self.DEFAULT_MODEL_NAME)
         self.normalize = self.config.get("normalize", True)
+        self.batch_size = self.config.get("batch_size", 64)
         
-        # Initialize the model
-        from sentence_transformers import SentenceTransformer
-        self.logger.info(f"Loading operational embedding model: {self.model_name}")
-        self.model = SentenceTransformer(self.model_name)
+        # Shared across embedders, so the model is only loaded once per process
+        self.logger.info(f"Using operational embedding model: {self.model_name}")
+        self.model = self._acquire_model(self.model_name)
+        self._use_cache(cache)
         self.name = "OperationalEmbedder"
         
     async def embed(self, texts: List[str]) -> List[List[float]]:
@@ -59,7 +63,7 @@ class OperationalEmbedder(Embedder):
         self.logger.info(f"Embedding {len(texts)} operational text chunks")
         
         # Use a larger batch size for operational data which tends to be more structured
-        batch_size = 64
+        batch_size = self.batch_size
         if len(texts) > batch_size:
             self.logger.info(f"Processing in batches of {batch_size}")
             
@@ -71,6 +75,14 @@ class OperationalEmbedder(Embedder):
         self.logger.info(f"Generated {len(embeddings)} embeddings of dimension {self.dimension}")
         return embeddings.tolist()
     
+    def _chunk_text(self, chunk: Dict[str, Any]) -> str:
+        """Extract the text to embed, flattening structured operational content"""
+        content = chunk["content"]
+        if isinstance(content, dict):
+            # For dict content, create a string representation
+            return " ".join(f"{k}: {v}" for k, v in content.items() if v)
+        return super()._chunk_text(chunk)
+
     def embed_chunk(self, chunk: Dict[str, Any]) -> Dict[str, Any]:
         """
         Embed an operational data chunk and add the embedding to the chunk.
@@ -92,23 +104,10 @@ class OperationalEmbedder(Embedder):
             content_value = " "
         
         # Handle structured operational data by converting to a string representation
-        if isinstance(chunk["content"], str):
-            text = chunk["content"]
-        elif isinstance(chunk["content"], dict):
-            # For dict content, create a string representation
-            text = " ".join(f"{k}: {v}" for k, v in chunk["content"].items() if v)
-        elif isinstance(chunk["content"], list) and chunk["content"]:
-            # For operational content model chunks, create a concatenated representation
-            if all(isinstance(item, dict) for item in chunk["content"]):
-                # List of structured records
-                text = " ".join(str(item) for item in chunk["content"])
-            else:
-                text = " ".join(str(item) for item in chunk["content"])
-        else:
-            text = str(chunk["content"])
+        text = self._chunk_text(chunk)
         
         # Generate the embedding
-        embedding = self.model.encode(text, normalize_embeddings=self.normalize)
+        embedding = self._encode_text(text)
         
         # Add the embedding to the chunk
         result = chunk.copy()
@@ -27,16 +27,13 @@ Pipeline executor for PulsePipe.
 Orchestrates the execution of pipeline stages in the correct order.
 """
 
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 import asyncio
 import traceback
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.utils.errors import PipelineError, ConfigurationError
 from pulsepipe.pipelines.context import PipelineContext
-from pulsepipe.pipelines.stages import PipelineStage, IngestionStage, ChunkingStage
-from pulsepipe.pipelines.stages.deid import DeidentificationStage
-from pulsepipe.pipelines.stages.embedding import EmbeddingStage
-from pulsepipe.pipelines.stages.vectorstore import VectorStoreStage
+from pulsepipe.pipelines.stages import PipelineStage, LazyStageMap, close_stages, warm_up_models
 
 logger = LogFactory.get_logger(__name__)
 
@@ -53,14 +50,8 @@ class PipelineExecutor:
     
     def __init__(self):
         """Initialize the pipeline executor."""
-        # Register available stages
-        self.available_stages = {
-            "ingestion": IngestionStage(),
-            "deid": DeidentificationStage(),
-            "chunking": ChunkingStage(),
-            "embedding": EmbeddingStage(),
-            "vectorstore": VectorStoreStage(),
-        }
+        # Register available stages; each is only constructed if a pipeline enables it
+        self.available_stages = LazyStageMap()
         
         # Define stage dependencies (which stages depend on which)
         self.stage_dependencies = {
@@ -98,12 +89,21 @@ class PipelineExecutor:
         
         logger.info(f"{context.log_prefix} Enabled stages: {', '.join(enabled_stages)}")
         
+        stages = {name: self.available_stages.get(name) for name in enabled_stages}
+        await warm_up_models(context, [stage for stage in stages.values() if stage])
+        
+        try:
+            return await self._execute_stages(context, stages)
+        finally:
+            # Release the worker pools the stages started for this run
+            close_stages([stage for stage in stages.values() if stage], context)
+    
+    async def _execute_stages(self, context: PipelineContext, stages: Dict[str, Optional[PipelineStage]]) -> Any:
+        """Run the enabled stages in order, feeding each the previous result."""
         # Execute each stage in sequence
         result = None
         
-        for stage_name in enabled_stages:
-            stage = self.available_stages.get(stage_name)
-            
+        for stage_name, stage in stages.items():
             if not stage:
                 context.add_warning("executor", f"Stage '{stage_name}' not found, skipping")
                 continue
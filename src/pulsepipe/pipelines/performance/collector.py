@@ -27,7 +27,6 @@ Metrics collection system for PulsePipe performance tracking.
 Provides centralized collection and aggregation of performance metrics.
 """
 
-import json
 import threading
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
@@ -35,6 +34,7 @@ from collections import defaultdict, deque
 from pathlib import Path
 
 from .tracker import PerformanceTracker, PipelineMetrics, StepMetrics
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.log_factory import LogFactory
 
 logger = LogFactory.get_logger(__name__)
@@ -200,7 +200,8 @@ class MetricsCollector:
     
     def export_metrics(self, file_path: Union[str, Path], 
                       format: str = 'json', 
-                      time_window: Optional[timedelta] = None) -> None:
+                      time_window: Optional[timedelta] = None,
+                      pretty: bool = False) -> None:
         """
         Export metrics to file.
         
@@ -208,11 +209,12 @@ class MetricsCollector:
             file_path: Path to export file
             format: Export format ('json', 'csv')
             time_window: Time window for filtering metrics
+            pretty: Whether to indent JSON output
         """
         file_path = Path(file_path)
         
         if format.lower() == 'json':
-            self._export_json(file_path, time_window)
+            self._export_json(file_path, time_window, pretty)
         elif format.lower() == 'csv':
             self._export_csv(file_path, time_window)
         else:
@@ -357,7 +359,8 @@ class MetricsCollector:
             }
         }
     
-    def _export_json(self, file_path: Path, time_window: Optional[timedelta]) -> None:
+    def _export_json(self, file_path: Path, time_window: Optional[timedelta],
+                     pretty: bool = False) -> None:
         """Export metrics to JSON format."""
         aggregated = self.get_aggregated_metrics(time_window)
         
@@ -379,7 +382,7 @@ class MetricsCollector:
         }
         
         with open(file_path, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+            json_codec.dump(export_data, f, pretty=pretty)
         
         logger.info(f"Exported {len(pipelines)} pipeline metrics to {file_path}")
     
@@ -29,13 +29,17 @@ Provides high-level interface for running pipelines.
 
 import os
 import asyncio
-import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.log_factory import LogFactory
-from pulsepipe.utils.errors import PipelineError
+from pulsepipe.utils.errors import PipelineError, ConfigurationError
+from pulsepipe.config.data_intelligence_config import load_data_intelligence_config
+from pulsepipe.persistence.factory import get_tracking_repository
+from pulsepipe.persistence.tracking_repository import TrackingRepository
 from pulsepipe.pipelines.context import PipelineContext
 from pulsepipe.pipelines.executor import PipelineExecutor
+from pulsepipe.pipelines.stages import close_stages
 
 
 logger = LogFactory.get_logger(__name__)
@@ -47,13 +51,19 @@ class PipelineRunner:
     
     This class handles:
     - Setting up execution context
-    - Running a single pipeline
+    - Running a single pipeline, or several side by side in one process
     - Coordinating outputs and reporting
     """
     
+    # Keys of a pipeline.yaml entry that describe the pipeline rather than configure it
+    PIPELINE_META_KEYS = ("name", "description", "active")
+    
     def __init__(self):
         """Initialize the pipeline runner."""
         self.executor = PipelineExecutor()
+        
+        # Concurrent executors currently running, so stop() can reach them all
+        self._active_executors = []
     
     async def run_pipeline(self, config: Dict[str, Any], name: str, **kwargs) -> Dict[str, Any]:
         """
@@ -64,6 +74,8 @@ class PipelineRunner:
             name: Pipeline name
             **kwargs: Additional options
                 concurrent: Whether to run the pipeline with concurrent stages
+                executor: Executor to use instead of creating one
+                tracking_repository: Tracking repository shared with other pipelines
                 
         Returns:
             Dictionary with execution results
@@ -114,14 +126,19 @@ class PipelineRunner:
             summary=kwargs.get('summary', False),
             print_model=kwargs.get('print_model', False),
             pretty=kwargs.get('pretty', True),
-            verbose=kwargs.get('verbose', False)
+            verbose=kwargs.get('verbose', False),
+            tracking_repository=kwargs.get('tracking_repository')
         )
         
+        executor = kwargs.get('executor')
+        
         try:
             # Check if concurrent execution is requested
             concurrent = kwargs.get('concurrent', False)
             
-            if concurrent:
+            if executor is not None:
+                logger.info(f"{context.log_prefix} Using shared concurrent pipeline execution")
+            elif concurrent:
                 # Use concurrent executor
                 from pulsepipe.pipelines.concurrent_executor import ConcurrentPipelineExecutor
                 executor = ConcurrentPipelineExecutor()
@@ -132,7 +149,13 @@ class PipelineRunner:
                 logger.info(f"{context.log_prefix} Using sequential pipeline execution")
             
             # Execute the pipeline
-            result = await executor.execute_pipeline(context)
+            if executor is not self.executor:
+                self._active_executors.append(executor)
+            try:
+                result = await executor.execute_pipeline(context)
+            finally:
+                if executor in self._active_executors:
+                    self._active_executors.remove(executor)
             
             # Get execution summary
             summary = context.get_summary()
@@ -158,7 +181,7 @@ class PipelineRunner:
                         model_json = result.model_dump_json(indent=2 if context.pretty else None)
                         print(model_json)
                     elif hasattr(result, "__dict__"):
-                        print(json.dumps(result.__dict__, indent=2 if context.pretty else None, default=str))
+                        print(json_codec.dumps(result.__dict__, pretty=context.pretty))
                     else:
                         print(result)
             
@@ -183,3 +206,91 @@ class PipelineRunner:
                 "errors": context.errors if hasattr(context, 'errors') else [str(e)],
                 "warnings": context.warnings if hasattr(context, 'warnings') else []
             }
+    
+    async def run_all(self, pipelines: List[Dict[str, Any]], max_concurrency: Optional[int] = None,
+                      **kwargs) -> Dict[str, Any]:
+        """
+        Run several pipelines concurrently in this process.
+        
+        All pipelines share one set of stage instances, created only for stages
+        some pipeline enables, and one tracking repository per
+        distinct persistence configuration. Each pipeline keeps its own
+        PipelineContext and concurrent executor.
+        
+        Args:
+            pipelines: Pipeline definitions, e.g. the ``pipelines`` list of
+                       pipeline.yaml; entries with ``active: false`` are skipped
+            max_concurrency: Maximum number of items being processed by stages
+                             at once across all pipelines (unbounded if None)
+            **kwargs: Options passed to run_pipeline for every pipeline
+            
+        Returns:
+            Dictionary with per-pipeline results and overall success
+            
+        Raises:
+            ConfigurationError: If there is nothing to run or names are not unique
+        """
+        from pulsepipe.pipelines.concurrent_executor import ConcurrentPipelineExecutor
+        
+        active = [p for p in pipelines if p.get("active", True)]
+        if not active:
+            raise ConfigurationError("No active pipelines to run")
+        
+        names = [p.get("name") for p in active]
+        if None in names or len(set(names)) != len(names):
+            raise ConfigurationError(
+                "Every active pipeline needs a unique name",
+                details={"names": names}
+            )
+        
+        logger.info(f"🚀 Starting {len(active)} pipelines: {', '.join(names)}")
+        
+        stages = ConcurrentPipelineExecutor.create_stages()
+        concurrency_limit = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        repositories: Dict[str, TrackingRepository] = {}
+        
+        async def run_one(pipeline: Dict[str, Any]) -> Dict[str, Any]:
+            config = {k: v for k, v in pipeline.items() if k not in self.PIPELINE_META_KEYS}
+            executor = ConcurrentPipelineExecutor(stages=stages, concurrency_limit=concurrency_limit)
+            return await self.run_pipeline(
+                config=config,
+                name=pipeline["name"],
+                executor=executor,
+                tracking_repository=self._get_shared_repository(config, repositories),
+                **kwargs
+            )
+        
+        try:
+            outcomes = await asyncio.gather(*(run_one(p) for p in active))
+        finally:
+            close_stages(stages.loaded().values())
+            for repository in repositories.values():
+                repository.close()
+        
+        results = dict(zip(names, outcomes))
+        return {
+            "results": results,
+            "success": all(r.get("success", False) for r in results.values()),
+            "errors": {name: r["errors"] for name, r in results.items() if r.get("errors")}
+        }
+    
+    def _get_shared_repository(self, config: Dict[str, Any],
+                               repositories: Dict[str, TrackingRepository]) -> Optional[TrackingRepository]:
+        """Get the tracking repository for a pipeline's persistence config, creating it once."""
+        try:
+            if not load_data_intelligence_config(config).is_feature_enabled("audit_trail"):
+                return None
+            
+            key = json_codec.dumps(config.get("persistence", {}), sort_keys=True)
+            if key not in repositories:
+                repositories[key] = get_tracking_repository(config)
+            return repositories[key]
+        except Exception as e:
+            # The pipeline context will try again on its own and degrade gracefully
+            logger.warning(f"Could not create shared tracking repository: {e}")
+            return None
+    
+    async def stop(self) -> None:
+        """Signal every running concurrent pipeline to stop."""
+        for executor in list(self._active_executors):
+            await executor.stop()
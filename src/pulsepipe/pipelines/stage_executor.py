@@ -0,0 +1,144 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/pipelines/stage_executor.py
+
+"""
+Per-stage executors for CPU-bound pipeline work.
+
+De-identification and chunking are synchronous, CPU-heavy calls. Running them
+directly inside ``async def execute`` blocks the event loop, so every stage
+ends up sharing a single core. A ``StageExecutor`` moves that work onto a
+thread or process pool configured per stage:
+
+    deid:
+      executor:
+        type: process        # inline | thread | process
+        workers: 4           # pool size (defaults to the CPU count)
+        max_in_flight: 8     # items a stage worker may have outstanding
+
+Process pools pickle the callable and its arguments, so stages must hand them
+module-level functions rather than bound methods holding loaded models.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from pulsepipe.utils.log_factory import LogFactory
+from pulsepipe.utils.errors import ConfigurationError
+
+logger = LogFactory.get_logger(__name__)
+
+EXECUTOR_TYPES = ("inline", "thread", "process")
+
+
+class StageExecutor:
+    """
+    Runs blocking stage work inline, on a thread pool or on a process pool.
+
+    The pool is created lazily on first use and released by ``shutdown()``.
+    """
+
+    def __init__(self, stage_name: str, executor_type: str = "inline",
+                 workers: Optional[int] = None, max_in_flight: Optional[int] = None):
+        if executor_type not in EXECUTOR_TYPES:
+            raise ConfigurationError(
+                f"Unknown executor type '{executor_type}' for stage '{stage_name}'",
+                details={"stage": stage_name, "valid_types": list(EXECUTOR_TYPES)}
+            )
+
+        self.stage_name = stage_name
+        self.executor_type = executor_type
+        self.workers = max(1, int(workers or os.cpu_count() or 1))
+        if executor_type == "inline":
+            self.workers = 1
+        self.max_in_flight = max(1, int(max_in_flight or self.workers * 2))
+        if executor_type == "inline" and not max_in_flight:
+            self.max_in_flight = 1
+
+        self._pool: Optional[Executor] = None
+
+    @classmethod
+    def from_config(cls, stage_name: str, config: Optional[Dict[str, Any]]) -> "StageExecutor":
+        """
+        Build an executor from a stage's configuration section.
+
+        Args:
+            stage_name: Name of the owning stage (used for logging and errors)
+            config: The stage config; its ``executor`` key is read if present
+
+        Returns:
+            A StageExecutor, inline when nothing is configured
+        """
+        executor_config = config.get("executor") if isinstance(config, dict) else None
+        if isinstance(executor_config, str):
+            executor_config = {"type": executor_config}
+        if not isinstance(executor_config, dict):
+            return cls(stage_name)
+
+        return cls(
+            stage_name,
+            executor_type=executor_config.get("type", "inline"),
+            workers=executor_config.get("workers"),
+            max_in_flight=executor_config.get("max_in_flight"),
+        )
+
+    @property
+    def uses_processes(self) -> bool:
+        """True when work is shipped to other processes and must be picklable."""
+        return self.executor_type == "process"
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            if self.executor_type == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.workers,
+                    thread_name_prefix=f"pulsepipe-{self.stage_name}"
+                )
+            logger.info(f"Started {self.executor_type} pool for stage '{self.stage_name}' "
+                        f"with {self.workers} workers")
+        return self._pool
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run ``func(*args, **kwargs)`` according to the configured executor type.
+
+        Inline executors call the function directly on the event loop thread.
+        """
+        if self.executor_type == "inline":
+            return func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args, **kwargs) if kwargs else functools.partial(func, *args)
+        return await loop.run_in_executor(self._get_pool(), call)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Release the worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+            logger.debug(f"Shut down {self.executor_type} pool for stage '{self.stage_name}'")
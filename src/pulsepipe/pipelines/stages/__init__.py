@@ -27,12 +27,16 @@ Pipeline stages for PulsePipe.
 Each stage represents a discrete step in the processing pipeline.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from pulsepipe.utils.log_factory import LogFactory
 from pulsepipe.utils.errors import PulsePipeError
 from pulsepipe.pipelines.context import PipelineContext
+from pulsepipe.pipelines.stage_executor import StageExecutor
+from pulsepipe.utils.model_registry import model_registry
 
 
 class PipelineStage(ABC):
@@ -52,6 +56,10 @@ class PipelineStage(ABC):
         """
         self.name = name
         self.logger = LogFactory.get_logger(f"pipeline.stage.{name}")
+        # Executors per pipeline run, so one stage instance can serve several pipelines
+        self._executors: Dict[str, StageExecutor] = {}
+        # Registry references held per pipeline run, released by close_executor()
+        self._held_models: Dict[str, Set[Tuple[str, str]]] = {}
     
     @abstractmethod
     async def execute(self, context: PipelineContext, input_data: Any = None) -> Any:
@@ -93,6 +101,94 @@ class PipelineStage(ABC):
             True if stage is enabled, False otherwise
         """
         return context.is_stage_enabled(self.name)
+    
+    def required_models(self, context: PipelineContext) -> List[Tuple[str, str]]:
+        """
+        Models this stage will load from the shared model registry.
+        
+        Used to warm the registry up before items start flowing.
+        
+        Args:
+            context: Pipeline execution context
+            
+        Returns:
+            (kind, key) pairs understood by ``model_registry``
+        """
+        return []
+    
+    def hold_models(self, context: PipelineContext) -> None:
+        """
+        Load the stage's required models and hold them for the pipeline run.
+        
+        Each model is acquired once per run and released by
+        ``close_executor()``, so it stays loaded between batches even when
+        another pipeline finishes and unloads unused models. Loads block;
+        call from a worker thread.
+        
+        Args:
+            context: Pipeline execution context
+        """
+        held = self._held_models.setdefault(context.pipeline_id, set())
+        for model in self.required_models(context):
+            if model not in held:
+                model_registry.acquire(*model)
+                held.add(model)
+    
+    def get_executor(self, context: PipelineContext) -> StageExecutor:
+        """
+        Get the executor for this stage's blocking work in a pipeline run.
+        
+        The executor is built from the ``executor`` key of the stage config on
+        first use and reused until ``close_executor()`` is called.
+        
+        Args:
+            context: Pipeline execution context
+            
+        Returns:
+            The stage's StageExecutor (inline when not configured)
+        """
+        executor = self._executors.get(context.pipeline_id)
+        if executor is None:
+            executor = StageExecutor.from_config(self.name, self.get_stage_config(context))
+            self._executors[context.pipeline_id] = executor
+        return executor
+    
+    async def run_blocking(self, context: PipelineContext, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a synchronous, CPU-bound call on this stage's executor.
+        
+        Args:
+            context: Pipeline execution context
+            func: Callable to run; must be picklable for process executors
+            *args: Positional arguments for ``func``
+            
+        Returns:
+            The value returned by ``func``
+        """
+        return await self.get_executor(context).run(func, *args)
+    
+    def close_executor(self, context: Optional[PipelineContext] = None) -> None:
+        """
+        Shut down worker pools started by this stage and release the models
+        it holds.
+        
+        Args:
+            context: Only release this pipeline run's pool and models; all if None
+        """
+        if context is None:
+            executors = list(self._executors.values())
+            self._executors.clear()
+            held = [model for models in self._held_models.values() for model in models]
+            self._held_models.clear()
+        else:
+            executor = self._executors.pop(context.pipeline_id, None)
+            executors = [executor] if executor else []
+            held = list(self._held_models.pop(context.pipeline_id, ()))
+        
+        for executor in executors:
+            executor.shutdown()
+        for model in held:
+            model_registry.release(*model)
 
 
 # Import specific stage implementations
@@ -102,9 +198,123 @@ from .deid import DeidentificationStage
 from .embedding import EmbeddingStage
 from .vectorstore import VectorStoreStage
 
+STAGE_CLASSES = {
+    "ingestion": IngestionStage,
+    "deid": DeidentificationStage,
+    "chunking": ChunkingStage,
+    "embedding": EmbeddingStage,
+    "vectorstore": VectorStoreStage,
+}
+
+
+class LazyStageMap(MutableMapping):
+    """
+    Stage instances by name, each constructed on first access.
+    
+    Executors can list every stage they support while only paying the
+    construction cost for the stages a pipeline actually enables.
+    """
+    
+    def __init__(self, factories: Dict[str, Callable[[], PipelineStage]] = None):
+        self._factories = dict(factories if factories is not None else STAGE_CLASSES)
+        self._instances: Dict[str, PipelineStage] = {}
+    
+    def __getitem__(self, name: str) -> PipelineStage:
+        if name not in self._instances:
+            if name not in self._factories:
+                raise KeyError(name)
+            self._instances[name] = self._factories[name]()
+        return self._instances[name]
+    
+    def __setitem__(self, name: str, stage: PipelineStage) -> None:
+        self._instances[name] = stage
+    
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self._factories.pop(name, None)
+        self._instances.pop(name, None)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._factories or name in self._instances
+    
+    def __iter__(self) -> Iterator[str]:
+        yield from self._factories
+        yield from (name for name in self._instances if name not in self._factories)
+    
+    def __len__(self) -> int:
+        return len(self._factories.keys() | self._instances.keys())
+    
+    def loaded(self) -> Dict[str, PipelineStage]:
+        """The stages that have been constructed so far."""
+        return dict(self._instances)
+
+
+async def warm_up_models(context: PipelineContext, stages: Iterable[PipelineStage]) -> None:
+    """
+    Load the models the given stages need before items start flowing.
+    
+    Only runs when the pipeline config sets ``models.warm_up: true``; otherwise
+    models load on first use. Each stage holds its models for the run (see
+    ``PipelineStage.hold_models``), so warmed models are not unloaded before
+    they are used. Loading happens in a worker thread so the event loop keeps
+    serving other pipelines meanwhile.
+    """
+    models_config = context.config.get("models") or {}
+    if not models_config.get("warm_up", False):
+        return
+    
+    stages = list(stages)
+    required = []
+    for stage in stages:
+        for model in stage.required_models(context):
+            if model not in required:
+                required.append(model)
+    
+    if required:
+        names = ", ".join(f"{kind}:{key}" for kind, key in required)
+        stage_logger = LogFactory.get_logger("pipeline.stages")
+        stage_logger.info(f"{context.log_prefix} Warming up models: {names}")
+        await asyncio.to_thread(_hold_stage_models, context, stages)
+
+
+def _hold_stage_models(context: PipelineContext, stages: Iterable[PipelineStage]) -> None:
+    """
+    Hold each stage's models for the run, logging failures rather than raising.
+    
+    A model that fails here is loaded (and the error surfaced) again when a
+    stage actually needs it.
+    """
+    for stage in stages:
+        try:
+            stage.hold_models(context)
+        except Exception as e:
+            stage.logger.warning(f"{context.log_prefix} Failed to warm up models for {stage.name}: {e}")
+
+
+def close_stages(stages: Iterable[PipelineStage], context: Optional[PipelineContext] = None) -> None:
+    """
+    Shut down the stages' worker pools, then unload models nothing still uses.
+    
+    Models another running pipeline has acquired keep their references and
+    stay loaded.
+    
+    Args:
+        stages: Stages the finished pipeline ran
+        context: Only release this pipeline run's pools; all pools if None
+    """
+    for stage in stages:
+        stage.close_executor(context)
+    model_registry.unload_unused()
+
+
 # Make stages available at package level
 __all__ = [
     "PipelineStage",
+    "LazyStageMap",
+    "STAGE_CLASSES",
+    "warm_up_models",
+    "close_stages",
     "IngestionStage",
     "ChunkingStage",
     "DeidentificationStage", 
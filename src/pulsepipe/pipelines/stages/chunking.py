@@ -32,6 +32,7 @@ from typing import Any, Dict, List, Union, Optional
 import json
 import os
 
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.errors import ChunkerError, ConfigurationError
 from pulsepipe.pipelines.chunkers.clinical_chunker import ClinicalSectionChunker
 from pulsepipe.pipelines.chunkers.operational_chunker import OperationalEntityChunker
@@ -135,7 +136,7 @@ class ChunkingStage(PipelineStage):
                     self.logger.info(f"{context.log_prefix} Processing batch item {i+1} of type {type(item).__name__}")
                     item_start_time = time.time()
                     try:
-                        chunks = self._chunk_item(item, chunker_type, include_metadata)
+                        chunks = await self._run_chunk_item(context, item, chunker_type, include_metadata)
                         if chunks:
                             all_chunks.extend(chunks)
                             processing_stats["successful_chunks"] += len(chunks)
@@ -166,7 +167,7 @@ class ChunkingStage(PipelineStage):
                 # Process a single item
                 try:
                     self.logger.info(f"{context.log_prefix} Processing single item of type {type(input_data).__name__}")
-                    chunks = self._chunk_item(input_data, chunker_type, include_metadata)
+                    chunks = await self._run_chunk_item(context, input_data, chunker_type, include_metadata)
                     processing_stats["total_items"] = 1
                     item_start_time = time.time()
                     if chunks:
@@ -234,7 +235,7 @@ class ChunkingStage(PipelineStage):
                     try:
                         with open(chunks_output_path, "w") as f:
                             for chunk in all_chunks:
-                                f.write(json.dumps(chunk) + "\n")
+                                f.write(json_codec.dumps(chunk) + "\n")
                         self.logger.info(f"{context.log_prefix} Chunked output written to {chunks_output_path}")
                     except Exception as e:
                         context.add_error("chunking", f"Failed to write chunks to {chunks_output_path}: {str(e)}")
@@ -291,6 +292,14 @@ class ChunkingStage(PipelineStage):
                 details={"chunker_type": chunker_type}
             )
     
+    async def _run_chunk_item(self, context: PipelineContext, item: Any, chunker_type: str,
+                              include_metadata: bool) -> Optional[List[Dict[str, Any]]]:
+        """Chunk a single item on the stage's configured executor."""
+        executor = self.get_executor(context)
+        if executor.uses_processes:
+            return await executor.run(_chunk_item_in_worker, item, chunker_type, include_metadata)
+        return await executor.run(self._chunk_item, item, chunker_type, include_metadata)
+    
     def _chunk_item(self, item: Any, chunker_type: str, include_metadata: bool) -> Optional[List[Dict[str, Any]]]:
         """
         Chunk a single item using the appropriate chunker.
@@ -357,3 +366,15 @@ class ChunkingStage(PipelineStage):
             return "operational"
         else:
             return "unknown"
+
+
+# Per-process stage used by process-pool executors
+_worker_stage: Optional[ChunkingStage] = None
+
+
+def _chunk_item_in_worker(item: Any, chunker_type: str, include_metadata: bool) -> Optional[List[Dict[str, Any]]]:
+    """Chunk an item inside a process-pool worker."""
+    global _worker_stage
+    if _worker_stage is None:
+        _worker_stage = ChunkingStage()
+    return _worker_stage._chunk_item(item, chunker_type, include_metadata)
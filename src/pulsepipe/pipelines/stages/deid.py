@@ -32,11 +32,15 @@ Implements the HIPAA Safe Harbor method with configurable options.
 
 import re
 import copy
+import threading
 import uuid
-from typing import Any, Dict, List, Optional, Union, Tuple
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union, Tuple
 from datetime import datetime, date
 
-from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
+from pydantic import BaseModel
+
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerRegistry
 from presidio_anonymizer import AnonymizerEngine
 from presidio_analyzer.nlp_engine import SpacyNlpEngine
 from pulsepipe.utils.errors import DeidentificationError, ConfigurationError
@@ -49,6 +53,48 @@ from pulsepipe.pipelines.deid.config import (
     GENERAL_ID_HASH_LENGTH, ACCOUNT_HASH_LENGTH, REDACTION_MARKERS
 )
 from pulsepipe.pipelines.deid.healthcare_recognizers import create_healthcare_analyzer
+from pulsepipe.pipelines.deid.regex_redactor import RegexRedactor
+from pulsepipe.pipelines.deid.prefilter import PHIPrefilter, SKIP, REGEX, NER
+from pulsepipe.pipelines.deid.field_plan import plan_for, MRN, SSN, LICENSE, REFERENCE
+from pulsepipe.utils.log_factory import LogFactory
+from pulsepipe.utils.model_registry import model_registry
+
+logger = LogFactory.get_logger(__name__)
+
+# Registry kind for Presidio analyzers; there is a single healthcare configuration
+DEID_ANALYZER = "deid_analyzer"
+DEFAULT_ANALYZER_KEY = "healthcare"
+
+# Healthcare-specific entities detected by Presidio unless presidio_entities is configured
+HEALTHCARE_ENTITIES = [
+    "PERSON", "EMAIL_ADDRESS", "PHONE_NUMBER", "US_SSN", 
+    "CREDIT_CARD", "US_DRIVER_LICENSE", "DATE_TIME",
+    "MEDICAL_RECORD_NUMBER", "MEDICAL_LICENSE", "UK_NHS",
+    "MEDICATION", "MEDICAL_CONDITION", "MEDICAL_PROCEDURE",
+    "BODY_PART", "MEDICAL_DEVICE", "LAB_VALUE"
+]
+
+# Defaults for batched NER over free text (spaCy nlp.pipe)
+DEFAULT_TEXT_BATCH_SIZE = 32
+DEFAULT_TEXT_N_PROCESS = 1
+
+
+def _load_analyzer(key: str) -> AnalyzerEngine:
+    """Build the healthcare analyzer, falling back to the standard Presidio setup."""
+    try:
+        analyzer = create_healthcare_analyzer()
+        logger.info("Initialized de-identification with healthcare NER capabilities")
+        return analyzer
+    except Exception as e:
+        logger.warning(f"Failed to initialize healthcare NER, falling back to standard: {e}")
+        nlp_engine = SpacyNlpEngine(models=[{"lang_code": "en", "model_name": "en_core_web_lg"}])
+        nlp_engine.load()
+        registry = RecognizerRegistry()
+        registry.load_predefined_recognizers()
+        return AnalyzerEngine(registry=registry, nlp_engine=nlp_engine, supported_languages=["en"])
+
+
+model_registry.register_loader(DEID_ANALYZER, _load_analyzer)
 
 class DeidentificationStage(PipelineStage):
     """
@@ -68,21 +114,16 @@ class DeidentificationStage(PipelineStage):
         """Initialize the de-identification stage with healthcare NER capabilities."""
         super().__init__("deid")
 
-        # Create enhanced healthcare analyzer with biomedical NER
-        try:
-            self.analyzer = create_healthcare_analyzer()
-            self.logger.info("Initialized de-identification with healthcare NER capabilities")
-        except Exception as e:
-            self.logger.warning(f"Failed to initialize healthcare NER, falling back to standard: {e}")
-            # Fallback to standard analyzer
-            nlp_engine = SpacyNlpEngine(models=[{"lang_code": "en", "model_name": "en_core_web_lg"}])
-            nlp_engine.load()
-            registry = RecognizerRegistry()
-            registry.load_predefined_recognizers()
-            self.analyzer = AnalyzerEngine(registry=registry, nlp_engine=nlp_engine, supported_languages=["en"])
+        # The healthcare analyzer loads spaCy models, so it comes from the shared
+        # model registry on first use rather than at construction
+        self._analyzer = None
+        self._analyzer_lock = threading.Lock()
         
         self.anonymizer = AnonymizerEngine()
         
+        # PHI prefilters per config
+        self._prefilters: Dict[Any, PHIPrefilter] = {}
+        
         # These are the default PHI type handlers
         self.phi_handlers = {
             "names": self._redact_names,
@@ -93,38 +134,28 @@ class DeidentificationStage(PipelineStage):
             "biometrics": self._handle_biometric_identifiers,
             "accounts": self._handle_account_numbers
         }
-        
-        # Common PHI regular expressions
-        self.phi_regex = {
-            # Medical record numbers - various formats
-            "mrn": re.compile(r'\b(MRN|Medical Record Number|Record Number|Chart Number)\s*:?\s*([A-Za-z0-9-]{4,14})\b', re.IGNORECASE),
-            
-            # Phone numbers
-            "phone": re.compile(r'\b(\+\d{1,3}[-\s.]?)?\(?\d{3}\)?[-\s.]?\d{3}[-\s.]?\d{4}\b'),
-            
-            # Social Security Numbers (with or without dashes)
-            "ssn": re.compile(r'\b\d{3}[-\s]?\d{2}[-\s]?\d{4}\b'),
-            
-            # Email addresses
-            "email": re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-            
-            # URLs
-            "url": re.compile(r'\bhttps?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+(/[-\w%.]+)*\b'),
-            
-            # IP addresses
-            "ip": re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b'),
-            
-            # Common financial account patterns 
-            "account": re.compile(r'\b(?:Acct|Account)\s*(?:#|No|Number|:)?\s*[-#]?\s*(\d{4,17})\b', re.IGNORECASE),
-            
-            # Credit card-like patterns
-            "cc": re.compile(r'\b(?:\d{4}[- ]?){3}\d{4}\b'),
-            
-            # License numbers (simple pattern, could be enhanced)
-            "license": re.compile(r'\b[A-Z](?:\d[- ]?){6,8}[A-Z0-9]\b', re.IGNORECASE)
-        }
     
 
+    @property
+    def analyzer(self) -> AnalyzerEngine:
+        """Presidio analyzer shared through the model registry, loaded on first use."""
+        if self._analyzer is None:
+            with self._analyzer_lock:
+                if self._analyzer is None:
+                    self._analyzer = model_registry.acquire(DEID_ANALYZER, DEFAULT_ANALYZER_KEY)
+        return self._analyzer
+    
+    @analyzer.setter
+    def analyzer(self, value: AnalyzerEngine) -> None:
+        self._analyzer = value
+    
+    def required_models(self, context: PipelineContext) -> List[Tuple[str, str]]:
+        """The Presidio analyzer, when text redaction uses it."""
+        config = self.get_stage_config(context) or {}
+        if config.get("use_presidio_for_text", True):
+            return [(DEID_ANALYZER, DEFAULT_ANALYZER_KEY)]
+        return []
+    
     def _redact_phi_with_presidio(self, text: str, config: Dict[str, Any] = None) -> str:
         """
         Redact PHI using Presidio with healthcare-specific NER.
@@ -142,54 +173,209 @@ class DeidentificationStage(PipelineStage):
         if config is None:
             config = {}
         
-        # Define healthcare-specific entities to detect
-        healthcare_entities = [
-            "PERSON", "EMAIL_ADDRESS", "PHONE_NUMBER", "US_SSN", 
-            "CREDIT_CARD", "US_DRIVER_LICENSE", "DATE_TIME",
-            "MEDICAL_RECORD_NUMBER", "MEDICAL_LICENSE", "UK_NHS",
-            "MEDICATION", "MEDICAL_CONDITION", "MEDICAL_PROCEDURE",
-            "BODY_PART", "MEDICAL_DEVICE", "LAB_VALUE"
-        ]
-        
-        # Allow configuration to specify which entities to detect
-        entities_to_detect = config.get("presidio_entities", healthcare_entities)
-        
         try:
             # Analyze text for healthcare PHI
             results = self.analyzer.analyze(
                 text=text, 
                 language='en',
-                entities=entities_to_detect
+                # Allow configuration to specify which entities to detect
+                entities=config.get("presidio_entities", HEALTHCARE_ENTITIES)
             )
-            
-            # Log detected entities for debugging (if enabled)
-            if config.get("log_detected_entities", False) and results:
-                entity_summary = {}
-                for result in results:
-                    entity_type = result.entity_type
-                    entity_summary[entity_type] = entity_summary.get(entity_type, 0) + 1
-                self.logger.debug(f"Detected healthcare entities: {entity_summary}")
-            
-            # Anonymize the text
-            anonymized_result = self.anonymizer.anonymize(text=text, analyzer_results=results)
-            return anonymized_result.text
+            return self._anonymize(text, results, config)
             
         except Exception as e:
             self.logger.warning(f"Healthcare NER failed, using fallback: {str(e)}")
             # Fallback to regex-based redaction
             return self._redact_phi_from_text(text, config)
+    
+    def _anonymize(self, text: str, results: List[Any], config: Dict[str, Any]) -> str:
+        """Apply the anonymizer to one text given its analyzer results."""
+        # Log detected entities for debugging (if enabled)
+        if config.get("log_detected_entities", False) and results:
+            entity_summary = {}
+            for result in results:
+                entity_type = result.entity_type
+                entity_summary[entity_type] = entity_summary.get(entity_type, 0) + 1
+            self.logger.debug(f"Detected healthcare entities: {entity_summary}")
+        
+        # Anonymize the text
+        anonymized_result = self.anonymizer.anonymize(text=text, analyzer_results=results)
+        return anonymized_result.text
+    
+    def redact_texts(self, texts: Iterable[str], config: Dict[str, Any] = None,
+                     prefilter: bool = False) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Redact a batch of text fields in one NER pass.
+        
+        With Presidio enabled, the texts are run through spaCy's nlp.pipe via
+        Presidio's BatchAnalyzerEngine (text_batch_size / text_n_process in
+        the config), then anonymized field by field. Identical texts are
+        analyzed once. If batch analysis fails, each text is analyzed on its own.
+        
+        Args:
+            texts: Text values to redact
+            config: Configuration for redaction behavior
+            prefilter: Screen the texts with the PHI prefilter so fields it
+                clears skip NER; for short structured fields, never for note
+                or narrative text
+            
+        Returns:
+            Redacted texts in input order, and the prefilter verdict counts
+            for this call (empty when nothing was screened)
+        """
+        if config is None:
+            config = {}
+        texts = list(texts)
+        unique = list(dict.fromkeys(t for t in texts if t))
+        if not unique:
+            return texts, {}
+        
+        if not config.get("use_presidio_for_text", True):
+            redacted = {text: self._redact_text(text, config) for text in unique}
+            return [redacted[t] if t else t for t in texts], {}
+        
+        # Only fields the prefilter flags go to NER
+        redacted = {}
+        candidates = []
+        counts: Counter = Counter()
+        for text in unique:
+            verdict = self._screen(text, config) if prefilter else NER
+            if prefilter:
+                counts[verdict] += 1
+            if verdict == SKIP:
+                redacted[text] = text
+            elif verdict == REGEX:
+                redacted[text] = self._redact_phi_from_text(text, config)
+            else:
+                candidates.append(text)
+        
+        if candidates:
+            try:
+                batch_analyzer = BatchAnalyzerEngine(analyzer_engine=self.analyzer)
+                batch_results = batch_analyzer.analyze_iterator(
+                    candidates,
+                    language='en',
+                    batch_size=config.get("text_batch_size", DEFAULT_TEXT_BATCH_SIZE),
+                    n_process=config.get("text_n_process", DEFAULT_TEXT_N_PROCESS),
+                    entities=config.get("presidio_entities", HEALTHCARE_ENTITIES)
+                )
+                for text, results in zip(candidates, batch_results):
+                    redacted[text] = self._anonymize(text, results, config)
+            except Exception as e:
+                self.logger.warning(f"Batched healthcare NER failed, redacting texts individually: {str(e)}")
+                for text in candidates:
+                    try:
+                        redacted[text] = self._redact_phi_with_presidio(text, config)
+                    except Exception:
+                        redacted[text] = self._redact_phi_from_text(text, config)
+        return [redacted[t] if t else t for t in texts], dict(counts)
+    
+    def _collect_texts(self, item: Any) -> List[str]:
+        """Note and narrative text of a content item that _redact_text would process."""
+        texts = []
+        if isinstance(item, PulseClinicalContent):
+            for report in item.imaging or []:
+                if getattr(report, "narrative", None):
+                    texts.append(report.narrative)
+            for note in item.notes or []:
+                if getattr(note, "text", None):
+                    texts.append(note.text)
+        return texts
+    
+    def _collect_field_texts(self, item: Any) -> List[str]:
+        """Short free-text fields (FieldPlan.free_text) of the records _handle_free_text visits."""
+        if isinstance(item, PulseClinicalContent):
+            records = [*(item.allergies or []), *(item.immunizations or []), *(item.diagnoses or []),
+                       *(item.problem_list or []), *(item.medications or [])]
+            for report in item.lab or []:
+                records.append(report)
+                records.extend(getattr(report, "observations", None) or [])
+        elif isinstance(item, PulseOperationalContent):
+            records = [*(item.claims or []), *(item.charges or []), *(item.payments or []),
+                       *(item.prior_authorizations or [])]
+        else:
+            return []
+        texts = []
+        for record in records:
+            for attr_name in plan_for(record).free_text:
+                value = getattr(record, attr_name, None)
+                if isinstance(value, str) and value:
+                    texts.append(value)
+        return texts
+    
+    async def _batch_redactions(self, context: PipelineContext, items: List[Any],
+                                config: Dict[str, Any]) -> Tuple[Dict[str, str], Dict[str, int]]:
+        """
+        Pre-redact the free text of a batch of items with one batched NER pass.
+        
+        The pass runs on the stage's configured executor, like the per-item
+        work; process pools get a module-level function backed by a
+        per-process stage.
+        
+        Returns a mapping of original text to redacted text, consumed by
+        _redact_text while the items are de-identified, and the prefilter
+        verdict counts of the pass. Note and narrative text goes to NER as
+        is; the short free-text fields of structured records are screened
+        by the PHI prefilter first. The mapping is empty when Presidio or
+        batching is disabled.
+        """
+        if not config.get("use_presidio_for_text", True) or not config.get("batch_text_analysis", True):
+            return {}, {}
+        narrative = list(dict.fromkeys(t for item in items for t in self._collect_texts(item)))
+        seen = set(narrative)
+        fields = [t for t in dict.fromkeys(t for item in items for t in self._collect_field_texts(item))
+                  if t not in seen]
+        redact = _redact_texts_in_worker if self.get_executor(context).uses_processes else self.redact_texts
+        redactions: Dict[str, str] = {}
+        counts: Dict[str, int] = {}
+        if narrative:
+            redacted, _ = await self.run_blocking(context, redact, narrative, config)
+            redactions.update(zip(narrative, redacted))
+        if fields:
+            redacted, counts = await self.run_blocking(context, redact, fields, config, True)
+            redactions.update(zip(fields, redacted))
+        return redactions, counts
 
+    def _screen(self, text: str, config: Dict[str, Any]) -> str:
+        """
+        Prefilter verdict (SKIP, REGEX or NER) for a text field.
+        
+        Always NER when phi_prefilter is disabled.
+        """
+        if not config.get("phi_prefilter", True):
+            return NER
+        key = (config.get("prefilter_max_length"), tuple(config.get("prefilter_vocabulary") or ()))
+        prefilter = self._prefilters.get(key)
+        if prefilter is None:
+            prefilter = self._prefilters[key] = PHIPrefilter.from_config(config)
+        return prefilter.classify(text)
 
-    def _redact_text(self, text: str, config: Dict[str, Any]) -> str:
+    def _redact_text(self, text: str, config: Dict[str, Any],
+                     redactions: Optional[Dict[str, str]] = None, prefilter: bool = False) -> str:
         """
         Combined redaction: Presidio healthcare NER first (if enabled), fallback to regex.
+        
+        Texts already redacted by a batched pass (redactions) are looked up
+        instead of analyzed again. With prefilter, the PHI prefilter keeps
+        short structured fields that cannot contain names away from NER;
+        note and narrative text is never prefiltered.
         """
         if not text:
             return text
         
+        if redactions and text in redactions:
+            return redactions[text]
+        
         # Use Presidio healthcare NER by default, unless explicitly disabled
         use_presidio = config.get("use_presidio_for_text", True)
         
+        if use_presidio and prefilter:
+            verdict = self._screen(text, config)
+            if verdict == SKIP:
+                return text
+            if verdict == REGEX:
+                return self._redact_phi_from_text(text, config)
+        
         try:
             if use_presidio:
                 # Use healthcare-enhanced Presidio
@@ -271,13 +457,16 @@ class DeidentificationStage(PipelineStage):
                 self.logger.info(f"{context.log_prefix} Processing batch of {len(input_data)} items")
                 processing_stats["total_items"] = len(input_data)
                 
+                # Run NER over the free text of the whole batch at once
+                redactions, prefilter_counts = await self._batch_redactions(context, input_data, config)
+                
                 deid_results = []
                 for i, item in enumerate(input_data):
                     self.logger.info(f"{context.log_prefix} De-identifying item {i+1} of type {type(item).__name__}")
                     item_start_time = time.time()
                     
                     try:
-                        deid_item = self._deid_item(item, config)
+                        deid_item = await self._run_deid_item(context, item, config, redactions)
                         deid_results.append(deid_item)
                         processing_stats["successful_items"] += 1
                         
@@ -352,6 +541,9 @@ class DeidentificationStage(PipelineStage):
                         # For batch processing, continue with other items
                         self.logger.warning(f"{context.log_prefix} Failed to de-identify item {i+1}: {str(e)}")
                     
+                if deid_tracker and prefilter_counts:
+                    deid_tracker.record_prefilter(prefilter_counts)
+                
                 # Update pipeline run totals
                 if context.tracking_repository:
                     context.tracking_repository.update_pipeline_run_counts(
@@ -371,8 +563,12 @@ class DeidentificationStage(PipelineStage):
                 item_start_time = time.time()
                 
                 try:
-                    result = self._deid_item(input_data, config)
+                    # Batch the NER over all notes and narratives in the item
+                    redactions, prefilter_counts = await self._batch_redactions(context, [input_data], config)
+                    result = await self._run_deid_item(context, input_data, config, redactions)
                     processing_stats["successful_items"] = 1
+                    if deid_tracker and prefilter_counts:
+                        deid_tracker.record_prefilter(prefilter_counts)
                     
                     # Record success if tracker is available
                     if deid_tracker:
@@ -490,37 +686,74 @@ class DeidentificationStage(PipelineStage):
                 details={"deid_method": config.get("method", "safe_harbor")}
             )
     
-    def _deid_item(self, item: Any, config: Dict[str, Any]) -> Any:
+    async def _run_deid_item(self, context: PipelineContext, item: Any, config: Dict[str, Any],
+                             redactions: Optional[Dict[str, str]] = None) -> Any:
+        """
+        De-identify one item on the stage's configured executor.
+        
+        Process pools cannot receive this stage (it holds the loaded NLP models),
+        so they get a module-level function backed by a per-process stage.
+        """
+        executor = self.get_executor(context)
+        if executor.uses_processes:
+            if redactions:
+                # Only ship the item's own texts to the worker
+                texts = self._collect_texts(item) + self._collect_field_texts(item)
+                redactions = {t: redactions[t] for t in texts if t in redactions}
+            return await executor.run(_deid_item_in_worker, item, config, redactions)
+        return await executor.run(self._deid_item, item, config, redactions)
+    
+    def _deid_item(self, item: Any, config: Dict[str, Any],
+                   redactions: Optional[Dict[str, str]] = None) -> Any:
         """
         De-identify a single item based on its type.
         
         Args:
             item: Item to de-identify
             config: De-identification configuration
+            redactions: Free text already redacted by a batched NER pass
             
         Returns:
             De-identified item
         """
-        # Make a deep copy to avoid modifying the original
-        item_copy = copy.deepcopy(item)
-        
-        # Apply de-identification based on item type
-        if isinstance(item_copy, PulseClinicalContent):
-            return self._deid_clinical_content(item_copy, config)
-        elif isinstance(item_copy, PulseOperationalContent):
-            return self._deid_operational_content(item_copy, config)
+        # Copy-on-write: the original item is never modified, and only the
+        # records that de-identification changes are copied (see _cow)
+        if isinstance(item, PulseClinicalContent):
+            return self._cow(self._deid_clinical_content, item, config, redactions)
+        elif isinstance(item, PulseOperationalContent):
+            return self._cow(self._deid_operational_content, item, config, redactions)
         else:
             # For other types, just return as is with a warning
-            self.logger.warning(f"Unsupported item type for de-identification: {type(item_copy).__name__}")
-            return item_copy
+            self.logger.warning(f"Unsupported item type for de-identification: {type(item).__name__}")
+            return item
+    
+    def _cow(self, handler: Callable[..., Any], record: Any, config: Dict[str, Any], *args: Any) -> Any:
+        """
+        Run a record handler copy-on-write.
+        
+        The handler works on a shallow copy (model_copy() for Pydantic models),
+        so fields it replaces never touch the original and fields it leaves
+        alone stay shared. When nothing changed the original record is
+        returned. With in_place: true in the config the handler modifies the
+        record directly, for pipelines that never need the original.
+        """
+        if config.get("in_place", False):
+            return handler(record, config, *args)
+        work = record.model_copy() if isinstance(record, BaseModel) else copy.copy(record)
+        result = handler(work, config, *args)
+        if result is work and _same_fields(record, work):
+            return record
+        return result
     
-    def _deid_clinical_content(self, content: PulseClinicalContent, config: Dict[str, Any]) -> PulseClinicalContent:
+    def _deid_clinical_content(self, content: PulseClinicalContent, config: Dict[str, Any],
+                               redactions: Optional[Dict[str, str]] = None) -> PulseClinicalContent:
         """
         De-identify clinical content by handling each component.
         
         Args:
             content: Clinical content to de-identify
             config: De-identification configuration
+            redactions: Free text already redacted by a batched NER pass
             
         Returns:
             De-identified clinical content
@@ -530,56 +763,64 @@ class DeidentificationStage(PipelineStage):
         
         # Process patient information first
         if content.patient:
-            content.patient = self._deid_patient(content.patient, config, id_mapping)
+            content.patient = self._cow(self._deid_patient, content.patient, config, id_mapping)
         
         # Process encounter information
         if content.encounter:
-            content.encounter = self._deid_encounter(content.encounter, config, id_mapping)
+            content.encounter = self._cow(self._deid_encounter, content.encounter, config, id_mapping)
         
         # Process allergies
         if content.allergies:
-            content.allergies = [self._deid_allergy(a, config, id_mapping) for a in content.allergies]
+            content.allergies = [self._cow(self._deid_allergy, a, config, id_mapping, redactions)
+                                 for a in content.allergies]
         
         # Process immunizations
         if content.immunizations:
-            content.immunizations = [self._deid_immunization(i, config, id_mapping) for i in content.immunizations]
+            content.immunizations = [self._cow(self._deid_immunization, i, config, id_mapping, redactions)
+                                     for i in content.immunizations]
         
         # Process diagnoses
         if content.diagnoses:
-            content.diagnoses = [self._deid_diagnosis(d, config, id_mapping) for d in content.diagnoses]
+            content.diagnoses = [self._cow(self._deid_diagnosis, d, config, id_mapping, redactions)
+                                 for d in content.diagnoses]
         
         # Process problems
         if content.problem_list:
-            content.problem_list = [self._deid_problem(p, config, id_mapping) for p in content.problem_list]
+            content.problem_list = [self._cow(self._deid_problem, p, config, id_mapping, redactions)
+                                    for p in content.problem_list]
         
         # Process medications
         if content.medications:
-            content.medications = [self._deid_medication(m, config, id_mapping) for m in content.medications]
+            content.medications = [self._cow(self._deid_medication, m, config, id_mapping, redactions)
+                                   for m in content.medications]
         
         # Process labs
         if content.lab:
-            content.lab = [self._deid_lab_report(l, config, id_mapping) for l in content.lab]
+            content.lab = [self._cow(self._deid_lab_report, l, config, id_mapping, redactions) for l in content.lab]
         
         # Process imaging reports
         if content.imaging:
-            content.imaging = [self._deid_imaging_report(i, config, id_mapping) for i in content.imaging]
+            content.imaging = [self._cow(self._deid_imaging_report, i, config, id_mapping, redactions)
+                               for i in content.imaging]
         
         # Process notes (need special text processing)
         if content.notes:
-            content.notes = [self._deid_note(n, config, id_mapping) for n in content.notes]
+            content.notes = [self._cow(self._deid_note, n, config, id_mapping, redactions) for n in content.notes]
         
         # Mark the content as de-identified
         content.deidentified = True
         
         return content
     
-    def _deid_operational_content(self, content: PulseOperationalContent, config: Dict[str, Any]) -> PulseOperationalContent:
+    def _deid_operational_content(self, content: PulseOperationalContent, config: Dict[str, Any],
+                                  redactions: Optional[Dict[str, str]] = None) -> PulseOperationalContent:
         """
         De-identify operational content by handling financial components.
         
         Args:
             content: Operational content to de-identify
             config: De-identification configuration
+            redactions: Free text already redacted by a batched NER pass
             
         Returns:
             De-identified operational content
@@ -589,19 +830,23 @@ class DeidentificationStage(PipelineStage):
         
         # Claims
         if content.claims:
-            content.claims = [self._deid_claim(c, config, id_mapping) for c in content.claims]
+            content.claims = [self._cow(self._deid_claim, c, config, id_mapping, redactions)
+                              for c in content.claims]
         
         # Charges
         if content.charges:
-            content.charges = [self._deid_charge(c, config, id_mapping) for c in content.charges]
+            content.charges = [self._cow(self._deid_charge, c, config, id_mapping, redactions)
+                               for c in content.charges]
         
         # Payments
         if content.payments:
-            content.payments = [self._deid_payment(p, config, id_mapping) for p in content.payments]
+            content.payments = [self._cow(self._deid_payment, p, config, id_mapping, redactions)
+                                for p in content.payments]
         
         # Prior authorizations
         if content.prior_authorizations:
-            content.prior_authorizations = [self._deid_prior_auth(a, config, id_mapping) for a in content.prior_authorizations]
+            content.prior_authorizations = [self._cow(self._deid_prior_auth, a, config, id_mapping, redactions)
+                                            for a in content.prior_authorizations]
         
         # Mark the content as de-identified
         content.deidentified = True
@@ -650,18 +895,24 @@ class DeidentificationStage(PipelineStage):
         
         # Handle provider information
         if hasattr(encounter, "providers") and encounter.providers:
-            for provider in encounter.providers:
-                # Redact specific provider identifiers
-                if hasattr(provider, "id"):
-                    provider.id = f"DEID_PROV_{str(uuid.uuid4())[:8]}"
-                
-                # Generalize provider names
-                if hasattr(provider, "name"):
-                    provider.name = f"Provider-{str(uuid.uuid4())[:4]}"
+            encounter.providers = [self._cow(self._deid_provider, p, config) for p in encounter.providers]
         
         return encounter
     
-    def _deid_allergy(self, allergy, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_provider(self, provider, config: Dict[str, Any]) -> Any:
+        """De-identify an encounter provider."""
+        # Redact specific provider identifiers
+        if hasattr(provider, "id"):
+            provider.id = f"DEID_PROV_{str(uuid.uuid4())[:8]}"
+        
+        # Generalize provider names
+        if hasattr(provider, "name"):
+            provider.name = f"Provider-{str(uuid.uuid4())[:4]}"
+        
+        return provider
+    
+    def _deid_allergy(self, allergy, config: Dict[str, Any], id_mapping: Dict[str, str],
+                      redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify allergy information."""
         # Patient ID reference handling
         if hasattr(allergy, "patient_id") and allergy.patient_id in id_mapping:
@@ -670,9 +921,13 @@ class DeidentificationStage(PipelineStage):
         # Handle dates
         allergy = self._handle_dates(allergy, config)
         
+        # Handle free-text fields
+        allergy = self._handle_free_text(allergy, config, redactions)
+        
         return allergy
     
-    def _deid_immunization(self, immunization, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_immunization(self, immunization, config: Dict[str, Any], id_mapping: Dict[str, str],
+                           redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify immunization information."""
         # Patient ID reference handling
         if hasattr(immunization, "patient_id") and immunization.patient_id in id_mapping:
@@ -685,9 +940,13 @@ class DeidentificationStage(PipelineStage):
         if hasattr(immunization, "lot_number") and immunization.lot_number:
             immunization.lot_number = f"LOT-{str(uuid.uuid4())[:6]}"
         
+        # Handle free-text fields
+        immunization = self._handle_free_text(immunization, config, redactions)
+        
         return immunization
     
-    def _deid_diagnosis(self, diagnosis, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_diagnosis(self, diagnosis, config: Dict[str, Any], id_mapping: Dict[str, str],
+                        redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify diagnosis information."""
         # Patient ID reference handling
         if hasattr(diagnosis, "patient_id") and diagnosis.patient_id in id_mapping:
@@ -696,9 +955,13 @@ class DeidentificationStage(PipelineStage):
         # Handle dates
         diagnosis = self._handle_dates(diagnosis, config)
         
+        # Handle free-text fields
+        diagnosis = self._handle_free_text(diagnosis, config, redactions)
+        
         return diagnosis
     
-    def _deid_problem(self, problem, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_problem(self, problem, config: Dict[str, Any], id_mapping: Dict[str, str],
+                      redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify problem information."""
         # Patient ID reference handling
         if hasattr(problem, "patient_id") and problem.patient_id in id_mapping:
@@ -707,9 +970,13 @@ class DeidentificationStage(PipelineStage):
         # Handle dates
         problem = self._handle_dates(problem, config)
         
+        # Handle free-text fields
+        problem = self._handle_free_text(problem, config, redactions)
+        
         return problem
     
-    def _deid_medication(self, medication, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_medication(self, medication, config: Dict[str, Any], id_mapping: Dict[str, str],
+                         redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify medication information."""
         # Patient ID reference handling
         if hasattr(medication, "patient_id") and medication.patient_id in id_mapping:
@@ -718,9 +985,13 @@ class DeidentificationStage(PipelineStage):
         # Handle dates
         medication = self._handle_dates(medication, config)
         
+        # Handle free-text fields
+        medication = self._handle_free_text(medication, config, redactions)
+        
         return medication
     
-    def _deid_lab_report(self, lab_report, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_lab_report(self, lab_report, config: Dict[str, Any], id_mapping: Dict[str, str],
+                         redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify lab report information."""
         # Patient ID reference handling
         if hasattr(lab_report, "patient_id") and lab_report.patient_id in id_mapping:
@@ -731,16 +1002,30 @@ class DeidentificationStage(PipelineStage):
         
         # Handle observations
         if hasattr(lab_report, "observations") and lab_report.observations:
-            for obs in lab_report.observations:
-                obs = self._handle_dates(obs, config)
-                
-                # Patient ID reference handling
-                if hasattr(obs, "patient_id") and obs.patient_id in id_mapping:
-                    obs.patient_id = id_mapping[obs.patient_id]
+            lab_report.observations = [self._cow(self._deid_observation, obs, config, id_mapping, redactions)
+                                       for obs in lab_report.observations]
+        
+        # Handle free-text fields
+        lab_report = self._handle_free_text(lab_report, config, redactions)
         
         return lab_report
     
-    def _deid_imaging_report(self, imaging_report, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_observation(self, obs, config: Dict[str, Any], id_mapping: Dict[str, str],
+                          redactions: Optional[Dict[str, str]] = None) -> Any:
+        """De-identify a lab observation."""
+        obs = self._handle_dates(obs, config)
+        
+        # Patient ID reference handling
+        if hasattr(obs, "patient_id") and obs.patient_id in id_mapping:
+            obs.patient_id = id_mapping[obs.patient_id]
+        
+        # Handle free-text fields
+        obs = self._handle_free_text(obs, config, redactions)
+        
+        return obs
+    
+    def _deid_imaging_report(self, imaging_report, config: Dict[str, Any], id_mapping: Dict[str, str],
+                             redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify imaging report information."""
         # Patient ID reference handling
         if hasattr(imaging_report, "patient_id") and imaging_report.patient_id in id_mapping:
@@ -751,11 +1036,12 @@ class DeidentificationStage(PipelineStage):
         
         # Handle narrative text which might contain PHI
         if hasattr(imaging_report, "narrative") and imaging_report.narrative:
-            imaging_report.narrative = self._redact_text(imaging_report.narrative, config)
+            imaging_report.narrative = self._redact_text(imaging_report.narrative, config, redactions)
         
         return imaging_report
     
-    def _deid_note(self, note, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_note(self, note, config: Dict[str, Any], id_mapping: Dict[str, str],
+                   redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify clinical note information."""
         # Patient ID reference handling
         if hasattr(note, "patient_id") and note.patient_id in id_mapping:
@@ -766,7 +1052,7 @@ class DeidentificationStage(PipelineStage):
         
         # Handle text content which contains PHI
         if hasattr(note, "text") and note.text:
-            note.text = self._redact_text(note.text, config)
+            note.text = self._redact_text(note.text, config, redactions)
         
         # Handle author information
         if hasattr(note, "author_id"):
@@ -777,7 +1063,8 @@ class DeidentificationStage(PipelineStage):
         
         return note
     
-    def _deid_claim(self, claim, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_claim(self, claim, config: Dict[str, Any], id_mapping: Dict[str, str],
+                    redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify claim information."""
         # Patient ID reference handling
         if hasattr(claim, "patient_id") and claim.patient_id in id_mapping:
@@ -789,9 +1076,13 @@ class DeidentificationStage(PipelineStage):
         # Handle account numbers
         claim = self._handle_account_numbers(claim, config)
         
+        # Handle free-text fields
+        claim = self._handle_free_text(claim, config, redactions)
+        
         return claim
     
-    def _deid_charge(self, charge, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_charge(self, charge, config: Dict[str, Any], id_mapping: Dict[str, str],
+                     redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify charge information."""
         # Patient ID reference handling
         if hasattr(charge, "patient_id") and charge.patient_id in id_mapping:
@@ -800,9 +1091,13 @@ class DeidentificationStage(PipelineStage):
         # Handle dates
         charge = self._handle_dates(charge, config)
         
+        # Handle free-text fields
+        charge = self._handle_free_text(charge, config, redactions)
+        
         return charge
     
-    def _deid_payment(self, payment, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_payment(self, payment, config: Dict[str, Any], id_mapping: Dict[str, str],
+                      redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify payment information."""
         # Patient ID reference handling
         if hasattr(payment, "patient_id") and payment.patient_id in id_mapping:
@@ -815,9 +1110,13 @@ class DeidentificationStage(PipelineStage):
         if hasattr(payment, "check_number") and payment.check_number:
             payment.check_number = f"CHKNUM-{str(uuid.uuid4())[:6]}"
         
+        # Handle free-text fields
+        payment = self._handle_free_text(payment, config, redactions)
+        
         return payment
     
-    def _deid_prior_auth(self, auth, config: Dict[str, Any], id_mapping: Dict[str, str]) -> Any:
+    def _deid_prior_auth(self, auth, config: Dict[str, Any], id_mapping: Dict[str, str],
+                         redactions: Optional[Dict[str, str]] = None) -> Any:
         """De-identify prior authorization information."""
         # Patient ID reference handling
         if hasattr(auth, "patient_id") and auth.patient_id in id_mapping:
@@ -826,6 +1125,9 @@ class DeidentificationStage(PipelineStage):
         # Handle dates
         auth = self._handle_dates(auth, config)
         
+        # Handle free-text fields
+        auth = self._handle_free_text(auth, config, redactions)
+        
         return auth
     
     # === PHI Handler Methods ===
@@ -851,13 +1153,10 @@ class DeidentificationStage(PipelineStage):
         if hasattr(obj, "over_90"):
             is_over_90 = bool(obj.over_90)
         
-        # Process date attributes
-        # Use model.__dict__ instead of iterating through dir(obj) to avoid
-        # Pydantic deprecation warnings
-        for attr_name, attr_value in obj.__dict__.items():
-            # Skip private and special attributes
-            if attr_name.startswith('_'):
-                continue
+        # Process the date fields of the object's precompiled plan
+        plan = plan_for(obj)
+        for attr_name in plan.dates:
+            attr_value = getattr(obj, attr_name, None)
             
             # Handle lists of dates (like service_dates in PriorAuthorization)
             if isinstance(attr_value, list):
@@ -929,11 +1228,7 @@ class DeidentificationStage(PipelineStage):
                     setattr(obj, attr_name, None)
             
             # Handle date strings
-            elif isinstance(attr_value, str) and ("date" in attr_name.lower() or 
-                                               "time" in attr_name.lower() or
-                                               "birth" in attr_name.lower() or
-                                               "admit" in attr_name.lower() or
-                                               "discharge" in attr_name.lower()):
+            elif isinstance(attr_value, str) and attr_name in plan.date_strings:
                 try:
                     # Try to parse the date string
                     formats = [
@@ -996,16 +1291,13 @@ class DeidentificationStage(PipelineStage):
         # Get the salt value from config or use the default from the config file
         salt = config.get("id_salt", DEFAULT_SALT)
         
-        # Process attributes looking for identifier fields
-        # Use model.__dict__ instead of iterating through dir(obj) to avoid
-        # Pydantic deprecation warnings
-        for attr_name, attr_value in obj.__dict__.items():
-            # Skip private and special attributes
-            if attr_name.startswith('_'):
-                continue
+        # Process the identifier fields of the object's precompiled plan
+        plan = plan_for(obj)
+        for attr_name, kind in plan.identifiers:
+            attr_value = getattr(obj, attr_name, None)
             
             # Handle dictionaries (like identifiers dict)
-            if isinstance(attr_value, dict) and "identifiers" in attr_name:
+            if isinstance(attr_value, dict) and attr_name in plan.identifier_dicts:
                 # Create a new filtered dict
                 new_dict = {}
                 
@@ -1030,7 +1322,7 @@ class DeidentificationStage(PipelineStage):
             # Handle string fields that appear to be identifiers
             elif isinstance(attr_value, str):
                 # Check if it's a common identifier field
-                if "mrn" in attr_name.lower():
+                if kind == MRN:
                     # Use deterministic hashing for MRN
                     import hashlib
                     hashed = hashlib.sha256((attr_value + salt).encode()).hexdigest()[:MRN_HASH_LENGTH]
@@ -1039,18 +1331,18 @@ class DeidentificationStage(PipelineStage):
                     # Store in the mapping for reference
                     id_mapping[attr_value] = f"DEID_MRN_{hashed}"
                     
-                elif "ssn" in attr_name.lower() or "license" in attr_name.lower():
+                elif kind == SSN or kind == LICENSE:
                     # Use deterministic hashing for other identifiers
                     import hashlib
-                    prefix = "SSN" if "ssn" in attr_name.lower() else "LIC"
+                    prefix = "SSN" if kind == SSN else "LIC"
                     hashed = hashlib.sha256((attr_value + salt).encode()).hexdigest()[:GENERAL_ID_HASH_LENGTH]
                     setattr(obj, attr_name, f"DEID_{prefix}_{hashed}")
                 
                 # Check for ID fields that are references
-                elif attr_name.endswith("_id") and attr_value in id_mapping:
+                elif kind == REFERENCE and attr_value in id_mapping:
                     # Use consistent mapping
                     setattr(obj, attr_name, id_mapping[attr_value])
-                elif attr_name.endswith("_id") and attr_value:
+                elif kind == REFERENCE and attr_value:
                     # Create new mapping for this ID
                     import hashlib
                     hashed = hashlib.sha256((attr_value + salt).encode()).hexdigest()[:GENERAL_ID_HASH_LENGTH]
@@ -1093,64 +1385,35 @@ class DeidentificationStage(PipelineStage):
                         obj.geographic_area = state_part
             # If precision is city or higher, leave as is
         
-        # Check address fields
-        address_fields = ["address", "street", "city", "zip", "zipcode", "postal"]
-        for attr_name in dir(obj):
-            if any(addr_field in attr_name.lower() for addr_field in address_fields):
-                # Address field found, handle based on precision
-                if precision in ["none", "country", "state"]:
-                    # Remove specific address
-                    setattr(obj, attr_name, None)
+        # Remove specific address fields below city precision
+        if precision in ["none", "country", "state"]:
+            for attr_name in plan_for(obj).geographic:
+                setattr(obj, attr_name, None)
         
         return obj
     
     def _handle_contact_info(self, obj: Any, config: Dict[str, Any]) -> Any:
         """Handle contact information like phone, email, etc."""
-        # Look for common contact info attributes
-        contact_fields = ["phone", "fax", "email", "contact"]
-        
-        for attr_name, attr_value in obj.__dict__.items():
-            # Skip private and special attributes
-            if attr_name.startswith('_'):
-                continue
-            
-            # Check if attribute contains contact info
-            if any(field in attr_name.lower() for field in contact_fields):
-                if isinstance(attr_value, str):
-                    # Redact the contact information
-                    setattr(obj, attr_name, None)
+        for attr_name in plan_for(obj).contact:
+            if isinstance(getattr(obj, attr_name, None), str):
+                # Redact the contact information
+                setattr(obj, attr_name, None)
         
         return obj
     
     def _handle_biometric_identifiers(self, obj: Any, config: Dict[str, Any]) -> Any:
         """Handle biometric identifiers."""
-        # Look for biometric fields
-        biometric_fields = ["biometric", "fingerprint", "iris", "retinal", "voice", "dna"]
-        
-        for attr_name, attr_value in obj.__dict__.items():
-            # Skip private and special attributes
-            if attr_name.startswith('_'):
-                continue
-                
-            # Check if attribute contains biometric data
-            if any(field in attr_name.lower() for field in biometric_fields):
-                # Remove biometric data
-                setattr(obj, attr_name, None)
+        for attr_name in plan_for(obj).biometric:
+            # Remove biometric data
+            setattr(obj, attr_name, None)
         
         return obj
     
     def _handle_account_numbers(self, obj: Any, config: Dict[str, Any]) -> Any:
         """Handle account numbers and financial information."""
-        # Look for account-related fields
-        account_fields = ["account", "payment", "credit", "debit", "card", "bank", "financial"]
-        
-        for attr_name, attr_value in obj.__dict__.items():
-            # Skip private and special attributes
-            if attr_name.startswith('_'):
-                continue
-            
-            # Check if attribute contains account info
-            if any(field in attr_name.lower() for field in account_fields) and isinstance(attr_value, str):
+        for attr_name in plan_for(obj).account:
+            attr_value = getattr(obj, attr_name, None)
+            if isinstance(attr_value, str):
                 # Pseudonymize the account number
                 import hashlib
                 hashed = hashlib.sha256(attr_value.encode()).hexdigest()[:8]
@@ -1158,100 +1421,34 @@ class DeidentificationStage(PipelineStage):
         
         return obj
     
+    def _handle_free_text(self, obj: Any, config: Dict[str, Any],
+                          redactions: Optional[Dict[str, str]] = None) -> Any:
+        """Redact the short free-text fields in the object's plan with the PHI prefilter."""
+        for attr_name in plan_for(obj).free_text:
+            attr_value = getattr(obj, attr_name, None)
+            if isinstance(attr_value, str) and attr_value:
+                redacted = self._redact_text(attr_value, config, redactions, prefilter=True)
+                if redacted != attr_value:
+                    setattr(obj, attr_name, redacted)
+        return obj
+    
     def _redact_phi_from_text(self, text: str, config: Dict[str, Any]) -> str:
         """
         Redact PHI from free text content.
         
         This is a simplified version that uses regex patterns to identify
-        common PHI patterns. A production system would use more advanced
-        NLP techniques and named entity recognition.
+        common PHI patterns (see pulsepipe.pipelines.deid.regex_redactor).
+        A production system would use more advanced NLP techniques and
+        named entity recognition.
         """
         if not text:
             return text
-            
-        # Make a copy of the text
-        redacted_text = text
-        
-        # Apply regex-based redaction for common patterns
-        for phi_type, pattern in self.phi_regex.items():
-            # Different replacement based on type
-            if phi_type == "mrn":
-                redacted_text = pattern.sub(r'\1: [REDACTED-MRN]', redacted_text)
-            elif phi_type == "phone":
-                redacted_text = pattern.sub('[REDACTED-PHONE]', redacted_text)
-            elif phi_type == "ssn":
-                redacted_text = pattern.sub('[REDACTED-SSN]', redacted_text)
-            elif phi_type == "email":
-                redacted_text = pattern.sub('[REDACTED-EMAIL]', redacted_text)
-            elif phi_type == "url":
-                redacted_text = pattern.sub('[REDACTED-URL]', redacted_text)
-            elif phi_type == "ip":
-                redacted_text = pattern.sub('[REDACTED-IP]', redacted_text)
-            elif phi_type == "account":
-                redacted_text = pattern.sub(r'\1: [REDACTED-ACCT]', redacted_text)
-            elif phi_type == "cc":
-                redacted_text = pattern.sub('[REDACTED-CC]', redacted_text)
-            elif phi_type == "license":
-                redacted_text = pattern.sub('[REDACTED-LICENSE]', redacted_text)
-        
-        # Redact dates
-        date_patterns = [
-            # YYYY-MM-DD
-            re.compile(r'\b\d{4}[-/]\d{1,2}[-/]\d{1,2}\b'),
-            # MM/DD/YYYY
-            re.compile(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{4}\b'),
-            # DD-MON-YYYY
-            re.compile(r'\b\d{1,2}[-\s][A-Za-z]{3,9}[-\s]\d{4}\b'),
-            # MON DD, YYYY
-            re.compile(r'\b[A-Za-z]{3,9}\s\d{1,2},?\s\d{4}\b')
-        ]
-        
-        for pattern in date_patterns:
-            redacted_text = pattern.sub('[REDACTED-DATE]', redacted_text)
-        
-        # Handle specific HIPAA concerns for over-90 patients
-        if config.get("over_90_handling") == "redact" and getattr(self, "_patient_is_over_90", False):
-            # More aggressive date redaction for over 90 patients
-            # Remove all years
-            year_pattern = re.compile(r'\b(19|20)\d{2}\b')
-            redacted_text = year_pattern.sub('[REDACTED-YEAR]', redacted_text)
-        
-        # Since we don't have a proper NER, we use a simple name search
-        # Note: This is a very basic approach that would need improvement
-        name_patterns = [
-            # Dr. Lastname
-            re.compile(r'\b(Dr|Doctor)\.?\s+[A-Z][a-z]+\b'),
-            # First Last
-            re.compile(r'\b[A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?\b'),
-            # Mr./Mrs./Ms. Last
-            re.compile(r'\b(Mr|Mrs|Ms|Miss)\.?\s+[A-Z][a-z]+\b')
-        ]
-        
-        for pattern in name_patterns:
-            redacted_text = pattern.sub('[REDACTED-NAME]', redacted_text)
-        
-        # Geographic redaction based on configuration
-        precision = config.get("geographic_precision", "state")
         
-        if precision in ["none", "country"]:
-            # Redact city and state names
-            # This is a simplified approach - would need a gazetteer for production
-            city_state_pattern = re.compile(r'\b[A-Z][a-z]+(?:,\s*[A-Z]{2})?\b')
-            redacted_text = city_state_pattern.sub('[REDACTED-LOCATION]', redacted_text)
-            
-            # Redact ZIP codes
-            zip_pattern = re.compile(r'\b\d{5}(?:-\d{4})?\b')
-            redacted_text = zip_pattern.sub('[REDACTED-ZIP]', redacted_text)
-        elif precision == "state":
-            # Only redact specific addresses and ZIP codes
-            address_pattern = re.compile(r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Court|Ct|Place|Pl|Terrace|Ter|Way)\b', re.IGNORECASE)
-            redacted_text = address_pattern.sub('[REDACTED-ADDRESS]', redacted_text)
-            
-            # Redact ZIP codes
-            zip_pattern = re.compile(r'\b\d{5}(?:-\d{4})?\b')
-            redacted_text = zip_pattern.sub('[REDACTED-ZIP]', redacted_text)
-        
-        return redacted_text
+        # Structured patterns scan first, then names and places between their matches.
+        # Years are only redacted for over-90 patients with over_90_handling: redact
+        redact_years = config.get("over_90_handling") == "redact" and getattr(self, "_patient_is_over_90", False)
+        redactor = RegexRedactor(config.get("geographic_precision", "state"), redact_years)
+        return redactor.redact(text)
     
     def _extract_record_id(self, item: Any) -> Optional[str]:
         """
@@ -1291,3 +1488,38 @@ class DeidentificationStage(PipelineStage):
             # Simple heuristic: assume ~1 PHI entity per 100 characters
             return max(1, len(text_content) // 100)
         return 1
+
+
+def _same_fields(original: Any, copied: Any) -> bool:
+    """True if a shallow copy still holds exactly the original's field values."""
+    fields, copied_fields = vars(original), vars(copied)
+    return len(fields) == len(copied_fields) and all(
+        copied_fields.get(name, _MISSING) is value for name, value in fields.items()
+    )
+
+
+_MISSING = object()
+
+
+# Per-process stage used by process-pool executors, built on first use so each
+# worker loads the NLP models once rather than once per item.
+_worker_stage: Optional[DeidentificationStage] = None
+
+
+def _get_worker_stage() -> DeidentificationStage:
+    global _worker_stage
+    if _worker_stage is None:
+        _worker_stage = DeidentificationStage()
+    return _worker_stage
+
+
+def _deid_item_in_worker(item: Any, config: Dict[str, Any],
+                         redactions: Optional[Dict[str, str]] = None) -> Any:
+    """De-identify an item inside a process-pool worker."""
+    return _get_worker_stage()._deid_item(item, config, redactions)
+
+
+def _redact_texts_in_worker(texts: List[str], config: Dict[str, Any],
+                            prefilter: bool = False) -> Tuple[List[str], Dict[str, int]]:
+    """Run a batched text redaction pass inside a process-pool worker."""
+    return _get_worker_stage().redact_texts(texts, config, prefilter)
@@ -28,15 +28,18 @@ Creates vector embeddings from chunked healthcare data
 to enable semantic search and retrieval.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 import asyncio
 import json
 import os
 
+from pulsepipe.utils import json_codec
 from pulsepipe.utils.errors import EmbedderError, ConfigurationError
 from pulsepipe.pipelines.context import PipelineContext
 from pulsepipe.pipelines.stages import PipelineStage
-from pulsepipe.pipelines.embedders import EMBEDDER_REGISTRY
+from pulsepipe.pipelines.stage_executor import StageExecutor
+from pulsepipe.pipelines.embedders import EMBEDDER_REGISTRY, EmbeddingCache
+from pulsepipe.pipelines.embedders.base_embedder import SENTENCE_TRANSFORMER
 
 class EmbeddingStage(PipelineStage):
     """
@@ -51,6 +54,65 @@ class EmbeddingStage(PipelineStage):
     def __init__(self):
         """Initialize the embedding stage."""
         super().__init__("embedding")
+        # Embedding caches per pipeline run; embedders are rebuilt every execute
+        self._caches: Dict[str, Optional[EmbeddingCache]] = {}
+    
+    def get_executor(self, context: PipelineContext) -> StageExecutor:
+        """
+        Get the executor that runs this stage's encode calls.
+        
+        Embedders hold the loaded model and cache, which cannot be shipped to
+        worker processes; a thread pool takes encode calls off the event loop.
+        
+        Raises:
+            ConfigurationError: If a process executor is configured
+        """
+        executor = super().get_executor(context)
+        if executor.uses_processes:
+            raise ConfigurationError(
+                "The embedding stage cannot use a process executor; use type: thread",
+                details={"stage": self.name}
+            )
+        return executor
+    
+    def get_cache(self, context: PipelineContext, config: Dict[str, Any]) -> Optional[EmbeddingCache]:
+        """
+        Get the embedding cache for a pipeline run.
+        
+        The cache is built from the ``cache`` section of the stage config on
+        first use and kept until ``close_executor()`` is called, so its memory
+        tier survives across executes of the same run.
+        
+        Args:
+            context: Pipeline execution context
+            config: Embedding stage config
+            
+        Returns:
+            The run's EmbeddingCache, or None if caching is not configured
+        """
+        if context.pipeline_id not in self._caches:
+            self._caches[context.pipeline_id] = EmbeddingCache.from_config(config.get("cache"))
+        return self._caches[context.pipeline_id]
+    
+    def close_executor(self, context: Optional[PipelineContext] = None) -> None:
+        """Shut down worker pools and close the embedding caches of finished runs."""
+        super().close_executor(context)
+        if context is None:
+            caches = list(self._caches.values())
+            self._caches.clear()
+        else:
+            caches = [self._caches.pop(context.pipeline_id, None)]
+        
+        for cache in caches:
+            if cache is not None:
+                cache.close()
+    
+    def required_models(self, context: PipelineContext) -> List[Tuple[str, str]]:
+        """The embedding model named in the stage config."""
+        config = self.get_stage_config(context) or {}
+        embedder_class = EMBEDDER_REGISTRY.get(config.get("type", "clinical"), EMBEDDER_REGISTRY["clinical"])
+        model_name = config.get("model_name") or embedder_class.DEFAULT_MODEL_NAME
+        return [(SENTENCE_TRANSFORMER, model_name)]
     
     async def execute(self, context: PipelineContext, chunked_data: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
@@ -96,6 +158,9 @@ class EmbeddingStage(PipelineStage):
         
         embedder_type = config.get("type", "clinical")
         
+        # Fail fast on an unsupported executor before loading the model
+        self.get_executor(context)
+        
         self.logger.info(f"{context.log_prefix} Embedding data with type: {embedder_type}")
         
         processing_stats = {
@@ -105,15 +170,19 @@ class EmbeddingStage(PipelineStage):
             "processing_errors": []
         }
         
+        embedder = None
         try:
             # Select embedder type
             if embedder_type not in EMBEDDER_REGISTRY:
                 self.logger.warning(f"{context.log_prefix} Unknown embedder type: {embedder_type}, falling back to clinical")
                 embedder_type = "clinical"
             
+            # Keep the model loaded for the whole run, not just this execute
+            await asyncio.to_thread(self.hold_models, context)
+            
             # Create embedder instance
             embedder_class = EMBEDDER_REGISTRY[embedder_type]
-            embedder = embedder_class(config)
+            embedder = embedder_class(config, cache=self.get_cache(context, config))
             
             self.logger.info(f"{context.log_prefix} Using embedder: {embedder.name} ({embedder_type})")
             
@@ -128,97 +197,26 @@ class EmbeddingStage(PipelineStage):
             self.logger.info(f"{context.log_prefix} Embedding {chunk_count} chunks")
             
             # Process chunks in batches to avoid memory issues
-            batch_size = 20  # Can be tuned based on model size and available memory
+            batch_size = max(1, int(config.get("batch_size", 32)))  # Can be tuned based on model size and available memory
+            batch_mode = config.get("batch_mode", True)
             
             for i in range(0, chunk_count, batch_size):
                 batch = chunked_data[i:i+batch_size]
                 self.logger.info(f"{context.log_prefix} Processing batch {i//batch_size + 1}/{(chunk_count-1)//batch_size + 1} ({len(batch)} chunks)")
                 
-                # Process each chunk in the batch
-                batch_results = []
-                for j, chunk in enumerate(batch):
-                    chunk_start_time = time.time()
-                    try:
-                        # Embed chunk
-                        embedded_chunk = embedder.embed_chunk(chunk)
-                        batch_results.append(embedded_chunk)
-                        processing_stats["successful_chunks"] += 1
-                        
-                        # Record success if tracker is available
-                        if embedding_tracker:
-                            processing_time_ms = int((time.time() - chunk_start_time) * 1000)
-                            embedding_dimensions = len(embedded_chunk.get("embedding", []))
-                            embedding_tracker.record_success(
-                                record_id=chunk.get("id", f"chunk_{i}_{j}"),
-                                source_id=f"batch_{i}",
-                                content_type=self._determine_content_type(chunk),
-                                processing_time_ms=processing_time_ms,
-                                chunk_count=1,  # Single chunk being processed
-                                embedding_dimensions=embedding_dimensions,
-                                model_name=config.get("model_name", embedder.name),
-                                metadata={
-                                    "embedder_type": embedder_type,
-                                    "embedder_name": embedder.name,
-                                    "chunk_content_length": len(str(chunk.get("content", ""))),
-                                    "batch_index": i,
-                                    "chunk_index": j
-                                }
-                            )
-                            
-                        # Log audit event if audit logger is available
-                        if context.audit_logger:
-                            context.audit_logger.log_record_processed(
-                                stage_name="embedding",
-                                record_id=chunk.get("id", f"chunk_{i}_{j}"),
-                                record_type=chunk.get("type", "unknown_chunk"),
-                                processing_time_ms=int((time.time() - chunk_start_time) * 1000),
-                                details={
-                                    "embedder_type": embedder_type,
-                                    "embedder_name": embedder.name,
-                                    "model_name": config.get("model_name", "unknown"),
-                                    "chunk_content_length": len(str(chunk.get("content", "")))
-                                }
-                            )
-                            
-                    except Exception as e:
-                        processing_stats["failed_chunks"] += 1
-                        processing_stats["processing_errors"].append(str(e))
-                        
-                        # Record failure if tracker is available
-                        if embedding_tracker:
-                            from pulsepipe.audit.embedding_tracker import EmbeddingStage
-                            processing_time_ms = int((time.time() - chunk_start_time) * 1000)
-                            embedding_tracker.record_failure(
-                                record_id=chunk.get("id", f"chunk_{i}_{j}"),
-                                error=e,
-                                stage=EmbeddingStage.EMBEDDING_GENERATION,
-                                source_id=f"batch_{i}",
-                                content_type=self._determine_content_type(chunk),
-                                processing_time_ms=processing_time_ms,
-                                model_name=config.get("model_name", embedder.name),
-                                metadata={
-                                    "embedder_type": embedder_type,
-                                    "embedder_name": embedder.name,
-                                    "batch_index": i,
-                                    "chunk_index": j
-                                }
-                            )
-                            
-                        # Log audit event if audit logger is available
-                        if context.audit_logger:
-                            context.audit_logger.log_record_failed(
-                                stage_name="embedding",
-                                record_id=chunk.get("id", f"chunk_{i}_{j}"),
-                                error=e,
-                                details={
-                                    "embedder_type": embedder_type,
-                                    "batch_index": i,
-                                    "chunk_index": j
-                                }
-                            )
-                        
-                        self.logger.error(f"{context.log_prefix} Error embedding chunk: {str(e)}")
-                        # Continue with other chunks
+                batch_results = None
+                if batch_mode:
+                    batch_results = await self._embed_batch(
+                        context, embedder, embedder_type, config, batch, i,
+                        batch_size, embedding_tracker, processing_stats
+                    )
+                
+                if batch_results is None:
+                    # Per-chunk mode, also used to isolate failures when a batch encode fails
+                    batch_results = await self._embed_chunks_individually(
+                        context, embedder, embedder_type, config, batch, i,
+                        embedding_tracker, processing_stats
+                    )
                 
                 result_chunks.extend(batch_results)
                 self.logger.info(f"{context.log_prefix} Completed batch {i//batch_size + 1}")
@@ -250,7 +248,7 @@ class EmbeddingStage(PipelineStage):
                     try:
                         with open(embeddings_output_path, "w") as f:
                             for chunk in result_chunks:
-                                f.write(json.dumps(chunk) + "\n")
+                                f.write(json_codec.dumps(chunk) + "\n")
                         self.logger.info(f"{context.log_prefix} Embeddings written to {embeddings_output_path}")
                     except Exception as e:
                         context.add_error("embedding", f"Failed to write embeddings to {embeddings_output_path}: {str(e)}")
@@ -302,6 +300,190 @@ class EmbeddingStage(PipelineStage):
                 f"Error during embedding: {str(e)}",
                 details={"embedder_type": embedder_type}
             )
+        finally:
+            # The run's reference keeps the model loaded for the next batch
+            if embedder is not None and hasattr(embedder, "close"):
+                embedder.close()
+    
+    async def _embed_batch(self, context: PipelineContext, embedder: Any, embedder_type: str,
+                           config: Dict[str, Any], batch: List[Dict[str, Any]], batch_index: int,
+                           batch_size: int, embedding_tracker: Any,
+                           processing_stats: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Embed a whole batch with a single vectorized encode call.
+        
+        The encode runs on the stage's executor. Tracker and audit events are
+        recorded once per batch. Returns None if the batch encode fails so the
+        caller can retry chunk by chunk.
+        """
+        import time
+        
+        cache = getattr(embedder, "cache", None)
+        if not isinstance(cache, EmbeddingCache):
+            cache = None
+        hits_before, misses_before = (cache.hits, cache.misses) if cache else (0, 0)
+        
+        batch_start_time = time.time()
+        try:
+            batch_results = await self.run_blocking(context, embedder.embed_chunks, batch, batch_size)
+        except Exception as e:
+            self.logger.warning(f"{context.log_prefix} Batch embedding failed, retrying chunk by chunk: {str(e)}")
+            return None
+        
+        cache_hits = cache.hits - hits_before if cache else 0
+        cache_misses = cache.misses - misses_before if cache else 0
+        if cache and embedding_tracker:
+            embedding_tracker.record_cache_stats(hits=cache_hits, misses=cache_misses)
+        
+        processing_time_ms = int((time.time() - batch_start_time) * 1000)
+        processing_stats["successful_chunks"] += len(batch_results)
+        batch_id = f"batch_{batch_index}"
+        embedding_dimensions = len(batch_results[0].get("embedding", [])) if batch_results else 0
+        content_length = sum(len(str(chunk.get("content", ""))) for chunk in batch)
+        
+        # Record success if tracker is available
+        if embedding_tracker:
+            embedding_tracker.record_success(
+                record_id=batch_id,
+                source_id=batch_id,
+                content_type=self._determine_content_type(batch[0]),
+                processing_time_ms=processing_time_ms,
+                chunk_count=len(batch_results),
+                embedding_dimensions=embedding_dimensions,
+                model_name=config.get("model_name", embedder.name),
+                metadata={
+                    "embedder_type": embedder_type,
+                    "embedder_name": embedder.name,
+                    "chunk_content_length": content_length,
+                    "batch_index": batch_index,
+                    "batch_mode": True,
+                    "cache_hits": cache_hits,
+                    "cache_misses": cache_misses
+                }
+            )
+        
+        # Log audit event if audit logger is available
+        if context.audit_logger:
+            context.audit_logger.log_record_processed(
+                stage_name="embedding",
+                record_id=batch_id,
+                record_type="chunk_batch",
+                processing_time_ms=processing_time_ms,
+                details={
+                    "embedder_type": embedder_type,
+                    "embedder_name": embedder.name,
+                    "model_name": config.get("model_name", "unknown"),
+                    "chunk_count": len(batch_results),
+                    "chunk_ids": [chunk.get("id") for chunk in batch],
+                    "chunk_content_length": content_length,
+                    "cache_hits": cache_hits
+                }
+            )
+        
+        return batch_results
+    
+    async def _embed_chunks_individually(self, context: PipelineContext, embedder: Any, embedder_type: str,
+                                         config: Dict[str, Any], batch: List[Dict[str, Any]], batch_index: int,
+                                         embedding_tracker: Any, processing_stats: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Embed a batch one chunk at a time, recording tracker and audit events per chunk."""
+        import time
+        
+        cache = getattr(embedder, "cache", None)
+        if not isinstance(cache, EmbeddingCache):
+            cache = None
+        hits_before, misses_before = (cache.hits, cache.misses) if cache else (0, 0)
+        
+        i = batch_index
+        batch_results = []
+        for j, chunk in enumerate(batch):
+            chunk_start_time = time.time()
+            try:
+                # Embed chunk
+                embedded_chunk = await self.run_blocking(context, embedder.embed_chunk, chunk)
+                batch_results.append(embedded_chunk)
+                processing_stats["successful_chunks"] += 1
+
+                # Record success if tracker is available
+                if embedding_tracker:
+                    processing_time_ms = int((time.time() - chunk_start_time) * 1000)
+                    embedding_dimensions = len(embedded_chunk.get("embedding", []))
+                    embedding_tracker.record_success(
+                        record_id=chunk.get("id", f"chunk_{i}_{j}"),
+                        source_id=f"batch_{i}",
+                        content_type=self._determine_content_type(chunk),
+                        processing_time_ms=processing_time_ms,
+                        chunk_count=1,  # Single chunk being processed
+                        embedding_dimensions=embedding_dimensions,
+                        model_name=config.get("model_name", embedder.name),
+                        metadata={
+                            "embedder_type": embedder_type,
+                            "embedder_name": embedder.name,
+                            "chunk_content_length": len(str(chunk.get("content", ""))),
+                            "batch_index": i,
+                            "chunk_index": j
+                        }
+                    )
+
+                # Log audit event if audit logger is available
+                if context.audit_logger:
+                    context.audit_logger.log_record_processed(
+                        stage_name="embedding",
+                        record_id=chunk.get("id", f"chunk_{i}_{j}"),
+                        record_type=chunk.get("type", "unknown_chunk"),
+                        processing_time_ms=int((time.time() - chunk_start_time) * 1000),
+                        details={
+                            "embedder_type": embedder_type,
+                            "embedder_name": embedder.name,
+                            "model_name": config.get("model_name", "unknown"),
+                            "chunk_content_length": len(str(chunk.get("content", "")))
+                        }
+                    )
+
+            except Exception as e:
+                processing_stats["failed_chunks"] += 1
+                processing_stats["processing_errors"].append(str(e))
+
+                # Record failure if tracker is available
+                if embedding_tracker:
+                    from pulsepipe.audit.embedding_tracker import EmbeddingStage
+                    processing_time_ms = int((time.time() - chunk_start_time) * 1000)
+                    embedding_tracker.record_failure(
+                        record_id=chunk.get("id", f"chunk_{i}_{j}"),
+                        error=e,
+                        stage=EmbeddingStage.EMBEDDING_GENERATION,
+                        source_id=f"batch_{i}",
+                        content_type=self._determine_content_type(chunk),
+                        processing_time_ms=processing_time_ms,
+                        model_name=config.get("model_name", embedder.name),
+                        metadata={
+                            "embedder_type": embedder_type,
+                            "embedder_name": embedder.name,
+                            "batch_index": i,
+                            "chunk_index": j
+                        }
+                    )
+
+                # Log audit event if audit logger is available
+                if context.audit_logger:
+                    context.audit_logger.log_record_failed(
+                        stage_name="embedding",
+                        record_id=chunk.get("id", f"chunk_{i}_{j}"),
+                        error=e,
+                        details={
+                            "embedder_type": embedder_type,
+                            "batch_index": i,
+                            "chunk_index": j
+                        }
+                    )
+
+                self.logger.error(f"{context.log_prefix} Error embedding chunk: {str(e)}")
+                # Continue with other chunks
+        
+        if cache and embedding_tracker:
+            embedding_tracker.record_cache_stats(hits=cache.hits - hits_before,
+                                                 misses=cache.misses - misses_before)
+        
+        return batch_results
     
     def _determine_content_type(self, chunk: Dict[str, Any]) -> str:
         """Determine the content type based on the chunk."""
@@ -28,7 +28,7 @@ Handles the acquisition and parsing of input data using appropriate adapters and
 """
 
 import asyncio
-from typing import Any, Dict, Optional, Union, List
+from typing import Any, Awaitable, Callable, Dict, Optional, Union, List
 
 from pulsepipe.utils.errors import AdapterError, IngesterError, IngestionEngineError, ConfigurationError
 from pulsepipe.utils.factory import create_adapter, create_ingester
@@ -98,7 +98,7 @@ class IngestionStage(PipelineStage):
             ingester = create_ingester(ingester_config)
             
             # Create ingestion engine
-            engine = IngestionEngine(adapter, ingester)
+            engine = IngestionEngine(adapter, ingester, **self._engine_options(context.config))
             
             # Determine timeout based on configuration
             timeout = None  # Default: no timeout for continuous adapters
@@ -142,60 +142,7 @@ class IngestionStage(PipelineStage):
                                          details=err)
             
             # Log summary of results and record ingestion statistics
-            ingestion_tracker = context.get_ingestion_tracker("ingestion")
-            
-            if isinstance(result, list):
-                self.logger.info(f"{context.log_prefix} Ingested {len(result)} items")
-                
-                # Record ingestion statistics for each item
-                if ingestion_tracker:
-                    with ingestion_tracker.track_batch(f"ingestion_batch_{context.pipeline_id[:8]}") as batch:
-                        for i, item in enumerate(result):
-                            record_id = self._extract_record_id(item)
-                            record_type = type(item).__name__
-                            ingestion_tracker.record_success(
-                                record_id=record_id,
-                                record_type=record_type,
-                                processing_time_ms=10,  # Approximate since we don't track individual timing
-                                data_source="pipeline_ingestion"
-                            )
-                
-                # Update pipeline run totals
-                if context.tracking_repository:
-                    context.tracking_repository.update_pipeline_run_counts(
-                        run_id=context.pipeline_id,
-                        total=len(result),
-                        successful=len(result),
-                        failed=0,
-                        skipped=0
-                    )
-                        
-            elif result is not None:
-                self.logger.info(f"{context.log_prefix} Ingested 1 item of type: {type(result).__name__}")
-                
-                # Record single item ingestion statistics
-                if ingestion_tracker:
-                    with ingestion_tracker.track_batch(f"ingestion_batch_{context.pipeline_id[:8]}") as batch:
-                        record_id = self._extract_record_id(result)
-                        record_type = type(result).__name__
-                        ingestion_tracker.record_success(
-                            record_id=record_id,
-                            record_type=record_type,
-                            processing_time_ms=10,
-                            data_source="pipeline_ingestion"
-                        )
-                
-                # Update pipeline run totals
-                if context.tracking_repository:
-                    context.tracking_repository.update_pipeline_run_counts(
-                        run_id=context.pipeline_id,
-                        total=1,
-                        successful=1,
-                        failed=0,
-                        skipped=0
-                    )
-            else:
-                self.logger.warning(f"{context.log_prefix} No data was ingested")
+            self._record_ingested(context, result)
             
             # Return the result
             return result
@@ -213,6 +160,127 @@ class IngestionStage(PipelineStage):
                 cause=e
             )
     
+    def _record_ingested(self, context: PipelineContext, result: Any) -> None:
+        """
+        Log and record ingestion statistics for a result (single item or list).
+        
+        Args:
+            context: Pipeline execution context
+            result: Ingested item or list of items
+        """
+        ingestion_tracker = context.get_ingestion_tracker("ingestion")
+        
+        if isinstance(result, list):
+            self.logger.info(f"{context.log_prefix} Ingested {len(result)} items")
+        
+            # Record ingestion statistics for each item
+            if ingestion_tracker:
+                with ingestion_tracker.track_batch(f"ingestion_batch_{context.pipeline_id[:8]}") as batch:
+                    for i, item in enumerate(result):
+                        record_id = self._extract_record_id(item)
+                        record_type = type(item).__name__
+                        ingestion_tracker.record_success(
+                            record_id=record_id,
+                            record_type=record_type,
+                            processing_time_ms=10,  # Approximate since we don't track individual timing
+                            data_source="pipeline_ingestion"
+                        )
+        
+            # Update pipeline run totals
+            if context.tracking_repository:
+                context.tracking_repository.update_pipeline_run_counts(
+                    run_id=context.pipeline_id,
+                    total=len(result),
+                    successful=len(result),
+                    failed=0,
+                    skipped=0
+                )
+        
+        elif result is not None:
+            self.logger.info(f"{context.log_prefix} Ingested 1 item of type: {type(result).__name__}")
+        
+            # Record single item ingestion statistics
+            if ingestion_tracker:
+                with ingestion_tracker.track_batch(f"ingestion_batch_{context.pipeline_id[:8]}") as batch:
+                    record_id = self._extract_record_id(result)
+                    record_type = type(result).__name__
+                    ingestion_tracker.record_success(
+                        record_id=record_id,
+                        record_type=record_type,
+                        processing_time_ms=10,
+                        data_source="pipeline_ingestion"
+                    )
+        
+            # Update pipeline run totals
+            if context.tracking_repository:
+                context.tracking_repository.update_pipeline_run_counts(
+                    run_id=context.pipeline_id,
+                    total=1,
+                    successful=1,
+                    failed=0,
+                    skipped=0
+                )
+        else:
+            self.logger.warning(f"{context.log_prefix} No data was ingested")
+    
+    def open_session(self, context: PipelineContext) -> "IngestionSession":
+        """
+        Create a long-lived ingestion session for continuous pipelines.
+        
+        The adapter, ingester and engine are created once and reused for the
+        lifetime of the pipeline instead of on every poll.
+        
+        Args:
+            context: Pipeline execution context
+            
+        Returns:
+            An IngestionSession ready to run
+            
+        Raises:
+            ConfigurationError: If adapter or ingester configuration is missing
+        """
+        adapter_config = context.config.get("adapter")
+        ingester_config = context.config.get("ingester")
+        
+        if not adapter_config:
+            raise ConfigurationError(
+                "Missing adapter configuration",
+                details={"pipeline": context.name}
+            )
+            
+        if not ingester_config:
+            raise ConfigurationError(
+                "Missing ingester configuration",
+                details={"pipeline": context.name}
+            )
+        
+        self.logger.info(f"{context.log_prefix} Opening ingestion session: "
+                         f"{adapter_config.get('type', 'unknown')} -> {ingester_config.get('type', 'unknown')}")
+        
+        adapter = create_adapter(adapter_config, single_scan=context.config.get("single_scan", False),
+                                 full_config=context.config)
+        ingester = create_ingester(ingester_config)
+        engine = IngestionEngine(adapter, ingester,
+                                 max_queue_size=context.config.get("ingestion_queue_size", 100),
+                                 **self._engine_options(context.config))
+        return IngestionSession(self, context, adapter, engine)
+    
+    def _engine_options(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map the optional ingestion_workers / ingestion_pool / ingestion_ordered
+        settings onto IngestionEngine keyword arguments.
+        
+        Only keys present in the config are passed, so the engine defaults
+        (a single inline worker) apply otherwise.
+        """
+        options = {}
+        for key, option in (("ingestion_workers", "workers"),
+                            ("ingestion_pool", "pool"),
+                            ("ingestion_ordered", "ordered")):
+            if key in config:
+                options[option] = config[key]
+        return options
+    
     def _extract_record_id(self, item: Any) -> Optional[str]:
         """
         Extract a record ID from an ingested item.
@@ -231,3 +299,66 @@ class IngestionStage(PipelineStage):
             return item.patient_id
         else:
             return None
+
+
+class IngestionSession:
+    """
+    A persistent adapter/ingester/engine triple for continuous ingestion.
+    
+    The session runs the engine in streaming mode and hands every parsed
+    item to a callback (typically a put on the next stage's queue) as soon
+    as it is parsed, so there is no per-poll setup cost or polling latency.
+    """
+    
+    def __init__(self, stage: IngestionStage, context: PipelineContext, adapter: Any,
+                 engine: IngestionEngine):
+        self.stage = stage
+        self.context = context
+        self.adapter = adapter
+        self.engine = engine
+        self.item_count = 0
+        self._reported_errors = 0
+    
+    async def run(self, emit: Callable[[Any], Awaitable[None]],
+                  stop_event: Optional[asyncio.Event] = None) -> int:
+        """
+        Stream parsed items to emit until the adapter finishes or stop_event is set.
+        
+        Args:
+            emit: Coroutine function called once per ingested item
+            stop_event: Event that ends the session when set
+            
+        Returns:
+            Number of items emitted
+        """
+        async def on_result(result: Any) -> None:
+            if result is None:
+                return
+            self.stage._record_ingested(self.context, result)
+            for item in (result if isinstance(result, list) else [result]):
+                await emit(item)
+                self.item_count += 1
+            self._report_errors()
+        
+        try:
+            await self.engine.stream(on_result, stop_event)
+        finally:
+            self._report_errors()
+        return self.item_count
+    
+    def _report_errors(self) -> None:
+        """Add engine processing errors not yet reported to the context."""
+        errors = self.engine.processing_errors
+        for err in errors[self._reported_errors:]:
+            self.context.add_error("ingestion", err.get("message", "Unknown error"), details=err)
+        self._reported_errors = len(errors)
+    
+    async def close(self) -> None:
+        """Stop the adapter and release its resources."""
+        stop = getattr(self.adapter, "stop", None)
+        if callable(stop):
+            await stop()
+        bookmarks = getattr(self.adapter, "bookmarks", None)
+        close = getattr(bookmarks, "close", None)
+        if callable(close):
+            close()
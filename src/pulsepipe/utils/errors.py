@@ -69,6 +69,11 @@ class FileWatcherError(FileAdapterError):
     pass
 
 
+class MLLPError(AdapterError):
+    """Error in the MLLP listener adapter."""
+    pass
+
+
 class IngesterError(PulsePipeError):
     """Error occurred in a data ingester component."""
     pass
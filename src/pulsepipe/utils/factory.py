@@ -64,6 +64,10 @@ def create_adapter(config: dict, **kwargs):
         
         return adapter
     
+    if adapter_type == "mllp":
+        from pulsepipe.adapters.mllp import MLLPAdapter
+        return MLLPAdapter(config)
+    
     raise ValueError(f"Unsupported adapter type: {adapter_type}")
 
 def create_ingester(config: dict):
@@ -76,8 +80,11 @@ def create_ingester(config: dict):
         return FHIRIngester()
     elif ingester_type == "hl7v2":
         return HL7v2Ingester()
+    elif ingester_type == "fhir_ndjson":
+        from pulsepipe.ingesters.fhir_ndjson_ingester import FHIRNDJSONIngester
+        return FHIRNDJSONIngester.from_config(config)
     elif ingester_type == "x12":
-        return X12Ingester()
+        return X12Ingester.from_config(config)
     elif ingester_type == "plaintext":
         return PlainTextIngester()
 
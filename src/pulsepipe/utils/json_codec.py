@@ -0,0 +1,247 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/utils/json_codec.py
+
+"""
+Pluggable JSON codec used on PulsePipe's hot paths.
+
+Encoding and decoding go through orjson or msgspec when one is installed
+and fall back to the standard library otherwise. Every backend produces
+the same output:
+- compact separators and UTF-8 text (no ASCII escaping)
+- datetimes, dates and times via ``isoformat()``
+- ``NaN`` and infinities as ``null``, so the output is strict JSON
+- Pydantic models via ``model_dump(mode="json")``
+- enums by value, and sets and numpy arrays as lists
+- anything else via ``str``
+
+Pretty-printing (two-space indent) is opt-in.
+
+Objects the fast backend cannot encode, such as integers wider than 64
+bits, are encoded with the standard library. Decoding is not retried:
+input one backend rejects (``NaN`` literals, or a payload that is not
+JSON at all) raises ``json.JSONDecodeError`` straight away.
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import math
+import re
+from typing import Any, Callable, Dict, IO, List, Union
+
+from pydantic import BaseModel
+
+from pulsepipe.utils.errors import ConfigurationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Encode types the JSON backends do not handle themselves."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if hasattr(obj, "tolist"):
+        # numpy arrays and scalars
+        return obj.tolist()
+    return str(obj)
+
+
+_TEMPORAL = (datetime.datetime, datetime.date, datetime.time)
+
+
+def _normalize(obj: Any) -> Any:
+    """Copy of ``obj`` with temporal values encoded by ``_default`` and non-finite floats as None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, _TEMPORAL):
+        return _default(obj)
+    if isinstance(obj, dict):
+        return {key: _normalize(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_normalize(value) for value in obj]
+    return obj
+
+
+# --- standard library -------------------------------------------------------
+
+def _stdlib_dumps(obj: Any, pretty: bool, sort_keys: bool) -> str:
+    options = dict(
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        sort_keys=sort_keys,
+        indent=2 if pretty else None,
+        separators=(",", ": ") if pretty else (",", ":"),
+    )
+    try:
+        return json.dumps(obj, **options)
+    except ValueError as e:
+        if not str(e).startswith("Out of range float"):
+            raise
+    # Rare: only documents holding NaN or infinities pay for the extra pass
+    return json.dumps(_normalize(obj), **options)
+
+
+def _stdlib_loads(data: Union[str, bytes, bytearray]) -> Any:
+    return json.loads(data)
+
+
+# --- orjson -----------------------------------------------------------------
+
+def _orjson_dumps(obj: Any, pretty: bool, sort_keys: bool) -> str:
+    # Datetimes go through _default so offsets are written as isoformat() does
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(obj, default=_default, option=option).decode("utf-8")
+    except TypeError:
+        return _stdlib_dumps(obj, pretty, sort_keys)
+
+
+def _orjson_loads(data: Union[str, bytes, bytearray]) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return orjson.loads(data)
+
+
+# --- msgspec ----------------------------------------------------------------
+
+_MSGSPEC_ENCODERS: Dict[bool, Any] = {}
+
+
+def _msgspec_dumps(obj: Any, pretty: bool, sort_keys: bool) -> str:
+    encoder = _MSGSPEC_ENCODERS.get(sort_keys)
+    if encoder is None:
+        encoder = _MSGSPEC_ENCODERS[sort_keys] = msgspec.json.Encoder(
+            enc_hook=_default, order="sorted" if sort_keys else None
+        )
+    try:
+        # msgspec writes UTC as "Z" and has no datetime passthrough, so
+        # temporal values are encoded by _default up front
+        encoded = encoder.encode(_normalize(obj))
+    except (TypeError, msgspec.EncodeError):
+        return _stdlib_dumps(obj, pretty, sort_keys)
+    if pretty:
+        encoded = msgspec.json.format(encoded, indent=2)
+    return encoded.decode("utf-8")
+
+
+_MSGSPEC_ERROR_POS = re.compile(r"\(byte (\d+)\)")
+
+
+def _msgspec_loads(data: Union[str, bytes, bytearray]) -> Any:
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError as e:
+        doc = data if isinstance(data, str) else bytes(data).decode("utf-8", errors="replace")
+        match = _MSGSPEC_ERROR_POS.search(str(e))
+        raise JSONDecodeError(str(e), doc, int(match.group(1)) if match else 0) from e
+
+
+_BACKENDS: Dict[str, Any] = {
+    "orjson": (orjson, _orjson_dumps, _orjson_loads),
+    "msgspec": (msgspec, _msgspec_dumps, _msgspec_loads),
+    "json": (json, _stdlib_dumps, _stdlib_loads),
+}
+
+BACKEND = "json"
+_dumps: Callable[[Any, bool, bool], str] = _stdlib_dumps
+_loads: Callable[[Union[str, bytes, bytearray]], Any] = _stdlib_loads
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the JSON backend: ``"orjson"``, ``"msgspec"`` or ``"json"``.
+
+    Raises:
+        ConfigurationError: If the backend is unknown or not installed
+    """
+    global BACKEND, _dumps, _loads
+
+    if name not in _BACKENDS:
+        raise ConfigurationError(
+            f"Unknown JSON backend: {name}",
+            details={"available": available_backends()},
+        )
+    module, dumps_impl, loads_impl = _BACKENDS[name]
+    if module is None:
+        raise ConfigurationError(
+            f"JSON backend {name} is not installed",
+            details={"available": available_backends()},
+        )
+    BACKEND, _dumps, _loads = name, dumps_impl, loads_impl
+
+
+def available_backends() -> List[str]:
+    """Names of the installed backends, fastest first."""
+    return [name for name, (module, _, _) in _BACKENDS.items() if module is not None]
+
+
+def dumps(obj: Any, *, pretty: bool = False, sort_keys: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string."""
+    return _dumps(obj, pretty, sort_keys)
+
+
+def dump(obj: Any, fp: IO[str], *, pretty: bool = False, sort_keys: bool = False) -> None:
+    """Serialize ``obj`` as JSON to a text file handle."""
+    fp.write(_dumps(obj, pretty, sort_keys))
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    return _loads(data)
+
+
+def load(fp: IO) -> Any:
+    """Deserialize JSON from a text or binary file handle."""
+    return _loads(fp.read())
+
+
+set_backend(available_backends()[0])
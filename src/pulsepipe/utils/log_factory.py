@@ -572,7 +572,7 @@ class DomainAwareJsonFormatter:
     def format(self, logger_name: str, level: str, message: str, 
               context: Optional[Dict[str, Any]] = None) -> str:
         """Format log message as JSON with domain-specific additions."""
-        import json
+        from pulsepipe.utils import json_codec
         
         log_data = {
             "timestamp": "{{timestamp}}",  # Placeholder to be filled by LogFactory
@@ -596,7 +596,7 @@ class DomainAwareJsonFormatter:
         if context:
             log_data["context"] = context
         
-        return json.dumps(log_data)
+        return json_codec.dumps(log_data)
 
 
 class DomainAwareTextFormatter:
@@ -0,0 +1,167 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# src/pulsepipe/utils/model_registry.py
+
+"""
+Process-wide registry of loaded models.
+
+Embedding models and de-identification analyzers take seconds to load and
+hundreds of megabytes each. Components ask the registry for a model by kind
+and key (usually the model name) instead of constructing it themselves, so a
+model is loaded at most once per process and shared by every stage, batch and
+pipeline that needs it.
+
+Loaders are registered per kind by the module that knows how to build the
+model, and run lazily on first use. ``acquire``/``release`` keep a reference
+count; models with no references stay loaded for the next batch or pipeline
+restart until ``unload_unused()`` is called.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from pulsepipe.utils.log_factory import LogFactory
+from pulsepipe.utils.errors import ConfigurationError
+
+logger = LogFactory.get_logger(__name__)
+
+ModelKey = Tuple[str, str]
+
+
+class ModelRegistry:
+    """Lazily loads, shares and reference-counts models within a process."""
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable[[str], Any]] = {}
+        self._models: Dict[ModelKey, Any] = {}
+        self._refcounts: Dict[ModelKey, int] = {}
+        self._load_locks: Dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def register_loader(self, kind: str, loader: Callable[[str], Any]) -> None:
+        """
+        Register the function that builds models of a given kind.
+
+        Args:
+            kind: Model kind, e.g. "sentence_transformer"
+            loader: Callable taking the model key and returning the loaded model
+        """
+        self._loaders[kind] = loader
+
+    def get(self, kind: str, key: str) -> Any:
+        """
+        Get a model, loading it on first use, without taking a reference.
+
+        Raises:
+            ConfigurationError: If no loader is registered for the kind
+        """
+        model_key = (kind, key)
+        with self._lock:
+            if model_key in self._models:
+                return self._models[model_key]
+            loader = self._loaders.get(kind)
+            if loader is None:
+                raise ConfigurationError(
+                    f"No model loader registered for '{kind}'",
+                    details={"kind": kind, "registered": sorted(self._loaders)}
+                )
+            load_lock = self._load_locks.setdefault(model_key, threading.Lock())
+
+        # Load outside the registry lock so different models can load in parallel,
+        # while concurrent requests for the same model wait for a single load
+        with load_lock:
+            with self._lock:
+                if model_key in self._models:
+                    return self._models[model_key]
+
+            logger.info(f"Loading {kind} model: {key}")
+            model = loader(key)
+
+            with self._lock:
+                self._models[model_key] = model
+                self._refcounts.setdefault(model_key, 0)
+            return model
+
+    def acquire(self, kind: str, key: str) -> Any:
+        """Get a model and hold a reference to it until ``release``."""
+        model = self.get(kind, key)
+        with self._lock:
+            self._refcounts[(kind, key)] = self._refcounts.get((kind, key), 0) + 1
+        return model
+
+    def release(self, kind: str, key: str) -> None:
+        """Drop a reference taken with ``acquire``; the model stays loaded."""
+        with self._lock:
+            count = self._refcounts.get((kind, key), 0)
+            if count > 0:
+                self._refcounts[(kind, key)] = count - 1
+
+    def refcount(self, kind: str, key: str) -> int:
+        """Number of outstanding references to a model."""
+        with self._lock:
+            return self._refcounts.get((kind, key), 0)
+
+    def is_loaded(self, kind: str, key: str) -> bool:
+        """True if the model has been loaded in this process."""
+        with self._lock:
+            return (kind, key) in self._models
+
+    def warm_up(self, models: Iterable[ModelKey]) -> None:
+        """
+        Load models ahead of first use, e.g. at pipeline startup.
+
+        Failures are logged rather than raised; the model will be loaded (and
+        the error surfaced) again when a stage actually needs it.
+        """
+        for kind, key in models:
+            try:
+                self.get(kind, key)
+            except Exception as e:
+                logger.warning(f"Failed to warm up {kind} model '{key}': {e}")
+
+    def unload_unused(self) -> int:
+        """
+        Drop loaded models that nothing holds a reference to.
+
+        Returns:
+            Number of models unloaded
+        """
+        with self._lock:
+            unused = [k for k in self._models if self._refcounts.get(k, 0) == 0]
+            for model_key in unused:
+                del self._models[model_key]
+                self._refcounts.pop(model_key, None)
+        for kind, key in unused:
+            logger.info(f"Unloaded {kind} model: {key}")
+        return len(unused)
+
+    def clear(self) -> None:
+        """Drop every loaded model and reference count, keeping the loaders."""
+        with self._lock:
+            self._models.clear()
+            self._refcounts.clear()
+            self._load_locks.clear()
+
+
+# Shared by everything in the process
+model_registry = ModelRegistry()
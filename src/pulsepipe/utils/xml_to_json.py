@@ -22,10 +22,11 @@
 # src/pulsepipe/config/xml_to_json.py
 
 import xmltodict
-import json
 
 def xml_to_json(xml_string: str) -> dict:
-    """Converts FHIR XML to JSON dict"""
-    parsed_dict = xmltodict.parse(xml_string)
-    json_str = json.dumps(parsed_dict)
-    return json.loads(json_str)
+    """
+    Converts XML to a generic xmltodict-style dict (``@value`` attributes,
+    no type or cardinality handling). For FHIR resources use
+    ``pulsepipe.ingesters.fhir_utils.xml_converter.fhir_xml_to_dict``.
+    """
+    return xmltodict.parse(xml_string, dict_constructor=dict)
@@ -36,6 +36,7 @@ from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
 
 from pulsepipe.utils.log_factory import LogFactory, WindowsSafeFileHandler
+from pulsepipe.utils.model_registry import model_registry
 
 # Register global cleanup to ensure file handlers are closed at exit
 @atexit.register
@@ -180,6 +181,13 @@ def cleanup_log_files_session():
     WindowsSafeFileHandler.close_all()
     cleanup_root_logger_handlers()
 
+@pytest.fixture(autouse=True)
+def reset_model_registry():
+    """Drop models cached by earlier tests, which may have patched the loaders' classes."""
+    model_registry.clear()
+    yield
+    model_registry.clear()
+
 @pytest.fixture(autouse=True)
 def cleanup_log_files_test():
     """
@@ -247,7 +247,8 @@ class TestEmbeddingStageAuditLogging:
             # Set up the stage configuration
             embedding_stage.get_stage_config = MagicMock(return_value={
                 "type": "clinical",
-                "model_name": "test-model"
+                "model_name": "test-model",
+                "batch_mode": False
             })
             
             # Execute the stage
@@ -291,7 +292,8 @@ class TestEmbeddingStageAuditLogging:
             # Set up the stage configuration
             embedding_stage.get_stage_config = MagicMock(return_value={
                 "type": "clinical",
-                "model_name": "test-model"
+                "model_name": "test-model",
+                "batch_mode": False
             })
             
             # Execute the stage
@@ -312,6 +314,32 @@ class TestEmbeddingStageAuditLogging:
                 skipped=0
             )
 
+    
+    @pytest.mark.asyncio
+    async def test_embedding_stage_logs_per_batch(self, embedding_stage, mock_context_with_audit, sample_chunks):
+        """Test that batch mode records one audit event per batch."""
+        mock_embedder = MagicMock()
+        mock_embedder.name = "TestEmbedder"
+        mock_embedder.embed_chunks = MagicMock(
+            side_effect=lambda chunks, batch_size=None: [{**chunk, "embedding": [0.1, 0.2, 0.3]} for chunk in chunks]
+        )
+        
+        with patch('pulsepipe.pipelines.stages.embedding.EMBEDDER_REGISTRY', {"clinical": MagicMock(return_value=mock_embedder)}):
+            embedding_stage.get_stage_config = MagicMock(return_value={
+                "type": "clinical",
+                "model_name": "test-model"
+            })
+            
+            result = await embedding_stage.execute(mock_context_with_audit, sample_chunks)
+            
+            assert len(result) == 2
+            audit_logger = mock_context_with_audit.audit_logger
+            assert audit_logger.log_record_processed.call_count == 1
+            call_kwargs = audit_logger.log_record_processed.call_args[1]
+            assert call_kwargs["record_id"] == "batch_0"
+            assert call_kwargs["details"]["chunk_count"] == 2
+            assert call_kwargs["details"]["chunk_ids"] == ["chunk-1", "chunk-2"]
+
 
 class TestVectorStoreStageAuditLogging:
     """Tests for audit logging in the vector store stage."""
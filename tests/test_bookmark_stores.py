@@ -0,0 +1,138 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_bookmark_stores.py
+
+import pytest
+
+from pulsepipe.adapters.file_watcher_bookmarks.common_store import CommonBookmarkStore
+from pulsepipe.adapters.file_watcher_bookmarks.sqlite_store import SQLiteBookmarkStore
+from pulsepipe.persistence.database.sqlite_impl import SQLiteConnection, SQLiteDialect
+
+
+class CountingConnection:
+    """Wraps a connection and counts statements sent to the database."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.statements = 0
+
+    def execute(self, *args, **kwargs):
+        self.statements += 1
+        return self._conn.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        self.statements += 1
+        return self._conn.executemany(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+@pytest.fixture
+def common_store(tmp_path):
+    conn = CountingConnection(SQLiteConnection(str(tmp_path / "bookmarks.db")))
+    store = CommonBookmarkStore(conn, SQLiteDialect())
+    yield store
+    conn.close()
+
+
+class TestCommonBookmarkStoreBulk:
+    def test_filter_and_mark_many(self, common_store):
+        paths = [f"/data/file_{i}.json" for i in range(10)]
+        common_store.mark_processed_many(paths[:4])
+
+        assert common_store.filter_unprocessed(paths) == paths[4:]
+        assert common_store.is_processed(paths[0])
+        assert sorted(common_store.get_all()) == sorted(paths[:4])
+
+    def test_bulk_calls_batch_round_trips(self, common_store, monkeypatch):
+        monkeypatch.setattr(CommonBookmarkStore, "BATCH_SIZE", 10)
+        paths = [f"/data/file_{i}.json" for i in range(25)]
+
+        common_store.conn.statements = 0
+        common_store.mark_processed_many(paths)
+        # Five rows per insert statement (two parameters each)
+        assert common_store.conn.statements == 5
+
+        common_store.conn.statements = 0
+        assert common_store.filter_unprocessed(paths + ["/data/new.json"]) == ["/data/new.json"]
+        assert common_store.conn.statements == 3
+
+    def test_duplicates_and_empty_input(self, common_store):
+        common_store.mark_processed_many([])
+        common_store.mark_processed_many(["/a.json", "/a.json"])
+        assert common_store.get_all() == ["/a.json"]
+        assert common_store.filter_unprocessed(["/b.json", "/b.json", "/a.json"]) == ["/b.json", "/b.json"]
+
+    def test_cache_skips_database_for_known_paths(self, tmp_path):
+        conn = CountingConnection(SQLiteConnection(str(tmp_path / "cached.db")))
+        store = CommonBookmarkStore(conn, SQLiteDialect(), cache=True)
+        store.mark_processed_many(["/a.json", "/b.json"])
+
+        conn.statements = 0
+        assert store.is_processed("/a.json")
+        assert store.filter_unprocessed(["/a.json", "/b.json"]) == []
+        assert conn.statements == 0
+
+        store.clear_all()
+        assert store.filter_unprocessed(["/a.json"]) == ["/a.json"]
+        conn.close()
+
+    def test_dialect_without_bulk_queries_falls_back(self, tmp_path):
+        class PerPathDialect:
+            def __init__(self):
+                self._dialect = SQLiteDialect()
+
+            def get_bookmark_table_create(self):
+                return self._dialect.get_bookmark_table_create()
+
+            def get_bookmark_check(self):
+                return self._dialect.get_bookmark_check()
+
+            def get_bookmark_insert(self):
+                return self._dialect.get_bookmark_insert()
+
+        conn = SQLiteConnection(str(tmp_path / "fallback.db"))
+        store = CommonBookmarkStore(conn, PerPathDialect())
+        store.mark_processed_many(["/a.json", "/b.json"])
+        assert store.filter_unprocessed(["/a.json", "/c.json"]) == ["/c.json"]
+        conn.close()
+
+
+class TestSQLiteBookmarkStoreBulk:
+    def test_filter_and_mark_many(self, tmp_path):
+        store = SQLiteBookmarkStore(tmp_path / "bookmarks.db")
+        paths = [f"/data/{i}.json" for i in range(1200)]
+        store.mark_processed_many(paths[:700])
+
+        assert store.filter_unprocessed(paths) == paths[700:]
+        assert len(store.get_all()) == 700
+
+    def test_cache(self, tmp_path):
+        store = SQLiteBookmarkStore(tmp_path / "bookmarks.db", cache=True)
+        store.mark_processed("/a.json")
+        store.conn.execute("DELETE FROM bookmarks")
+        # Served from the in-process cache
+        assert store.filter_unprocessed(["/a.json", "/b.json"]) == ["/b.json"]
+        store.clear_all()
+        assert not store.is_processed("/a.json")
@@ -21,6 +21,8 @@
 
 # tests/test_cda_document_parser.py
 
+import io
+
 import pytest
 import xml.etree.ElementTree as ET
 
@@ -320,4 +322,76 @@ class TestCDADocumentParser:
         assert lab['result']['value'] == '180'
         assert lab['result']['unit'] == 'mg/dL'
         assert lab['reference_range']['low'] == '100'
-        assert lab['reference_range']['high'] == '199'
\ No newline at end of file
+        assert lab['reference_range']['high'] == '199'
+
+    def test_iterparse_matches_parse_document(self, parser, sample_cda_root):
+        """Streaming parse yields the same structure as the tree parser."""
+        xml = ET.tostring(sample_cda_root)
+        expected = parser.parse_document(sample_cda_root)
+        result = CDADocumentParser().iterparse_document(io.BytesIO(xml))
+
+        assert result == expected
+        assert list(result) == list(expected)
+
+    def test_iterparse_validates_header_before_sections(self, parser, sample_cda_root, monkeypatch):
+        """The validate callback runs before any section is parsed."""
+        parsed = []
+        monkeypatch.setattr(parser, '_parse_section', lambda section, result: parsed.append(section))
+
+        def validate(root):
+            assert parser._find_element(root, './/recordTarget/patientRole') is not None
+            raise ValueError("rejected")
+
+        with pytest.raises(ValueError, match="rejected"):
+            parser.iterparse_document(io.BytesIO(ET.tostring(sample_cda_root)), validate=validate)
+        assert parsed == []
+
+    def test_iterparse_clears_completed_sections(self, parser, monkeypatch):
+        """Top-level sections are released once parsed; nested ones go with their parent."""
+        xml = '''
+        <ClinicalDocument xmlns="urn:hl7-org:v3">
+            <component>
+                <structuredBody>
+                    <component>
+                        <section>
+                            <templateId root="2.16.840.1.113883.10.20.22.2.7.1"/>
+                            <component>
+                                <section>
+                                    <templateId root="2.16.840.1.113883.10.20.22.2.6.1"/>
+                                </section>
+                            </component>
+                        </section>
+                    </component>
+                </structuredBody>
+            </component>
+        </ClinicalDocument>
+        '''
+        seen = []
+        parse_section = parser._parse_section
+
+        def record(section, result):
+            seen.append(parser._find_element(section, './templateId').get('root'))
+            parse_section(section, result)
+
+        monkeypatch.setattr(parser, '_parse_section', record)
+        root_holder = []
+        result = parser.iterparse_document(io.StringIO(xml), validate=root_holder.append)
+
+        assert seen == ['2.16.840.1.113883.10.20.22.2.7.1', '2.16.840.1.113883.10.20.22.2.6.1']
+        assert result['procedures'] == [] and result['allergies'] == []
+        section = parser._find_element(root_holder[0], './/component/section')
+        assert section is not None and len(section) == 0
+
+    def test_iterparse_malformed_xml(self, parser):
+        """Malformed XML surfaces as an ElementTree ParseError."""
+        with pytest.raises(ET.ParseError):
+            parser.iterparse_document(io.StringIO('<ClinicalDocument><component>'))
+
+    def test_namespaced_paths_compiled_once(self, parser):
+        """Namespaced lookups reuse the path built on first use."""
+        root = ET.fromstring('<root xmlns="urn:hl7-org:v3"><child><leaf/></child></root>')
+
+        assert parser._find_element(root, './child/leaf') is not None
+        assert parser._compiled_paths['./child/leaf'] == './{urn:hl7-org:v3}child/{urn:hl7-org:v3}leaf'
+        parser._compiled_paths['./child/leaf'] = './{urn:hl7-org:v3}child'
+        assert parser._find_element(root, './child/leaf').tag == '{urn:hl7-org:v3}child'
@@ -360,6 +360,23 @@ class TestCDAIngester:
         assert result.encounter is None
         assert result.allergies == []
 
+    def test_parse_file_streams_document(self, ingester, sample_cda_xml, tmp_path):
+        """parse_file produces the same content as parse."""
+        path = tmp_path / "doc.xml"
+        path.write_text(sample_cda_xml, encoding="utf-8")
+
+        streamed = ingester.parse_file(path)
+        parsed = ingester.parse(sample_cda_xml)
+
+        assert isinstance(streamed, PulseClinicalContent)
+        assert streamed.model_dump() == parsed.model_dump()
+
+    def test_parse_bytes(self, ingester, sample_cda_xml):
+        """Byte payloads are parsed as well as strings."""
+        result = ingester.parse(sample_cda_xml.encode("utf-8"))
+        assert isinstance(result, PulseClinicalContent)
+        assert result.patient is not None
+
 
 class TestCDAIngesterIntegration:
     """Integration tests with real CDA files."""
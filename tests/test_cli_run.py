@@ -285,6 +285,56 @@ class TestCliRun:
             assert result.exit_code == 1
             assert "You must specify either --profile, or both --adapter and --ingester" in result.output
 
+    def test_run_all_pipelines(self, mock_pipeline_runner, mock_find_profile):
+        """Test --all runs every active pipeline from pipeline.yaml."""
+        runner = CliRunner()
+        mock_find_profile.return_value = "pipeline.yaml"
+        pipelines_config = {
+            "pipelines": [
+                {"name": "fhir_clinical", "active": True,
+                 "adapter": {"type": "file_watcher", "continuous": True}, "ingester": {"type": "fhir"}},
+                {"name": "x12_billing", "active": False,
+                 "adapter": {"type": "file_watcher"}, "ingester": {"type": "x12"}},
+            ]
+        }
+        
+        with patch('pulsepipe.cli.command.run.load_config', return_value=pipelines_config), \
+             patch('pulsepipe.cli.command.run.supplement_from_main_config'), \
+             patch('pulsepipe.cli.command.run.run_async_with_shutdown') as mock_run_async, \
+             patch('pulsepipe.cli.main.load_config') as main_config_loader:
+            main_config_loader.return_value = {"logging": {"show_banner": False}}
+            mock_run_async.return_value = {
+                "success": True,
+                "results": {"fhir_clinical": {"success": True}},
+                "errors": {}
+            }
+            
+            result = runner.invoke(cli, ["run", "--all", "--max-concurrency", "8", "--one-time"])
+            
+            assert result.exit_code == 0
+            assert "fhir_clinical" in result.output
+            mock_find_profile.assert_called_once_with("pipeline")
+            
+            pipeline_instance = mock_pipeline_runner.return_value.return_value
+            args, kwargs = pipeline_instance.run_all.call_args
+            assert [p["name"] for p in args[0]] == ["fhir_clinical"]
+            assert args[0][0]["adapter"]["continuous"] is False
+            assert kwargs["max_concurrency"] == 8
+
+    def test_run_all_without_active_pipelines(self, mock_pipeline_runner, mock_find_profile):
+        """Test --all fails when no pipeline is active."""
+        runner = CliRunner()
+        mock_find_profile.return_value = "pipeline.yaml"
+        
+        with patch('pulsepipe.cli.command.run.load_config', return_value={"pipelines": [{"name": "off", "active": False}]}), \
+             patch('pulsepipe.cli.main.load_config') as main_config_loader:
+            main_config_loader.return_value = {"logging": {"show_banner": False}}
+            
+            result = runner.invoke(cli, ["run", "--all"])
+            
+            assert result.exit_code == 1
+            assert "No active pipelines" in result.output
+
     def test_run_only_adapter_no_ingester(self, mock_pipeline_runner):
         """Test running with only adapter but no ingester."""
         runner = CliRunner()
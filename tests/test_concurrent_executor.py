@@ -399,6 +399,43 @@ class TestConcurrentPipelineExecutor:
         assert result["stage"] == "ingestion"
         assert result["status"] == "completed"
 
+    @pytest.mark.asyncio
+    async def test_run_stage_ingestion_continuous_session(self, executor, continuous_context):
+        """Test that continuous ingestion uses one persistent session instead of polling execute."""
+        session = MagicMock()
+        
+        async def run(emit, stop_event):
+            await emit("item1")
+            await emit("item2")
+            await stop_event.wait()
+            return 2
+        session.run = AsyncMock(side_effect=run)
+        session.close = AsyncMock()
+        
+        mock_stage = MockStage("ingestion")
+        mock_stage.open_session = MagicMock(return_value=session)
+        output_queue = asyncio.Queue()
+        
+        stage_task = asyncio.create_task(
+            executor._run_stage(
+                stage=mock_stage,
+                stage_name="ingestion",
+                context=continuous_context,
+                output_queue=output_queue
+            )
+        )
+        
+        await asyncio.sleep(0.1)
+        executor.stop_event.set()
+        result = await stage_task
+        
+        assert not mock_stage.executed
+        mock_stage.open_session.assert_called_once_with(continuous_context)
+        session.close.assert_awaited_once()
+        assert result["result_count"] == 2
+        assert result["results"] == []
+        assert [await output_queue.get(), await output_queue.get()] == ["item1", "item2"]
+
     @pytest.mark.asyncio
     async def test_run_stage_processing_stage(self, executor, pipeline_context):
         """Test non-ingestion stage execution."""
@@ -425,6 +462,44 @@ class TestConcurrentPipelineExecutor:
         assert result["status"] == "completed"
         assert result["result_count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_run_stage_bounded_in_flight_keeps_order(self, executor, basic_config):
+        """Items overlap up to max_in_flight and results keep input order."""
+        basic_config["chunking"] = {"executor": {"type": "thread", "workers": 2, "max_in_flight": 3}}
+        context = PipelineContext(name="in_flight", config=basic_config)
+        
+        class SlowFirstStage(PipelineStage):
+            def __init__(self):
+                super().__init__("chunking")
+                self.active = 0
+                self.peak = 0
+            
+            async def execute(self, context, input_data=None):
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+                await asyncio.sleep(0.05 if input_data == 0 else 0.01)
+                self.active -= 1
+                return f"out{input_data}"
+        
+        stage = SlowFirstStage()
+        input_queue = asyncio.Queue()
+        output_queue = asyncio.Queue()
+        for i in range(6):
+            await input_queue.put(i)
+        await input_queue.put(None)
+        
+        result = await executor._run_stage(
+            stage=stage,
+            stage_name="chunking",
+            context=context,
+            input_queue=input_queue,
+            output_queue=output_queue
+        )
+        
+        assert result["results"] == [f"out{i}" for i in range(6)]
+        assert stage.peak == 3
+        stage.close_executor(context)
+
     @pytest.mark.asyncio
     async def test_run_stage_no_input_queue_error(self, executor, pipeline_context):
         """Test stage error when missing input queue."""
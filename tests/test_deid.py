@@ -21,15 +21,16 @@
 
 # tests/test_deid.py
 
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 import copy
 import re
 import uuid
 from decimal import Decimal
 from datetime import datetime, date
 
-from pulsepipe.pipelines.stages.deid import DeidentificationStage
+from pulsepipe.pipelines.stages.deid import DeidentificationStage, _redact_texts_in_worker
 from pulsepipe.pipelines.context import PipelineContext
 from pulsepipe.models.clinical_content import PulseClinicalContent
 from pulsepipe.models.operational_content import PulseOperationalContent
@@ -44,6 +45,9 @@ from pulsepipe.utils.errors import DeidentificationError, ConfigurationError
 # Import the de-identification configuration for testing
 from pulsepipe.pipelines.deid.config import DEFAULT_SALT, REDACTION_MARKERS
 from pulsepipe.models.encounter import EncounterInfo, EncounterProvider
+from pulsepipe.models.allergy import Allergy
+from pulsepipe.models.problem import Problem
+from pulsepipe.models.medication import Medication
 
 class TestDeidentificationStage(unittest.TestCase):
     def setUp(self):
@@ -951,5 +955,200 @@ class TestDeidentificationStage(unittest.TestCase):
         self.assertIn("mrn_hash", deid_patient.identifiers)
         self.assertEqual(deid_patient.identifiers["mrn_hash"], f"DEID_{expected_hash}")
 
+    def test_redact_texts_batches_ner(self):
+        """Test that redact_texts analyzes unique texts in one batched NER pass."""
+        config = {"use_presidio_for_text": True, "text_batch_size": 16, "text_n_process": 2}
+        texts = ["Jane Smith seen today", "", "John Doe follow-up", "Jane Smith seen today"]
+        
+        with patch("pulsepipe.pipelines.stages.deid.BatchAnalyzerEngine") as mock_batch, \
+             patch.object(self.deid_stage, "_analyzer", MagicMock()), \
+             patch.object(self.deid_stage, "anonymizer") as mock_anonymizer:
+            mock_batch.return_value.analyze_iterator.return_value = [["r1"], ["r2"]]
+            mock_anonymizer.anonymize.side_effect = lambda text, analyzer_results: MagicMock(
+                text=f"<{analyzer_results[0]}>")
+            
+            redacted, counts = self.deid_stage.redact_texts(texts, config)
+        
+        self.assertEqual(redacted, ["<r1>", "", "<r2>", "<r1>"])
+        self.assertEqual(counts, {})
+        mock_batch.return_value.analyze_iterator.assert_called_once()
+        args, kwargs = mock_batch.return_value.analyze_iterator.call_args
+        self.assertEqual(args[0], ["Jane Smith seen today", "John Doe follow-up"])
+        self.assertEqual(kwargs["batch_size"], 16)
+        self.assertEqual(kwargs["n_process"], 2)
+
+    def test_redact_texts_falls_back_per_text(self):
+        """Test that a failed batch analysis falls back to per-text redaction."""
+        config = {"use_presidio_for_text": True}
+        
+        with patch("pulsepipe.pipelines.stages.deid.BatchAnalyzerEngine") as mock_batch, \
+             patch.object(self.deid_stage, "_analyzer", MagicMock()), \
+             patch.object(self.deid_stage, "_redact_phi_with_presidio",
+                          side_effect=lambda text, config: text.upper()):
+            mock_batch.return_value.analyze_iterator.side_effect = RuntimeError("no model")
+            
+            redacted, _ = self.deid_stage.redact_texts(["a note", "another"], config)
+        
+        self.assertEqual(redacted, ["A NOTE", "ANOTHER"])
+
+    def test_deid_item_uses_batch_redactions(self):
+        """Test that pre-redacted note text is used instead of a per-note NER call."""
+        config = dict(self.test_config, use_presidio_for_text=True)
+        redactions = {self.sample_note.text: "[BATCH-REDACTED]"}
+        
+        with patch.object(self.deid_stage, "_redact_phi_with_presidio",
+                          side_effect=lambda text, config: "[SINGLE]") as mock_presidio:
+            result = self.deid_stage._deid_item(self.clinical_content, config, redactions)
+        
+        self.assertEqual(result.notes[0].text, "[BATCH-REDACTED]")
+        # The imaging narrative was not in the batch, so it is analyzed on its own
+        mock_presidio.assert_called_once()
+
+    def test_batch_redactions_disabled(self):
+        """Test that no batch pass runs when Presidio or batching is off."""
+        batch = self.deid_stage._batch_redactions
+        with patch.object(self.deid_stage, "redact_texts") as mock_redact:
+            self.assertEqual(asyncio.run(batch(self.mock_context, [self.clinical_content], self.test_config)),
+                             ({}, {}))
+            config = dict(self.test_config, use_presidio_for_text=True, batch_text_analysis=False)
+            self.assertEqual(asyncio.run(batch(self.mock_context, [self.clinical_content], config)), ({}, {}))
+        mock_redact.assert_not_called()
+        
+        config = dict(self.test_config, use_presidio_for_text=True)
+        self.mock_context.pipeline_id = "test-run"
+        with patch.object(self.deid_stage, "redact_texts",
+                          side_effect=lambda texts, config, prefilter=False: (["x"] * len(texts), {})):
+            redactions, _ = asyncio.run(
+                batch(self.mock_context, [self.clinical_content, self.clinical_content], config))
+        self.deid_stage.close_executor(self.mock_context)
+        self.assertEqual(set(redactions), {self.sample_note.text, self.sample_imaging.narrative,
+                                           "Within normal limits except for glucose", "Glucose measurement"})
+
+    def test_batch_redactions_run_on_stage_executor(self):
+        """Test that the batched NER pass is dispatched through the stage executor."""
+        config = dict(self.test_config, use_presidio_for_text=True)
+        executor = MagicMock(uses_processes=False)
+        executor.run = AsyncMock(side_effect=lambda func, texts, *args: (["x"] * len(texts), {"regex": len(texts)}))
+        
+        with patch.object(self.deid_stage, "get_executor", return_value=executor):
+            redactions, counts = asyncio.run(
+                self.deid_stage._batch_redactions(self.mock_context, [self.clinical_content], config))
+            # One pass for notes and narratives, one prefiltered pass for structured fields
+            narrative_call, field_call = executor.run.call_args_list
+            self.assertEqual(narrative_call.args[0], self.deid_stage.redact_texts)
+            self.assertEqual(narrative_call.args[3:], ())
+            self.assertEqual(field_call.args[1], ["Within normal limits except for glucose", "Glucose measurement"])
+            self.assertEqual(field_call.args[3], True)
+            
+            executor.uses_processes = True
+            asyncio.run(self.deid_stage._batch_redactions(self.mock_context, [self.clinical_content], config))
+            self.assertIs(executor.run.call_args.args[0], _redact_texts_in_worker)
+        self.assertEqual(len(redactions), 4)
+        self.assertEqual(counts, {"regex": 2})
+
+    def test_prefilter_keeps_structured_fields_from_ner(self):
+        """Test that numbers skip NER, other short fields are regex-redacted, and counts are per call."""
+        config = {"use_presidio_for_text": True}
+        
+        with patch("pulsepipe.pipelines.stages.deid.BatchAnalyzerEngine") as mock_batch, \
+             patch.object(self.deid_stage, "_analyzer", MagicMock()), \
+             patch.object(self.deid_stage, "anonymizer") as mock_anonymizer:
+            mock_batch.return_value.analyze_iterator.return_value = [[]]
+            mock_anonymizer.anonymize.return_value = MagicMock(text="[NER]")
+            
+            redacted, counts = self.deid_stage.redact_texts(
+                ["120/80", "5.4", "Hemoglobin A1c", "call 555-123-4567", "Seen by Dr. Jones"], config,
+                prefilter=True)
+            _, second_counts = self.deid_stage.redact_texts(["120/80"], config, prefilter=True)
+        
+        self.assertEqual(redacted, ["120/80", "5.4", "Hemoglobin A1c", "call [REDACTED-PHONE]", "[NER]"])
+        args, _ = mock_batch.return_value.analyze_iterator.call_args_list[0]
+        self.assertEqual(args[0], ["Seen by Dr. Jones"])
+        self.assertEqual(counts, {"skip": 2, "regex": 2, "ner": 1})
+        self.assertEqual(second_counts, {"skip": 1})
+
+    def test_structured_free_text_is_prefiltered(self):
+        """Test that FieldPlan.free_text fields are redacted through the prefiltered path."""
+        config = {"use_presidio_for_text": True}
+        problem = Problem(code="W19", description="Fall at home, found by Mary Jones")
+        medication = Medication(code=None, coding_method=None, name="Metformin", dose=None, route=None,
+                                frequency=None, start_date=None, end_date=None, status=None,
+                                patient_id=None, encounter_id=None, notes="take with food")
+        
+        with patch.object(self.deid_stage, "_redact_phi_with_presidio", return_value="[NER]") as mock_presidio:
+            deid_problem = self.deid_stage._deid_problem(problem, config, {})
+            deid_medication = self.deid_stage._deid_medication(medication, config, {})
+        
+        self.assertEqual(deid_problem.description, "[NER]")
+        self.assertEqual(deid_medication.notes, "take with food")
+        mock_presidio.assert_called_once_with("Fall at home, found by Mary Jones", config)
+    
+    def test_note_text_is_not_prefiltered(self):
+        """Test that short notes always reach NER, even without name-like tokens."""
+        config = {"use_presidio_for_text": True}
+        
+        with patch.object(self.deid_stage, "_redact_phi_with_presidio",
+                          side_effect=lambda text, config: "[NER]") as mock_presidio:
+            self.assertEqual(self.deid_stage._redact_text("smith called re refill", config), "[NER]")
+            mock_presidio.assert_called_once()
+        
+        with patch("pulsepipe.pipelines.stages.deid.BatchAnalyzerEngine") as mock_batch, \
+             patch.object(self.deid_stage, "_analyzer", MagicMock()), \
+             patch.object(self.deid_stage, "anonymizer") as mock_anonymizer:
+            mock_batch.return_value.analyze_iterator.return_value = [[]]
+            mock_anonymizer.anonymize.return_value = MagicMock(text="[NER]")
+            
+            redacted, counts = self.deid_stage.redact_texts(["Smith called re refill"], config)
+        
+        self.assertEqual(redacted, ["[NER]"])
+        self.assertEqual(counts, {})
+
+    def test_prefilter_in_redact_text(self):
+        """Test the per-field path honors the prefilter and its opt-out."""
+        config = {"use_presidio_for_text": True, "prefilter_vocabulary": ["Body Mass Index"]}
+        
+        with patch.object(self.deid_stage, "_redact_phi_with_presidio",
+                          side_effect=lambda text, config: "[NER]") as mock_presidio:
+            self.assertEqual(self.deid_stage._redact_text("body mass index", config, prefilter=True),
+                             "body mass index")
+            self.assertEqual(self.deid_stage._redact_text("120/80", config, prefilter=True), "120/80")
+            self.assertEqual(self.deid_stage._redact_text("E11.9", config, prefilter=True), "E11.9")
+            mock_presidio.assert_not_called()
+            
+            config["phi_prefilter"] = False
+            self.assertEqual(self.deid_stage._redact_text("E11.9", config, prefilter=True), "[NER]")
+
+    def test_deid_item_is_copy_on_write(self):
+        """Test that de-identification leaves the original intact and shares unchanged records."""
+        unchanged = Allergy(substance="Peanut", coding_method=None, reaction="Hives",
+                            severity="mild", onset=None, patient_id=None)
+        content = copy.deepcopy(self.clinical_content)
+        content.allergies = [unchanged]
+        before = content.model_dump()
+        
+        result = self.deid_stage._deid_item(content, self.test_config)
+        
+        self.assertEqual(content.model_dump(), before)
+        self.assertFalse(content.deidentified)
+        self.assertTrue(result.deidentified)
+        self.assertIsNot(result, content)
+        # Changed records are new objects; untouched ones and fields are shared
+        self.assertIsNot(result.patient, content.patient)
+        self.assertIsNot(result.lab[0].observations[0], content.lab[0].observations[0])
+        self.assertIs(result.allergies[0], unchanged)
+        self.assertIs(result.vital_signs, content.vital_signs)
+
+    def test_deid_item_in_place(self):
+        """Test that in_place mode modifies and returns the original item."""
+        content = copy.deepcopy(self.clinical_content)
+        note = content.notes[0]
+        
+        result = self.deid_stage._deid_item(content, dict(self.test_config, in_place=True))
+        
+        self.assertIs(result, content)
+        self.assertTrue(content.deidentified)
+        self.assertIs(content.notes[0], note)
+        self.assertNotEqual(note.author_id, "PROVIDER-123")
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
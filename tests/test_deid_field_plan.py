@@ -0,0 +1,76 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_deid_field_plan.py
+
+from pulsepipe.models import PatientInfo, EncounterInfo, PriorAuthorization, Payment, Note, Problem, Medication
+from pulsepipe.pipelines.deid.field_plan import plan_for, plan_for_model, MRN, SSN, LICENSE, REFERENCE
+
+
+class TestFieldPlan:
+    """Tests for per-model de-identification field plans."""
+
+    def test_plans_are_cached_per_model(self):
+        """A model class is inspected once and its plan shared by every instance."""
+        assert plan_for_model(EncounterInfo) is plan_for_model(EncounterInfo)
+        patient = PatientInfo(id="1", dob_year=1980, gender="F", geographic_area="NY",
+                              identifiers={"MRN": "123"}, preferences=None)
+        assert plan_for(patient) is plan_for_model(PatientInfo)
+
+    def test_dates_follow_annotations(self):
+        """Date, date-list and date-named string fields are planned; others are not."""
+        encounter = plan_for_model(EncounterInfo)
+        assert "admit_date" in encounter.dates
+        assert "patient_id" not in encounter.dates
+        assert plan_for_model(PriorAuthorization).dates == ("service_dates",)
+        # Literal string fields can never hold a date
+        assert "payment_type" not in plan_for_model(Payment).dates
+
+    def test_identifiers_and_free_text(self):
+        """Identifier kinds and free text fields are classified by name."""
+        patient = plan_for_model(PatientInfo)
+        assert patient.identifiers == (("identifiers", None),)
+        assert patient.identifier_dicts == {"identifiers"}
+        note = plan_for_model(Note)
+        assert ("patient_id", REFERENCE) in note.identifiers
+        assert "text" in note.free_text
+        assert plan_for_model(Problem).free_text == ("description",)
+        assert plan_for_model(Medication).free_text == ("notes",)
+
+    def test_plain_objects_use_instance_attributes(self):
+        """Objects that are not Pydantic models are planned from their current attributes."""
+        class Record:
+            pass
+
+        record = Record()
+        record.mrn = "MRN1"
+        record.ssn = "123-45-6789"
+        record.drivers_license = "D1234567"
+        record.home_phone = "555-123-4567"
+        record.zip = "10001"
+        plan = plan_for(record)
+        assert plan.identifiers == (("mrn", MRN), ("ssn", SSN), ("drivers_license", LICENSE))
+        assert plan.contact == ("home_phone",)
+        assert plan.geographic == ("zip",)
+
+        record.visit_date = "2023-05-15"
+        assert "visit_date" in plan_for(record).date_strings
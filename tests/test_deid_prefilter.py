@@ -0,0 +1,63 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_deid_prefilter.py
+
+import pytest
+
+from pulsepipe.pipelines.deid.prefilter import PHIPrefilter, SKIP, REGEX, NER
+
+
+class TestPHIPrefilter:
+    """Tests for the PHI prefilter tiers."""
+
+    @pytest.mark.parametrize("text", ["", "   ", "120/80", "5.4", "98.6 %"])
+    def test_values_without_letters_skip(self, text):
+        """Empty values and numbers without structured PHI need no redaction."""
+        assert PHIPrefilter().classify(text) == SKIP
+
+    @pytest.mark.parametrize("text", [
+        "mg/dL", "E11.9", "ICD-10", "Hemoglobin A1c", "Hypertension", "BID", "smith called re refill",
+        "call 555-123-4567", "SSN 123-45-6789", "jane@example.com", "2023-05-15", "10001",
+    ])
+    def test_other_short_text_uses_regex(self, text):
+        """Anything with letters or structured PHI that is not name-like gets regex redaction."""
+        assert PHIPrefilter().classify(text) == REGEX
+
+    @pytest.mark.parametrize("text", [
+        "Seen by Dr. Jones", "Jane Smith", "SMITH, JOHN", "Mrs. Brown", "Type 2 Diabetes",
+    ])
+    def test_name_like_text_goes_to_ner(self, text):
+        """Anything name-like is an NER candidate."""
+        assert PHIPrefilter().classify(text) == NER
+
+    def test_long_text_always_goes_to_ner(self):
+        """Free text beyond max_length is never screened out."""
+        note = "patient doing well, no complaints, continue current regimen and follow up as needed"
+        assert PHIPrefilter().classify(note) == NER
+        assert PHIPrefilter(max_length=len(note)).classify(note) == REGEX
+
+    def test_vocabulary(self):
+        """Known vocabulary values are skipped case-insensitively."""
+        prefilter = PHIPrefilter.from_config({"prefilter_vocabulary": ["Type 2 Diabetes"]})
+        assert prefilter.classify("type 2 diabetes") == SKIP
+        assert prefilter.classify("Type 2 Diabetes Mellitus") == NER
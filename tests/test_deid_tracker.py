@@ -709,6 +709,23 @@ class TestDeidTracker:
         assert summary["total_phi_removed"] == 5
         assert "duration_seconds" in summary
     
+    def test_record_prefilter(self, deid_tracker, disabled_deid_tracker):
+        """Test that PHI prefilter verdicts accumulate per batch and in the summary."""
+        deid_tracker.record_prefilter({"skip": 3, "ner": 1})
+        deid_tracker.record_prefilter({"skip": 2, "regex": 1})
+        assert deid_tracker.get_current_batch_summary()["prefilter_counts"] == {"skip": 5, "ner": 1, "regex": 1}
+        deid_tracker.finish_batch()
+        
+        deid_tracker.start_batch("batch-2")
+        deid_tracker.record_prefilter({"ner": 4})
+        
+        summary = deid_tracker.get_summary()
+        assert summary.prefilter_counts == {"skip": 5, "ner": 5, "regex": 1}
+        assert summary.to_dict()["prefilter_counts"] == {"skip": 5, "ner": 5, "regex": 1}
+        
+        disabled_deid_tracker.record_prefilter({"skip": 1})
+        assert disabled_deid_tracker.current_batch is None
+    
     def test_get_summary(self, deid_tracker):
         """Test getting comprehensive summary."""
         # Create and finish first batch
@@ -150,6 +150,48 @@ class TestClinicalEmbedder:
         assert "embedding" not in result
     
 
+    def test_embed_chunks_batches_encode(self, mock_sentence_transformer):
+        """Test that embed_chunks encodes a whole batch in one call and keeps chunk order."""
+        embedder = ClinicalEmbedder(config={"batch_size": 16})
+        mock_sentence_transformer.encode.side_effect = None
+        mock_sentence_transformer.encode.return_value = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]])
+        
+        chunks = [
+            {"id": "a", "content": "Hypertension"},
+            {"id": "skip", "other_field": "value"},
+            {"id": "b", "content": ["Diabetes", "Asthma"]},
+        ]
+        result = embedder.embed_chunks(chunks)
+        
+        assert mock_sentence_transformer.encode.call_count == 1
+        args, kwargs = mock_sentence_transformer.encode.call_args
+        assert args[0] == ["Hypertension", "Diabetes Asthma"]
+        assert kwargs["batch_size"] == 16
+        assert [chunk["id"] for chunk in result] == ["a", "skip", "b"]
+        assert result[0]["embedding"] == pytest.approx([0.1, 0.2, 0.3])
+        assert "embedding" not in result[1]
+        assert result[2]["embedding"] == pytest.approx([0.4, 0.5, 0.6])
+        assert result[2]["embedding_dim"] == 3
+
+    def test_embed_chunks_uses_cache(self, mock_sentence_transformer):
+        """Test that cached texts are not re-encoded and duplicates are encoded once."""
+        embedder = ClinicalEmbedder(config={"cache": {"memory_entries": 100}})
+        mock_sentence_transformer.encode.side_effect = None
+        mock_sentence_transformer.encode.return_value = np.array([[0.1, 0.2, 0.3]])
+        
+        chunks = [{"id": "a", "content": "NKDA"}, {"id": "b", "content": "NKDA"}]
+        first = embedder.embed_chunks(chunks)
+        
+        args, _ = mock_sentence_transformer.encode.call_args
+        assert args[0] == ["NKDA"]
+        assert first[0]["embedding"] == first[1]["embedding"]
+        assert embedder.cache.misses == 2
+        
+        second = embedder.embed_chunks(chunks)
+        assert mock_sentence_transformer.encode.call_count == 1
+        assert embedder.cache.hits == 2
+        assert second[0]["embedding"] == pytest.approx([0.1, 0.2, 0.3])
+
     def test_dimension_property(self, mock_sentence_transformer):
         """Test the dimension property."""
         embedder = ClinicalEmbedder()
@@ -167,3 +167,19 @@ class TestOperationalEmbedder:
         result = embedder.embed_chunk(claim_chunk)
         assert "embedding" in result
         assert result["embedding_model"] == "all-MiniLM-L6-v2"
+
+    def test_embed_chunks_flattens_structured_content(self, mock_sentence_transformer):
+        """Test that embed_chunks uses the same text extraction as embed_chunk."""
+        embedder = OperationalEmbedder()
+        
+        chunks = [
+            {"id": "dict", "content": {"claim_id": "CL1", "status": "paid", "note": ""}},
+            {"id": "text", "content": "Remittance advice"},
+        ]
+        result = embedder.embed_chunks(chunks)
+        
+        args, kwargs = mock_sentence_transformer.return_value.encode.call_args
+        assert args[0] == ["claim_id: CL1 status: paid", "Remittance advice"]
+        assert kwargs["batch_size"] == 64
+        assert len(result) == 2
+        assert all(len(chunk["embedding"]) == 4 for chunk in result)
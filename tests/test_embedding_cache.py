@@ -0,0 +1,116 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+# tests/test_embedding_cache.py
+
+import numpy as np
+import pytest
+
+from pulsepipe.pipelines.embedders.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Tests for the content-addressed EmbeddingCache."""
+
+    def test_key_normalizes_whitespace_and_includes_model(self):
+        key = EmbeddingCache.make_key("model-a", "Patient  has\n diabetes ")
+        assert key == EmbeddingCache.make_key("model-a", "Patient has diabetes")
+        assert key != EmbeddingCache.make_key("model-b", "Patient has diabetes")
+
+    def test_key_includes_normalize(self):
+        cache = EmbeddingCache()
+        cache.put_many("m", ["a"], np.array([[3.0, 4.0]]), normalize=False)
+
+        assert cache.get_many("m", ["a"], normalize=True) == [None]
+        assert cache.get_many("m", ["a"], normalize=False)[0].tolist() == [3.0, 4.0]
+
+    def test_memory_hits_and_misses(self):
+        cache = EmbeddingCache(max_memory_entries=10)
+        assert cache.get_many("m", ["a", "b"]) == [None, None]
+        assert cache.misses == 2
+
+        cache.put_many("m", ["a"], np.array([[1.0, 2.0]]))
+        result = cache.get_many("m", ["a", "b"])
+
+        assert result[0].tolist() == [1.0, 2.0]
+        assert result[1] is None
+        assert cache.memory_hits == 1
+        assert cache.misses == 3
+
+    def test_lru_eviction(self):
+        cache = EmbeddingCache(max_memory_entries=2)
+        cache.put_many("m", ["a", "b"], np.eye(2))
+        cache.get_many("m", ["a"])  # "a" becomes most recently used
+        cache.put_many("m", ["c"], np.ones((1, 2)))
+
+        result = cache.get_many("m", ["a", "b", "c"])
+        assert result[0] is not None
+        assert result[1] is None
+        assert result[2] is not None
+
+    def test_disk_tier_persists_across_instances(self, tmp_path):
+        db_path = tmp_path / "cache" / "embeddings.sqlite3"
+        cache = EmbeddingCache(db_path=db_path)
+        cache.put_many("m", ["allergy list", "lab panel"], np.array([[0.5, 0.25], [1.0, 0.0]], dtype=np.float32))
+        cache.close()
+
+        reopened = EmbeddingCache(db_path=db_path)
+        result = reopened.get_many("m", ["lab panel", "unseen"])
+
+        assert result[0].tolist() == [1.0, 0.0]
+        assert result[1] is None
+        assert reopened.disk_hits == 1
+        assert reopened.misses == 1
+
+        # Promoted to memory on the first disk hit
+        reopened.get_many("m", ["lab panel"])
+        assert reopened.memory_hits == 1
+        reopened.close()
+
+    def test_from_config(self, tmp_path):
+        assert EmbeddingCache.from_config(None) is None
+        assert EmbeddingCache.from_config({"enabled": False}) is None
+
+        cache = EmbeddingCache.from_config({"memory_entries": 5, "db_path": str(tmp_path / "c.db")})
+        assert cache.max_memory_entries == 5
+        assert cache.stats()["misses"] == 0
+        cache.close()
+
+    def test_clear(self, tmp_path):
+        cache = EmbeddingCache(db_path=tmp_path / "c.db")
+        cache.put_many("m", ["a"], np.ones((1, 3)))
+        cache.clear()
+        assert cache.get_many("m", ["a"]) == [None]
+        cache.close()
+
+    def test_counters_are_consistent_across_threads(self, tmp_path):
+        from concurrent.futures import ThreadPoolExecutor
+
+        cache = EmbeddingCache(db_path=tmp_path / "c.db")
+        cache.put_many("m", ["a"], np.ones((1, 2)))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: cache.get_many("m", ["a", "b"]), range(200)))
+
+        stats = cache.stats()
+        assert stats["memory_hits"] + stats["disk_hits"] == 200
+        assert stats["misses"] == 200
+        cache.close()
@@ -23,6 +23,7 @@
 
 """Unit tests for the EmbeddingStage pipeline stage."""
 
+import asyncio
 import json
 import os
 import tempfile
@@ -39,9 +40,11 @@ sys.modules['sentence_transformers.SentenceTransformer'] = MagicMock()
 
 from pulsepipe.pipelines.context import PipelineContext
 from pulsepipe.pipelines.stages.embedding import EmbeddingStage
-from pulsepipe.utils.errors import EmbedderError
+from pulsepipe.utils.errors import EmbedderError, ConfigurationError
 from pulsepipe.pipelines.embedders.clinical_embedder import ClinicalEmbedder
 from pulsepipe.pipelines.embedders.operational_embedder import OperationalEmbedder
+from pulsepipe.pipelines.embedders.base_embedder import SENTENCE_TRANSFORMER
+from pulsepipe.utils.model_registry import model_registry
 
 
 class TestEmbeddingStage:
@@ -65,10 +68,12 @@ class TestEmbeddingStage:
         self.mock_clinical_embedder = MagicMock(spec=ClinicalEmbedder)
         self.mock_clinical_embedder.name = "MockClinicalEmbedder"
         self.mock_clinical_embedder.embed_chunk.side_effect = lambda chunk: {**chunk, "embedding": self.mock_embedding}
+        self.mock_clinical_embedder.embed_chunks.side_effect = lambda chunks, batch_size=None: [{**chunk, "embedding": self.mock_embedding} for chunk in chunks]
         
         self.mock_operational_embedder = MagicMock(spec=OperationalEmbedder)
         self.mock_operational_embedder.name = "MockOperationalEmbedder"
         self.mock_operational_embedder.embed_chunk.side_effect = lambda chunk: {**chunk, "embedding": self.mock_embedding}
+        self.mock_operational_embedder.embed_chunks.side_effect = lambda chunks, batch_size=None: [{**chunk, "embedding": self.mock_embedding} for chunk in chunks]
         
         # Create embedder classes that return our mock instances
         self.mock_clinical_embedder_class = MagicMock(return_value=self.mock_clinical_embedder)
@@ -101,11 +106,12 @@ class TestEmbeddingStage:
         assert result[0]["id"] == "chunk1"
         assert result[1]["id"] == "chunk2"
         
-        # Verify the clinical embedder was called twice (for our two chunks)
-        assert self.mock_clinical_embedder.embed_chunk.call_count == 2
+        # Verify the clinical embedder embedded both chunks in a single batch
+        assert self.mock_clinical_embedder.embed_chunks.call_count == 1
+        assert self.mock_clinical_embedder.embed_chunk.call_count == 0
         
         # Verify operational embedder was not called
-        assert self.mock_operational_embedder.embed_chunk.call_count == 0
+        assert self.mock_operational_embedder.embed_chunks.call_count == 0
             
     @pytest.mark.asyncio
     async def test_execute_with_explicit_config(self):
@@ -122,11 +128,11 @@ class TestEmbeddingStage:
         assert "embedding" in result[0]
         assert result[0]["embedding"] == self.mock_embedding
         
-        # Verify the operational embedder was called twice (for our two chunks)
-        assert self.mock_operational_embedder.embed_chunk.call_count == 2
+        # Verify the operational embedder embedded both chunks in a single batch
+        assert self.mock_operational_embedder.embed_chunks.call_count == 1
         
         # Verify clinical embedder was not called
-        assert self.mock_clinical_embedder.embed_chunk.call_count == 0
+        assert self.mock_clinical_embedder.embed_chunks.call_count == 0
     
     @pytest.mark.asyncio
     async def test_execute_with_no_input_data(self):
@@ -152,8 +158,8 @@ class TestEmbeddingStage:
         assert "embedding" in result[0]
         assert result[0]["embedding"] == self.mock_embedding
         
-        # Verify the clinical embedder was called twice (for our two chunks)
-        assert self.mock_clinical_embedder.embed_chunk.call_count == 2
+        # Verify the clinical embedder embedded both chunks in a single batch
+        assert self.mock_clinical_embedder.embed_chunks.call_count == 1
     
     @pytest.mark.asyncio
     async def test_execute_with_empty_chunks(self):
@@ -165,8 +171,8 @@ class TestEmbeddingStage:
         assert result == []
         
         # Verify that no embedders were called
-        assert self.mock_clinical_embedder.embed_chunk.call_count == 0
-        assert self.mock_operational_embedder.embed_chunk.call_count == 0
+        assert self.mock_clinical_embedder.embed_chunks.call_count == 0
+        assert self.mock_operational_embedder.embed_chunks.call_count == 0
     
     @pytest.mark.asyncio
     async def test_export_embeddings_to_jsonl(self):
@@ -294,4 +300,126 @@ class TestEmbeddingStage:
                 await self.embedding_stage.execute(self.context, self.sample_chunks)
                 
             # Verify the error details
-            assert error_message in str(error_context.value)
\ No newline at end of file
+            assert error_message in str(error_context.value)
+    @pytest.mark.asyncio
+    async def test_execute_respects_configured_batch_size(self):
+        """Test that chunks are embedded in batches of the configured size."""
+        config = {"type": "clinical", "model_name": "test-model", "batch_size": 2}
+        self.context.config = {"embedding": config}
+        chunks = [{"id": f"chunk{n}", "content": f"text {n}"} for n in range(5)]
+        
+        result = await self.embedding_stage.execute(self.context, chunks)
+        
+        assert [chunk["id"] for chunk in result] == [f"chunk{n}" for n in range(5)]
+        calls = self.mock_clinical_embedder.embed_chunks.call_args_list
+        assert [len(call.args[0]) for call in calls] == [2, 2, 1]
+        assert all(call.args[1] == 2 for call in calls)
+    
+    @pytest.mark.asyncio
+    async def test_encode_runs_on_stage_executor(self):
+        """Test that encode calls run on the configured thread pool, off the event loop."""
+        import threading
+        
+        self.context.config = {"embedding": {"type": "clinical", "executor": {"type": "thread", "workers": 1}}}
+        threads = []
+        
+        def embed_chunks(chunks, batch_size=None):
+            threads.append(threading.current_thread())
+            return [{**chunk, "embedding": self.mock_embedding} for chunk in chunks]
+        self.mock_clinical_embedder.embed_chunks.side_effect = embed_chunks
+        
+        try:
+            result = await self.embedding_stage.execute(self.context, self.sample_chunks)
+        finally:
+            self.embedding_stage.close_executor(self.context)
+        
+        assert len(result) == 2
+        assert threads and threads[0] is not threading.current_thread()
+    
+    def test_process_executor_is_rejected(self):
+        """Test that a process executor is refused, since embedders cannot be pickled."""
+        self.context.config = {"embedding": {"type": "clinical", "executor": {"type": "process"}}}
+        
+        with pytest.raises(ConfigurationError):
+            asyncio.run(self.embedding_stage.execute(self.context, self.sample_chunks))
+        self.mock_clinical_embedder_class.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_execute_per_chunk_mode(self):
+        """Test that batch_mode: false embeds each chunk individually."""
+        self.context.config = {"embedding": {"type": "clinical", "batch_mode": False}}
+        
+        result = await self.embedding_stage.execute(self.context, self.sample_chunks)
+        
+        assert len(result) == 2
+        assert self.mock_clinical_embedder.embed_chunk.call_count == 2
+        assert self.mock_clinical_embedder.embed_chunks.call_count == 0
+    
+    @pytest.mark.asyncio
+    async def test_batch_failure_falls_back_to_per_chunk(self):
+        """Test that a failed batch encode is retried chunk by chunk to isolate bad chunks."""
+        self.mock_clinical_embedder.embed_chunks.side_effect = RuntimeError("batch encode failed")
+        
+        def embed_chunk(chunk):
+            if chunk["id"] == "chunk2":
+                raise ValueError("bad chunk")
+            return {**chunk, "embedding": self.mock_embedding}
+        self.mock_clinical_embedder.embed_chunk.side_effect = embed_chunk
+        
+        result = await self.embedding_stage.execute(self.context, self.sample_chunks)
+        
+        assert [chunk["id"] for chunk in result] == ["chunk1"]
+        assert self.mock_clinical_embedder.embed_chunk.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_cache_stats_recorded_per_batch(self):
+        """Test that embedding cache hits and misses are reported to the tracker."""
+        from pulsepipe.pipelines.embedders import EmbeddingCache
+        
+        cache = EmbeddingCache()
+        cache.put_many("test-model", ["This is a test chunk for embedding"], np.ones((1, 5)))
+        
+        def embed_chunks(chunks, batch_size=None):
+            cache.get_many("test-model", [chunk["content"] for chunk in chunks])
+            return [{**chunk, "embedding": self.mock_embedding} for chunk in chunks]
+        
+        self.mock_clinical_embedder.cache = cache
+        self.mock_clinical_embedder.embed_chunks.side_effect = embed_chunks
+        tracker = MagicMock()
+        self.context.get_embedding_tracker = MagicMock(return_value=tracker)
+        
+        await self.embedding_stage.execute(self.context, self.sample_chunks)
+        
+        tracker.record_cache_stats.assert_called_once_with(hits=1, misses=1)
+        metadata = tracker.record_success.call_args.kwargs["metadata"]
+        assert metadata["cache_hits"] == 1
+        assert metadata["cache_misses"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_cache_outlives_embedders_until_close(self, tmp_path):
+        """Test that the stage keeps one cache per run and closes it with the run."""
+        self.context.config = {"embedding": {"cache": {"memory_entries": 10, "db_path": str(tmp_path / "c.db")}}}
+        
+        await self.embedding_stage.execute(self.context, self.sample_chunks)
+        await self.embedding_stage.execute(self.context, self.sample_chunks)
+        
+        caches = [call.kwargs["cache"] for call in self.mock_clinical_embedder_class.call_args_list]
+        assert caches[0] is not None
+        assert caches[0] is caches[1]
+        assert self.mock_clinical_embedder.close.call_count == 2
+        assert caches[0].conn is not None
+        
+        self.embedding_stage.close_executor(self.context)
+        assert caches[0].conn is None
+    
+    @pytest.mark.asyncio
+    async def test_model_is_held_for_the_run(self):
+        """Test that the embedding model stays referenced between executes until the run closes."""
+        self.context.config = {"embedding": {"type": "clinical", "model_name": "held-model"}}
+        
+        await self.embedding_stage.execute(self.context, self.sample_chunks)
+        await self.embedding_stage.execute(self.context, self.sample_chunks)
+        assert model_registry.refcount(SENTENCE_TRANSFORMER, "held-model") == 1
+        
+        self.embedding_stage.close_executor(self.context)
+        assert model_registry.refcount(SENTENCE_TRANSFORMER, "held-model") == 0
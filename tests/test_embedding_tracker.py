@@ -565,6 +565,27 @@ class TestEmbeddingTracker:
         assert embedding_tracker.current_batch is not None  # Current batch preserved
         assert embedding_tracker.current_batch.batch_id == "batch-3"
     
+    def test_record_cache_stats(self, embedding_tracker):
+        """Test that cache hits and misses roll up into the summary."""
+        embedding_tracker.start_batch("batch-1")
+        embedding_tracker.record_cache_stats(hits=6, misses=2)
+        embedding_tracker.finish_batch()
+        
+        embedding_tracker.start_batch("batch-2")
+        embedding_tracker.record_cache_stats(hits=2, misses=0)
+        
+        assert embedding_tracker.get_current_batch_summary()["cache_hits"] == 2
+        
+        summary = embedding_tracker.get_summary()
+        assert summary.cache_hits == 8
+        assert summary.cache_misses == 2
+        assert summary.cache_hit_rate == 80.0
+    
+    def test_record_cache_stats_disabled(self, disabled_embedding_tracker):
+        """Test that cache stats are ignored when tracking is disabled."""
+        disabled_embedding_tracker.record_cache_stats(hits=1, misses=1)
+        assert disabled_embedding_tracker.current_batch is None
+    
     def test_auto_batch_creation(self, embedding_tracker):
         """Test automatic batch creation when recording without explicit batch."""
         embedding_tracker.record_success("embed-1", chunk_count=2)
@@ -682,6 +703,10 @@ class MockEmbeddingSummary:
         self.chunks_per_second = 20.0
         self.vectors_per_second = 25.0
         self.errors_by_category = {}
+        self.cache_hits = sum(getattr(b, 'cache_hits', 0) for b in batches)
+        self.cache_misses = sum(getattr(b, 'cache_misses', 0) for b in batches)
+        lookups = self.cache_hits + self.cache_misses
+        self.cache_hit_rate = (self.cache_hits / lookups) * 100 if lookups else 0.0
     
     def to_dict(self):
         """Convert to dictionary for serialization."""
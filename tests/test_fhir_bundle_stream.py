@@ -0,0 +1,100 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_fhir_bundle_stream.py
+
+import io
+import json
+from pathlib import Path
+
+import pytest
+
+from pulsepipe.ingesters.fhir_ingester import FHIRIngester
+from pulsepipe.ingesters.fhir_utils.bundle_stream import FHIRBundleStream
+from pulsepipe.ingesters.ingestion_engine import IngestionEngine
+from pulsepipe.utils.errors import FHIRError
+
+FIXTURES = Path(__file__).parent / "fixtures"
+SIMPLE_BUNDLE = FIXTURES / "simple_patient_bundle.json"
+SYNTHEA_BUNDLE = FIXTURES / "Aldo_Wuckert_f68cef5d-f873-979e-963b-06d81b5200b6.json"
+
+
+def test_stream_yields_entries_and_header_with_small_chunks():
+    bundle = {
+        "resourceType": "Bundle",
+        "entry": [{"resource": {"resourceType": "Patient", "id": str(i), "n": 10 ** i}} for i in range(5)],
+        "total": 12345,
+        "type": "collection",
+    }
+    stream = FHIRBundleStream(io.StringIO(json.dumps(bundle, indent=2)), chunk_size=3)
+
+    entries = list(stream)
+
+    assert entries == bundle["entry"]
+    assert stream.header == {"resourceType": "Bundle", "total": 12345, "type": "collection"}
+
+
+def test_stream_top_level_array():
+    stream = FHIRBundleStream(io.StringIO('[{"resourceType": "Patient"}, {"resourceType": "Encounter"}]'), chunk_size=4)
+
+    assert [r["resourceType"] for r in stream] == ["Patient", "Encounter"]
+    assert stream.is_array
+
+
+def test_stream_rejects_truncated_document():
+    stream = FHIRBundleStream(io.StringIO('{"resourceType": "Bundle", "entry": [{"resource": {'), chunk_size=8)
+
+    with pytest.raises(FHIRError):
+        list(stream)
+
+
+@pytest.mark.parametrize("path", [SIMPLE_BUNDLE, SYNTHEA_BUNDLE])
+def test_parse_file_matches_parse(path):
+    ingester = FHIRIngester()
+    expected = ingester.parse(path.read_text(encoding="utf-8"))
+
+    streamed = ingester.parse_file(path, chunk_size=512)
+
+    assert streamed == expected
+
+
+def test_parse_stream_single_resource_and_empty():
+    ingester = FHIRIngester()
+    patient = {"resourceType": "Patient", "id": "p1", "gender": "female"}
+
+    result = ingester.parse_stream(io.StringIO(json.dumps(patient)))
+
+    assert result.patient is not None
+    with pytest.raises(FHIRError, match="Empty or blank data received"):
+        ingester.parse_stream(io.StringIO("  \n"))
+
+
+def test_ingestion_engine_streams_paths(monkeypatch):
+    ingester = FHIRIngester()
+    calls = []
+    monkeypatch.setattr(ingester, "parse", lambda raw: calls.append(raw))
+    engine = IngestionEngine(adapter=None, ingester=ingester)
+
+    result = engine._parse(SIMPLE_BUNDLE)
+
+    assert calls == []
+    assert result.patient is not None
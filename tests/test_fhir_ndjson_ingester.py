@@ -0,0 +1,191 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_fhir_ndjson_ingester.py
+
+import asyncio
+import json
+
+import pytest
+
+from pulsepipe.ingesters import fhir_ndjson_ingester
+from pulsepipe.ingesters.fhir_ndjson_ingester import (
+    FHIRNDJSONIngester, patient_key, range_first_lines, split_ranges,
+)
+from pulsepipe.ingesters.ingestion_engine import IngestionEngine
+from pulsepipe.utils.errors import FHIRError
+
+
+def _resources(patients=3, observations=4):
+    for p in range(patients):
+        yield {"resourceType": "Patient", "id": f"p{p}", "gender": "female", "birthDate": "1980-01-01"}
+        for o in range(observations):
+            yield {
+                "resourceType": "Observation",
+                "id": f"o{p}-{o}",
+                "status": "final",
+                "category": [{"coding": [{"code": "vital-signs"}]}],
+                "code": {"coding": [{"system": "http://loinc.org", "code": "8867-4", "display": "Heart rate"}]},
+                "subject": {"reference": f"Patient/p{p}"},
+                "valueQuantity": {"value": 60 + o, "unit": "/min"},
+            }
+
+
+def _write_ndjson(path, resources):
+    path.write_text("\n".join(json.dumps(r) for r in resources) + "\n", encoding="utf-8")
+    return path
+
+
+def test_split_ranges_cover_file_on_line_boundaries(tmp_path):
+    path = _write_ndjson(tmp_path / "Observation.ndjson", _resources())
+    data = path.read_bytes()
+
+    ranges = split_ranges(path, range_bytes=100)
+
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+    assert all(data[end - 1:end] == b"\n" for _, end in ranges)
+
+
+def test_range_first_lines_count_lines_before_each_range(tmp_path):
+    path = _write_ndjson(tmp_path / "Observation.ndjson", _resources())
+    data = path.read_bytes()
+    ranges = split_ranges(path, range_bytes=100)
+
+    first_lines = range_first_lines(path, ranges)
+
+    assert first_lines == [data[:start].count(b"\n") + 1 for start, _ in ranges]
+
+
+def test_malformed_lines_report_file_line_numbers(tmp_path, monkeypatch):
+    lines = [json.dumps(r) for r in _resources(patients=2, observations=2)]
+    lines[4] = "{not json"
+    path = tmp_path / "export.ndjson"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    warnings = []
+    logger = fhir_ndjson_ingester._get_worker_ingester().logger
+    monkeypatch.setattr(logger, "warning", warnings.append)
+
+    list(FHIRNDJSONIngester(workers=1, range_bytes=100).iter_file(path))
+
+    assert len(warnings) == 1
+    assert "line 5:" in warnings[0]
+
+
+def test_closing_iter_file_shuts_down_the_pool(tmp_path, monkeypatch):
+    path = _write_ndjson(tmp_path / "export.ndjson", _resources(patients=6, observations=2))
+    pools = []
+
+    class RecordingPool(fhir_ndjson_ingester.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.shutdown_calls = []
+            pools.append(self)
+
+        def shutdown(self, wait=True, *, cancel_futures=False):
+            self.shutdown_calls.append((wait, cancel_futures))
+            super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    monkeypatch.setattr(fhir_ndjson_ingester, "ProcessPoolExecutor", RecordingPool)
+    iterator = FHIRNDJSONIngester(workers=2, range_bytes=200).iter_file(path)
+
+    next(iterator)
+    iterator.close()
+
+    assert pools[0].shutdown_calls[0] == (False, True)
+
+
+def test_patient_key():
+    assert patient_key({"resourceType": "Patient", "id": "p1"}) == "p1"
+    assert patient_key({"resourceType": "Claim", "patient": {"reference": "Patient/p2"}}) == "p2"
+    assert patient_key({"resourceType": "Organization", "id": "org"}) is None
+
+
+def test_parse_groups_resources_by_patient():
+    ingester = FHIRNDJSONIngester(workers=1)
+    raw = "\n".join(json.dumps(r) for r in _resources(patients=2, observations=3))
+
+    results = ingester.parse(raw)
+
+    assert [c.patient.id for c in results] == ["p0", "p1"]
+    assert all(len(c.vital_signs) == 3 for c in results)
+    with pytest.raises(FHIRError):
+        ingester.parse("\n")
+
+
+def test_parse_file_with_process_pool_matches_in_process(tmp_path):
+    path = _write_ndjson(tmp_path / "export.ndjson", _resources(patients=6, observations=5))
+
+    serial = FHIRNDJSONIngester(workers=1).parse_file(path)
+    parallel = FHIRNDJSONIngester(workers=2, range_bytes=512).parse_file(path)
+
+    assert len(parallel) > len(serial) == 6
+    assert {c.patient.id for c in parallel if c.patient} == {f"p{p}" for p in range(6)}
+    assert sum(len(c.vital_signs) for c in parallel) == sum(len(c.vital_signs) for c in serial) == 30
+
+
+@pytest.mark.asyncio
+async def test_ingestion_engine_emits_ndjson_ranges_incrementally(tmp_path):
+    path = _write_ndjson(tmp_path / "export.ndjson", _resources(patients=4, observations=2))
+    engine = IngestionEngine(adapter=None, ingester=FHIRNDJSONIngester(workers=1, range_bytes=200))
+    emitted = []
+
+    async def emit(result):
+        emitted.append(result)
+
+    engine._emit = emit
+    await engine.queue.put(path)
+    engine.stop_flag.set()
+    await asyncio.wait_for(engine.process(), timeout=10)
+
+    assert len(emitted) > 1
+    assert all(isinstance(batch, list) for batch in emitted)
+    assert engine.processing_errors == []
+
+
+@pytest.mark.asyncio
+async def test_ingestion_engine_closes_iter_file_on_cancellation(tmp_path):
+    closed = asyncio.Event()
+    blocked = asyncio.Event()
+
+    class SlowIngester:
+        def iter_file(self, path):
+            try:
+                yield ["first"]
+                yield ["second"]
+            finally:
+                closed.set()
+
+    engine = IngestionEngine(adapter=None, ingester=SlowIngester())
+
+    async def emit(result):
+        blocked.set()
+        await asyncio.Event().wait()
+
+    engine._emit = emit
+    task = asyncio.create_task(engine._process_file(tmp_path / "export.ndjson"))
+    await asyncio.wait_for(blocked.wait(), timeout=5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert closed.is_set()
@@ -0,0 +1,184 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_fhir_xml_converter.py
+
+import io
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from pulsepipe.ingesters.fhir_ingester import FHIRIngester
+from pulsepipe.ingesters.fhir_utils.xml_converter import fhir_xml_to_dict
+
+PATIENT_XML = '''<?xml version="1.0" encoding="UTF-8"?>
+<Patient xmlns="http://hl7.org/fhir">
+    <id value="pat-001"/>
+    <text>
+        <status value="generated"/>
+        <div xmlns="http://www.w3.org/1999/xhtml">Jane <b lang="en">Doe</b> &amp; co</div>
+    </text>
+    <identifier>
+        <system value="urn:mrn"/>
+        <value value="00123"/>
+    </identifier>
+    <active value="true"/>
+    <name>
+        <family value="Doe"/>
+        <given value="Jane"/>
+    </name>
+    <gender value="female"/>
+    <birthDate value="1930-01-01">
+        <extension url="http://hl7.org/fhir/StructureDefinition/patient-birthTime">
+            <valueDateTime value="1930-01-01T10:00:00Z"/>
+        </extension>
+    </birthDate>
+    <multipleBirthInteger value="2"/>
+    <managingOrganization>
+        <identifier>
+            <value value="org-1"/>
+        </identifier>
+        <display value="General Hospital"/>
+    </managingOrganization>
+</Patient>
+'''
+
+BUNDLE_XML = '''<Bundle xmlns="http://hl7.org/fhir">
+    <type value="collection"/>
+    <total value="2"/>
+    <entry>
+        <fullUrl value="urn:uuid:p1"/>
+        <resource>
+            <Patient>
+                <id value="p1"/>
+                <name><given value="Ann"/><given value="Marie"/></name>
+            </Patient>
+        </resource>
+    </entry>
+    <entry>
+        <resource>
+            <Observation>
+                <id value="o1"/>
+                <status value="final"/>
+                <category><coding><code value="vital-signs"/></coding></category>
+                <code><coding><system value="http://loinc.org"/><code value="8867-4"/></coding></code>
+                <subject><reference value="Patient/p1"/></subject>
+                <valueQuantity>
+                    <value value="72.5"/>
+                    <unit value="beats/minute"/>
+                </valueQuantity>
+            </Observation>
+        </resource>
+    </entry>
+</Bundle>
+'''
+
+
+def test_patient_matches_fhir_json_shape():
+    patient = fhir_xml_to_dict(PATIENT_XML)
+
+    assert patient["resourceType"] == "Patient"
+    assert patient["id"] == "pat-001"
+    assert patient["active"] is True
+    assert patient["gender"] == "female"
+    assert patient["multipleBirthInteger"] == 2
+    assert patient["identifier"] == [{"system": "urn:mrn", "value": "00123"}]
+    assert patient["name"] == [{"family": "Doe", "given": ["Jane"]}]
+    assert patient["managingOrganization"] == {
+        "identifier": {"value": "org-1"},
+        "display": "General Hospital",
+    }
+
+
+def test_primitive_extensions_and_narrative():
+    patient = fhir_xml_to_dict(PATIENT_XML)
+
+    assert patient["birthDate"] == "1930-01-01"
+    assert patient["_birthDate"] == {
+        "extension": [{
+            "url": "http://hl7.org/fhir/StructureDefinition/patient-birthTime",
+            "valueDateTime": "1930-01-01T10:00:00Z",
+        }]
+    }
+    assert patient["text"] == {
+        "status": "generated",
+        "div": '<div xmlns="http://www.w3.org/1999/xhtml">Jane <b lang="en">Doe</b> &amp; co</div>',
+    }
+
+
+def test_bundle_unwraps_nested_resources():
+    bundle = fhir_xml_to_dict(BUNDLE_XML)
+
+    assert bundle["total"] == 2
+    assert [entry["resource"]["resourceType"] for entry in bundle["entry"]] == ["Patient", "Observation"]
+    assert bundle["entry"][0]["resource"]["name"] == [{"given": ["Ann", "Marie"]}]
+
+    observation = bundle["entry"][1]["resource"]
+    assert observation["category"] == [{"coding": [{"code": "vital-signs"}]}]
+    assert observation["code"] == {"coding": [{"system": "http://loinc.org", "code": "8867-4"}]}
+    assert observation["valueQuantity"] == {"value": 72.5, "unit": "beats/minute"}
+
+
+def test_coding_version_is_single():
+    observation = fhir_xml_to_dict('''<Observation xmlns="http://hl7.org/fhir">
+        <code><coding>
+            <system value="http://loinc.org"/><version value="2.74"/><code value="8867-4"/>
+        </coding></code>
+    </Observation>''')
+
+    assert observation["code"]["coding"] == [{"system": "http://loinc.org", "version": "2.74", "code": "8867-4"}]
+
+
+def test_relationship_repeats_only_where_it_is_a_list():
+    coverage = fhir_xml_to_dict('''<Coverage xmlns="http://hl7.org/fhir">
+        <status value="active"/>
+        <relationship><coding><code value="self"/></coding></relationship>
+    </Coverage>''')
+    patient = fhir_xml_to_dict('''<Patient xmlns="http://hl7.org/fhir">
+        <contact>
+            <relationship><coding><code value="N"/></coding></relationship>
+        </contact>
+    </Patient>''')
+
+    assert coverage["relationship"] == {"coding": [{"code": "self"}]}
+    assert patient["contact"] == [{"relationship": [{"coding": [{"code": "N"}]}]}]
+
+
+def test_reads_file_objects():
+    assert fhir_xml_to_dict(io.BytesIO(BUNDLE_XML.encode("utf-8"))) == fhir_xml_to_dict(BUNDLE_XML)
+    assert fhir_xml_to_dict(io.StringIO(PATIENT_XML.split("?>", 1)[1])) == fhir_xml_to_dict(PATIENT_XML)
+
+
+def test_rejects_non_resource_and_malformed_xml():
+    with pytest.raises(ValueError, match="not a FHIR resource"):
+        fhir_xml_to_dict('<entry xmlns="http://hl7.org/fhir"/>')
+    with pytest.raises(ET.ParseError):
+        fhir_xml_to_dict("<Patient><id value='1'/>")
+
+
+def test_ingester_maps_xml_like_json():
+    ingester = FHIRIngester()
+    result = ingester.parse(BUNDLE_XML)
+
+    assert result.patient is not None
+    assert result.patient.id == "p1"
+    assert len(result.vital_signs) == 1
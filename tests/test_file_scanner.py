@@ -0,0 +1,175 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_file_scanner.py
+
+import os
+import time
+
+import pytest
+
+from pulsepipe.adapters import file_scanner
+from pulsepipe.adapters.file_scanner import IncrementalFileScanner
+
+
+def _age(*paths, seconds=60):
+    """Push mtimes into the past so directories are outside the racy window."""
+    old = time.time_ns() - seconds * 1_000_000_000
+    for path in paths:
+        os.utime(path, ns=(old, old))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "landing"
+    (root / "a").mkdir(parents=True)
+    (root / "a" / "one.json").write_text("{}")
+    (root / "two.json").write_text("{}")
+    (root / "notes.txt").write_text("skip")
+    _age(root / "a" / "one.json", root / "two.json", root / "notes.txt", root / "a", root)
+    return root
+
+
+def _scanner(root, tmp_path, **kwargs):
+    kwargs.setdefault("index_path", str(tmp_path / "index.sqlite3"))
+    return IncrementalFileScanner(str(root), [".json"], **kwargs)
+
+
+def test_first_scan_reports_all_matching_files(tree, tmp_path):
+    scanner = _scanner(tree, tmp_path)
+    changes = scanner.scan()
+
+    assert sorted(changes.added) == sorted([str(tree / "a" / "one.json"), str(tree / "two.json")])
+    assert not changes.modified and not changes.removed
+    assert len(scanner) == 2
+
+    assert not scanner.scan()
+
+
+def test_index_persists_across_restarts(tree, tmp_path):
+    scanner = _scanner(tree, tmp_path)
+    scanner.scan()
+    scanner.close()
+
+    (tree / "a" / "three.json").write_text("{}")
+    restarted = _scanner(tree, tmp_path)
+    assert len(restarted) == 2
+    changes = restarted.scan()
+    assert changes.added == [str(tree / "a" / "three.json")]
+    assert not changes.modified
+
+
+def test_unchanged_directories_are_not_listed(tree, tmp_path, monkeypatch):
+    scanner = _scanner(tree, tmp_path, full_scan_interval=3600)
+    scanner.scan()
+
+    listed = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(file_scanner.os, "scandir", lambda p: listed.append(p) or real_scandir(p))
+
+    assert not scanner.scan()
+    assert listed == []
+
+    new_file = tree / "a" / "new.json"
+    new_file.write_text("{}")
+    changes = scanner.scan()
+    assert changes.added == [str(new_file)]
+    assert listed == [str(tree / "a")]
+
+
+def test_in_place_modification_detected_on_full_scan(tree, tmp_path):
+    scanner = _scanner(tree, tmp_path, full_scan_interval=3600)
+    scanner.scan()
+
+    target = tree / "two.json"
+    dir_mtime = os.stat(tree).st_mtime_ns
+    target.write_text('{"changed": true}')
+    # Rewriting in place leaves the directory mtime untouched
+    assert os.stat(tree).st_mtime_ns == dir_mtime
+
+    assert not scanner.scan(full=False)
+    changes = scanner.scan(full=True)
+    assert changes.modified == [str(target)]
+
+
+def test_removed_files_and_directories(tree, tmp_path):
+    scanner = _scanner(tree, tmp_path)
+    scanner.scan()
+
+    (tree / "a" / "one.json").unlink()
+    (tree / "a").rmdir()
+    changes = scanner.scan()
+    assert changes.removed == [str(tree / "a" / "one.json")]
+    assert str(tree / "a" / "one.json") not in scanner
+
+
+def test_unsettled_files_are_deferred(tree, tmp_path):
+    scanner = _scanner(tree, tmp_path, settle_seconds=30)
+    scanner.scan()
+
+    fresh = tree / "fresh.json"
+    fresh.write_text("{")
+    changes = scanner.scan()
+    assert not changes
+    assert changes.unsettled == [str(fresh)]
+
+    _age(fresh)
+    assert scanner.scan().added == [str(fresh)]
+
+
+def test_refresh_reports_added_and_modified(tree, tmp_path):
+    scanner = _scanner(tree, tmp_path, index_path=None)
+    scanner.scan()
+
+    path = str(tree / "two.json")
+    assert scanner.refresh(path) is None
+    (tree / "two.json").write_text('{"grown": 1}')
+    assert scanner.refresh(path) == "modified"
+    (tree / "b.json").write_text("{}")
+    assert scanner.refresh(str(tree / "b.json")) == "added"
+    assert scanner.refresh(str(tree / "missing.json")) is None
+
+
+def test_discarded_files_are_reported_again(tree, tmp_path):
+    scanner = _scanner(tree, tmp_path, full_scan_interval=3600)
+    scanner.scan()
+    failed = tree / "a" / "failed.json"
+    failed.write_text("{}")
+    assert scanner.scan().added == [str(failed)]
+
+    scanner.discard(str(failed))
+    scanner.close()
+
+    restarted = _scanner(tree, tmp_path, full_scan_interval=3600)
+    assert restarted.scan(full=False).modified == [str(failed)]
+
+
+def test_index_is_keyed_by_watch_config(tree, tmp_path):
+    scanner = _scanner(tree, tmp_path)
+    scanner.scan()
+    scanner.close()
+
+    other = IncrementalFileScanner(str(tree), [".json", ".xml"], index_path=str(tmp_path / "index.sqlite3"))
+    assert len(other) == 0
+    assert len(_scanner(tree, tmp_path, key="pipeline-b")) == 0
+    assert len(_scanner(tree, tmp_path)) == 2
+
@@ -26,6 +26,8 @@ import sys
 import pytest
 
 from pulsepipe.adapters.file_watcher import FileWatcherAdapter
+from pulsepipe.adapters.inotify_watcher import inotify_available
+from pulsepipe.utils.errors import FileWatcherError
 
 # ToDo: Try to get this working on Windows.
 @pytest.mark.skipif(sys.platform == "win32", reason="File watcher paths not compatible with Windows")
@@ -84,3 +86,216 @@ async def test_filewatcher_enqueue(tmp_path, monkeypatch):
 
         if 'test_file_watcher_adapter_enqu' in os.environ:
             del os.environ['test_file_watcher_adapter_enqu']
+
+
+def _watcher_config(path, **overrides):
+    config = {
+        "watch_path": str(path),
+        "extensions": [".json"],
+        "bookmark_file": ".bookmark.dat",
+        "test_mode": True,
+        "scan_interval": 5.0,
+    }
+    config.update(overrides)
+    return config
+
+
+async def _stop_adapter(adapter, task):
+    await adapter.stop()
+    try:
+        await asyncio.wait_for(task, timeout=6.0)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        task.cancel()
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+@pytest.mark.asyncio
+async def test_filewatcher_inotify_detects_nested_directory(tmp_path):
+    """Event mode picks up files in subdirectories created after startup without waiting for a scan."""
+    adapter = FileWatcherAdapter(_watcher_config(tmp_path, watch_mode="inotify"))
+    queue = asyncio.Queue()
+    task = asyncio.create_task(adapter.run(queue))
+    try:
+        await asyncio.sleep(0.2)
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        await asyncio.sleep(0.1)
+        (nested / "deep.json").write_text('{"id": "deep"}', encoding="utf-8")
+        (nested / "ignored.txt").write_text("nope", encoding="utf-8")
+
+        # scan_interval is 5s, so this only succeeds via inotify
+        raw = await asyncio.wait_for(queue.get(), timeout=2.0)
+        assert raw == '{"id": "deep"}'
+        assert queue.empty()
+    finally:
+        await _stop_adapter(adapter, task)
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+@pytest.mark.asyncio
+async def test_filewatcher_inotify_debounces_open_files(tmp_path):
+    """A file still held open is only enqueued after it has been quiet for debounce_seconds."""
+    adapter = FileWatcherAdapter(_watcher_config(tmp_path, watch_mode="inotify", debounce_seconds=0.3))
+    queue = asyncio.Queue()
+    task = asyncio.create_task(adapter.run(queue))
+    try:
+        await asyncio.sleep(0.2)
+        with open(tmp_path / "slow.json", "w", encoding="utf-8") as f:
+            f.write('{"part": ')
+            f.flush()
+            await asyncio.sleep(0.15)
+            assert queue.empty()
+            f.write('1}')
+            f.flush()
+            raw = await asyncio.wait_for(queue.get(), timeout=2.0)
+        assert raw == '{"part": 1}'
+
+        # Closing the file does not enqueue it a second time
+        await asyncio.sleep(0.2)
+        assert queue.empty()
+    finally:
+        await _stop_adapter(adapter, task)
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+@pytest.mark.asyncio
+async def test_filewatcher_inotify_picks_up_files_unsettled_at_startup(tmp_path):
+    """A file too fresh for the initial incremental scan is enqueued once it settles."""
+    watch = tmp_path / "watch"
+    watch.mkdir()
+    (watch / "fresh.json").write_text('{"v": 1}', encoding="utf-8")
+    config = _watcher_config(
+        watch,
+        watch_mode="inotify",
+        incremental_scan=True,
+        debounce_seconds=0.5,
+        scan_index_path=str(tmp_path / "index.sqlite3"),
+    )
+
+    adapter = FileWatcherAdapter(config)
+    queue = asyncio.Queue()
+    task = asyncio.create_task(adapter.run(queue))
+    try:
+        # No event arrives for the file and scan_interval is 5s
+        raw = await asyncio.wait_for(queue.get(), timeout=3.0)
+        assert raw == '{"v": 1}'
+    finally:
+        await _stop_adapter(adapter, task)
+
+
+def test_filewatcher_poll_mode_skips_event_watcher(tmp_path):
+    adapter = FileWatcherAdapter(_watcher_config(tmp_path, watch_mode="poll"))
+    assert adapter._start_event_watcher() is None
+
+
+def test_filewatcher_falls_back_when_inotify_unavailable(tmp_path, monkeypatch):
+    monkeypatch.setattr("pulsepipe.adapters.file_watcher.inotify_available", lambda: False)
+    adapter = FileWatcherAdapter(_watcher_config(tmp_path, watch_mode="inotify"))
+    assert adapter._start_event_watcher() is None
+
+
+def test_filewatcher_rejects_unknown_watch_mode(tmp_path):
+    with pytest.raises(FileWatcherError):
+        FileWatcherAdapter(_watcher_config(tmp_path, watch_mode="fanotify"))
+
+
+@pytest.mark.asyncio
+async def test_filewatcher_incremental_scan_reingests_modified_files(tmp_path):
+    """With incremental_scan, a restart skips indexed files and re-ingests ones changed in place."""
+    watch = tmp_path / "watch"
+    watch.mkdir()
+    (watch / "a.json").write_text('{"v": 1}', encoding="utf-8")
+    (watch / "b.json").write_text('{"v": 2}', encoding="utf-8")
+    config = _watcher_config(
+        watch,
+        watch_mode="poll",
+        continuous=False,
+        incremental_scan=True,
+        debounce_seconds=0,
+        scan_index_path=str(tmp_path / "index.sqlite3"),
+    )
+
+    adapter = FileWatcherAdapter(config)
+    queue = asyncio.Queue()
+    await adapter.run(queue)
+    assert queue.qsize() == 2
+
+    # A fresh adapter has an empty in-memory bookmark store, so anything
+    # enqueued here comes from the scan index alone
+    (watch / "a.json").write_text('{"v": 10}', encoding="utf-8")
+    restarted = FileWatcherAdapter(config)
+    queried = []
+    restarted.bookmarks.filter_unprocessed = lambda paths: queried.extend(paths) or list(paths)
+    queue = asyncio.Queue()
+    await restarted.run(queue)
+    assert queue.qsize() == 1
+    assert await queue.get() == '{"v": 10}'
+    assert queried == []
+
+
+
+@pytest.mark.asyncio
+async def test_filewatcher_one_shot_scan_does_not_defer_fresh_files(tmp_path):
+    """A one-shot incremental run picks up files younger than the debounce window."""
+    watch = tmp_path / "watch"
+    watch.mkdir()
+    (watch / "fresh.json").write_text('{"v": 1}', encoding="utf-8")
+    config = _watcher_config(
+        watch,
+        watch_mode="poll",
+        continuous=False,
+        incremental_scan=True,
+        debounce_seconds=60,
+        scan_index_path=str(tmp_path / "index.sqlite3"),
+    )
+
+    queue = asyncio.Queue()
+    await FileWatcherAdapter(config).run(queue)
+    assert queue.qsize() == 1
+
+
+@pytest.mark.asyncio
+async def test_filewatcher_incremental_scan_retries_failed_reads(tmp_path):
+    """Files that could not be read are not committed to the scan index."""
+    watch = tmp_path / "watch"
+    watch.mkdir()
+    (watch / "a.json").write_text('{"v": 1}', encoding="utf-8")
+    (watch / "b.json").write_text('{"v": 2}', encoding="utf-8")
+    config = _watcher_config(
+        watch,
+        watch_mode="poll",
+        continuous=False,
+        incremental_scan=True,
+        debounce_seconds=0,
+        scan_index_path=str(tmp_path / "index.sqlite3"),
+    )
+
+    adapter = FileWatcherAdapter(config)
+    read_payload = adapter._read_payload
+
+    def flaky_read(path):
+        if str(path).endswith("b.json"):
+            raise OSError("device busy")
+        return read_payload(path)
+
+    adapter._read_payload = flaky_read
+    queue = asyncio.Queue()
+    await adapter.run(queue)
+    assert queue.qsize() == 1
+
+    queue = asyncio.Queue()
+    await FileWatcherAdapter(config).run(queue)
+    assert queue.qsize() == 1
+    assert await queue.get() == '{"v": 2}'
+
+
+def test_filewatcher_enqueues_paths_for_large_files(tmp_path):
+    """Files at or above stream_threshold_bytes are handed over as Paths for streaming ingest."""
+    adapter = FileWatcherAdapter(_watcher_config(tmp_path, stream_threshold_bytes=16))
+    small = tmp_path / "small.json"
+    large = tmp_path / "large.json"
+    small.write_text('{"v": 1}', encoding="utf-8")
+    large.write_text('{"resourceType": "Bundle"}', encoding="utf-8")
+
+    assert adapter._read_payload(small) == '{"v": 1}'
+    assert adapter._read_payload(large) == large
@@ -225,4 +225,47 @@ def test_complex_nested_access():
     assert pid_segment.fields[4].repetitions[0].components[0].subcomponents[2] == "MiddleInitial"
 
     assert pid_segment.fields[9].repetitions[0].components[0].subcomponents[0] == "Street"
-    assert pid_segment.fields[9].repetitions[0].components[0].subcomponents[4] == "Country"
\ No newline at end of file
+    assert pid_segment.fields[9].repetitions[0].components[0].subcomponents[4] == "Country"
+
+LAZY_MSG = (
+    "MSH|^~\\&|LAB|HOSP|EHR|HOSP|20240101120000||ORU^R01|MSG1|P|2.5\r"
+    "PID|1||12345^^^HOSP^MR~67890^^^HOSP^SS||Doe^Jane^Q||19800101|F\r"
+    "OBX|1|NM|8867-4^Heart rate^LN||72|/min|60-100|N"
+)
+
+
+def test_lazy_segment_decodes_fields_on_access():
+    """Fields of a parsed segment are only decoded when they are read."""
+    from pulsepipe.ingesters.hl7v2_utils.parser import HL7Message
+
+    msg = HL7Message(LAZY_MSG)
+    pid = msg.segment_map["PID"][0]
+    assert pid._fields is None
+
+    assert msg.get("PID.5.2") == "Jane"
+    assert pid._fields is None  # accessor reads the raw text directly
+
+    field = pid.fields[3]
+    assert pid.fields._decoded.count(None) == len(pid) - 1
+    assert field[1][0][0] == "67890"
+    assert pid.get(3, 1, 1, 1) == "67890"
+    assert [str(f) for f in pid.fields[1:3]] == ["1", ""]
+
+
+def test_lazy_message_accessors_and_round_trip():
+    from pulsepipe.ingesters.hl7v2_utils.parser import HL7Message, parse_accessor
+
+    msg = HL7Message(LAZY_MSG)
+    assert msg.get("MSH.1") == "^~\\&"
+    assert msg.get("MSH.1.2") is None
+    assert msg.get("OBX.3.2") == "Heart rate"
+    assert msg.get("OBX.40") is None
+    assert msg.get("ZZZ.2") is None
+    assert str(msg) == LAZY_MSG
+
+    parse_accessor.cache_clear()
+    msg.get("OBX.5")
+    msg.get("OBX.5")
+    assert parse_accessor.cache_info().hits == 1
+    with pytest.raises(ValueError):
+        msg.get("bad")
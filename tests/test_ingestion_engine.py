@@ -22,6 +22,9 @@
 """Unit tests for the IngestionEngine."""
 
 import asyncio
+import json
+import threading
+import time
 from unittest.mock import MagicMock, AsyncMock, patch, call
 
 import pytest
@@ -30,7 +33,7 @@ from pulsepipe.ingesters.ingestion_engine import IngestionEngine
 from pulsepipe.models.clinical_content import PulseClinicalContent
 from pulsepipe.models.operational_content import PulseOperationalContent
 from pulsepipe.utils.errors import (
-    IngestionEngineError, IngesterError, AdapterError, PulsePipeError
+    IngestionEngineError, IngesterError, AdapterError, PulsePipeError, ConfigurationError
 )
 
 
@@ -413,4 +416,172 @@ class TestIngestionEngine:
         
         # Verify empty operational content created
         assert isinstance(result, PulseOperationalContent)
-        assert result.transaction_type == "UNKNOWN"
\ No newline at end of file
+        assert result.transaction_type == "UNKNOWN"
+    @pytest.mark.asyncio
+    async def test_stream_emits_results_without_accumulating(self, engine):
+        """Test that stream hands each parse result to emit as it is parsed."""
+        async def adapter_run(queue):
+            await queue.put("data1")
+            await queue.put("data2")
+        engine.adapter.run = AsyncMock(side_effect=adapter_run)
+        engine.ingester.parse.side_effect = lambda raw: f"parsed_{raw}"
+        
+        emitted = []
+        async def emit(result):
+            emitted.append(result)
+        
+        await engine.stream(emit)
+        
+        assert emitted == ["parsed_data1", "parsed_data2"]
+        assert engine.results == []
+        assert engine._emit is None
+    
+    @pytest.mark.asyncio
+    async def test_stream_stops_on_stop_event(self, engine):
+        """Test that a long-running adapter is cancelled when the stop event is set."""
+        adapter_started = asyncio.Event()
+        async def adapter_run(queue):
+            await queue.put("data1")
+            adapter_started.set()
+            await asyncio.Event().wait()  # Never finishes on its own
+        engine.adapter.run = AsyncMock(side_effect=adapter_run)
+        engine.ingester.parse.side_effect = lambda raw: f"parsed_{raw}"
+        
+        emitted = []
+        async def emit(result):
+            emitted.append(result)
+        
+        stop_event = asyncio.Event()
+        stream_task = asyncio.create_task(engine.stream(emit, stop_event))
+        await adapter_started.wait()
+        await asyncio.sleep(0.05)
+        stop_event.set()
+        await asyncio.wait_for(stream_task, timeout=2.0)
+        
+        assert emitted == ["parsed_data1"]
+    
+    @pytest.mark.asyncio
+    async def test_stream_propagates_adapter_error(self, engine):
+        """Test that adapter failures surface from stream."""
+        engine.adapter.run.side_effect = AdapterError("Failed to connect to data source")
+        
+        async def emit(result):
+            pass
+        
+        with pytest.raises(AdapterError):
+            await engine.stream(emit)
+    
+    def test_bounded_queue(self):
+        """Test that max_queue_size bounds the adapter queue."""
+        engine = IngestionEngine(adapter=MagicMock(), ingester=MagicMock(), max_queue_size=5)
+        assert engine.queue.maxsize == 5
+
+
+class TestParallelIngestion:
+    """Tests for IngestionEngine worker pools."""
+    
+    @staticmethod
+    def _adapter(items):
+        async def adapter_run(queue):
+            for item in items:
+                await queue.put(item)
+        adapter = MagicMock()
+        adapter.run = AsyncMock(side_effect=adapter_run)
+        return adapter
+    
+    def test_invalid_pool_options(self):
+        """Test that bad worker counts and pool types are rejected."""
+        with pytest.raises(ConfigurationError):
+            IngestionEngine(MagicMock(), MagicMock(), workers=0)
+        with pytest.raises(ConfigurationError):
+            IngestionEngine(MagicMock(), MagicMock(), workers=2, pool="fiber")
+    
+    @pytest.mark.asyncio
+    async def test_thread_pool_preserves_order(self):
+        """Test that ordered results follow queue order even when parses finish out of order."""
+        items = [f"data{i}" for i in range(6)]
+        ingester = MagicMock()
+        def slow_first(raw):
+            # Early items take longest, so they finish last
+            time.sleep(0.05 * (6 - int(raw[-1])))
+            return f"parsed_{raw}"
+        ingester.parse.side_effect = slow_first
+        engine = IngestionEngine(self._adapter(items), ingester, workers=3, pool="thread")
+        
+        emitted = []
+        async def emit(result):
+            emitted.append(result)
+        await engine.stream(emit)
+        
+        assert emitted == [f"parsed_{item}" for item in items]
+    
+    @pytest.mark.asyncio
+    async def test_thread_pool_unordered_runs_concurrently(self):
+        """Test that unordered mode emits every result and parses in parallel."""
+        items = [f"data{i}" for i in range(4)]
+        active = []
+        peak = []
+        lock = threading.Lock()
+        ingester = MagicMock()
+        def parse(raw):
+            with lock:
+                active.append(raw)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(raw)
+            return f"parsed_{raw}"
+        ingester.parse.side_effect = parse
+        engine = IngestionEngine(self._adapter(items), ingester, workers=4, pool="thread",
+                                 ordered=False)
+        
+        emitted = []
+        async def emit(result):
+            emitted.append(result)
+        await engine.stream(emit)
+        
+        assert sorted(emitted) == [f"parsed_{item}" for item in items]
+        assert max(peak) > 1
+    
+    @pytest.mark.asyncio
+    async def test_thread_pool_aggregates_errors(self):
+        """Test that worker failures are acknowledged and recorded in processing_errors."""
+        mock_content = MagicMock(spec=PulseClinicalContent)
+        mock_content.summary.return_value = "Mock content summary"
+        ingester = MagicMock()
+        def parse(raw):
+            if raw == "bad":
+                raise IngesterError("Failed to parse bad data")
+            if raw == "broken":
+                raise ValueError("boom")
+            return mock_content
+        ingester.parse.side_effect = parse
+        engine = IngestionEngine(self._adapter(["good", "bad", "broken"]), ingester,
+                                 workers=2, pool="thread")
+        engine._acknowledge = MagicMock()
+        
+        result = await engine.run(timeout=5.0)
+        
+        assert result == mock_content
+        assert engine.processing_errors == [
+            {"message": "Failed to parse bad data", "type": "IngesterError", "details": {}},
+            {"message": "boom", "type": "ValueError"},
+        ]
+        assert engine._acknowledge.call_count == 3
+        assert engine.queue._unfinished_tasks == 0
+    
+    @pytest.mark.asyncio
+    async def test_process_pool_with_real_ingester(self):
+        """Test that a process pool parses FHIR payloads and returns them in order."""
+        from pulsepipe.ingesters.fhir_ingester import FHIRIngester
+        
+        items = [json.dumps({"resourceType": "Patient", "id": f"p{i}", "gender": "female"})
+                 for i in range(5)]
+        engine = IngestionEngine(self._adapter(items + ["not json"]), FHIRIngester(),
+                                 workers=2, pool="process")
+        
+        results = await engine.run(timeout=30.0)
+        
+        assert [r.patient.id for r in results] == [f"p{i}" for i in range(5)]
+        assert len(engine.processing_errors) == 1
+        assert engine.processing_errors[0]["type"] == "FHIRError"
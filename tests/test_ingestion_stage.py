@@ -31,7 +31,7 @@ from unittest.mock import MagicMock, patch, AsyncMock
 import pytest
 
 from pulsepipe.pipelines.context import PipelineContext
-from pulsepipe.pipelines.stages.ingestion import IngestionStage
+from pulsepipe.pipelines.stages.ingestion import IngestionStage, IngestionSession
 from pulsepipe.ingesters.ingestion_engine import IngestionEngine
 from pulsepipe.utils.errors import ConfigurationError, AdapterError, IngesterError, IngestionEngineError
 
@@ -330,5 +330,65 @@ class TestIngestionStage:
         assert result == single_result
         assert result["id"] == "patient1"
 
+    @pytest.mark.asyncio
+    async def test_open_session_builds_components_once(self):
+        """Test that a session creates its adapter, ingester and engine exactly once."""
+        session = self.ingestion_stage.open_session(self.context)
+        
+        assert isinstance(session, IngestionSession)
+        assert session.adapter is self.mock_adapter
+        assert session.engine is self.mock_engine
+        self.mock_create_adapter.assert_called_once()
+        self.mock_create_ingester.assert_called_once()
+        self.mock_engine_class.assert_called_once_with(self.mock_adapter, self.mock_ingester, max_queue_size=100)
+    
+    @pytest.mark.asyncio
+    async def test_execute_passes_worker_pool_options(self):
+        """Test that ingestion_workers/pool/ordered config reaches the engine."""
+        self.context.config.update({"ingestion_workers": 4, "ingestion_pool": "thread",
+                                    "ingestion_ordered": False})
+        
+        await self.ingestion_stage.execute(self.context)
+        
+        self.mock_engine_class.assert_called_once_with(self.mock_adapter, self.mock_ingester,
+                                                       workers=4, pool="thread", ordered=False)
+    
+    def test_open_session_missing_config(self):
+        """Test that opening a session without adapter config fails fast."""
+        self.context.config.pop("adapter")
+        with pytest.raises(ConfigurationError):
+            self.ingestion_stage.open_session(self.context)
+    
+    @pytest.mark.asyncio
+    async def test_session_run_streams_items_and_reports_errors(self):
+        """Test that the session flattens results, emits items and reports engine errors."""
+        async def stream(on_result, stop_event):
+            await on_result({"id": "patient1"})
+            self.mock_engine.processing_errors.append({"message": "bad file"})
+            await on_result([{"id": "patient2"}, {"id": "patient3"}])
+        self.mock_engine.stream = AsyncMock(side_effect=stream)
+        self.context.add_error = MagicMock()
+        
+        session = self.ingestion_stage.open_session(self.context)
+        emitted = []
+        async def emit(item):
+            emitted.append(item["id"])
+        
+        count = await session.run(emit)
+        
+        assert count == 3
+        assert emitted == ["patient1", "patient2", "patient3"]
+        self.context.add_error.assert_called_once_with("ingestion", "bad file", details={"message": "bad file"})
+    
+    @pytest.mark.asyncio
+    async def test_session_close_stops_adapter(self):
+        """Test that closing a session stops the adapter."""
+        self.mock_adapter.stop = AsyncMock()
+        session = self.ingestion_stage.open_session(self.context)
+        
+        await session.close()
+        
+        self.mock_adapter.stop.assert_awaited_once()
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
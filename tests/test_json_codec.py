@@ -0,0 +1,177 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_json_codec.py
+
+import datetime
+import enum
+import io
+import json
+import math
+
+import pytest
+from pydantic import BaseModel
+
+from pulsepipe.audit.audit_logger import AuditEvent, EventType
+from pulsepipe.utils import json_codec
+from pulsepipe.utils.errors import ConfigurationError
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Reading(BaseModel):
+    taken_at: datetime.datetime
+    value: float
+
+
+SAMPLE = {
+    "when": datetime.datetime(2024, 5, 1, 12, 30, 0, 250),
+    "day": datetime.date(2024, 5, 1),
+    "color": Color.RED,
+    "tags": {"a"},
+    "model": Reading(taken_at=datetime.datetime(2024, 5, 1, 8, 0), value=98.6),
+    1: "int key",
+    "text": "café",
+}
+
+EXPECTED = {
+    "when": "2024-05-01T12:30:00.000250",
+    "day": "2024-05-01",
+    "color": "red",
+    "tags": ["a"],
+    "model": {"taken_at": "2024-05-01T08:00:00", "value": 98.6},
+    "1": "int key",
+    "text": "café",
+}
+
+
+@pytest.fixture(params=json_codec.available_backends())
+def backend(request):
+    previous = json_codec.BACKEND
+    json_codec.set_backend(request.param)
+    yield request.param
+    json_codec.set_backend(previous)
+
+
+def test_encodes_rich_types(backend):
+    encoded = json_codec.dumps(SAMPLE)
+
+    assert json.loads(encoded) == EXPECTED
+    assert "café" in encoded
+
+
+def test_backends_produce_identical_output():
+    outputs = set()
+    previous = json_codec.BACKEND
+    try:
+        for name in json_codec.available_backends():
+            json_codec.set_backend(name)
+            outputs.add(json_codec.dumps(EXPECTED))
+            outputs.add(json_codec.dumps(EXPECTED, pretty=True, sort_keys=True))
+    finally:
+        json_codec.set_backend(previous)
+
+    assert outputs == {
+        json.dumps(EXPECTED, ensure_ascii=False, separators=(",", ":")),
+        json.dumps(EXPECTED, ensure_ascii=False, indent=2, sort_keys=True),
+    }
+
+
+def test_pretty_is_opt_in(backend):
+    assert "\n" not in json_codec.dumps({"a": [1, 2]})
+    assert json_codec.dumps({"a": 1}, pretty=True) == '{\n  "a": 1\n}'
+
+
+def test_loads_accepts_text_and_bytes(backend):
+    assert json_codec.loads('{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+    assert json_codec.loads(b'{"a": true}') == {"a": True}
+
+
+def test_backends_agree_on_offsets_and_non_finite_floats():
+    value = {
+        "utc": datetime.datetime(2024, 5, 1, 12, 0, tzinfo=datetime.timezone.utc),
+        "offset": datetime.datetime(2024, 5, 1, 12, 0, tzinfo=datetime.timezone(datetime.timedelta(hours=-5))),
+        "readings": [1.5, math.nan, math.inf],
+        "nested": ({"at": datetime.time(8, 30)},),
+    }
+    outputs = set()
+    previous = json_codec.BACKEND
+    try:
+        for name in json_codec.available_backends():
+            json_codec.set_backend(name)
+            outputs.add(json_codec.dumps(value))
+    finally:
+        json_codec.set_backend(previous)
+
+    assert outputs == {
+        '{"utc":"2024-05-01T12:00:00+00:00","offset":"2024-05-01T12:00:00-05:00",'
+        '"readings":[1.5,null,null],"nested":[{"at":"08:30:00"}]}'
+    }
+
+
+def test_encodes_wide_integers_with_stdlib(backend):
+    big = 2 ** 70
+    assert json.loads(json_codec.dumps({"n": big})) == {"n": big}
+
+
+def test_decode_errors_are_json_decode_errors(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads("<Patient/>")
+
+
+def test_decode_errors_are_not_retried(backend, monkeypatch):
+    if backend == "json":
+        pytest.skip("the stdlib backend is the only parse")
+    monkeypatch.setattr(json_codec.json, "loads", lambda data: pytest.fail("parsed twice"))
+
+    with pytest.raises(json.JSONDecodeError):
+        json_codec.loads(b"<Patient/>")
+
+
+def test_dump_and_load_file_handles(backend):
+    buffer = io.StringIO()
+    json_codec.dump({"a": 1}, buffer)
+    buffer.seek(0)
+
+    assert json_codec.load(buffer) == {"a": 1}
+    assert json_codec.load(io.BytesIO(b'{"b": 2}')) == {"b": 2}
+
+
+def test_set_backend_rejects_unknown_backend():
+    with pytest.raises(ConfigurationError, match="Unknown JSON backend"):
+        json_codec.set_backend("simdjson")
+
+
+def test_audit_event_to_json_is_compact_by_default():
+    event = AuditEvent(
+        event_type=EventType.ERROR_OCCURRED,
+        stage_name="ingestion",
+        message="failed",
+        timestamp=datetime.datetime(2024, 5, 1, 9, 0),
+    )
+
+    compact = event.to_json()
+    assert "\n" not in compact
+    assert json.loads(compact)["timestamp"] == "2024-05-01T09:00:00"
+    assert json.loads(event.to_json(pretty=True)) == json.loads(compact)
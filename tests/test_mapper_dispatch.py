@@ -0,0 +1,83 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_mapper_dispatch.py
+
+import pytest
+
+import pulsepipe.ingesters.fhir_ingester  # noqa: F401 - registers FHIR mappers
+import pulsepipe.ingesters.x12_ingester  # noqa: F401 - registers X12 mappers
+from pulsepipe.ingesters.fhir_utils.base_mapper import (
+    BaseFHIRMapper, MAPPER_REGISTRY, fhir_mapper, get_fhir_mapper,
+)
+from pulsepipe.ingesters.fhir_utils.problem_list_mapper import ProblemListMapper
+from pulsepipe.ingesters.x12_utils import base_mapper as x12_base
+from pulsepipe.ingesters.x12_utils.clp_mapper import CLPMapper
+from pulsepipe.ingesters.x12_utils.pa_mapper import PriorAuthorizationMapper
+
+
+def test_fhir_dispatch_matches_accepts():
+    for mapper in MAPPER_REGISTRY:
+        assert get_fhir_mapper(mapper.resource_type) is mapper
+        assert mapper.accepts({"resourceType": mapper.resource_type})
+
+
+def test_fhir_dispatch_is_case_insensitive():
+    assert isinstance(get_fhir_mapper("Condition"), ProblemListMapper)
+    assert get_fhir_mapper("condition") is get_fhir_mapper("Condition")
+    assert get_fhir_mapper("NotAResource") is None
+    assert get_fhir_mapper(None) is None
+
+
+def test_fhir_duplicate_registration_is_rejected():
+    count = len(MAPPER_REGISTRY)
+    with pytest.raises(ValueError, match="Duplicate FHIR mapper for Patient"):
+        @fhir_mapper("Patient")
+        class ShadowPatientMapper(BaseFHIRMapper):
+            RESOURCE_TYPE = "Patient"
+    assert len(MAPPER_REGISTRY) == count
+
+
+def test_x12_dispatch_by_segment_id():
+    assert isinstance(x12_base.get_x12_mapper("CLP"), CLPMapper)
+    # Unmapped segments resolve to None and are cached as misses
+    assert x12_base.get_x12_mapper("ISA") is None
+    assert "ISA" in x12_base._LOOKUP_CACHE
+
+
+def test_x12_mapper_rejecting_its_type_code_is_not_dispatched():
+    # PriorAuthorizationMapper.accepts() never matches, so it stays out of the table
+    assert not isinstance(x12_base.MAPPER_DISPATCH.get("UM"), PriorAuthorizationMapper)
+    assert any(isinstance(m, PriorAuthorizationMapper) for m in x12_base._FALLBACK_MAPPERS)
+    assert x12_base.get_x12_mapper("UM") is None
+
+
+def test_x12_duplicate_registration_is_rejected():
+    count = len(x12_base.MAPPER_REGISTRY)
+    with pytest.raises(ValueError, match="Duplicate X12 mapper for segment CLP"):
+        class ShadowCLPMapper(x12_base.BaseX12Mapper):
+            def __init__(self):
+                self.typeCode = "CLP"
+
+            def accepts(self, segment_id):
+                return segment_id == self.typeCode
+    assert len(x12_base.MAPPER_REGISTRY) == count
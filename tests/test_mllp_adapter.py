@@ -0,0 +1,145 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_mllp_adapter.py
+
+import asyncio
+
+import pytest
+
+from pulsepipe.adapters.mllp import (
+    END_BLOCK, MLLPAdapter, MLLPMessage, build_ack, frame,
+)
+from pulsepipe.ingesters.hl7v2_ingester import HL7v2Ingester
+from pulsepipe.ingesters.ingestion_engine import IngestionEngine
+from pulsepipe.utils.errors import MLLPError
+
+ORU = (
+    "MSH|^~\\&|LAB|HOSP|PULSE|HOSP|20240101120000||ORU^R01|CTRL42|P|2.5\r"
+    "PID|1||12345^^^HOSP^MR||Doe^Jane||19800101|F\r"
+    "OBX|1|NM|8867-4^Heart rate^LN||72|/min|60-100|N"
+)
+
+
+async def _send(port, payload: bytes) -> str:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        writer.write(payload)
+        await writer.drain()
+        reply = await asyncio.wait_for(reader.readuntil(END_BLOCK), timeout=5)
+        return reply[1:-len(END_BLOCK)].decode("utf-8")
+    finally:
+        writer.close()
+
+
+def test_build_ack_swaps_endpoints_and_echoes_control_id():
+    ack = build_ack(ORU, "AA").split("\r")
+    msh = ack[0].split("|")
+    assert msh[2:6] == ["PULSE", "HOSP", "LAB", "HOSP"]
+    assert msh[8] == "ACK^R01"
+    assert ack[1] == "MSA|AA|CTRL42"
+    assert build_ack("garbage", "AE", "bad").endswith("MSA|AE||bad")
+
+
+def test_mllp_message_acknowledge():
+    loop = asyncio.new_event_loop()
+    try:
+        ok, empty = loop.create_future(), loop.create_future()
+        message = MLLPMessage("MSH|x", ok)
+        assert message == "MSH|x"
+        message.acknowledge(result=["parsed"])
+        MLLPMessage("MSH|x", empty).acknowledge(result=[])
+        assert ok.result() is None
+        assert empty.result() == "No message could be parsed"
+    finally:
+        loop.close()
+
+
+def test_invalid_ack_mode():
+    with pytest.raises(MLLPError):
+        MLLPAdapter({"ack_mode": "later"})
+
+
+@pytest.mark.asyncio
+async def test_mllp_round_trip_through_ingestion_engine():
+    adapter = MLLPAdapter({"port": 0, "ack_timeout": 5})
+    engine = IngestionEngine(adapter, HL7v2Ingester(), max_queue_size=1)
+    emitted = []
+
+    async def emit(result):
+        emitted.append(result)
+
+    stop = asyncio.Event()
+    task = asyncio.create_task(engine.stream(emit, stop_event=stop))
+    try:
+        await asyncio.wait_for(adapter.listening.wait(), timeout=5)
+
+        ack = await _send(adapter.bound_port, frame(ORU))
+        assert ack.split("\r")[1] == "MSA|AA|CTRL42"
+        assert len(emitted) == 1 and emitted[0][0].patient.id == "12345"
+
+        nack = await _send(adapter.bound_port, frame("not an hl7 message"))
+        assert nack.split("\r")[1].startswith("MSA|AE||")
+        assert len(emitted) == 1
+    finally:
+        stop.set()
+        await adapter.stop()
+        await asyncio.wait_for(task, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_mllp_enqueue_mode_acks_when_queued():
+    adapter = MLLPAdapter({"port": 0, "ack_mode": "enqueue"})
+    queue = asyncio.Queue()
+    task = asyncio.create_task(adapter.run(queue))
+    try:
+        await asyncio.wait_for(adapter.listening.wait(), timeout=5)
+        ack = await _send(adapter.bound_port, b"noise" + frame(ORU))
+        assert ack.endswith("MSA|AA|CTRL42")
+        assert await queue.get() == ORU
+    finally:
+        await adapter.stop()
+        await asyncio.wait_for(task, timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_mllp_ack_timeout_withdraws_message():
+    adapter = MLLPAdapter({"port": 0, "ack_timeout": 0.1})
+    queue = asyncio.Queue()
+    task = asyncio.create_task(adapter.run(queue))
+    try:
+        await asyncio.wait_for(adapter.listening.wait(), timeout=5)
+        # Nothing consumes the queue, so the parse ACK times out
+        nack = await _send(adapter.bound_port, frame(ORU))
+        assert nack.split("\r")[1].startswith("MSA|AE|CTRL42|")
+    finally:
+        await adapter.stop()
+        await asyncio.wait_for(task, timeout=5)
+
+    message = await queue.get()
+    assert message.withdrawn
+
+    # A late parse is neither acknowledged nor ingested
+    engine = IngestionEngine(adapter, HL7v2Ingester())
+    await engine._process_item(message)
+    assert engine.results == []
+
@@ -0,0 +1,251 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_model_registry.py
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pulsepipe.utils.errors import ConfigurationError
+from pulsepipe.utils.model_registry import ModelRegistry, model_registry
+from pulsepipe.pipelines.context import PipelineContext
+from pulsepipe.pipelines.stages import LazyStageMap, PipelineStage, close_stages, warm_up_models
+from pulsepipe.pipelines.embedders.clinical_embedder import ClinicalEmbedder
+from pulsepipe.pipelines.embedders.base_embedder import SENTENCE_TRANSFORMER
+
+
+class ModelStage(PipelineStage):
+    """Stage that needs the given registry models."""
+    
+    def __init__(self, *models):
+        super().__init__("model_stage")
+        self.models = list(models)
+    
+    async def execute(self, context, input_data=None):
+        return input_data
+    
+    def required_models(self, context):
+        return self.models
+
+
+@pytest.fixture
+def registry():
+    registry = ModelRegistry()
+    registry.loader = MagicMock(side_effect=lambda key: f"model:{key}")
+    registry.register_loader("test", registry.loader)
+    return registry
+
+
+class TestModelRegistry:
+    def test_loads_lazily_once(self, registry):
+        assert not registry.is_loaded("test", "a")
+        
+        assert registry.get("test", "a") == "model:a"
+        assert registry.get("test", "a") == "model:a"
+        
+        registry.loader.assert_called_once_with("a")
+        assert registry.is_loaded("test", "a")
+
+    def test_unknown_kind_raises(self, registry):
+        with pytest.raises(ConfigurationError):
+            registry.get("missing", "a")
+
+    def test_reference_counting(self, registry):
+        registry.acquire("test", "a")
+        registry.acquire("test", "a")
+        registry.acquire("test", "b")
+        registry.release("test", "a")
+        registry.release("test", "b")
+        
+        assert registry.refcount("test", "a") == 1
+        assert registry.refcount("test", "b") == 0
+        
+        # Released models stay loaded until explicitly unloaded
+        assert registry.is_loaded("test", "b")
+        assert registry.unload_unused() == 1
+        assert registry.is_loaded("test", "a")
+        assert not registry.is_loaded("test", "b")
+
+    def test_release_never_goes_negative(self, registry):
+        registry.release("test", "a")
+        assert registry.refcount("test", "a") == 0
+
+    def test_concurrent_requests_share_one_load(self):
+        registry = ModelRegistry()
+        calls = []
+        
+        def slow_loader(key):
+            calls.append(key)
+            time.sleep(0.05)
+            return object()
+        
+        registry.register_loader("slow", slow_loader)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.get("slow", "m"))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert calls == ["m"]
+        assert len({id(r) for r in results}) == 1
+
+    def test_warm_up_logs_failures(self, registry):
+        registry.register_loader("broken", MagicMock(side_effect=RuntimeError("no model")))
+        
+        registry.warm_up([("test", "a"), ("broken", "x")])
+        
+        assert registry.is_loaded("test", "a")
+        assert not registry.is_loaded("broken", "x")
+
+
+class TestSharedEmbeddingModels:
+    def test_embedders_share_loaded_model(self):
+        mock_model = MagicMock()
+        mock_model.get_sentence_embedding_dimension.return_value = 3
+        
+        with patch("sentence_transformers.SentenceTransformer", return_value=mock_model) as st_class:
+            first = ClinicalEmbedder({"model_name": "shared-model"})
+            second = ClinicalEmbedder({"model_name": "shared-model"})
+        
+        st_class.assert_called_once_with("shared-model")
+        assert first.model is second.model
+        assert model_registry.refcount(SENTENCE_TRANSFORMER, "shared-model") == 2
+        
+        first.close()
+        second.close()
+        first.close()
+        assert model_registry.refcount(SENTENCE_TRANSFORMER, "shared-model") == 0
+        assert model_registry.is_loaded(SENTENCE_TRANSFORMER, "shared-model")
+
+
+class TestLazyStages:
+    def test_stages_built_on_first_access(self):
+        factory = MagicMock()
+        stages = LazyStageMap({"deid": factory, "chunking": MagicMock()})
+        
+        assert "deid" in stages
+        assert list(stages) == ["deid", "chunking"]
+        factory.assert_not_called()
+        
+        assert stages["deid"] is stages.get("deid")
+        factory.assert_called_once_with()
+        assert list(stages.loaded()) == ["deid"]
+        assert stages.get("missing") is None
+
+    def test_assigned_stages_override_factories(self):
+        stages = LazyStageMap({"deid": MagicMock()})
+        replacement = MagicMock()
+        
+        stages.update({"deid": replacement, "extra": MagicMock()})
+        
+        assert stages["deid"] is replacement
+        assert len(stages) == 2
+        del stages["extra"]
+        assert "extra" not in stages
+
+    def test_deid_stage_defers_analyzer_load(self):
+        from pulsepipe.pipelines.stages.deid import DeidentificationStage, DEID_ANALYZER, DEFAULT_ANALYZER_KEY
+        
+        analyzer = MagicMock()
+        with patch("pulsepipe.pipelines.stages.deid.create_healthcare_analyzer", return_value=analyzer) as create:
+            first = DeidentificationStage()
+            second = DeidentificationStage()
+            create.assert_not_called()
+            
+            assert first.analyzer is analyzer
+            assert second.analyzer is analyzer
+        
+        create.assert_called_once_with()
+        assert model_registry.refcount(DEID_ANALYZER, DEFAULT_ANALYZER_KEY) == 2
+
+
+class TestWarmUp:
+    @pytest.mark.asyncio
+    async def test_warm_up_loads_required_models(self):
+        loader = MagicMock(return_value="model")
+        model_registry.register_loader("warm_test", loader)
+        stage = ModelStage(("warm_test", "m"), ("warm_test", "m"))
+        context = PipelineContext("warm", {"models": {"warm_up": True}})
+        
+        await warm_up_models(context, [stage, stage])
+        
+        loader.assert_called_once_with("m")
+        assert model_registry.is_loaded("warm_test", "m")
+        # Held for the run, so other pipelines finishing cannot unload it
+        assert model_registry.refcount("warm_test", "m") == 1
+        model_registry.unload_unused()
+        assert model_registry.is_loaded("warm_test", "m")
+        
+        stage.close_executor(context)
+        assert model_registry.refcount("warm_test", "m") == 0
+
+    def test_models_are_held_per_run(self):
+        model_registry.register_loader("held_test", lambda key: f"model-{key}")
+        stage = ModelStage(("held_test", "m"))
+        first, second = PipelineContext("first", {}), PipelineContext("second", {})
+        
+        stage.hold_models(first)
+        stage.hold_models(first)
+        stage.hold_models(second)
+        assert model_registry.refcount("held_test", "m") == 2
+        
+        # The first run finishing leaves the model loaded for the second
+        close_stages([stage], first)
+        assert model_registry.is_loaded("held_test", "m")
+        
+        close_stages([stage], second)
+        assert not model_registry.is_loaded("held_test", "m")
+
+    @pytest.mark.asyncio
+    async def test_warm_up_disabled_by_default(self):
+        stage = MagicMock()
+        
+        await warm_up_models(PipelineContext("cold", {}), [stage])
+        
+        stage.required_models.assert_not_called()
+
+    def test_close_stages_unloads_unreferenced_models(self):
+        model_registry.register_loader("close_test", lambda key: f"model-{key}")
+        model_registry.get("close_test", "idle")
+        model_registry.acquire("close_test", "held")
+        stage = MagicMock()
+        context = PipelineContext("done", {})
+        
+        close_stages([stage], context)
+        
+        stage.close_executor.assert_called_once_with(context)
+        assert not model_registry.is_loaded("close_test", "idle")
+        assert model_registry.is_loaded("close_test", "held")
+
+    def test_embedding_stage_reports_model(self):
+        from pulsepipe.pipelines.stages.embedding import EmbeddingStage
+        from pulsepipe.pipelines.embedders.operational_embedder import OperationalEmbedder
+        
+        context = PipelineContext("emb", {"embedding": {"type": "operational"}})
+        registry = {"clinical": ClinicalEmbedder, "operational": OperationalEmbedder}
+        
+        with patch.dict("pulsepipe.pipelines.stages.embedding.EMBEDDER_REGISTRY", registry):
+            assert EmbeddingStage().required_models(context) == [(SENTENCE_TRANSFORMER, "all-MiniLM-L6-v2")]
@@ -432,6 +432,57 @@ class TestMongoDBConnection:
         
         conn.close()
     
+    @patch('pulsepipe.persistence.database.mongodb_impl.MongoClient')
+    def test_executemany_update_one_uses_bulk_write(self, mock_mongo_client):
+        """Batched update_one operations are sent as one unordered bulk_write."""
+        mock_collection = MagicMock()
+        mock_collection.bulk_write.return_value = MagicMock(modified_count=0, upserted_count=2)
+        mock_database = MagicMock()
+        mock_database.__getitem__.return_value = mock_collection
+        mock_client = MagicMock()
+        mock_client.__getitem__.return_value = mock_database
+        mock_mongo_client.return_value = mock_client
+        
+        conn = MongoDBConnection("mongodb://localhost:27017/", "test")
+        query = MongoDBAdapter().get_bookmark_insert()
+        
+        result = conn.executemany(query, [("/a.json", "processed"), ("/b.json", "processed")])
+        
+        assert result.rowcount == 2
+        mock_collection.bulk_write.assert_called_once()
+        requests = mock_collection.bulk_write.call_args[0][0]
+        assert len(requests) == 2
+        assert mock_collection.bulk_write.call_args[1] == {"ordered": False}
+        mock_collection.update_one.assert_not_called()
+        
+        conn.close()
+    
+    @patch('pulsepipe.persistence.database.mongodb_impl.MongoClient')
+    def test_execute_find_with_in_field(self, mock_mongo_client):
+        """Bookmark bulk check matches all given paths with $in."""
+        mock_collection = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter([{"path": "/a.json"}])
+        mock_collection.find.return_value = mock_cursor
+        mock_database = MagicMock()
+        mock_database.__getitem__.return_value = mock_collection
+        mock_client = MagicMock()
+        mock_client.__getitem__.return_value = mock_database
+        mock_mongo_client.return_value = mock_client
+        
+        conn = MongoDBConnection("mongodb://localhost:27017/", "test")
+        query = MongoDBAdapter().get_bookmark_check_many(2)
+        
+        result = conn.execute(query, ("/a.json", "/b.json"))
+        
+        assert [row["path"] for row in result.rows] == ["/a.json"]
+        mock_collection.find.assert_called_once_with(
+            {"path": {"$in": ["/a.json", "/b.json"]}},
+            {"path": 1, "_id": 0}
+        )
+        
+        conn.close()
+    
     @patch('pulsepipe.persistence.database.mongodb_impl.MongoClient')
     def test_commit_with_transaction(self, mock_mongo_client):
         """Test commit with active transaction."""
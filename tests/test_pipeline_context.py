@@ -258,6 +258,26 @@ class TestPipelineContext(unittest.TestCase):
         self.assertIn("ingestion", summary["stage_timings"])
         self.assertIn("chunking", summary["stage_timings"])
 
+    def test_shared_tracking_repository_is_flushed_not_closed(self):
+        """A repository shared between pipelines stays open for the others."""
+        shared = MagicMock()
+        di_config = MagicMock()
+        di_config.is_feature_enabled.return_value = True
+        
+        with patch("pulsepipe.pipelines.context.load_data_intelligence_config", return_value=di_config), \
+             patch("pulsepipe.pipelines.context.get_tracking_repository") as factory, \
+             patch("pulsepipe.pipelines.context.AuditLogger"):
+            context = PipelineContext("shared", self.config, tracking_repository=shared)
+        
+        factory.assert_not_called()
+        self.assertIs(context.tracking_repository, shared)
+        
+        context.get_summary()
+        
+        shared.complete_pipeline_run.assert_called_once()
+        shared.flush.assert_called_once()
+        shared.close.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
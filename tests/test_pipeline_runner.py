@@ -7,7 +7,8 @@ from datetime import datetime
 from pulsepipe.pipelines.runner import PipelineRunner
 from pulsepipe.pipelines.context import PipelineContext
 from pulsepipe.pipelines.executor import PipelineExecutor
-from pulsepipe.utils.errors import PipelineError
+from pulsepipe.pipelines.stages import LazyStageMap
+from pulsepipe.utils.errors import PipelineError, ConfigurationError
 
 
 class MockExecutor:
@@ -153,7 +154,8 @@ class TestPipelineRunner:
                 summary=True,
                 print_model=True,
                 pretty=False,
-                verbose=True
+                verbose=True,
+                tracking_repository=None
             )
 
     @pytest.mark.asyncio
@@ -513,5 +515,133 @@ class TestPipelineRunner:
                 summary=False,
                 print_model=False,
                 pretty=True,
-                verbose=False
-            )
\ No newline at end of file
+                verbose=False,
+                tracking_repository=None
+            )
+
+
+class FakeConcurrentExecutor:
+    """Stands in for ConcurrentPipelineExecutor in run_all tests."""
+    created = []
+    
+    def __init__(self, stages=None, concurrency_limit=None):
+        self.stages = stages
+        self.concurrency_limit = concurrency_limit
+        self.contexts = []
+        self.stopped = False
+        FakeConcurrentExecutor.created.append(self)
+    
+    @staticmethod
+    def create_stages():
+        return LazyStageMap({"deid": Mock, "chunking": Mock})
+    
+    async def execute_pipeline(self, context):
+        self.contexts.append(context)
+        self.stages["deid"]
+        return f"{context.name}_result"
+    
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture
+def fake_concurrent_executor():
+    FakeConcurrentExecutor.created = []
+    with patch('pulsepipe.pipelines.concurrent_executor.ConcurrentPipelineExecutor', FakeConcurrentExecutor):
+        yield FakeConcurrentExecutor
+
+
+class TestRunAll:
+    
+    @pytest.mark.asyncio
+    async def test_runs_active_pipelines_with_shared_stages(self, runner, basic_config, fake_concurrent_executor):
+        pipelines = [
+            {"name": "fhir", "active": True, **basic_config},
+            {"name": "hl7", **basic_config},
+            {"name": "x12", "active": False, **basic_config},
+        ]
+        
+        result = await runner.run_all(pipelines, max_concurrency=4)
+        
+        assert result["success"] is True
+        assert set(result["results"]) == {"fhir", "hl7"}
+        assert result["results"]["fhir"]["result"] == "fhir_result"
+        
+        executors = fake_concurrent_executor.created
+        assert len(executors) == 2
+        assert executors[0].stages is executors[1].stages
+        assert executors[0].concurrency_limit is executors[1].concurrency_limit
+        assert executors[0].concurrency_limit._value == 4
+        
+        # Pipeline metadata is not passed on as stage configuration
+        assert "name" not in executors[0].contexts[0].config
+        assert "active" not in executors[0].contexts[0].config
+        
+        # Only used stages are built, and they release their pools at the end
+        loaded = executors[0].stages.loaded()
+        assert list(loaded) == ["deid"]
+        loaded["deid"].close_executor.assert_called_once_with(None)
+        assert runner._active_executors == []
+
+    @pytest.mark.asyncio
+    async def test_no_limit_by_default(self, runner, basic_config, fake_concurrent_executor):
+        await runner.run_all([{"name": "only", **basic_config}])
+        
+        assert fake_concurrent_executor.created[0].concurrency_limit is None
+
+    @pytest.mark.asyncio
+    async def test_requires_active_pipelines(self, runner, basic_config):
+        with pytest.raises(ConfigurationError):
+            await runner.run_all([{"name": "off", "active": False, **basic_config}])
+
+    @pytest.mark.asyncio
+    async def test_requires_unique_names(self, runner, basic_config):
+        with pytest.raises(ConfigurationError):
+            await runner.run_all([{"name": "dup", **basic_config}, {"name": "dup", **basic_config}])
+
+    @pytest.mark.asyncio
+    async def test_stop_reaches_running_pipelines(self, runner, basic_config):
+        started = asyncio.Event()
+        
+        class BlockingExecutor(FakeConcurrentExecutor):
+            async def execute_pipeline(self, context):
+                started.set()
+                while not self.stopped:
+                    await asyncio.sleep(0.01)
+                return None
+        
+        executor = BlockingExecutor()
+        task = asyncio.create_task(runner.run_pipeline(basic_config, "blocking", executor=executor))
+        await started.wait()
+        
+        await runner.stop()
+        result = await asyncio.wait_for(task, timeout=1.0)
+        
+        assert executor.stopped
+        assert result["success"] is True
+        assert runner._active_executors == []
+
+    def test_shared_repository_per_persistence_config(self, runner):
+        repositories = {}
+        audit_on = Mock()
+        audit_on.is_feature_enabled.return_value = True
+        
+        with patch('pulsepipe.pipelines.runner.load_data_intelligence_config', return_value=audit_on), \
+             patch('pulsepipe.pipelines.runner.get_tracking_repository', side_effect=lambda c: Mock()) as factory:
+            first = runner._get_shared_repository({"persistence": {"type": "sqlite"}}, repositories)
+            second = runner._get_shared_repository({"persistence": {"type": "sqlite"}}, repositories)
+            other = runner._get_shared_repository({"persistence": {"type": "postgresql"}}, repositories)
+        
+        assert first is second
+        assert other is not first
+        assert factory.call_count == 2
+
+    def test_no_shared_repository_without_audit(self, runner):
+        audit_off = Mock()
+        audit_off.is_feature_enabled.return_value = False
+        
+        with patch('pulsepipe.pipelines.runner.load_data_intelligence_config', return_value=audit_off), \
+             patch('pulsepipe.pipelines.runner.get_tracking_repository') as factory:
+            assert runner._get_shared_repository({}, {}) is None
+        
+        factory.assert_not_called()
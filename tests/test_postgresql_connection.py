@@ -257,3 +257,12 @@ class TestPostgreSQLDialect:
         assert dialect.supports_feature("unsupported_feature") is False
 
 
+    
+    def test_bookmark_bulk_queries(self, dialect):
+        """Bulk bookmark SQL binds one placeholder per path and two per inserted row."""
+        check = dialect.get_bookmark_check_many(3)
+        assert check == "SELECT path FROM bookmarks WHERE path IN (%s, %s, %s)"
+        
+        insert = dialect.get_bookmark_insert_many(2)
+        assert "VALUES (%s, %s), (%s, %s)" in insert
+        assert "ON CONFLICT (path) DO NOTHING" in insert
@@ -0,0 +1,117 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_regex_redactor.py
+
+import pytest
+
+from pulsepipe.pipelines.deid.regex_redactor import (
+    RegexRedactor, compile_scanner, enabled_patterns
+)
+
+
+class TestRegexRedactor:
+    """Tests for the single-pass regex PHI redactor."""
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Call (555) 123-4567 today", "Call ([REDACTED-PHONE] today"),
+        ("SSN: 123-45-6789.", "SSN: [REDACTED-SSN]."),
+        ("mail jane.smith@example.com now", "mail [REDACTED-EMAIL] now"),
+        ("see https://portal.example.org/a/b", "see [REDACTED-URL]"),
+        ("from 10.0.0.12", "from [REDACTED-IP]"),
+        ("card 4111 1111 1111 1111", "card [REDACTED-CC]"),
+        ("license D1234567", "license [REDACTED-LICENSE]"),
+        ("seen 2023-05-15 and March 5, 2019", "seen [REDACTED-DATE] and [REDACTED-DATE]"),
+        ("seen by Dr. Johnson", "seen by [REDACTED-NAME]"),
+        ("zip 10001", "zip [REDACTED-ZIP]"),
+    ])
+    def test_replacement_tokens(self, text, expected):
+        """Each PHI type gets its redaction marker."""
+        assert RegexRedactor().redact(text) == expected
+
+    def test_labels_are_kept(self):
+        """MRN and account labels survive; only the number is redacted."""
+        redactor = RegexRedactor()
+        assert redactor.redact("MRN: 12345") == "MRN: [REDACTED-MRN]"
+        assert redactor.redact("Medical Record Number AB-99812") == "Medical Record Number: [REDACTED-MRN]"
+        assert redactor.redact("Account # 123456789") == "Account: [REDACTED-ACCT]"
+
+    def test_leftmost_match_then_priority(self):
+        """Overlaps resolve to the leftmost match, then to the higher-priority pattern."""
+        redactor = RegexRedactor()
+        # The address starts before the name-like "Main St", so it wins
+        assert redactor.redact("lives at 123 Main St") == "lives at [REDACTED-ADDRESS]"
+        # At the same position a date outranks the bare year and zip patterns
+        assert RegexRedactor(redact_years=True).redact("on 2023-05-15") == "on [REDACTED-DATE]"
+        # Replacement markers are never rescanned
+        assert redactor.redact("Mrs. Brown") == "[REDACTED-NAME]"
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Mr. Robert Lee, age 93", "[REDACTED-NAME], age 93"),
+        ("Ms. Jane Doe called", "[REDACTED-NAME] called"),
+        ("Dr. Mary Ann Smith signed", "[REDACTED-NAME] signed"),
+    ])
+    def test_honorific_takes_the_whole_name(self, text, expected):
+        """A surname after an honorific and first name is not left behind."""
+        assert RegexRedactor().redact(text) == expected
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Admitted March 3, 2021 for chest pain", "Admitted [REDACTED-DATE] for chest pain"),
+        ("Seen Jan 12, 2020.", "Seen [REDACTED-DATE]."),
+        ("Follow-up with Dr. Lee on March 3, 2021", "Follow-up with [REDACTED-NAME] on [REDACTED-DATE]"),
+    ])
+    def test_structured_patterns_outrank_names(self, text, expected):
+        """Dates are redacted as dates even where a name or address pattern would match first."""
+        assert RegexRedactor().redact(text) == expected
+
+    def test_geographic_precision(self):
+        """Location patterns follow the configured precision."""
+        text = "Springfield, IL 62704"
+        assert RegexRedactor("none").redact(text) == "[REDACTED-LOCATION] [REDACTED-ZIP]"
+        assert RegexRedactor("state").redact(text) == "Springfield, IL [REDACTED-ZIP]"
+        assert RegexRedactor("city").redact(text) == text
+
+    def test_year_redaction(self):
+        """Bare years are only redacted when requested."""
+        text = "born 1930, admitted 2023"
+        assert RegexRedactor().redact(text) == text
+        assert RegexRedactor(redact_years=True).redact(text) == "born [REDACTED-YEAR], admitted [REDACTED-YEAR]"
+
+    def test_scanner_is_compiled_once(self):
+        """Scanners are cached per pattern set and shared across redactors."""
+        assert RegexRedactor("state").structured_scanner is RegexRedactor("state").structured_scanner
+        assert RegexRedactor("state").free_text_scanner is RegexRedactor("state").free_text_scanner
+        assert compile_scanner(enabled_patterns("none")) is not compile_scanner(enabled_patterns("state"))
+
+    def test_finditer_and_search(self):
+        """Matches report the pattern that produced them."""
+        redactor = RegexRedactor()
+        assert list(redactor.finditer("SSN 123-45-6789 on 2023-05-15")) == [
+            ("ssn", 4, 15), ("date", 19, 29)
+        ]
+        assert redactor.search("call 555-123-4567")
+        assert not redactor.search("hemoglobin a1c 5.4 mmol/L")
+
+    def test_empty_text(self):
+        """None and empty strings pass through."""
+        assert RegexRedactor().redact(None) is None
+        assert RegexRedactor().redact("") == ""
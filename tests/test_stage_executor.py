@@ -0,0 +1,132 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_stage_executor.py
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from pulsepipe.pipelines.context import PipelineContext
+from pulsepipe.pipelines.stage_executor import StageExecutor
+from pulsepipe.pipelines.stages import PipelineStage
+from pulsepipe.utils.errors import ConfigurationError
+
+
+class BlockingStage(PipelineStage):
+    def __init__(self):
+        super().__init__("chunking")
+
+    async def execute(self, context, input_data=None):
+        return await self.run_blocking(context, lambda: threading.current_thread().name)
+
+
+def make_context(stage_config):
+    return PipelineContext(name="executor_test", config={"chunking": stage_config})
+
+
+class TestStageExecutorConfig:
+    def test_defaults_to_inline(self):
+        executor = StageExecutor.from_config("deid", {})
+        assert executor.executor_type == "inline"
+        assert executor.max_in_flight == 1
+        assert not executor.uses_processes
+
+    def test_ignores_non_dict_config(self):
+        assert StageExecutor.from_config("deid", None).executor_type == "inline"
+
+    def test_reads_executor_section(self):
+        executor = StageExecutor.from_config(
+            "deid", {"executor": {"type": "process", "workers": 3, "max_in_flight": 5}}
+        )
+        assert executor.executor_type == "process"
+        assert executor.workers == 3
+        assert executor.max_in_flight == 5
+        assert executor.uses_processes
+
+    def test_shorthand_type_string(self):
+        executor = StageExecutor.from_config("deid", {"executor": "thread"})
+        assert executor.executor_type == "thread"
+        assert executor.workers == (os.cpu_count() or 1)
+        assert executor.max_in_flight == executor.workers * 2
+
+    def test_unknown_type_raises(self):
+        with pytest.raises(ConfigurationError):
+            StageExecutor.from_config("deid", {"executor": {"type": "gpu"}})
+
+
+class TestStageExecutorRun:
+    @pytest.mark.asyncio
+    async def test_inline_runs_on_loop_thread(self):
+        executor = StageExecutor("chunking")
+        assert await executor.run(threading.get_ident) == threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_thread_pool_runs_off_loop(self):
+        executor = StageExecutor("chunking", "thread", workers=2)
+        try:
+            assert await executor.run(threading.get_ident) != threading.get_ident()
+            assert await executor.run(pow, 2, 10) == 1024
+        finally:
+            executor.shutdown()
+        assert executor._pool is None
+
+    @pytest.mark.asyncio
+    async def test_process_pool_runs_in_worker_process(self):
+        executor = StageExecutor("chunking", "process", workers=1)
+        try:
+            assert await executor.run(os.getpid) != os.getpid()
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate(self):
+        executor = StageExecutor("chunking", "thread", workers=1)
+        try:
+            with pytest.raises(ValueError):
+                await executor.run(int, "not a number")
+        finally:
+            executor.shutdown()
+
+
+class TestPipelineStageExecutor:
+    @pytest.mark.asyncio
+    async def test_stage_uses_configured_pool(self):
+        stage = BlockingStage()
+        context = make_context({"executor": {"type": "thread", "workers": 1}})
+
+        thread_name = await stage.execute(context)
+
+        assert thread_name.startswith("pulsepipe-chunking")
+        assert stage.get_executor(context) is stage.get_executor(context)
+        stage.close_executor(context)
+        assert stage._executors == {}
+
+    @pytest.mark.asyncio
+    async def test_stage_defaults_inline(self):
+        stage = BlockingStage()
+
+        thread_name = await stage.execute(make_context({}))
+
+        assert thread_name == threading.current_thread().name
@@ -927,4 +927,104 @@ class TestRepositoryIntegration:
         
         # Without date filter, should include both
         summary_all = repository.get_ingestion_summary(run_id)
-        assert summary_all['total_records'] == 2
\ No newline at end of file
+        assert summary_all['total_records'] == 2
+
+class TestWriteBehind:
+    """Test buffered (write-behind) tracking inserts."""
+    
+    @pytest.fixture
+    def temp_db(self):
+        fd, path = tempfile.mkstemp(suffix='.db')
+        os.close(fd)
+        config = {"persistence": {"type": "sqlite", "sqlite": {"db_path": path}}}
+        conn = get_database_connection(config)
+        init_data_intelligence_db(conn)
+        yield conn
+        conn.close()
+        os.unlink(path)
+    
+    def _repository(self, conn, **settings):
+        write_behind = {"enabled": True, "batch_size": 50, "flush_interval": 30.0}
+        write_behind.update(settings)
+        dialect = get_sql_dialect({"persistence": {"type": "sqlite"}})
+        return TrackingRepository(conn, dialect, write_behind=write_behind)
+    
+    def _count(self, conn, table):
+        return conn.execute(f"SELECT COUNT(*) AS n FROM {table}").fetchone()['n']
+    
+    def test_disabled_by_default(self, temp_db):
+        dialect = get_sql_dialect({"persistence": {"type": "sqlite"}})
+        repo = TrackingRepository(temp_db, dialect)
+        assert not repo.write_behind_enabled
+        repo.close()
+    
+    def test_rows_buffered_until_complete(self, temp_db):
+        repo = self._repository(temp_db)
+        repo.start_pipeline_run("run-1", "wb")
+        
+        for i in range(10):
+            result = repo.record_audit_event("run-1", "record_processed", "ingestion", f"record {i}")
+            assert result is None
+        assert self._count(temp_db, "audit_events") == 0
+        
+        repo.complete_pipeline_run("run-1")
+        assert self._count(temp_db, "audit_events") == 10
+        assert repo.get_pipeline_run("run-1").status == "completed"
+        repo.close()
+    
+    def test_size_threshold_writes_batch(self, temp_db):
+        repo = self._repository(temp_db, batch_size=5)
+        repo.start_pipeline_run("run-1", "wb")
+        
+        calls = []
+        real_executemany = temp_db.executemany
+        temp_db.executemany = lambda sql, rows: calls.append(len(rows)) or real_executemany(sql, rows)
+        
+        for i in range(12):
+            stat = IngestionStat(None, "run-1", "ingestion", None, f"r{i}", "Patient", ProcessingStatus.SUCCESS, None, None, None, None, None, None, None)
+            repo.record_ingestion_stat(stat)
+        repo.flush()
+        
+        assert calls == [5, 5, 2]
+        assert self._count(temp_db, "ingestion_stats") == 12
+        repo.close()
+    
+    def test_time_threshold_flushes(self, temp_db):
+        import time
+        repo = self._repository(temp_db, flush_interval=0.05)
+        repo.start_pipeline_run("run-1", "wb")
+        repo.record_audit_event("run-1", "record_processed", "ingestion", "one")
+        
+        deadline = time.monotonic() + 2.0
+        while self._count(temp_db, "audit_events") == 0 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert self._count(temp_db, "audit_events") == 1
+        repo.close()
+    
+    def test_reads_see_buffered_rows(self, temp_db):
+        repo = self._repository(temp_db)
+        repo.start_pipeline_run("run-1", "wb")
+        stat = IngestionStat(None, "run-1", "ingestion", None, "r1", "Patient", ProcessingStatus.SUCCESS, None, None, None, None, None, None, None)
+        repo.record_ingestion_stat(stat)
+        
+        assert repo.get_ingestion_summary("run-1")['total_records'] == 1
+        repo.close()
+    
+    def test_failed_batch_falls_back_to_rows(self, temp_db):
+        repo = self._repository(temp_db)
+        repo.start_pipeline_run("run-1", "wb")
+        repo.record_audit_event("run-1", "ok", "ingestion", "good")
+        repo._buffer.submit("INSERT INTO missing_table (x) VALUES (?)", (1,))
+        repo.record_audit_event("run-1", "ok", "ingestion", "also good")
+        repo.flush()
+        
+        assert self._count(temp_db, "audit_events") == 2
+        assert repo._buffer.rows_failed == 1
+        repo.close()
+    
+    def test_writes_after_close_go_through(self, temp_db):
+        repo = self._repository(temp_db)
+        repo.start_pipeline_run("run-1", "wb")
+        repo.close()
+        repo.record_audit_event("run-1", "late", "ingestion", "after close")
+        assert self._count(temp_db, "audit_events") == 1
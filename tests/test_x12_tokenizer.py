@@ -0,0 +1,146 @@
+# ------------------------------------------------------------------------------
+# PulsePipe — Ingest, Normalize, De-ID, Chunk, Embed. Healthcare Data, AI-Ready with RAG.
+# https://github.com/PulsePipe/pulsepipe
+#
+# Copyright (C) 2025 Amir Abrams
+#
+# This file is part of PulsePipe and is licensed under the GNU Affero General 
+# Public License v3.0 (AGPL-3.0). A full copy of this license can be found in 
+# the LICENSE file at the root of this repository or online at:
+# https://www.gnu.org/licenses/agpl-3.0.html
+#
+# PulsePipe is distributed WITHOUT ANY WARRANTY; without even the implied 
+# warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# We welcome community contributions — if you make it better, 
+# share it back. The whole healthcare ecosystem wins.
+# ------------------------------------------------------------------------------
+# ------------------------------------------------------------------------------
+# PulsePipe - Open Source ❤️, Healthcare Tough 💪, Builders Only 🛠️
+# ------------------------------------------------------------------------------
+
+
+# tests/test_x12_tokenizer.py
+
+import io
+from pathlib import Path
+
+import pytest
+
+from pulsepipe.ingesters.x12_ingester import X12Ingester
+from pulsepipe.ingesters.x12_utils.tokenizer import (
+    DEFAULT_DELIMITERS, X12Delimiters, iter_segments, read_delimiters,
+)
+from pulsepipe.utils.errors import X12Error
+
+FIXTURE_835 = Path(__file__).parent / "fixtures" / "test_x12_835.txt"
+
+ISA = "ISA*00*          *00*          *ZZ*UHC         *ZZ*PROVIDERID   *210101*1253*^*00501*000000905*0*T*:~"
+
+
+def _transaction(control, claims):
+    segments = [f"ST*835*{control}", "BPR*I*1000*C*ACH", "N1*PR*UHC*XV*12345"]
+    for i in range(claims):
+        segments += [
+            f"CLP*PCN{control}{i}*1*1500*1000*500*12*1234567890*11",
+            f"SVC*HC:99213*1500*1000*1",
+            "CAS*CO*45*500",
+        ]
+    segments += ["PLB*PROVADJ*25", f"SE*{len(segments) + 2}*{control}"]
+    return segments
+
+
+def _interchange(*transactions, element="*", terminator="~"):
+    segments = [ISA[:-1], "GS*HP*UHC*PROVIDERID*20210101*1253*905*X*005010X221A1"]
+    for t in transactions:
+        segments += t
+    segments += ["GE*1*905", "IEA*1*000000905"]
+    return (terminator + "\n").join(s.replace("*", element) for s in segments) + terminator
+
+
+def test_read_delimiters_from_isa():
+    assert read_delimiters(ISA) == X12Delimiters("*", ":", "~")
+    custom = ISA.replace("*", "|").replace(":~", ">\n")
+    assert read_delimiters("\n" + custom) == X12Delimiters("|", ">", "\n")
+    assert read_delimiters("ST*835*0001~") == DEFAULT_DELIMITERS
+
+
+def test_iter_segments_streams_across_chunks():
+    text = _interchange(_transaction("0001", 3), element="|", terminator="\r")
+    expected = [s.split("|") for s in text.replace("\n", "").split("\r") if s]
+
+    assert list(iter_segments(io.StringIO(text), chunk_size=7)) == expected
+
+
+def test_parse_with_custom_delimiters_matches_default():
+    default = X12Ingester().parse(_interchange(_transaction("0001", 2)))
+    custom = X12Ingester().parse(_interchange(_transaction("0001", 2), element="|", terminator="\r"))
+
+    assert len(default.claims) == 2
+    assert custom == default
+
+
+def test_split_by_transaction():
+    ingester = X12Ingester(split_by="transaction")
+
+    results = ingester.parse(_interchange(_transaction("0001", 2), _transaction("0002", 1)))
+
+    assert [len(c.claims) for c in results] == [2, 1]
+    assert all(c.transaction_type == "835" and c.interchange_control_number == "000000905" for c in results)
+
+
+def test_split_by_claim_emits_each_claim_loop(tmp_path):
+    path = tmp_path / "remit.835"
+    path.write_text(_interchange(_transaction("0001", 3)), encoding="utf-8")
+    ingester = X12Ingester(split_by="claim", chunk_size=64)
+
+    batches = list(ingester.iter_file(path))
+
+    contents = [c for batch in batches for c in batch]
+    assert [c.claims[0].claim_id for c in contents[:3]] == ["PCN00010", "PCN00011", "PCN00012"]
+    assert all(len(c.charges) == 1 and len(c.adjustments) == 1 for c in contents[:3])
+    # The provider level adjustment lands in the transaction-level object
+    assert len(contents) == 4 and not contents[3].claims and len(contents[3].charges) == 1
+
+
+def test_split_by_claim_closes_claims_at_header_loops(monkeypatch):
+    transaction = [
+        "ST*835*0001", "BPR*I*1000*C*ACH", "N1*PR*UHC*XV*12345",
+        "LX*1",
+        "CLP*PCNA*1*1500*1000*500*12*1234567890*11", "SVC*HC:99213*1500*1000*1", "CAS*CO*45*500",
+        "LX*2", "TS3*1234567890*11*20211231*1*900", "TS2*900",
+        "CLP*PCNB*1*900*900*0*12*1234567891*11", "SVC*HC:99214*900*900*1",
+        "PLB*PROVADJ*25", "SE*14*0001",
+    ]
+    ingester = X12Ingester(split_by="claim")
+    targets = []
+    map_segment = ingester._map_segment
+
+    def record(segment_id, elements, content, cache):
+        targets.append((segment_id, content))
+        map_segment(segment_id, elements, content, cache)
+
+    monkeypatch.setattr(ingester, "_map_segment", record)
+    contents = ingester.parse(_interchange(transaction))
+
+    assert [c.claims[0].claim_id for c in contents[:2]] == ["PCNA", "PCNB"]
+    assert [len(c.charges) for c in contents[:2]] == [1, 1]
+    assert len(contents[0].adjustments) == 1 and not contents[1].adjustments
+    # Loop 2000 headers belong to the transaction, not the preceding claim
+    outer = contents[2]
+    assert all(content is outer for segment_id, content in targets if segment_id in ("LX", "TS3", "TS2"))
+
+
+def test_invalid_split_mode():
+    with pytest.raises(X12Error):
+        X12Ingester(split_by="segment")
+
+
+def test_fixture_parses_same_in_interchange_and_transaction_mode():
+    raw = FIXTURE_835.read_text(encoding="utf-8")
+
+    whole = X12Ingester().parse(raw)
+    [single] = X12Ingester(split_by="transaction").parse(raw)
+
+    assert single.claims == whole.claims
+    assert single.charges == whole.charges